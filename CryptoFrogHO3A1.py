@@ -1,10 +1,12 @@
+import logging
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
-from cachetools import TTLCache
+from cachetools import TTLCache, LRUCache
 
 ## I hope you know what these are already
-from pandas import DataFrame
+from pandas import DataFrame, Series
 import numpy as np
+import pandas as pd
 
 ## Indicator libs
 import talib.abstract as ta
@@ -17,6 +19,8 @@ from freqtrade.exchange import timeframe_to_minutes
 from freqtrade.persistence import Trade
 from skopt.space import Dimension
 
+logger = logging.getLogger(__name__)
+
 class CryptoFrogHO3A1(IStrategy):
     # Sell hyperspace params:
     sell_params = {
@@ -81,11 +85,18 @@ class CryptoFrogHO3A1(IStrategy):
     stoploss = custom_stop['decay-start']    
 
     custom_trade_info = {}
+    # open trades of the live / dry-run bot by pair, refreshed once per bot iteration in bot_loop_start
+    open_trades = {}
     custom_current_price_cache: TTLCache = TTLCache(maxsize=100, ttl=300) # 5 minutes
+    # informative indicators per pair, keyed by the last closed informative candle
+    informative_cache: LRUCache = LRUCache(maxsize=100)
         
     # run "populate_indicators" only for new candle
     process_only_new_candles = False
 
+    # The last analyzed candle of every pair for custom_stoploss and the dynamic ROI
+    candle_snapshots = {}
+
     # Experimental settings (configuration will overide these if set)
     use_sell_signal = True
     sell_profit_only = False
@@ -96,6 +107,19 @@ class CryptoFrogHO3A1(IStrategy):
     timeframe = '5m'
     informative_timeframe = '1h'
 
+    # Per pair informative row mapping, only kept in live / dry-run
+    informative_projections = {}
+
+    # Indicators custom_stoploss and the dynamic ROI read per candle in backtesting and hyperopt
+    trade_indicator_columns = ('roc', 'atr', 'sroc', 'ssl-dir', 'rmi-up-trend', 'candle-up-trend')
+
+    # Keep the populated frames with float32 indicators, bool conditions and an int8 ssl-dir, the first frame of
+    # every pair is checked to give the same buy / sell signals as in full precision
+    compact_indicators = False
+
+    # Per pair result of that check, True when the compact frame can be used
+    compact_checked = {}
+
     # Optional order type mapping
     order_types = {
         'buy': 'limit',
@@ -150,30 +174,30 @@ class CryptoFrogHO3A1(IStrategy):
 
     ## smoothed Heiken Ashi
     def HA(self, dataframe, smoothing=None):
-        df = dataframe.copy()
+        ha_close = (dataframe['open'].values + dataframe['high'].values + dataframe['low'].values + dataframe['close'].values) / 4
 
-        df['HA_Close']=(df['open'] + df['high'] + df['low'] + df['close'])/4
+        # ha_open[i] = (ha_open[i-1] + ha_close[i-1]) / 2 is a first order IIR filter, so solve it in one pass
+        ha_open = np.empty_like(ha_close)
+        if len(ha_close) > 0:
+            ha_open[0] = (dataframe['open'].values[0] + dataframe['close'].values[0]) / 2
+            ha_open[1:] = iir_filter(ha_close[:-1] / 2, 0.5, ha_open[0])
 
-        df.reset_index(inplace=True)
-
-        ha_open = [ (df['open'][0] + df['close'][0]) / 2 ]
-        [ ha_open.append((ha_open[i] + df['HA_Close'].values[i]) / 2) for i in range(0, len(df)-1) ]
-        df['HA_Open'] = ha_open
-
-        df.set_index('index', inplace=True)
-
-        df['HA_High']=df[['HA_Open','HA_Close','high']].max(axis=1)
-        df['HA_Low']=df[['HA_Open','HA_Close','low']].min(axis=1)
+        dataframe['HA_Close'] = ha_close
+        dataframe['HA_Open'] = ha_open
+        dataframe['HA_High'] = np.fmax(np.fmax(ha_open, ha_close), dataframe['high'].values)
+        dataframe['HA_Low'] = np.fmin(np.fmin(ha_open, ha_close), dataframe['low'].values)
 
         if smoothing is not None:
             sml = abs(int(smoothing))
             if sml > 0:
-                df['Smooth_HA_O']=ta.EMA(df['HA_Open'], sml)
-                df['Smooth_HA_C']=ta.EMA(df['HA_Close'], sml)
-                df['Smooth_HA_H']=ta.EMA(df['HA_High'], sml)
-                df['Smooth_HA_L']=ta.EMA(df['HA_Low'], sml)
-                
-        return df
+                # smooth all four series in a single batched EMA
+                smooth = EMA_batch(dataframe[['HA_Open', 'HA_Close', 'HA_High', 'HA_Low']].values, sml)
+                dataframe['Smooth_HA_O'] = smooth[:, 0]
+                dataframe['Smooth_HA_C'] = smooth[:, 1]
+                dataframe['Smooth_HA_H'] = smooth[:, 2]
+                dataframe['Smooth_HA_L'] = smooth[:, 3]
+
+        return dataframe
     
     def hansen_HA(self, informative_df, period=6):
         dataframe = informative_df.copy()
@@ -189,17 +213,13 @@ class CryptoFrogHO3A1(IStrategy):
         return {'emac': dataframe['emac'], 'emao': dataframe['emao']}
     
     ## detect BB width expansion to indicate possible volatility
-    def bbw_expansion(self, bbw_rolling, mult=1.1):
-        bbw = list(bbw_rolling)
+    def bbw_expansion(self, bbw, window=4, mult=1.1):
+        # max of the previous window-1 values (floored at 0) vs. the current value
+        prev_max = bbw.shift(1).rolling(window - 1).max() if window > 1 else bbw * 0.0
+        expansion = np.where(bbw > (prev_max.clip(lower=0.0) * mult), 1.0, 0.0)
 
-        m = 0.0
-        for i in range(len(bbw)-1):
-            if bbw[i] > m:
-                m = bbw[i]
-
-        if (bbw[-1] > (m * mult)):
-            return 1
-        return 0
+        # keep the NaN warm-up of rolling(window).apply
+        return Series(expansion, index=bbw.index).where(prev_max.notna() & bbw.notna())
 
     ## do_indicator style a la Obelisk strategies
     def do_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
@@ -228,7 +248,7 @@ class CryptoFrogHO3A1(IStrategy):
         
         ## confirm wideboi variance signal with bbw expansion
         dataframe["bb_width"] = ((dataframe["bb_upperband"] - dataframe["bb_lowerband"]) / dataframe["bb_middleband"])
-        dataframe['bbw_expansion'] = dataframe['bb_width'].rolling(window=4).apply(self.bbw_expansion)
+        dataframe['bbw_expansion'] = self.bbw_expansion(dataframe['bb_width'], window=4, mult=1.1)
 
         # confirm entry and exit on smoothed HA
         dataframe = self.HA(dataframe, 4)
@@ -268,6 +288,66 @@ class CryptoFrogHO3A1(IStrategy):
         
         return dataframe
 
+    def informative_indicators(self, metadata: dict) -> DataFrame:
+        """
+        The informative timeframe with its indicators. In live runs the computed frame is reused until
+        a new informative candle closes, only the merge is redone on every loop.
+        """
+        informative = self.dp.get_pair_dataframe(pair=metadata['pair'], timeframe=self.informative_timeframe)
+        if not self.config['runmode'].value in ('live', 'dry_run') or informative.empty:
+            return self.do_indicators(informative.copy(), metadata)
+
+        candle = informative['date'].iloc[-1]
+        cached = self.informative_cache.get(metadata['pair'])
+        if cached is None or cached[0] != candle or len(cached[1]) != len(informative):
+            cached = (candle, self.do_indicators(informative.copy(), metadata))
+            self.informative_cache[metadata['pair']] = cached
+
+        return cached[1]
+
+    def project_informative(self, dataframe: DataFrame, informative: DataFrame, metadata: dict, columns: dict = None) -> DataFrame:
+        """
+        Same columns as merge_informative_pair(ffill=True), without merging and copying the whole dataframe.
+        In live runs the row mapping is kept per pair and extended as candles arrive.
+
+        :param dataframe: DataFrame of the strategy timeframe
+        :param informative: DataFrame of the informative timeframe
+        :param metadata: dict Metadata of the pair
+        :param columns: dict Informative column -> name in the dataframe, by default all of them with the timeframe suffix
+        """
+        if columns is None:
+            columns = {column: f"{column}_{self.informative_timeframe}" for column in informative.columns}
+
+        projection = InformativeProjection(timeframe_to_minutes(self.timeframe), timeframe_to_minutes(self.informative_timeframe))
+        if self.config['runmode'].value in ('live', 'dry_run'):
+            projection = self.informative_projections.setdefault(metadata['pair'], projection)
+
+        return projection.project(dataframe, informative, columns)
+
+    def compact(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        """
+        Compact copy of a populated frame (see compact_frame). On the first frame of a pair both frames run
+        through populate_buy_trend / populate_sell_trend, a pair whose signals differ stays in full precision.
+        :param dataframe: DataFrame The populated frame
+        :param metadata: dict Pair metadata
+        :return: DataFrame The compact frame, or the populated one if the pair failed the check
+        """
+        compact = compact_frame(dataframe)
+        pair = metadata['pair']
+        if pair not in self.compact_checked:
+            full = self.populate_sell_trend(self.populate_buy_trend(dataframe.copy(), metadata), metadata)
+            small = self.populate_sell_trend(self.populate_buy_trend(compact.copy(), metadata), metadata)
+            self.compact_checked[pair] = all(np.array_equal(signal_values(full, column), signal_values(small, column))
+                                             for column in ('buy', 'sell'))
+            if self.compact_checked[pair]:
+                logger.info(f"{pair}: compact frame {compact.memory_usage(deep=True).sum() / 1024:.0f} KiB, "
+                            f"{dataframe.memory_usage(deep=True).sum() / 1024:.0f} KiB in full precision")
+            else:
+                logger.warning(f"{pair}: the compact frame changes the signals, keeping it in full precision")
+        if not self.compact_checked[pair]:
+            return dataframe
+        return compact
+
     ## stolen from Obelisk's Ichi strat code and backtest blog post, and Solipsis4
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         # Populate/update the trade data if there is any, set trades to false if not live/dry
@@ -282,24 +362,20 @@ class CryptoFrogHO3A1(IStrategy):
             if not self.dp:
                 return dataframe
 
-            informative = self.dp.get_pair_dataframe(pair=metadata['pair'], timeframe=self.informative_timeframe)
-
-            informative = self.do_indicators(informative.copy(), metadata)
-            
-            dataframe = merge_informative_pair(dataframe, informative, self.timeframe, self.informative_timeframe, ffill=True)
+            informative = self.informative_indicators(metadata)
             
-            skip_columns = [(s + "_" + self.informative_timeframe) for s in ['date', 'open', 'high', 'low', 'close', 'volume', 'emac', 'emao']]
-            dataframe.rename(columns=lambda s: s.replace("_{}".format(self.informative_timeframe), "") if (not s in skip_columns) else s, inplace=True)
+            # the indicators keep their own names, only the candle and emac / emao get the suffix
+            suffixed = ['date', 'open', 'high', 'low', 'close', 'volume', 'emac', 'emao']
+            columns = {column: (f"{column}_{self.informative_timeframe}" if column in suffixed else column) for column in informative.columns}
+            dataframe = self.project_informative(dataframe, informative, metadata, columns)
 
         # Slam some indicators into the trade_info dict so we can dynamic roi and custom stoploss in backtest
         if self.dp.runmode.value in ('backtest', 'hyperopt'):
-            self.custom_trade_info[metadata['pair']]['roc'] = dataframe[['date', 'roc']].copy().set_index('date')
-            self.custom_trade_info[metadata['pair']]['atr'] = dataframe[['date', 'atr']].copy().set_index('date')
-            self.custom_trade_info[metadata['pair']]['sroc'] = dataframe[['date', 'sroc']].copy().set_index('date')
-            self.custom_trade_info[metadata['pair']]['ssl-dir'] = dataframe[['date', 'ssl-dir']].copy().set_index('date')
-            self.custom_trade_info[metadata['pair']]['rmi-up-trend'] = dataframe[['date', 'rmi-up-trend']].copy().set_index('date')
-            self.custom_trade_info[metadata['pair']]['candle-up-trend'] = dataframe[['date', 'candle-up-trend']].copy().set_index('date')            
+            self.custom_trade_info[metadata['pair']]['indicators'] = self.build_trade_indicators(dataframe)
             
+        if self.compact_indicators:
+            dataframe = self.compact(dataframe, metadata)
+
         return dataframe
 
     ## cryptofrog signals
@@ -398,6 +474,67 @@ class CryptoFrogHO3A1(IStrategy):
             'sell'] = 1
         return dataframe
 
+    def trade_indicator(self, pair: str, column: str, time: datetime):
+        """
+        Value of an indicator at a candle, backtesting and hyperopt only
+        :param pair: str Pair
+        :param column: str One of trade_indicator_columns
+        :param time: datetime Date of the candle
+        :return: The value at that candle
+        """
+        return self.custom_trade_info[pair]['indicators'].get(column, time)
+
+    def build_trade_indicators(self, dataframe: DataFrame) -> 'TradeIndicators':
+        """
+        The per candle indicators of a pair for backtesting and hyperopt, with the dynamic ROI trend of
+        every droi_trend_type evaluated up front as in-trend-<type>
+        :param dataframe: DataFrame Populated frame of the pair
+        :return: TradeIndicators
+        """
+        indicators = TradeIndicators(dataframe, self.trade_indicator_columns, timeframe_to_minutes(self.timeframe))
+        ssl_dir = indicators.columns['ssl-dir']
+        trends = {
+            'rmi': indicators.columns['rmi-up-trend'] == 1,
+            'ssl': ssl_dir == 1 if ssl_dir.dtype.kind in 'iu' else ssl_dir == 'up',
+            'candle': indicators.columns['candle-up-trend'] == 1,
+        }
+        trends['any'] = trends['rmi'] | trends['ssl'] | trends['candle']
+        for trend, values in trends.items():
+            indicators.add(f"in-trend-{trend}", values)
+        return indicators
+
+    def sroc_bail(self, pair: str, time: datetime) -> bool:
+        """
+        Whether sroc is at or below cstp_bail_roc at a candle, backtesting and hyperopt only.
+        The comparison runs over all candles of the pair once per value of cstp_bail_roc.
+        :param pair: str Pair
+        :param time: datetime Date of the candle
+        :return: bool
+        """
+        indicators = self.custom_trade_info[pair]['indicators']
+        bail_roc = self.cstp_bail_roc.value
+        if indicators.keys.get('sroc-bail') != bail_roc:
+            indicators.add('sroc-bail', (indicators.columns['sroc'] / 100) <= bail_roc, bail_roc)
+        return indicators.get('sroc-bail', time)
+
+    def candle_snapshot(self, pair: str) -> dict:
+        """
+        The last analyzed candle of a pair as a plain dict. It is built once per analyzed candle and
+        shared by custom_stoploss and the dynamic ROI, instead of a row Series per call.
+        :param pair: str Pair
+        :return: dict Column values of the last candle, None if the pair was not analyzed yet
+        """
+        dataframe, last_updated = self.dp.get_analyzed_dataframe(pair, self.timeframe)
+        if len(dataframe.index) == 0:
+            return None
+        # a new analysis in live, the next candle of the slice in backtesting
+        key = (last_updated, dataframe.index[-1])
+        snapshot = self.candle_snapshots.get(pair)
+        if snapshot is None or snapshot[0] != key:
+            snapshot = (key, dataframe.iloc[-1].to_dict())
+            self.candle_snapshots[pair] = snapshot
+        return snapshot[1]
+
     """
     Everything from here completely stolen from the godly work of @werkkrew
     
@@ -407,16 +544,16 @@ class CryptoFrogHO3A1(IStrategy):
         trade_dur = int((current_time.timestamp() - trade.open_date_utc.timestamp()) // 60)
 
         if self.config['runmode'].value in ('live', 'dry_run'):
-            dataframe, last_updated = self.dp.get_analyzed_dataframe(pair=pair, timeframe=self.timeframe)
-            sroc = dataframe['sroc'].iat[-1]
-        # If in backtest or hyperopt, get the indicator values out of the trades dict (Thanks @JoeSchr!)
+            last_candle = self.candle_snapshot(pair)
+            sroc_bail = (last_candle['sroc'] / 100) <= self.cstp_bail_roc.value
+        # If in backtest or hyperopt, the bailout of every candle of the pair is compared up front
         else:
-            sroc = self.custom_trade_info[trade.pair]['sroc'].loc[current_time]['sroc']
+            sroc_bail = self.sroc_bail(trade.pair, current_time)
 
         if current_profit < self.cstp_threshold.value:
             if self.cstp_bail_how.value == 'roc' or self.cstp_bail_how.value == 'any':
                 # Dynamic bailout based on rate of change
-                if (sroc/100) <= self.cstp_bail_roc.value:
+                if sroc_bail:
                     return 0.001
             if self.cstp_bail_how.value == 'time' or self.cstp_bail_how.value == 'any':
                 # Dynamic bailout based on time
@@ -436,34 +573,32 @@ class CryptoFrogHO3A1(IStrategy):
         # see if we have the data we need to do this, otherwise fall back to the standard table
         if self.custom_trade_info and trade and trade.pair in self.custom_trade_info:
             if self.config['runmode'].value in ('live', 'dry_run'):
-                dataframe, last_updated = self.dp.get_analyzed_dataframe(pair=trade.pair, timeframe=self.timeframe)
-                rmi_trend = dataframe['rmi-up-trend'].iat[-1]
-                candle_trend = dataframe['candle-up-trend'].iat[-1]
-                ssl_dir = dataframe['ssl-dir'].iat[-1]
-            # If in backtest or hyperopt, get the indicator values out of the trades dict (Thanks @JoeSchr!)
+                last_candle = self.candle_snapshot(trade.pair)
+                rmi_trend = last_candle['rmi-up-trend']
+                candle_trend = last_candle['candle-up-trend']
+                ssl_dir = last_candle['ssl-dir']
+                in_trend = False
+
+                if self.droi_trend_type.value == 'rmi' or self.droi_trend_type.value == 'any':
+                    if rmi_trend == 1:
+                        in_trend = True
+                if self.droi_trend_type.value == 'ssl' or self.droi_trend_type.value == 'any':
+                    if ssl_dir in ('up', 1):
+                        in_trend = True
+                if self.droi_trend_type.value == 'candle' or self.droi_trend_type.value == 'any':
+                    if candle_trend == 1:
+                        in_trend = True
+            # If in backtest or hyperopt, the trend of every candle of the pair was evaluated up front
             else:
-                rmi_trend = self.custom_trade_info[trade.pair]['rmi-up-trend'].loc[current_time]['rmi-up-trend']
-                candle_trend = self.custom_trade_info[trade.pair]['candle-up-trend'].loc[current_time]['candle-up-trend']
-                ssl_dir = self.custom_trade_info[trade.pair]['ssl-dir'].loc[current_time]['ssl-dir']
+                in_trend = self.trade_indicator(trade.pair, f"in-trend-{self.droi_trend_type.value}", current_time)
 
             min_roi = table_roi
-            max_profit = trade.calc_profit_ratio(trade.max_rate)
-            pullback_value = (max_profit - self.droi_pullback_amount.value)
-            in_trend = False
-
-            if self.droi_trend_type.value == 'rmi' or self.droi_trend_type.value == 'any':
-                if rmi_trend == 1:
-                    in_trend = True
-            if self.droi_trend_type.value == 'ssl' or self.droi_trend_type.value == 'any':
-                if ssl_dir == 'up':
-                    in_trend = True
-            if self.droi_trend_type.value == 'candle' or self.droi_trend_type.value == 'any':
-                if candle_trend == 1:
-                    in_trend = True
 
             # Force the ROI value high if in trend
             if (in_trend == True):
                 min_roi = 100
+                max_profit = trade.calc_profit_ratio(trade.max_rate)
+                pullback_value = (max_profit - self.droi_pullback_amount.value)
                 # If pullback is enabled, allow to sell if a pullback from peak has happened regardless of trend
                 if self.droi_pullback.value == True and (current_profit < pullback_value):
                     if self.droi_pullback_respect_table.value == True:
@@ -508,6 +643,17 @@ class CryptoFrogHO3A1(IStrategy):
         self.custom_current_price_cache[pair] = rate
         return rate    
     
+    def bot_loop_start(self, **kwargs) -> None:
+        """
+        Index the open trades by pair once per bot iteration, before the pairs are analyzed.
+        populate_trades reads them from here instead of querying the database for every pair.
+        """
+        if self.config['runmode'].value in ('live', 'dry_run'):
+            open_trades = {}
+            for trade in Trade.get_open_trades():
+                open_trades.setdefault(trade.pair, []).append(trade)
+            self.open_trades = open_trades
+
     """
     Stripped down version from Schism, meant only to update the price data a bit
     more frequently than the default instead of getting all sorts of trade information
@@ -525,7 +671,7 @@ class CryptoFrogHO3A1(IStrategy):
         if self.config['runmode'].value in ('live', 'dry_run'):
             
             # find out if we have an open trade for this pair
-            active_trade = Trade.get_trades([Trade.pair == pair, Trade.is_open.is_(True),]).all()
+            active_trade = self.open_trades.get(pair)
 
             # if so, get some information
             if active_trade:
@@ -589,3 +735,203 @@ def SROC(dataframe, roclen=21, emalen=13, smooth=21):
     sroc = ta.ROC(ema, timeperiod=smooth)
 
     return sroc
+
+def iir_filter(x, decay, initial=0.0):
+    """
+    First order IIR filter y[n] = decay * y[n-1] + x[n], with y[-1] = initial, evaluated in closed form.
+    Works on 1D arrays or column-wise on 2D arrays. The series is split into blocks short enough that
+    decay ** -block stays well inside float64 range, so each block is a single scaled cumsum.
+    Without decay (an EMA of period 1) the output is the input.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    if decay <= 0:
+        return x.copy()
+    out = np.empty_like(x)
+    block = max(1, int(200 / -np.log10(decay)))
+    steps = np.arange(block, dtype=np.float64)
+    if x.ndim > 1:
+        steps = steps.reshape((-1,) + (1,) * (x.ndim - 1))
+    grow = decay ** -steps
+    shrink = decay ** steps
+    carry = np.asarray(initial, dtype=np.float64)
+
+    for start in range(0, len(x), block):
+        chunk = x[start:start + block]
+        m = len(chunk)
+        out[start:start + m] = np.cumsum(chunk * grow[:m], axis=0) * shrink[:m] + carry * (shrink[:m] * decay)
+        carry = out[start + m - 1]
+
+    return out
+
+def EMA_batch(values, period):
+    """
+    TA-Lib compatible EMA (SMA seeded) computed column-wise over a 2D array in one pass.
+    Like TA-Lib the leading NaNs of a column are skipped, its EMA is seeded from the first period values after them.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    out = np.full_like(values, np.nan)
+    columns = values.reshape(len(values), -1)
+    result = out.reshape(len(values), -1)
+
+    valid = ~np.isnan(columns)
+    starts = np.where(valid.any(axis=0), valid.argmax(axis=0), len(columns))
+    k = 2.0 / (period + 1)
+    # one pass per distinct start, a single one for columns without leading NaNs
+    for start in np.unique(starts):
+        seed = start + period - 1
+        if seed >= len(columns):
+            continue
+        group = np.flatnonzero(starts == start)
+        result[seed, group] = columns[start:seed + 1, group].sum(axis=0) / period
+        result[seed + 1:, group] = iir_filter(columns[seed + 1:, group] * k, 1 - k, result[seed, group])
+
+    return out
+
+class InformativeProjection:
+    """
+    As-of projection of an informative timeframe onto the candles of the strategy timeframe.
+    Every candle gets the last informative candle that has closed by then, the rows merge_informative_pair
+    picks, found with searchsorted on the timestamps and gathered as array takes. The row mapping is
+    kept and only extended for the new candles while the informative candles stay the same.
+    """
+
+    def __init__(self, timeframe_minutes, timeframe_inf_minutes):
+        self.offset = np.timedelta64(timeframe_inf_minutes - timeframe_minutes, 'm')
+        self.dates = None
+        self.inf_dates = None
+        self.rows = None
+
+    def mapping(self, dates, inf_dates):
+        """
+        Row of the informative frame for every candle, -1 before the first informative candle.
+        The candles are expected without gaps, as the dataprovider serves them.
+        """
+        overlap = 0
+        if self.rows is not None and len(self.dates) and len(dates) and np.array_equal(inf_dates, self.inf_dates):
+            last = np.searchsorted(dates, self.dates[-1])
+            if last < len(dates) and dates[last] == self.dates[-1] and last < len(self.dates) and dates[0] == self.dates[-(last + 1)]:
+                overlap = last + 1
+
+        merge_dates = inf_dates + self.offset
+        fresh = np.searchsorted(merge_dates, dates[overlap:], side='right') - 1
+        rows = np.concatenate([self.rows[len(self.rows) - overlap:], fresh]) if overlap else fresh
+
+        # merge_informative_pair only matches informative candles that line up with a candle of the
+        # frame, the ones from before its first candle are not carried over
+        if len(dates):
+            head = np.searchsorted(rows, np.searchsorted(merge_dates, dates[0]))
+            rows[:head] = -1
+
+        self.dates = np.array(dates)
+        self.inf_dates = np.array(inf_dates)
+        self.rows = rows
+        return rows
+
+    def project(self, dataframe, informative, columns):
+        """
+        Add the informative columns to the dataframe, forward filled like merge_informative_pair(ffill=True)
+
+        :param dataframe: DataFrame of the strategy timeframe
+        :param informative: DataFrame of the informative timeframe
+        :param columns: dict Informative column -> name in the dataframe
+        """
+        rows = self.mapping(dataframe['date'].values, informative['date'].values)
+        source = informative[list(columns)].reset_index(drop=True)
+        # candles before the first informative candle get NaN, like the left merge
+        projected = source.reindex(rows) if len(rows) and rows[0] < 0 else source.take(rows)
+        projected = projected.ffill().set_axis(dataframe.index)
+        for column, name in columns.items():
+            dataframe[name] = projected[column]
+        return dataframe
+
+
+def compact_frame(dataframe: DataFrame, keep=('date', 'open', 'high', 'low', 'close', 'volume')) -> DataFrame:
+    """
+    Copy of a populated frame in smaller dtypes: float64 indicators become float32 (unless out of its range),
+    columns of only True / False / NaN become bool with NaN as False (which is what the signal masks make of it),
+    integers take the smallest type that holds them and ssl-dir is int8, 1 up / 0 down / -1 missing.
+    The candles keep their dtypes.
+    :param dataframe: DataFrame The populated frame
+    :param keep: tuple Columns to copy as they are
+    :return: DataFrame
+    """
+    columns = {}
+    for column in dataframe.columns:
+        series = dataframe[column]
+        if column in keep:
+            pass
+        elif column == 'ssl-dir':
+            values = series.to_numpy(dtype=object)
+            series = Series(np.select([values == 'up', values == 'down'], [1, 0], -1).astype(np.int8), index=series.index)
+        elif series.dtype == np.float64:
+            values = series.to_numpy()
+            finite = np.abs(values[np.isfinite(values)])
+            if not len(finite) or finite.max() <= np.finfo(np.float32).max:
+                series = series.astype(np.float32)
+        elif series.dtype.kind in 'iu':
+            series = pd.to_numeric(series, downcast='unsigned' if series.dtype.kind == 'u' else 'integer')
+        elif series.dtype == object:
+            values = series.to_numpy()
+            values = values[~pd.isna(values)]
+            if len(values) and isinstance(values[0], (bool, np.bool_)) and ((values == True) | (values == False)).all():
+                series = series.fillna(False).astype(bool)
+        columns[column] = series
+    return DataFrame(columns, index=dataframe.index)
+
+
+def signal_values(dataframe: DataFrame, column: str) -> np.ndarray:
+    """
+    Signal column as float array, missing signals as 0.
+    :param dataframe: DataFrame Frame after populate_buy_trend / populate_sell_trend
+    :param column: str 'buy' or 'sell'
+    :return: np.ndarray
+    """
+    if column not in dataframe:
+        return np.zeros(len(dataframe))
+    return dataframe[column].fillna(0).to_numpy(dtype=float)
+
+
+class TradeIndicators:
+    """
+    Indicators of one pair per candle, for the lookups of custom_stoploss and the dynamic ROI in backtesting.
+    One array per indicator, the row of a candle follows from its date and the fixed candle step. Frames
+    with gaps in the dates fall back to a binary search.
+    """
+
+    def __init__(self, dataframe: DataFrame, columns, timeframe_minutes: int):
+        minutes = dataframe['date'].values.astype('datetime64[m]').astype(np.int64)
+        self.step = timeframe_minutes
+        self.rows = len(minutes)
+        self.start = int(minutes[0]) if self.rows else 0
+        # only kept when the candles are not evenly spaced
+        self.minutes = None if (np.diff(minutes) == self.step).all() else minutes
+        self.columns = {column: dataframe[column].to_numpy() for column in columns}
+        # what the derived columns were computed for
+        self.keys = {}
+
+    def add(self, column: str, values: np.ndarray, key=None):
+        """
+        Add a column derived from the others
+        :param column: str Name of the column
+        :param values: np.ndarray One value per candle
+        :param key: The parameters the values depend on, kept in keys
+        """
+        self.columns[column] = values
+        self.keys[column] = key
+
+    def get(self, column: str, time: datetime):
+        """
+        :param column: str Indicator column
+        :param time: datetime Date of the candle
+        :return: The value at that candle, KeyError if there is no candle at that date
+        """
+        minute = int(time.timestamp()) // 60
+        if self.minutes is None:
+            row, offset = divmod(minute - self.start, self.step)
+            if offset or not 0 <= row < self.rows:
+                raise KeyError(time)
+        else:
+            row = int(np.searchsorted(self.minutes, minute))
+            if row == self.rows or self.minutes[row] != minute:
+                raise KeyError(time)
+        return self.columns[column][row]
@@ -1,11 +1,23 @@
+import bisect
+import logging
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 from cachetools import TTLCache
 from functools import reduce
+import multiprocessing
+import os
+import queue
+import traceback
+try:
+    from multiprocessing import resource_tracker, shared_memory
+except ImportError:
+    # Python 3.7, pairs are populated serially
+    resource_tracker = shared_memory = None
 
 ## I hope you know what these are already
-from pandas import DataFrame, Series
+from pandas import DataFrame, Series, concat
 import numpy as np
+import pandas as pd
 
 ## Indicator libs
 import talib.abstract as ta
@@ -18,6 +30,8 @@ from freqtrade.exchange import timeframe_to_minutes
 from freqtrade.persistence import Trade
 from skopt.space import Dimension
 
+logger = logging.getLogger(__name__)
+
 class CryptoFrogNFIHO1A(IStrategy):
     # Buy hyperspace params:
     buy_params = {
@@ -627,11 +641,33 @@ class CryptoFrogNFIHO1A(IStrategy):
     stoploss = custom_stop['decay-start']    
 
     custom_trade_info = {}
+    # open trades of the live / dry-run bot by pair, refreshed once per bot iteration in bot_loop_start
+    open_trades = {}
     custom_current_price_cache: TTLCache = TTLCache(maxsize=100, ttl=300) # 5 minutes
         
     # run "populate_indicators" only for new candle
     process_only_new_candles = False
 
+    # The last analyzed candle of every pair for custom_sell, custom_stoploss and the dynamic ROI
+    candle_snapshots = {}
+
+    # The custom_sell rules compiled from the current parameters, see compile_sell_rules
+    sell_rules = None
+
+    # Backtesting and hyperopt: the analyzed candles of every pair and the sell reasons of its open trade,
+    # evaluated for a window of candles at once that doubles while the trade stays open, up to backtest_sell_window
+    sell_candles = {}
+    sell_windows = {}
+    backtest_sell_window = 1024
+
+    # custom_sell calls of backtesting and hyperopt whose candle or profits were not the precomputed ones,
+    # they are evaluated on their own. The first one is logged.
+    sell_window_fallbacks = 0
+
+    # The columns the custom_sell rules read
+    sell_rule_columns = ('rsi', 'rsi_1h', 'close', 'ema_200', 'ema_100', 'sma_200_dec', 'sma_200_dec_1h',
+                         'pump_ratio_48_1h', 'pump_ratio_36_1h', 'pump_ratio_24_1h')
+
     # Experimental settings (configuration will overide these if set)
     use_sell_signal = True
     sell_profit_only = False
@@ -643,6 +679,25 @@ class CryptoFrogNFIHO1A(IStrategy):
     timeframe = '5m'
     informative_timeframe = '1h'
 
+    # Per pair informative row mapping, only kept in live / dry-run
+    informative_projections = {}
+
+    # Indicators custom_stoploss and the dynamic ROI read per candle in backtesting and hyperopt
+    trade_indicator_columns = ('roc', 'atr', 'sroc', 'ssl-dir', 'rmi-up-trend', 'candle-up-trend')
+
+    # Keep the populated frames with float32 indicators, bool conditions and an int8 ssl-dir, the first frame of
+    # every pair is checked to give the same buy / sell signals as in full precision
+    compact_indicators = False
+
+    # Per pair result of that check, True when the compact frame can be used
+    compact_checked = {}
+
+    # Worker processes populating the pairs in backtesting and hyperopt, 1 populates serially, 0 for one per core
+    populate_workers = 1
+
+    # Per pair buy / sell signals the population workers computed along with the indicators, backtesting only
+    parallel_signals = {}
+
     # Optional order type mapping
     order_types = {
         'buy': 'limit',
@@ -1488,6 +1543,9 @@ class CryptoFrogNFIHO1A(IStrategy):
     sell_custom_stoploss_under_rel_1 = DecimalParameter(0.001, 0.02, default=0.004, space='sell', optimize=True, load=True)
     sell_custom_stoploss_under_rsi_diff_1 = DecimalParameter(0.0, 20.0, default=8.0, space='sell', optimize=True, load=True)
 
+    # Pump sell checks, window length -> sell_pump_threshold_N of each level
+    sell_pump_levels = {48: (1, 2, 3), 36: (4, 5, 6), 24: (7, 8, 9)}
+
     # 48h for pump sell checks
     sell_pump_threshold_1 = DecimalParameter(0.5, 1.2, default=0.9, space='sell', decimals=2, optimize=True, load=True)
     sell_pump_threshold_2 = DecimalParameter(0.4, 0.9, default=0.7, space='sell', decimals=2, optimize=True, load=True)
@@ -1543,149 +1601,172 @@ class CryptoFrogNFIHO1A(IStrategy):
 
     #############################################################
 
+    def candle_snapshot(self, pair: str) -> dict:
+        """
+        The last analyzed candle of a pair as a plain dict. It is built once per analyzed candle and
+        shared by custom_sell, custom_stoploss and the dynamic ROI, instead of a row Series per call.
+        :param pair: str Pair
+        :return: dict Column values of the last candle, None if the pair was not analyzed yet
+        """
+        dataframe, last_updated = self.dp.get_analyzed_dataframe(pair, self.timeframe)
+        if len(dataframe.index) == 0:
+            return None
+        # a new analysis in live, the next candle of the slice in backtesting
+        key = (last_updated, dataframe.index[-1])
+        snapshot = self.candle_snapshots.get(pair)
+        if snapshot is None or snapshot[0] != key:
+            snapshot = (key, dataframe.iloc[-1].to_dict())
+            self.candle_snapshots[pair] = snapshot
+        return snapshot[1]
+
     def custom_sell(self, pair: str, trade: 'Trade', current_time: 'datetime', current_rate: float,
                     current_profit: float, **kwargs):
-        dataframe, _ = self.dp.get_analyzed_dataframe(pair, self.timeframe)
-        last_candle = dataframe.iloc[-1].squeeze()
-
         max_profit = ((trade.max_rate - trade.open_rate) / trade.open_rate)
 
+        if self.sell_rules is None:
+            self.sell_rules = self.compile_sell_rules()
+
+        # In backtesting and hyperopt the reasons of the next candles of the trade are evaluated at once
+        if self.config['runmode'].value in ('backtest', 'hyperopt') and pair in self.sell_candles:
+            found, reason = self.backtest_sell_reason(pair, trade, current_time, current_profit, max_profit)
+            if found:
+                return reason
+
+        last_candle = self.candle_snapshot(pair)
+
         if (last_candle is not None):
-            if (current_profit > self.sell_custom_profit_11.value) & (last_candle['rsi'] < self.sell_custom_rsi_11.value):
-                return 'signal_profit_11'
-            if (self.sell_custom_profit_11.value > current_profit > self.sell_custom_profit_10.value) & (last_candle['rsi'] < self.sell_custom_rsi_10.value):
-                return 'signal_profit_10'
-            if (self.sell_custom_profit_10.value > current_profit > self.sell_custom_profit_9.value) & (last_candle['rsi'] < self.sell_custom_rsi_9.value):
-                return 'signal_profit_9'
-            if (self.sell_custom_profit_9.value > current_profit > self.sell_custom_profit_8.value) & (last_candle['rsi'] < self.sell_custom_rsi_8.value):
-                return 'signal_profit_8'
-            if (self.sell_custom_profit_8.value > current_profit > self.sell_custom_profit_7.value) & (last_candle['rsi'] < self.sell_custom_rsi_7.value):
-                return 'signal_profit_7'
-            if (self.sell_custom_profit_7.value > current_profit > self.sell_custom_profit_6.value) & (last_candle['rsi'] < self.sell_custom_rsi_6.value):
-                return 'signal_profit_6'
-            if (self.sell_custom_profit_6.value > current_profit > self.sell_custom_profit_5.value) & (last_candle['rsi'] < self.sell_custom_rsi_5.value):
-                return 'signal_profit_5'
-            elif (self.sell_custom_profit_5.value > current_profit > self.sell_custom_profit_4.value) & (last_candle['rsi'] < self.sell_custom_rsi_4.value):
-                return 'signal_profit_4'
-            elif (self.sell_custom_profit_4.value > current_profit > self.sell_custom_profit_3.value) & (last_candle['rsi'] < self.sell_custom_rsi_3.value):
-                return 'signal_profit_3'
-            elif (self.sell_custom_profit_3.value > current_profit > self.sell_custom_profit_2.value) & (last_candle['rsi'] < self.sell_custom_rsi_2.value):
-                return 'signal_profit_2'
-            elif (self.sell_custom_profit_2.value > current_profit > self.sell_custom_profit_1.value) & (last_candle['rsi'] < self.sell_custom_rsi_1.value):
-                return 'signal_profit_1'
-            elif (self.sell_custom_profit_1.value > current_profit > self.sell_custom_profit_0.value) & (last_candle['rsi'] < self.sell_custom_rsi_0.value):
-                return 'signal_profit_0'
+            return self.sell_rules.match(last_candle, current_profit, max_profit)
+
+        return None
+
+    def compile_sell_rules(self) -> 'SellRules':
+        """
+        The custom_sell rules with the current parameter values, in the order they are checked.
+        Rebuilt by populate_sell_trend, which is where hyperopt has set the parameters of an epoch.
+        """
+        p = {name: parameter.value for name, parameter in self.enumerate_parameters('sell')}
+        pumps = {(length, level): p[f"sell_pump_threshold_{param}"]
+                 for length, params in self.sell_pump_levels.items() for level, param in enumerate(params, 1)}
 
+        families = [
+            (None, [p[f"sell_custom_profit_{n}"] for n in range(12)], [p[f"sell_custom_rsi_{n}"] for n in range(12)],
+             [f"signal_profit_{n}" for n in range(12)]),
             # check if close is under EMA200
-            elif (current_profit > self.sell_custom_under_profit_11.value) & (last_candle['rsi'] < self.sell_custom_under_rsi_11.value) & (last_candle['close'] < last_candle['ema_200']):
-                return 'signal_profit_u_11'
-            elif (self.sell_custom_under_profit_11.value > current_profit > self.sell_custom_under_profit_10.value) & (last_candle['rsi'] < self.sell_custom_under_rsi_10.value) & (last_candle['close'] < last_candle['ema_200']):
-                return 'signal_profit_u_10'
-            elif (self.sell_custom_under_profit_10.value > current_profit > self.sell_custom_under_profit_9.value) & (last_candle['rsi'] < self.sell_custom_under_rsi_9.value) & (last_candle['close'] < last_candle['ema_200']):
-                return 'signal_profit_u_9'
-            elif (self.sell_custom_under_profit_9.value > current_profit > self.sell_custom_under_profit_8.value) & (last_candle['rsi'] < self.sell_custom_under_rsi_8.value) & (last_candle['close'] < last_candle['ema_200']):
-                return 'signal_profit_u_8'
-            elif (self.sell_custom_under_profit_8.value > current_profit > self.sell_custom_under_profit_7.value) & (last_candle['rsi'] < self.sell_custom_under_rsi_7.value) & (last_candle['close'] < last_candle['ema_200']):
-                return 'signal_profit_u_7'
-            elif (self.sell_custom_under_profit_7.value > current_profit > self.sell_custom_under_profit_6.value) & (last_candle['rsi'] < self.sell_custom_under_rsi_6.value) & (last_candle['close'] < last_candle['ema_200']):
-                return 'signal_profit_u_6'
-            elif (self.sell_custom_under_profit_6.value > current_profit > self.sell_custom_under_profit_5.value) & (last_candle['rsi'] < self.sell_custom_under_rsi_5.value) & (last_candle['close'] < last_candle['ema_200']):
-                return 'signal_profit_u_5'
-            elif (self.sell_custom_under_profit_5.value > current_profit > self.sell_custom_under_profit_4.value) & (last_candle['rsi'] < self.sell_custom_under_rsi_4.value) & (last_candle['close'] < last_candle['ema_200']):
-                return 'signal_profit_u_4'
-            elif (self.sell_custom_under_profit_4.value > current_profit > self.sell_custom_under_profit_3.value) & (last_candle['rsi'] < self.sell_custom_under_rsi_3.value) & (last_candle['close'] < last_candle['ema_200']):
-                return 'signal_profit_u_3'
-            elif (self.sell_custom_under_profit_3.value > current_profit > self.sell_custom_under_profit_2.value) & (last_candle['rsi'] < self.sell_custom_under_rsi_2.value) & (last_candle['close'] < last_candle['ema_200']):
-                return 'signal_profit_u_2'
-            elif (self.sell_custom_under_profit_2.value > current_profit > self.sell_custom_under_profit_1.value) & (last_candle['rsi'] < self.sell_custom_under_rsi_1.value) & (last_candle['close'] < last_candle['ema_200']):
-                return 'signal_profit_u_1'
-            elif (self.sell_custom_under_profit_1.value > current_profit > self.sell_custom_under_profit_0.value) & (last_candle['rsi'] < self.sell_custom_under_rsi_0.value) & (last_candle['close'] < last_candle['ema_200']):
-                return 'signal_profit_u_0'
-
-            # check if the pair is "pumped"
-
-            elif (last_candle['sell_pump_48_1_1h']) & (current_profit > self.sell_custom_pump_profit_1_5.value) & (last_candle['rsi'] < self.sell_custom_pump_rsi_1_5.value):
-                return 'signal_profit_p_1_5'
-            elif (last_candle['sell_pump_48_1_1h']) & (self.sell_custom_pump_profit_1_5.value > current_profit > self.sell_custom_pump_profit_1_4.value) & (last_candle['rsi'] < self.sell_custom_pump_rsi_1_4.value):
-                return 'signal_profit_p_1_4'
-            elif (last_candle['sell_pump_48_1_1h']) & (self.sell_custom_pump_profit_1_4.value > current_profit > self.sell_custom_pump_profit_1_3.value) & (last_candle['rsi'] < self.sell_custom_pump_rsi_1_3.value):
-                return 'signal_profit_p_1_3'
-            elif (last_candle['sell_pump_48_1_1h']) & (self.sell_custom_pump_profit_1_3.value > current_profit > self.sell_custom_pump_profit_1_2.value) & (last_candle['rsi'] < self.sell_custom_pump_rsi_1_2.value):
-                return 'signal_profit_p_1_2'
-            elif (last_candle['sell_pump_48_1_1h']) & (self.sell_custom_pump_profit_1_2.value > current_profit > self.sell_custom_pump_profit_1_1.value) & (last_candle['rsi'] < self.sell_custom_pump_rsi_1_1.value):
-                return 'signal_profit_p_1_1'
-
-            elif (last_candle['sell_pump_36_1_1h']) & (current_profit > self.sell_custom_pump_profit_2_5.value) & (last_candle['rsi'] < self.sell_custom_pump_rsi_2_5.value):
-                return 'signal_profit_p_2_5'
-            elif (last_candle['sell_pump_36_1_1h']) & (self.sell_custom_pump_profit_2_5.value > current_profit > self.sell_custom_pump_profit_2_4.value) & (last_candle['rsi'] < self.sell_custom_pump_rsi_2_4.value):
-                return 'signal_profit_p_2_4'
-            elif (last_candle['sell_pump_36_1_1h']) & (self.sell_custom_pump_profit_2_4.value > current_profit > self.sell_custom_pump_profit_2_3.value) & (last_candle['rsi'] < self.sell_custom_pump_rsi_2_3.value):
-                return 'signal_profit_p_2_3'
-            elif (last_candle['sell_pump_36_1_1h']) & (self.sell_custom_pump_profit_2_3.value > current_profit > self.sell_custom_pump_profit_2_2.value) & (last_candle['rsi'] < self.sell_custom_pump_rsi_2_2.value):
-                return 'signal_profit_p_2_2'
-            elif (last_candle['sell_pump_36_1_1h']) & (self.sell_custom_pump_profit_2_2.value > current_profit > self.sell_custom_pump_profit_2_1.value) & (last_candle['rsi'] < self.sell_custom_pump_rsi_2_1.value):
-                return 'signal_profit_p_2_1'
-
-            elif (last_candle['sell_pump_24_1_1h']) & (current_profit > self.sell_custom_pump_profit_3_5.value) & (last_candle['rsi'] < self.sell_custom_pump_rsi_3_5.value):
-                return 'signal_profit_p_3_5'
-            elif (last_candle['sell_pump_24_1_1h']) & (self.sell_custom_pump_profit_3_5.value > current_profit > self.sell_custom_pump_profit_3_4.value) & (last_candle['rsi'] < self.sell_custom_pump_rsi_3_4.value):
-                return 'signal_profit_p_3_4'
-            elif (last_candle['sell_pump_24_1_1h']) & (self.sell_custom_pump_profit_3_4.value > current_profit > self.sell_custom_pump_profit_3_3.value) & (last_candle['rsi'] < self.sell_custom_pump_rsi_3_3.value):
-                return 'signal_profit_p_3_3'
-            elif (last_candle['sell_pump_24_1_1h']) & (self.sell_custom_pump_profit_3_3.value > current_profit > self.sell_custom_pump_profit_3_2.value) & (last_candle['rsi'] < self.sell_custom_pump_rsi_3_2.value):
-                return 'signal_profit_p_3_2'
-            elif (last_candle['sell_pump_24_1_1h']) & (self.sell_custom_pump_profit_3_2.value > current_profit > self.sell_custom_pump_profit_3_1.value) & (last_candle['rsi'] < self.sell_custom_pump_rsi_3_1.value):
-                return 'signal_profit_p_3_1'
-
-            elif (self.sell_custom_dec_profit_max_1.value > current_profit > self.sell_custom_dec_profit_min_1.value) & (last_candle['sma_200_dec']):
-                return 'signal_profit_d_1'
-            elif (self.sell_custom_dec_profit_max_2.value > current_profit > self.sell_custom_dec_profit_min_2.value) & (last_candle['close'] < last_candle['ema_100']):
-                return 'signal_profit_d_2'
+            ('under', [p[f"sell_custom_under_profit_{n}"] for n in range(12)], [p[f"sell_custom_under_rsi_{n}"] for n in range(12)],
+             [f"signal_profit_u_{n}" for n in range(12)]),
+        ]
+        # check if the pair is "pumped"
+        for family, length in ((1, 48), (2, 36), (3, 24)):
+            families.append(((length, 1), [p[f"sell_custom_pump_profit_{family}_{n}"] for n in range(1, 6)],
+                             [p[f"sell_custom_pump_rsi_{family}_{n}"] for n in range(1, 6)],
+                             [f"signal_profit_p_{family}_{n}" for n in range(1, 6)]))
+
+        rules = [
+            ('signal_profit_d_1', p['sell_custom_dec_profit_min_1'], p['sell_custom_dec_profit_max_1'],
+             lambda candle, shared, profit, max_profit: candle['sma_200_dec']),
+            ('signal_profit_d_2', p['sell_custom_dec_profit_min_2'], p['sell_custom_dec_profit_max_2'],
+             lambda candle, shared, profit, max_profit: candle['close'] < candle['ema_100']),
 
             # Trailing
-            elif (self.sell_trail_profit_max_1.value > current_profit > self.sell_trail_profit_min_1.value) & (self.sell_trail_rsi_min_1.value < last_candle['rsi'] < self.sell_trail_rsi_max_1.value) & (max_profit > (current_profit + self.sell_trail_down_1.value)):
-                return 'signal_profit_t_1'
-            elif (self.sell_trail_profit_max_2.value > current_profit > self.sell_trail_profit_min_2.value) & (self.sell_trail_rsi_min_2.value < last_candle['rsi'] < self.sell_trail_rsi_max_2.value) & (max_profit > (current_profit + self.sell_trail_down_2.value)):
-                return 'signal_profit_t_2'
-            elif (self.sell_trail_profit_max_3.value > current_profit > self.sell_trail_profit_min_3.value) & (max_profit > (current_profit + self.sell_trail_down_3.value)) & (last_candle['sma_200_dec_1h']):
-                return 'signal_profit_t_3'
-
-            elif (last_candle['close'] < last_candle['ema_200']) & (current_profit > self.sell_trail_profit_min_3.value) & (current_profit < self.sell_trail_profit_max_3.value) & (max_profit > (current_profit + self.sell_trail_down_3.value)):
-                return 'signal_profit_u_t_1'
-
-            elif (current_profit > 0.0) & (last_candle['close'] < last_candle['ema_200']) & (((last_candle['ema_200'] - last_candle['close']) / last_candle['close']) < self.sell_custom_profit_under_rel_1.value) & (last_candle['rsi'] > last_candle['rsi_1h'] + self.sell_custom_profit_under_rsi_diff_1.value):
-                return 'signal_profit_u_e_1'
-
-            elif (current_profit < -0.0) & (last_candle['close'] < last_candle['ema_200']) & (((last_candle['ema_200'] - last_candle['close']) / last_candle['close']) < self.sell_custom_stoploss_under_rel_1.value) & (last_candle['rsi'] > last_candle['rsi_1h'] + self.sell_custom_stoploss_under_rsi_diff_1.value):
-                return 'signal_stoploss_u_1'
-
-            elif (self.sell_custom_pump_dec_profit_max_1.value > current_profit > self.sell_custom_pump_dec_profit_min_1.value) & (last_candle['sell_pump_48_1_1h']) & (last_candle['sma_200_dec']) & (last_candle['close'] < last_candle['ema_200']):
-                return 'signal_profit_p_d_1'
-            elif (self.sell_custom_pump_dec_profit_max_2.value > current_profit > self.sell_custom_pump_dec_profit_min_2.value) & (last_candle['sell_pump_48_2_1h']) & (last_candle['sma_200_dec']) & (last_candle['close'] < last_candle['ema_200']):
-                return 'signal_profit_p_d_2'
-            elif (self.sell_custom_pump_dec_profit_max_3.value > current_profit > self.sell_custom_pump_dec_profit_min_3.value) & (last_candle['sell_pump_48_3_1h']) & (last_candle['sma_200_dec']) & (last_candle['close'] < last_candle['ema_200']):
-                return 'signal_profit_p_d_3'
-            elif (self.sell_custom_pump_dec_profit_max_4.value > current_profit > self.sell_custom_pump_dec_profit_min_4.value) & (last_candle['sma_200_dec']) & (last_candle['sell_pump_24_2_1h']):
-                return 'signal_profit_p_d_4'
+            ('signal_profit_t_1', p['sell_trail_profit_min_1'], p['sell_trail_profit_max_1'],
+             lambda candle, shared, profit, max_profit: (p['sell_trail_rsi_min_1'] < candle['rsi']) & (candle['rsi'] < p['sell_trail_rsi_max_1'])
+             & (max_profit > (profit + p['sell_trail_down_1']))),
+            ('signal_profit_t_2', p['sell_trail_profit_min_2'], p['sell_trail_profit_max_2'],
+             lambda candle, shared, profit, max_profit: (p['sell_trail_rsi_min_2'] < candle['rsi']) & (candle['rsi'] < p['sell_trail_rsi_max_2'])
+             & (max_profit > (profit + p['sell_trail_down_2']))),
+            ('signal_profit_t_3', p['sell_trail_profit_min_3'], p['sell_trail_profit_max_3'],
+             lambda candle, shared, profit, max_profit: (max_profit > (profit + p['sell_trail_down_3'])) & candle['sma_200_dec_1h']),
+
+            ('signal_profit_u_t_1', p['sell_trail_profit_min_3'], p['sell_trail_profit_max_3'],
+             lambda candle, shared, profit, max_profit: shared['under'] & (max_profit > (profit + p['sell_trail_down_3']))),
+
+            ('signal_profit_u_e_1', 0.0, np.inf,
+             lambda candle, shared, profit, max_profit: shared['under'] & (shared['ema_200_rel'] < p['sell_custom_profit_under_rel_1'])
+             & (candle['rsi'] > candle['rsi_1h'] + p['sell_custom_profit_under_rsi_diff_1'])),
+
+            ('signal_stoploss_u_1', -np.inf, -0.0,
+             lambda candle, shared, profit, max_profit: shared['under'] & (shared['ema_200_rel'] < p['sell_custom_stoploss_under_rel_1'])
+             & (candle['rsi'] > candle['rsi_1h'] + p['sell_custom_stoploss_under_rsi_diff_1'])),
+
+            ('signal_profit_p_d_1', p['sell_custom_pump_dec_profit_min_1'], p['sell_custom_pump_dec_profit_max_1'],
+             lambda candle, shared, profit, max_profit: shared[(48, 1)] & candle['sma_200_dec'] & shared['under']),
+            ('signal_profit_p_d_2', p['sell_custom_pump_dec_profit_min_2'], p['sell_custom_pump_dec_profit_max_2'],
+             lambda candle, shared, profit, max_profit: shared[(48, 2)] & candle['sma_200_dec'] & shared['under']),
+            ('signal_profit_p_d_3', p['sell_custom_pump_dec_profit_min_3'], p['sell_custom_pump_dec_profit_max_3'],
+             lambda candle, shared, profit, max_profit: shared[(48, 3)] & candle['sma_200_dec'] & shared['under']),
+            ('signal_profit_p_d_4', p['sell_custom_pump_dec_profit_min_4'], p['sell_custom_pump_dec_profit_max_4'],
+             lambda candle, shared, profit, max_profit: candle['sma_200_dec'] & shared[(24, 2)]),
 
             # Pumped 48h 1, under EMA200
-            elif (self.sell_custom_pump_under_profit_max_1.value > current_profit > self.sell_custom_pump_under_profit_min_1.value) & (last_candle['sell_pump_48_1_1h']) & (last_candle['close'] < last_candle['ema_200']):
-                return 'signal_profit_p_u_1'
+            ('signal_profit_p_u_1', p['sell_custom_pump_under_profit_min_1'], p['sell_custom_pump_under_profit_max_1'],
+             lambda candle, shared, profit, max_profit: shared[(48, 1)] & shared['under']),
 
             # Pumped 36h 2, trail 1
-            elif (last_candle['sell_pump_36_2_1h']) & (self.sell_custom_pump_trail_profit_max_1.value > current_profit > self.sell_custom_pump_trail_profit_min_1.value) & (self.sell_custom_pump_trail_rsi_min_1.value < last_candle['rsi'] < self.sell_custom_pump_trail_rsi_max_1.value) & (max_profit > (current_profit + self.sell_custom_pump_trail_down_1.value)):
-                return 'signal_profit_p_t_1'
-
-            elif (max_profit < self.sell_custom_stoploss_pump_max_profit_1.value) & (self.sell_custom_stoploss_pump_min_1.value < current_profit < self.sell_custom_stoploss_pump_max_1.value) & (last_candle['sell_pump_48_1_1h']) & (last_candle['sma_200_dec']) & (last_candle['close'] < (last_candle['ema_200'] * self.sell_custom_stoploss_pump_ma_offset_1.value)):
-                return 'signal_stoploss_p_1'
-
-            elif (max_profit < self.sell_custom_stoploss_pump_max_profit_2.value) & (current_profit < self.sell_custom_stoploss_pump_loss_2.value) & (last_candle['sell_pump_48_1_1h']) & (last_candle['sma_200_dec_1h']) & (last_candle['close'] < (last_candle['ema_200'] * self.sell_custom_stoploss_pump_ma_offset_2.value)):
-                return 'signal_stoploss_p_2'
-
-            elif (max_profit < self.sell_custom_stoploss_pump_max_profit_3.value) & (current_profit < self.sell_custom_stoploss_pump_loss_3.value) & (last_candle['sell_pump_36_3_1h']) & (last_candle['close'] < (last_candle['ema_200'] * self.sell_custom_stoploss_pump_ma_offset_3.value)):
-                return 'signal_stoploss_p_3'
-
-        return None
+            ('signal_profit_p_t_1', p['sell_custom_pump_trail_profit_min_1'], p['sell_custom_pump_trail_profit_max_1'],
+             lambda candle, shared, profit, max_profit: shared[(36, 2)]
+             & (p['sell_custom_pump_trail_rsi_min_1'] < candle['rsi']) & (candle['rsi'] < p['sell_custom_pump_trail_rsi_max_1'])
+             & (max_profit > (profit + p['sell_custom_pump_trail_down_1']))),
+
+            ('signal_stoploss_p_1', p['sell_custom_stoploss_pump_min_1'], p['sell_custom_stoploss_pump_max_1'],
+             lambda candle, shared, profit, max_profit: (max_profit < p['sell_custom_stoploss_pump_max_profit_1']) & shared[(48, 1)]
+             & candle['sma_200_dec'] & (candle['close'] < (candle['ema_200'] * p['sell_custom_stoploss_pump_ma_offset_1']))),
+
+            ('signal_stoploss_p_2', -np.inf, p['sell_custom_stoploss_pump_loss_2'],
+             lambda candle, shared, profit, max_profit: (max_profit < p['sell_custom_stoploss_pump_max_profit_2']) & shared[(48, 1)]
+             & candle['sma_200_dec_1h'] & (candle['close'] < (candle['ema_200'] * p['sell_custom_stoploss_pump_ma_offset_2']))),
+
+            ('signal_stoploss_p_3', -np.inf, p['sell_custom_stoploss_pump_loss_3'],
+             lambda candle, shared, profit, max_profit: (max_profit < p['sell_custom_stoploss_pump_max_profit_3']) & shared[(36, 3)]
+             & (candle['close'] < (candle['ema_200'] * p['sell_custom_stoploss_pump_ma_offset_3']))),
+        ]
+        return SellRules(families, rules, pumps)
+
+    def backtest_sell_reason(self, pair: str, trade: 'Trade', current_time: datetime, current_profit: float,
+                             max_profit: float) -> tuple:
+        """
+        The custom_sell reason of a trade at a candle, backtesting and hyperopt only. The reasons of the next
+        candles of the trade are evaluated at once and reused by the calls that follow, 32 candles for a new
+        trade and twice as many for every following window, up to backtest_sell_window.
+        :param pair: str Pair
+        :param trade: Trade Open trade
+        :param current_time: datetime Date of the candle
+        :param current_profit: float Profit ratio of the trade at the candle
+        :param max_profit: float Highest profit ratio of the trade
+        :return: tuple (found, reason), not found if the candle or the profits are not the precomputed ones
+        """
+        candles = self.sell_candles[pair]
+        row = candles.row(current_time)
+        if row is None:
+            self.sell_window_fallback(pair, current_time, "no analyzed candle at that date")
+            return False, None
+        # custom_sell sees the candle before
+        if row == 0:
+            return False, None
+
+        window = self.sell_windows.get(pair)
+        if window is None or window['trade'] is not trade:
+            window = {'trade': trade, 'start': row, 'length': 32, 'reasons': ()}
+        if not window['start'] <= row < window['start'] + len(window['reasons']):
+            length = window['length'] if not len(window['reasons']) else min(2 * window['length'], self.backtest_sell_window)
+            window = candles.sell_reasons(self.sell_rules, trade, row, length)
+            window.update(trade=trade, length=length)
+            self.sell_windows[pair] = window
+
+        i = row - window['start']
+        if window['profits'][i] != current_profit or window['max_profits'][i] != max_profit:
+            self.sell_window_fallback(pair, current_time, f"profit {current_profit} / max profit {max_profit} instead of the "
+                                                          f"precomputed {window['profits'][i]} / {window['max_profits'][i]}")
+            return False, None
+        return True, window['reasons'][i]
+
+    def sell_window_fallback(self, pair: str, current_time: datetime, cause: str):
+        """
+        Count a custom_sell call the precomputed reasons could not answer, the first one is logged
+        """
+        if not self.sell_window_fallbacks:
+            logger.warning(f"custom_sell of {pair} at {current_time} is evaluated on its own, {cause}. "
+                           f"Every such call is counted in sell_window_fallbacks.")
+        self.sell_window_fallbacks += 1
 
     def informative_pairs(self):
         pairs = self.dp.current_whitelist()
@@ -1694,30 +1775,30 @@ class CryptoFrogNFIHO1A(IStrategy):
 
     ## smoothed Heiken Ashi
     def HA(self, dataframe, smoothing=None):
-        df = dataframe.copy()
-
-        df['HA_Close']=(df['open'] + df['high'] + df['low'] + df['close'])/4
-
-        df.reset_index(inplace=True)
+        ha_close = (dataframe['open'].values + dataframe['high'].values + dataframe['low'].values + dataframe['close'].values) / 4
 
-        ha_open = [ (df['open'][0] + df['close'][0]) / 2 ]
-        [ ha_open.append((ha_open[i] + df['HA_Close'].values[i]) / 2) for i in range(0, len(df)-1) ]
-        df['HA_Open'] = ha_open
+        # ha_open[i] = (ha_open[i-1] + ha_close[i-1]) / 2 is a first order IIR filter, so solve it in one pass
+        ha_open = np.empty_like(ha_close)
+        if len(ha_close) > 0:
+            ha_open[0] = (dataframe['open'].values[0] + dataframe['close'].values[0]) / 2
+            ha_open[1:] = iir_filter(ha_close[:-1] / 2, 0.5, ha_open[0])
 
-        df.set_index('index', inplace=True)
-
-        df['HA_High']=df[['HA_Open','HA_Close','high']].max(axis=1)
-        df['HA_Low']=df[['HA_Open','HA_Close','low']].min(axis=1)
+        dataframe['HA_Close'] = ha_close
+        dataframe['HA_Open'] = ha_open
+        dataframe['HA_High'] = np.fmax(np.fmax(ha_open, ha_close), dataframe['high'].values)
+        dataframe['HA_Low'] = np.fmin(np.fmin(ha_open, ha_close), dataframe['low'].values)
 
         if smoothing is not None:
             sml = abs(int(smoothing))
             if sml > 0:
-                df['Smooth_HA_O']=ta.EMA(df['HA_Open'], sml)
-                df['Smooth_HA_C']=ta.EMA(df['HA_Close'], sml)
-                df['Smooth_HA_H']=ta.EMA(df['HA_High'], sml)
-                df['Smooth_HA_L']=ta.EMA(df['HA_Low'], sml)
-                
-        return df
+                # smooth all four series in a single batched EMA
+                smooth = EMA_batch(dataframe[['HA_Open', 'HA_Close', 'HA_High', 'HA_Low']].values, sml)
+                dataframe['Smooth_HA_O'] = smooth[:, 0]
+                dataframe['Smooth_HA_C'] = smooth[:, 1]
+                dataframe['Smooth_HA_H'] = smooth[:, 2]
+                dataframe['Smooth_HA_L'] = smooth[:, 3]
+
+        return dataframe
     
     def hansen_HA(self, informative_df, period=6):
         dataframe = informative_df.copy()
@@ -1733,17 +1814,13 @@ class CryptoFrogNFIHO1A(IStrategy):
         return {'emac': dataframe['emac'], 'emao': dataframe['emao']}
     
     ## detect BB width expansion to indicate possible volatility
-    def bbw_expansion(self, bbw_rolling, mult=1.1):
-        bbw = list(bbw_rolling)
+    def bbw_expansion(self, bbw, window=4, mult=1.1):
+        # max of the previous window-1 values (floored at 0) vs. the current value
+        prev_max = bbw.shift(1).rolling(window - 1).max() if window > 1 else bbw * 0.0
+        expansion = np.where(bbw > (prev_max.clip(lower=0.0) * mult), 1.0, 0.0)
 
-        m = 0.0
-        for i in range(len(bbw)-1):
-            if bbw[i] > m:
-                m = bbw[i]
-
-        if (bbw[-1] > (m * mult)):
-            return 1
-        return 0
+        # keep the NaN warm-up of rolling(window).apply
+        return Series(expansion, index=bbw.index).where(prev_max.notna() & bbw.notna())
 
     ## do_indicator style a la Obelisk strategies
     def do_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
@@ -1772,7 +1849,7 @@ class CryptoFrogNFIHO1A(IStrategy):
         
         ## confirm wideboi variance signal with bbw expansion
         dataframe["bb_width"] = ((dataframe["bb_upperband"] - dataframe["bb_lowerband"]) / dataframe["bb_middleband"])
-        dataframe['bbw_expansion'] = dataframe['bb_width'].rolling(window=4).apply(self.bbw_expansion)
+        dataframe['bbw_expansion'] = self.bbw_expansion(dataframe['bb_width'], window=4, mult=1.1)
 
         # confirm entry and exit on smoothed HA
         dataframe = self.HA(dataframe, 4)
@@ -1843,74 +1920,71 @@ class CryptoFrogNFIHO1A(IStrategy):
         # Chaikin Money Flow
         informative_1h['cmf'] = chaikin_money_flow(informative_1h, 20)
 
-        # Pump protections
-        informative_1h['safe_pump_24_normal'] = self.safe_pump(informative_1h, 24, self.buy_pump_threshold_1.value, self.buy_pump_pull_threshold_1.value)
-        informative_1h['safe_pump_36_normal'] = self.safe_pump(informative_1h, 36, self.buy_pump_threshold_2.value, self.buy_pump_pull_threshold_2.value)
-        informative_1h['safe_pump_48_normal'] = self.safe_pump(informative_1h, 48, self.buy_pump_threshold_3.value, self.buy_pump_pull_threshold_3.value)
-
-        informative_1h['safe_pump_24_strict'] = self.safe_pump(informative_1h, 24, self.buy_pump_threshold_4.value, self.buy_pump_pull_threshold_4.value)
-        informative_1h['safe_pump_36_strict'] = self.safe_pump(informative_1h, 36, self.buy_pump_threshold_5.value, self.buy_pump_pull_threshold_5.value)
-        informative_1h['safe_pump_48_strict'] = self.safe_pump(informative_1h, 48, self.buy_pump_threshold_6.value, self.buy_pump_pull_threshold_6.value)
-
-        informative_1h['safe_pump_24_loose'] = self.safe_pump(informative_1h, 24, self.buy_pump_threshold_7.value, self.buy_pump_pull_threshold_7.value)
-        informative_1h['safe_pump_36_loose'] = self.safe_pump(informative_1h, 36, self.buy_pump_threshold_8.value, self.buy_pump_pull_threshold_8.value)
-        informative_1h['safe_pump_48_loose'] = self.safe_pump(informative_1h, 48, self.buy_pump_threshold_9.value, self.buy_pump_pull_threshold_9.value)
+        # Pump protections, all of them share the same rolling max/min
+        rolling = RollingCache(informative_1h)
+        informative_1h['safe_pump_24_normal'] = self.safe_pump(informative_1h, 24, self.buy_pump_threshold_1.value, self.buy_pump_pull_threshold_1.value, rolling)
+        informative_1h['safe_pump_36_normal'] = self.safe_pump(informative_1h, 36, self.buy_pump_threshold_2.value, self.buy_pump_pull_threshold_2.value, rolling)
+        informative_1h['safe_pump_48_normal'] = self.safe_pump(informative_1h, 48, self.buy_pump_threshold_3.value, self.buy_pump_pull_threshold_3.value, rolling)
 
-        informative_1h['sell_pump_48_1'] = (((informative_1h['high'].rolling(48).max() - informative_1h['low'].rolling(48).min()) / informative_1h['low'].rolling(48).min()) > self.sell_pump_threshold_1.value)
-        informative_1h['sell_pump_48_2'] = (((informative_1h['high'].rolling(48).max() - informative_1h['low'].rolling(48).min()) / informative_1h['low'].rolling(48).min()) > self.sell_pump_threshold_2.value)
-        informative_1h['sell_pump_48_3'] = (((informative_1h['high'].rolling(48).max() - informative_1h['low'].rolling(48).min()) / informative_1h['low'].rolling(48).min()) > self.sell_pump_threshold_3.value)
+        informative_1h['safe_pump_24_strict'] = self.safe_pump(informative_1h, 24, self.buy_pump_threshold_4.value, self.buy_pump_pull_threshold_4.value, rolling)
+        informative_1h['safe_pump_36_strict'] = self.safe_pump(informative_1h, 36, self.buy_pump_threshold_5.value, self.buy_pump_pull_threshold_5.value, rolling)
+        informative_1h['safe_pump_48_strict'] = self.safe_pump(informative_1h, 48, self.buy_pump_threshold_6.value, self.buy_pump_pull_threshold_6.value, rolling)
 
-        informative_1h['sell_pump_36_1'] = (((informative_1h['high'].rolling(36).max() - informative_1h['low'].rolling(36).min()) / informative_1h['low'].rolling(36).min()) > self.sell_pump_threshold_4.value)
-        informative_1h['sell_pump_36_2'] = (((informative_1h['high'].rolling(36).max() - informative_1h['low'].rolling(36).min()) / informative_1h['low'].rolling(36).min()) > self.sell_pump_threshold_5.value)
-        informative_1h['sell_pump_36_3'] = (((informative_1h['high'].rolling(36).max() - informative_1h['low'].rolling(36).min()) / informative_1h['low'].rolling(36).min()) > self.sell_pump_threshold_6.value)
+        informative_1h['safe_pump_24_loose'] = self.safe_pump(informative_1h, 24, self.buy_pump_threshold_7.value, self.buy_pump_pull_threshold_7.value, rolling)
+        informative_1h['safe_pump_36_loose'] = self.safe_pump(informative_1h, 36, self.buy_pump_threshold_8.value, self.buy_pump_pull_threshold_8.value, rolling)
+        informative_1h['safe_pump_48_loose'] = self.safe_pump(informative_1h, 48, self.buy_pump_threshold_9.value, self.buy_pump_pull_threshold_9.value, rolling)
 
-        informative_1h['sell_pump_24_1'] = (((informative_1h['high'].rolling(24).max() - informative_1h['low'].rolling(24).min()) / informative_1h['low'].rolling(24).min()) > self.sell_pump_threshold_7.value)
-        informative_1h['sell_pump_24_2'] = (((informative_1h['high'].rolling(24).max() - informative_1h['low'].rolling(24).min()) / informative_1h['low'].rolling(24).min()) > self.sell_pump_threshold_8.value)
-        informative_1h['sell_pump_24_3'] = (((informative_1h['high'].rolling(24).max() - informative_1h['low'].rolling(24).min()) / informative_1h['low'].rolling(24).min()) > self.sell_pump_threshold_9.value)
+        # Sell pump protections, one range ratio per window and all of its thresholds
+        for column, values in self.sell_pump_bank(informative_1h, rolling).items():
+            informative_1h[column] = values
 
         return informative_1h
 
-    def range_percent_change(self, dataframe: DataFrame, length: int) -> float:
+    def range_percent_change(self, dataframe: DataFrame, length: int, rolling: 'RollingCache' = None) -> float:
         """
         Rolling Percentage Change Maximum across interval.
 
         :param dataframe: DataFrame The original OHLC dataframe
         :param length: int The length to look back
+        :param rolling: RollingCache Shared rolling statistics of the dataframe (optional)
         """
-        df = dataframe.copy()
-        return ((df['open'].rolling(length).max() - df['close'].rolling(length).min()) / df['close'].rolling(length).min())
+        rolling = rolling or RollingCache(dataframe)
+        return ((rolling.get('open', length, 'max') - rolling.get('close', length, 'min')) / rolling.get('close', length, 'min'))
 
-    def range_maxgap(self, dataframe: DataFrame, length: int) -> float:
+    def range_maxgap(self, dataframe: DataFrame, length: int, rolling: 'RollingCache' = None) -> float:
         """
         Maximum Price Gap across interval.
 
         :param dataframe: DataFrame The original OHLC dataframe
         :param length: int The length to look back
+        :param rolling: RollingCache Shared rolling statistics of the dataframe (optional)
         """
-        df = dataframe.copy()
-        return (df['open'].rolling(length).max() - df['close'].rolling(length).min())
+        rolling = rolling or RollingCache(dataframe)
+        return (rolling.get('open', length, 'max') - rolling.get('close', length, 'min'))
 
-    def range_maxgap_adjusted(self, dataframe: DataFrame, length: int, adjustment: float) -> float:
+    def range_maxgap_adjusted(self, dataframe: DataFrame, length: int, adjustment: float, rolling: 'RollingCache' = None) -> float:
         """
         Maximum Price Gap across interval adjusted.
 
         :param dataframe: DataFrame The original OHLC dataframe
         :param length: int The length to look back
         :param adjustment: int The adjustment to be applied
+        :param rolling: RollingCache Shared rolling statistics of the dataframe (optional)
         """
-        return (self.range_maxgap(dataframe,length) / adjustment)
+        return (self.range_maxgap(dataframe, length, rolling) / adjustment)
 
-    def range_height(self, dataframe: DataFrame, length: int) -> float:
+    def range_height(self, dataframe: DataFrame, length: int, rolling: 'RollingCache' = None) -> float:
         """
         Current close distance to range bottom.
 
         :param dataframe: DataFrame The original OHLC dataframe
         :param length: int The length to look back
+        :param rolling: RollingCache Shared rolling statistics of the dataframe (optional)
         """
-        df = dataframe.copy()
-        return (df['close'] - df['close'].rolling(length).min())
+        rolling = rolling or RollingCache(dataframe)
+        return (dataframe['close'] - rolling.get('close', length, 'min'))
 
-    def safe_pump(self, dataframe: DataFrame, length: int, thresh: float, pull_thresh: float) -> bool:
+    def safe_pump(self, dataframe: DataFrame, length: int, thresh: float, pull_thresh: float, rolling: 'RollingCache' = None) -> bool:
         """
         Determine if entry after a pump is safe.
 
@@ -1918,9 +1992,54 @@ class CryptoFrogNFIHO1A(IStrategy):
         :param length: int The length to look back
         :param thresh: int Maximum percentage change threshold
         :param pull_thresh: int Pullback from interval maximum threshold
+        :param rolling: RollingCache Shared rolling statistics of the dataframe (optional)
+        """
+        rolling = rolling or RollingCache(dataframe)
+        return (self.range_percent_change(dataframe, length, rolling) < thresh) | (self.range_maxgap_adjusted(dataframe, length, pull_thresh, rolling) > self.range_height(dataframe, length, rolling))
+
+    def pump_ratio(self, dataframe: DataFrame, length: int, rolling: 'RollingCache' = None) -> Series:
+        """
+        Height of the interval range relative to its bottom.
+
+        :param dataframe: DataFrame The original OHLC dataframe
+        :param length: int The length to look back
+        :param rolling: RollingCache Shared rolling statistics of the dataframe (optional)
         """
-        df = dataframe.copy()
-        return (self.range_percent_change(df, length) < thresh) | (self.range_maxgap_adjusted(df, length, pull_thresh) > self.range_height(df, length))
+        rolling = rolling or RollingCache(dataframe)
+        return ((rolling.get('high', length, 'max') - rolling.get('low', length, 'min')) / rolling.get('low', length, 'min'))
+
+    def sell_pump_bank(self, dataframe: DataFrame, rolling: 'RollingCache' = None) -> dict:
+        """
+        Sell pump detectors: one range ratio per window, compared against all the thresholds of that window at once.
+        Returns the 'pump_ratio_{length}' ratios and the 'sell_pump_{length}_{level}' flags.
+
+        :param dataframe: DataFrame The original OHLC dataframe
+        :param rolling: RollingCache Shared rolling statistics of the dataframe (optional)
+        """
+        bank = {}
+        for length, params in self.sell_pump_levels.items():
+            ratio = self.pump_ratio(dataframe, length, rolling)
+            thresholds = np.array([getattr(self, f"sell_pump_threshold_{param}").value for param in params])
+            flags = ratio.values[:, None] > thresholds
+
+            bank[f"pump_ratio_{length}"] = ratio
+            for level in range(len(params)):
+                bank[f"sell_pump_{length}_{level + 1}"] = flags[:, level]
+
+        return bank
+
+    def safe_dips_bank(self, dataframe: DataFrame, profiles: dict) -> dict:
+        """
+        Dip protections. The drawdown ratios are computed once, every profile is a row of
+        thresholds and all profiles are checked against them in one comparison.
+
+        :param dataframe: DataFrame The original OHLC dataframe
+        :param profiles: dict Column name -> thresholds, one per window of dip_ratios
+        """
+        ratios = dip_ratios(dataframe)
+        thresholds = np.array(list(profiles.values()), dtype=np.float64)
+        safe = (ratios[:, None, :] < thresholds[None, :, :]).all(axis=2)
+        return {column: safe[:, i] for i, column in enumerate(profiles)}
 
     def normal_tf_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         # BB 40
@@ -1965,20 +2084,13 @@ class CryptoFrogNFIHO1A(IStrategy):
         dataframe['chop']= qtpylib.chopiness(dataframe, 14)
 
         # Dip protection
-        dataframe['safe_dips_normal'] = ((((dataframe['open'] - dataframe['close']) / dataframe['close']) < self.buy_dip_threshold_1.value) &
-                                  (((dataframe['open'].rolling(2).max() - dataframe['close']) / dataframe['close']) < self.buy_dip_threshold_2.value) &
-                                  (((dataframe['open'].rolling(12).max() - dataframe['close']) / dataframe['close']) < self.buy_dip_threshold_3.value) &
-                                  (((dataframe['open'].rolling(144).max() - dataframe['close']) / dataframe['close']) < self.buy_dip_threshold_4.value))
-
-        dataframe['safe_dips_strict'] = ((((dataframe['open'] - dataframe['close']) / dataframe['close']) < self.buy_dip_threshold_5.value) &
-                                  (((dataframe['open'].rolling(2).max() - dataframe['close']) / dataframe['close']) < self.buy_dip_threshold_6.value) &
-                                  (((dataframe['open'].rolling(12).max() - dataframe['close']) / dataframe['close']) < self.buy_dip_threshold_7.value) &
-                                  (((dataframe['open'].rolling(144).max() - dataframe['close']) / dataframe['close']) < self.buy_dip_threshold_8.value))
-
-        dataframe['safe_dips_loose'] = ((((dataframe['open'] - dataframe['close']) / dataframe['close']) < self.buy_dip_threshold_9.value) &
-                                  (((dataframe['open'].rolling(2).max() - dataframe['close']) / dataframe['close']) < self.buy_dip_threshold_10.value) &
-                                  (((dataframe['open'].rolling(12).max() - dataframe['close']) / dataframe['close']) < self.buy_dip_threshold_11.value) &
-                                  (((dataframe['open'].rolling(144).max() - dataframe['close']) / dataframe['close']) < self.buy_dip_threshold_12.value))
+        dips = self.safe_dips_bank(dataframe, {
+            'safe_dips_normal': (self.buy_dip_threshold_1.value, self.buy_dip_threshold_2.value, self.buy_dip_threshold_3.value, self.buy_dip_threshold_4.value),
+            'safe_dips_strict': (self.buy_dip_threshold_5.value, self.buy_dip_threshold_6.value, self.buy_dip_threshold_7.value, self.buy_dip_threshold_8.value),
+            'safe_dips_loose': (self.buy_dip_threshold_9.value, self.buy_dip_threshold_10.value, self.buy_dip_threshold_11.value, self.buy_dip_threshold_12.value),
+        })
+        for column, values in dips.items():
+            dataframe[column] = values
 
         # Volume
         dataframe['volume_mean_4'] = dataframe['volume'].rolling(4).mean().shift(1)
@@ -1987,10 +2099,150 @@ class CryptoFrogNFIHO1A(IStrategy):
         return dataframe
 
     ## stolen from Obelisk's Ichi strat code and backtest blog post, and Solipsis4
-    def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
-        # The indicators for the 1h informative timeframe
+    def project_informative(self, dataframe: DataFrame, informative: DataFrame, metadata: dict, columns: dict = None) -> DataFrame:
+        """
+        Same columns as merge_informative_pair(ffill=True), without merging and copying the whole dataframe.
+        In live runs the row mapping is kept per pair and extended as candles arrive.
+
+        :param dataframe: DataFrame of the strategy timeframe
+        :param informative: DataFrame of the informative timeframe
+        :param metadata: dict Metadata of the pair
+        :param columns: dict Informative column -> name in the dataframe, by default all of them with the timeframe suffix
+        """
+        if columns is None:
+            columns = {column: f"{column}_{self.informative_timeframe}" for column in informative.columns}
+
+        projection = InformativeProjection(timeframe_to_minutes(self.timeframe), timeframe_to_minutes(self.informative_timeframe))
+        if self.config['runmode'].value in ('live', 'dry_run'):
+            projection = self.informative_projections.setdefault(metadata['pair'], projection)
+
+        return projection.project(dataframe, informative, columns)
+
+    def merge_informative_1h(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        """
+        Both indicator sets of the 1h timeframe, computed on a single fetch and projected on one row mapping.
+        The final column names are chosen up front: the 1h candle and the NFI indicators get the 1h
+        suffix, the Frog indicators keep their own names (emac and emao excepted).
+        """
         informative_1h = self.informative_1h_indicators(dataframe, metadata)
+        candle = ['date', 'open', 'high', 'low', 'close', 'volume']
+        frog_1h = self.do_indicators(informative_1h[candle].copy(), metadata)
 
+        dataframe = self.project_informative(dataframe, informative_1h, metadata)
+        plain = {column: (f"{column}_{self.informative_timeframe}" if column in ('emac', 'emao') else column) for column in frog_1h.columns if not column in candle}
+
+        return self.project_informative(dataframe, frog_1h, metadata, plain)
+
+    def store_trade_indicators(self, dataframe: DataFrame, metadata: dict):
+        """
+        The indicators custom_stoploss and the dynamic ROI look up by candle date in backtesting and hyperopt
+        """
+        self.custom_trade_info[metadata['pair']]['indicators'] = self.build_trade_indicators(dataframe)
+
+    def trade_indicator(self, pair: str, column: str, time: datetime):
+        """
+        Value of an indicator at a candle, backtesting and hyperopt only
+        :param pair: str Pair
+        :param column: str One of trade_indicator_columns
+        :param time: datetime Date of the candle
+        :return: The value at that candle
+        """
+        return self.custom_trade_info[pair]['indicators'].get(column, time)
+
+    def build_trade_indicators(self, dataframe: DataFrame) -> 'TradeIndicators':
+        """
+        The per candle indicators of a pair for backtesting and hyperopt, with the dynamic ROI trend of
+        every droi_trend_type evaluated up front as in-trend-<type>
+        :param dataframe: DataFrame Populated frame of the pair
+        :return: TradeIndicators
+        """
+        indicators = TradeIndicators(dataframe, self.trade_indicator_columns, timeframe_to_minutes(self.timeframe))
+        ssl_dir = indicators.columns['ssl-dir']
+        trends = {
+            'rmi': indicators.columns['rmi-up-trend'] == 1,
+            'ssl': ssl_dir == 1 if ssl_dir.dtype.kind in 'iu' else ssl_dir == 'up',
+            'candle': indicators.columns['candle-up-trend'] == 1,
+        }
+        trends['any'] = trends['rmi'] | trends['ssl'] | trends['candle']
+        for trend, values in trends.items():
+            indicators.add(f"in-trend-{trend}", values)
+        return indicators
+
+    def sroc_bail(self, pair: str, time: datetime) -> bool:
+        """
+        Whether sroc is at or below cstp_bail_roc at a candle, backtesting and hyperopt only.
+        The comparison runs over all candles of the pair once per value of cstp_bail_roc.
+        :param pair: str Pair
+        :param time: datetime Date of the candle
+        :return: bool
+        """
+        indicators = self.custom_trade_info[pair]['indicators']
+        bail_roc = self.cstp_bail_roc.value
+        if indicators.keys.get('sroc-bail') != bail_roc:
+            indicators.add('sroc-bail', (indicators.columns['sroc'] / 100) <= bail_roc, bail_roc)
+        return indicators.get('sroc-bail', time)
+
+    def ohlcvdata_to_dataframe(self, data: dict) -> dict:
+        """
+        Populate the indicators of all pairs, in backtesting and hyperopt in worker processes when there are cores
+        to spare. Live runs only get here with Edge and are not forked. Backtesting also takes the buy / sell
+        signals from the workers, hyperopt changes them every epoch.
+
+        :param data: dict Pair -> OHLCV dataframe
+        """
+        self.parallel_signals = {}
+        workers = min(self.populate_workers or os.cpu_count() or 1, len(data))
+        if workers < 2 or not self.config['runmode'].value in ('backtest', 'hyperopt') or not ParallelPopulation.available():
+            return super().ohlcvdata_to_dataframe(data)
+
+        population = ParallelPopulation(workers, signals=self.config['runmode'].value == 'backtest')
+        populated, self.parallel_signals = population.run(self, data)
+
+        # The workers filled the trade info of their own copy of the strategy
+        for pair, dataframe in populated.items():
+            self.custom_trade_info[pair] = self.populate_trades(pair)
+            self.store_trade_indicators(dataframe, {'pair': pair})
+        return populated
+
+    def advise_buy(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        # Backtests take the buy signals computed by the population workers
+        signals = self.parallel_signals.get(metadata['pair'])
+        if signals is not None and take_signals(dataframe, signals, 'buy'):
+            return dataframe
+        return super().advise_buy(dataframe, metadata)
+
+    def advise_sell(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        # Backtests take the sell signals computed by the population workers
+        signals = self.parallel_signals.pop(metadata['pair'], None)
+        if signals is not None and take_signals(dataframe, signals, 'sell'):
+            return dataframe
+        return super().advise_sell(dataframe, metadata)
+
+    def compact(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        """
+        Compact copy of a populated frame (see compact_frame). On the first frame of a pair both frames run
+        through populate_buy_trend / populate_sell_trend, a pair whose signals differ stays in full precision.
+        :param dataframe: DataFrame The populated frame
+        :param metadata: dict Pair metadata
+        :return: DataFrame The compact frame, or the populated one if the pair failed the check
+        """
+        compact = compact_frame(dataframe)
+        pair = metadata['pair']
+        if pair not in self.compact_checked:
+            full = self.populate_sell_trend(self.populate_buy_trend(dataframe.copy(), metadata), metadata)
+            small = self.populate_sell_trend(self.populate_buy_trend(compact.copy(), metadata), metadata)
+            self.compact_checked[pair] = all(np.array_equal(signal_values(full, column), signal_values(small, column))
+                                             for column in ('buy', 'sell'))
+            if self.compact_checked[pair]:
+                logger.info(f"{pair}: compact frame {compact.memory_usage(deep=True).sum() / 1024:.0f} KiB, "
+                            f"{dataframe.memory_usage(deep=True).sum() / 1024:.0f} KiB in full precision")
+            else:
+                logger.warning(f"{pair}: the compact frame changes the signals, keeping it in full precision")
+        if not self.compact_checked[pair]:
+            return dataframe
+        return compact
+
+    def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         # Populate/update the trade data if there is any, set trades to false if not live/dry
         self.custom_trade_info[metadata['pair']] = self.populate_trades(metadata['pair'])
         
@@ -1998,34 +2250,26 @@ class CryptoFrogNFIHO1A(IStrategy):
             assert (timeframe_to_minutes(self.timeframe) <= 30), "Backtest this strategy in 5m or 1m timeframe."
 
         if self.timeframe == self.informative_timeframe:
+            informative_1h = self.informative_1h_indicators(dataframe, metadata)
             dataframe = self.do_indicators(dataframe, metadata)
+            dataframe = self.project_informative(dataframe, informative_1h, metadata)
         else:
             if not self.dp:
                 return dataframe
 
-            informative = self.dp.get_pair_dataframe(pair=metadata['pair'], timeframe=self.informative_timeframe)
-
-            informative = self.do_indicators(informative.copy(), metadata)
-            
-            dataframe = merge_informative_pair(dataframe, informative, self.timeframe, self.informative_timeframe, ffill=True)
-            
-            skip_columns = [(s + "_" + self.informative_timeframe) for s in ['date', 'open', 'high', 'low', 'close', 'volume', 'emac', 'emao']]
-            dataframe.rename(columns=lambda s: s.replace("_{}".format(self.informative_timeframe), "") if (not s in skip_columns) else s, inplace=True)
+            # The indicators for the 1h informative timeframe, NFI and Frog
+            dataframe = self.merge_informative_1h(dataframe, metadata)
 
         # Slam some indicators into the trade_info dict so we can dynamic roi and custom stoploss in backtest
         if self.dp.runmode.value in ('backtest', 'hyperopt'):
-            self.custom_trade_info[metadata['pair']]['roc'] = dataframe[['date', 'roc']].copy().set_index('date')
-            self.custom_trade_info[metadata['pair']]['atr'] = dataframe[['date', 'atr']].copy().set_index('date')
-            self.custom_trade_info[metadata['pair']]['sroc'] = dataframe[['date', 'sroc']].copy().set_index('date')
-            self.custom_trade_info[metadata['pair']]['ssl-dir'] = dataframe[['date', 'ssl-dir']].copy().set_index('date')
-            self.custom_trade_info[metadata['pair']]['rmi-up-trend'] = dataframe[['date', 'rmi-up-trend']].copy().set_index('date')
-            self.custom_trade_info[metadata['pair']]['candle-up-trend'] = dataframe[['date', 'candle-up-trend']].copy().set_index('date')            
-        
-        dataframe = merge_informative_pair(dataframe, informative_1h, self.timeframe, self.informative_timeframe, ffill=True)
+            self.store_trade_indicators(dataframe, metadata)
 
         # The indicators for the normal (5m) timeframe
         dataframe = self.normal_tf_indicators(dataframe, metadata)
 
+        if self.compact_indicators:
+            dataframe = self.compact(dataframe, metadata)
+
         return dataframe
 
     ## cryptofrog signals
@@ -2909,6 +3153,11 @@ class CryptoFrogNFIHO1A(IStrategy):
     
     ## more going on here
     def populate_sell_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        self.sell_rules = self.compile_sell_rules()
+        if self.config['runmode'].value in ('backtest', 'hyperopt'):
+            self.sell_candles[metadata['pair']] = SellCandles(dataframe, self.sell_rule_columns, timeframe_to_minutes(self.timeframe))
+            self.sell_windows.pop(metadata['pair'], None)
+
         conditions = []
 
         conditions.append(
@@ -3036,16 +3285,16 @@ class CryptoFrogNFIHO1A(IStrategy):
         trade_dur = int((current_time.timestamp() - trade.open_date_utc.timestamp()) // 60)
 
         if self.config['runmode'].value in ('live', 'dry_run'):
-            dataframe, last_updated = self.dp.get_analyzed_dataframe(pair=pair, timeframe=self.timeframe)
-            sroc = dataframe['sroc'].iat[-1]
-        # If in backtest or hyperopt, get the indicator values out of the trades dict (Thanks @JoeSchr!)
+            last_candle = self.candle_snapshot(pair)
+            sroc_bail = (last_candle['sroc'] / 100) <= self.cstp_bail_roc.value
+        # If in backtest or hyperopt, the bailout of every candle of the pair is compared up front
         else:
-            sroc = self.custom_trade_info[trade.pair]['sroc'].loc[current_time]['sroc']
+            sroc_bail = self.sroc_bail(trade.pair, current_time)
 
         if current_profit < self.cstp_threshold.value:
             if self.cstp_bail_how.value == 'roc' or self.cstp_bail_how.value == 'any':
                 # Dynamic bailout based on rate of change
-                if (sroc/100) <= self.cstp_bail_roc.value:
+                if sroc_bail:
                     return 0.001
             if self.cstp_bail_how.value == 'time' or self.cstp_bail_how.value == 'any':
                 # Dynamic bailout based on time
@@ -3065,34 +3314,32 @@ class CryptoFrogNFIHO1A(IStrategy):
         # see if we have the data we need to do this, otherwise fall back to the standard table
         if self.custom_trade_info and trade and trade.pair in self.custom_trade_info:
             if self.config['runmode'].value in ('live', 'dry_run'):
-                dataframe, last_updated = self.dp.get_analyzed_dataframe(pair=trade.pair, timeframe=self.timeframe)
-                rmi_trend = dataframe['rmi-up-trend'].iat[-1]
-                candle_trend = dataframe['candle-up-trend'].iat[-1]
-                ssl_dir = dataframe['ssl-dir'].iat[-1]
-            # If in backtest or hyperopt, get the indicator values out of the trades dict (Thanks @JoeSchr!)
+                last_candle = self.candle_snapshot(trade.pair)
+                rmi_trend = last_candle['rmi-up-trend']
+                candle_trend = last_candle['candle-up-trend']
+                ssl_dir = last_candle['ssl-dir']
+                in_trend = False
+
+                if self.droi_trend_type.value == 'rmi' or self.droi_trend_type.value == 'any':
+                    if rmi_trend == 1:
+                        in_trend = True
+                if self.droi_trend_type.value == 'ssl' or self.droi_trend_type.value == 'any':
+                    if ssl_dir in ('up', 1):
+                        in_trend = True
+                if self.droi_trend_type.value == 'candle' or self.droi_trend_type.value == 'any':
+                    if candle_trend == 1:
+                        in_trend = True
+            # If in backtest or hyperopt, the trend of every candle of the pair was evaluated up front
             else:
-                rmi_trend = self.custom_trade_info[trade.pair]['rmi-up-trend'].loc[current_time]['rmi-up-trend']
-                candle_trend = self.custom_trade_info[trade.pair]['candle-up-trend'].loc[current_time]['candle-up-trend']
-                ssl_dir = self.custom_trade_info[trade.pair]['ssl-dir'].loc[current_time]['ssl-dir']
+                in_trend = self.trade_indicator(trade.pair, f"in-trend-{self.droi_trend_type.value}", current_time)
 
             min_roi = table_roi
-            max_profit = trade.calc_profit_ratio(trade.max_rate)
-            pullback_value = (max_profit - self.droi_pullback_amount.value)
-            in_trend = False
-
-            if self.droi_trend_type.value == 'rmi' or self.droi_trend_type.value == 'any':
-                if rmi_trend == 1:
-                    in_trend = True
-            if self.droi_trend_type.value == 'ssl' or self.droi_trend_type.value == 'any':
-                if ssl_dir == 'up':
-                    in_trend = True
-            if self.droi_trend_type.value == 'candle' or self.droi_trend_type.value == 'any':
-                if candle_trend == 1:
-                    in_trend = True
 
             # Force the ROI value high if in trend
             if (in_trend == True):
                 min_roi = 100
+                max_profit = trade.calc_profit_ratio(trade.max_rate)
+                pullback_value = (max_profit - self.droi_pullback_amount.value)
                 # If pullback is enabled, allow to sell if a pullback from peak has happened regardless of trend
                 if self.droi_pullback.value == True and (current_profit < pullback_value):
                     if self.droi_pullback_respect_table.value == True:
@@ -3137,6 +3384,17 @@ class CryptoFrogNFIHO1A(IStrategy):
         self.custom_current_price_cache[pair] = rate
         return rate    
     
+    def bot_loop_start(self, **kwargs) -> None:
+        """
+        Index the open trades by pair once per bot iteration, before the pairs are analyzed.
+        populate_trades reads them from here instead of querying the database for every pair.
+        """
+        if self.config['runmode'].value in ('live', 'dry_run'):
+            open_trades = {}
+            for trade in Trade.get_open_trades():
+                open_trades.setdefault(trade.pair, []).append(trade)
+            self.open_trades = open_trades
+
     """
     Stripped down version from Schism, meant only to update the price data a bit
     more frequently than the default instead of getting all sorts of trade information
@@ -3154,7 +3412,7 @@ class CryptoFrogNFIHO1A(IStrategy):
         if self.config['runmode'].value in ('live', 'dry_run'):
             
             # find out if we have an open trade for this pair
-            active_trade = Trade.get_trades([Trade.pair == pair, Trade.is_open.is_(True),]).all()
+            active_trade = self.open_trades.get(pair)
 
             # if so, get some information
             if active_trade:
@@ -3247,4 +3505,552 @@ def chaikin_money_flow(dataframe, n=20, fillna=False):
            / df['volume'].rolling(n, min_periods=0).sum())
     if fillna:
         cmf = cmf.replace([np.inf, -np.inf], np.nan).fillna(0)
-    return Series(cmf, name='cmf')
\ No newline at end of file
+    return Series(cmf, name='cmf')
+
+def iir_filter(x, decay, initial=0.0):
+    """
+    First order IIR filter y[n] = decay * y[n-1] + x[n], with y[-1] = initial, evaluated in closed form.
+    Works on 1D arrays or column-wise on 2D arrays. The series is split into blocks short enough that
+    decay ** -block stays well inside float64 range, so each block is a single scaled cumsum.
+    Without decay (an EMA of period 1) the output is the input.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    if decay <= 0:
+        return x.copy()
+    out = np.empty_like(x)
+    block = max(1, int(200 / -np.log10(decay)))
+    steps = np.arange(block, dtype=np.float64)
+    if x.ndim > 1:
+        steps = steps.reshape((-1,) + (1,) * (x.ndim - 1))
+    grow = decay ** -steps
+    shrink = decay ** steps
+    carry = np.asarray(initial, dtype=np.float64)
+
+    for start in range(0, len(x), block):
+        chunk = x[start:start + block]
+        m = len(chunk)
+        out[start:start + m] = np.cumsum(chunk * grow[:m], axis=0) * shrink[:m] + carry * (shrink[:m] * decay)
+        carry = out[start + m - 1]
+
+    return out
+
+def EMA_batch(values, period):
+    """
+    TA-Lib compatible EMA (SMA seeded) computed column-wise over a 2D array in one pass.
+    Like TA-Lib the leading NaNs of a column are skipped, its EMA is seeded from the first period values after them.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    out = np.full_like(values, np.nan)
+    columns = values.reshape(len(values), -1)
+    result = out.reshape(len(values), -1)
+
+    valid = ~np.isnan(columns)
+    starts = np.where(valid.any(axis=0), valid.argmax(axis=0), len(columns))
+    k = 2.0 / (period + 1)
+    # one pass per distinct start, a single one for columns without leading NaNs
+    for start in np.unique(starts):
+        seed = start + period - 1
+        if seed >= len(columns):
+            continue
+        group = np.flatnonzero(starts == start)
+        result[seed, group] = columns[start:seed + 1, group].sum(axis=0) / period
+        result[seed + 1:, group] = iir_filter(columns[seed + 1:, group] * k, 1 - k, result[seed, group])
+
+    return out
+
+class RollingCache:
+    """
+    Rolling window statistics of one dataframe, computed once per (column, window, op).
+    Lets several protections share the same rolling max/min instead of recomputing them.
+    """
+
+    def __init__(self, dataframe: DataFrame):
+        self.dataframe = dataframe
+        self.stats = {}
+
+    def get(self, column: str, window: int, op: str) -> Series:
+        """
+        :param column: str Column of the dataframe
+        :param window: int Rolling window length
+        :param op: str Rolling reduction, e.g. 'max', 'min', 'mean'
+        """
+        key = (column, window, op)
+        if not key in self.stats:
+            self.stats[key] = getattr(self.dataframe[column].rolling(window), op)()
+        return self.stats[key]
+
+def dip_ratios(dataframe, windows=(1, 2, 12, 144)):
+    """
+    Drawdown of the close from the highest open of each window, one column per window
+    """
+    close = dataframe['close']
+    ratios = np.empty((len(dataframe), len(windows)))
+    for i, window in enumerate(windows):
+        top = dataframe['open'] if window == 1 else dataframe['open'].rolling(window).max()
+        ratios[:, i] = ((top - close) / close).values
+    return ratios
+
+class InformativeProjection:
+    """
+    As-of projection of an informative timeframe onto the candles of the strategy timeframe.
+    Every candle gets the last informative candle that has closed by then, the rows merge_informative_pair
+    picks, found with searchsorted on the timestamps and gathered as array takes. The row mapping is
+    kept and only extended for the new candles while the informative candles stay the same.
+    """
+
+    def __init__(self, timeframe_minutes, timeframe_inf_minutes):
+        self.offset = np.timedelta64(timeframe_inf_minutes - timeframe_minutes, 'm')
+        self.dates = None
+        self.inf_dates = None
+        self.rows = None
+
+    def mapping(self, dates, inf_dates):
+        """
+        Row of the informative frame for every candle, -1 before the first informative candle.
+        The candles are expected without gaps, as the dataprovider serves them.
+        """
+        overlap = 0
+        if self.rows is not None and len(self.dates) and len(dates) and np.array_equal(inf_dates, self.inf_dates):
+            last = np.searchsorted(dates, self.dates[-1])
+            if last < len(dates) and dates[last] == self.dates[-1] and last < len(self.dates) and dates[0] == self.dates[-(last + 1)]:
+                overlap = last + 1
+
+        merge_dates = inf_dates + self.offset
+        fresh = np.searchsorted(merge_dates, dates[overlap:], side='right') - 1
+        rows = np.concatenate([self.rows[len(self.rows) - overlap:], fresh]) if overlap else fresh
+
+        # merge_informative_pair only matches informative candles that line up with a candle of the
+        # frame, the ones from before its first candle are not carried over
+        if len(dates):
+            head = np.searchsorted(rows, np.searchsorted(merge_dates, dates[0]))
+            rows[:head] = -1
+
+        self.dates = np.array(dates)
+        self.inf_dates = np.array(inf_dates)
+        self.rows = rows
+        return rows
+
+    def project(self, dataframe, informative, columns):
+        """
+        Add the informative columns to the dataframe, forward filled like merge_informative_pair(ffill=True)
+
+        :param dataframe: DataFrame of the strategy timeframe
+        :param informative: DataFrame of the informative timeframe
+        :param columns: dict Informative column -> name in the dataframe
+        """
+        rows = self.mapping(dataframe['date'].values, informative['date'].values)
+        source = informative[list(columns)].reset_index(drop=True)
+        # candles before the first informative candle get NaN, like the left merge
+        projected = source.reindex(rows) if len(rows) and rows[0] < 0 else source.take(rows)
+        projected = projected.ffill().set_axis(dataframe.index)
+        for column, name in columns.items():
+            dataframe[name] = projected[column]
+        return dataframe
+
+def take_signals(dataframe, signals, column):
+    """
+    Copy a precomputed signal column onto the candles of the dataframe, False if some candle has no signal
+    """
+    dates = signals['date'].values
+    candles = dataframe['date'].values
+    rows = np.minimum(np.searchsorted(dates, candles), max(len(dates) - 1, 0))
+    if len(candles) and (not len(dates) or not np.array_equal(dates[rows], candles)):
+        return False
+    dataframe[column] = signals[column].values[rows]
+    return True
+
+class ParallelPopulation:
+    """
+    Populates the pairs of a backtest / hyperopt in forked worker processes, one pair at a time from a
+    shared task queue. The workers are forked once the candles are loaded, so every pair's OHLCV is shared
+    with them copy-on-write instead of being pickled over, only the pair names go out. The populated
+    numeric columns come back in one shared memory block per pair, the result queue carries their layout
+    and the other columns (strings, tz-aware dates), which are still pickled.
+    """
+
+    def __init__(self, workers, signals=False):
+        self.workers = workers
+        self.signals = signals
+
+    @staticmethod
+    def available():
+        return shared_memory is not None and 'fork' in multiprocessing.get_all_start_methods()
+
+    def run(self, strategy, data):
+        """
+        Return ({pair: populated dataframe}, {pair: date / buy / sell dataframe}), the signals only if requested
+
+        :param strategy: IStrategy The strategy, the workers inherit it as it is
+        :param data: dict Pair -> OHLCV dataframe
+        """
+        context = multiprocessing.get_context('fork')
+        # Started before forking so all processes share it, a block must outlive the worker that made it
+        resource_tracker.ensure_running()
+        tasks = context.Queue()
+        results = context.Queue()
+        for pair in data:
+            tasks.put(pair)
+        for _ in range(self.workers):
+            tasks.put(None)
+
+        processes = [context.Process(target=self.work, args=(strategy, data, tasks, results), daemon=True) for _ in range(self.workers)]
+        for process in processes:
+            process.start()
+
+        populated = {}
+        signals = {}
+        try:
+            while len(populated) < len(data):
+                try:
+                    pair, stored, error = results.get(timeout=1)
+                except queue.Empty:
+                    if any(process.exitcode not in (None, 0) for process in processes):
+                        raise RuntimeError("A population worker died")
+                    continue
+                if error:
+                    raise RuntimeError(f"Populating {pair} failed in a worker:\n{error}")
+
+                columns = self.load(stored)
+                if self.signals:
+                    signals[pair] = DataFrame({'date': data[pair]['date'], 'buy': columns.pop('buy'), 'sell': columns.pop('sell')})
+                populated[pair] = concat([data[pair], DataFrame(columns, index=data[pair].index)], axis=1)
+        finally:
+            if len(populated) < len(data):
+                for process in processes:
+                    process.terminate()
+                # release the blocks of the pairs that were done but not read
+                while True:
+                    try:
+                        pair, stored, error = results.get(timeout=0.1)
+                    except queue.Empty:
+                        break
+                    if stored:
+                        self.load(stored)
+            for process in processes:
+                process.join()
+
+        return populated, signals
+
+    def work(self, strategy, data, tasks, results):
+        for pair in iter(tasks.get, None):
+            try:
+                metadata = {'pair': pair}
+                dataframe = strategy.advise_indicators(data[pair].copy(), metadata)
+                if self.signals:
+                    # as backtesting does before asking for the signals
+                    dataframe['buy'] = 0
+                    dataframe['sell'] = 0
+                    dataframe = strategy.advise_sell(strategy.advise_buy(dataframe, metadata), metadata)
+                results.put((pair, self.store(dataframe, data[pair].columns), None))
+            except Exception:
+                results.put((pair, None, traceback.format_exc()))
+
+    @staticmethod
+    def store(dataframe, skip):
+        """
+        Copy the columns added to the frame into a new shared memory block. Returns (block name, rows, layout),
+        the layout is (column, dtype, offset, None) per column in the block, or (column, None, None, values)
+        for the ones without a flat numpy layout (strings, tz-aware dates), which go through the queue.
+        """
+        layout = []
+        size = 0
+        for column in dataframe.columns:
+            if column in skip:
+                continue
+            dtype = dataframe[column].dtype
+            if isinstance(dtype, np.dtype) and dtype.kind in 'biufM':
+                layout.append((column, dtype.str, size, None))
+                size += dtype.itemsize * len(dataframe)
+            else:
+                layout.append((column, None, None, dataframe[column].array))
+
+        block = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        for column, dtype, offset, values in layout:
+            if dtype:
+                np.ndarray(len(dataframe), dtype, buffer=block.buf, offset=offset)[:] = dataframe[column].values
+        name = block.name
+        block.close()
+        return name, len(dataframe), layout
+
+    @staticmethod
+    def load(stored):
+        """
+        {column: values} of a block made by store, the block is released once copied out
+        """
+        name, rows, layout = stored
+        block = shared_memory.SharedMemory(name=name)
+        try:
+            columns = {}
+            for column, dtype, offset, values in layout:
+                columns[column] = values if dtype is None else np.ndarray(rows, dtype, buffer=block.buf, offset=offset).copy()
+        finally:
+            block.close()
+            block.unlink()
+        return columns
+
+
+def compact_frame(dataframe: DataFrame, keep=('date', 'open', 'high', 'low', 'close', 'volume')) -> DataFrame:
+    """
+    Copy of a populated frame in smaller dtypes: float64 indicators become float32 (unless out of its range),
+    columns of only True / False / NaN become bool with NaN as False (which is what the signal masks make of it),
+    integers take the smallest type that holds them and ssl-dir is int8, 1 up / 0 down / -1 missing.
+    The candles keep their dtypes.
+    :param dataframe: DataFrame The populated frame
+    :param keep: tuple Columns to copy as they are
+    :return: DataFrame
+    """
+    columns = {}
+    for column in dataframe.columns:
+        series = dataframe[column]
+        if column in keep:
+            pass
+        elif column == 'ssl-dir':
+            values = series.to_numpy(dtype=object)
+            series = Series(np.select([values == 'up', values == 'down'], [1, 0], -1).astype(np.int8), index=series.index)
+        elif series.dtype == np.float64:
+            values = series.to_numpy()
+            finite = np.abs(values[np.isfinite(values)])
+            if not len(finite) or finite.max() <= np.finfo(np.float32).max:
+                series = series.astype(np.float32)
+        elif series.dtype.kind in 'iu':
+            series = pd.to_numeric(series, downcast='unsigned' if series.dtype.kind == 'u' else 'integer')
+        elif series.dtype == object:
+            values = series.to_numpy()
+            values = values[~pd.isna(values)]
+            if len(values) and isinstance(values[0], (bool, np.bool_)) and ((values == True) | (values == False)).all():
+                series = series.fillna(False).astype(bool)
+        columns[column] = series
+    return DataFrame(columns, index=dataframe.index)
+
+
+def signal_values(dataframe: DataFrame, column: str) -> np.ndarray:
+    """
+    Signal column as float array, missing signals as 0.
+    :param dataframe: DataFrame Frame after populate_buy_trend / populate_sell_trend
+    :param column: str 'buy' or 'sell'
+    :return: np.ndarray
+    """
+    if column not in dataframe:
+        return np.zeros(len(dataframe))
+    return dataframe[column].fillna(0).to_numpy(dtype=float)
+
+
+class TradeIndicators:
+    """
+    Indicators of one pair per candle, for the lookups of custom_stoploss and the dynamic ROI in backtesting.
+    One array per indicator, the row of a candle follows from its date and the fixed candle step. Frames
+    with gaps in the dates fall back to a binary search.
+    """
+
+    def __init__(self, dataframe: DataFrame, columns, timeframe_minutes: int):
+        minutes = dataframe['date'].values.astype('datetime64[m]').astype(np.int64)
+        self.step = timeframe_minutes
+        self.rows = len(minutes)
+        self.start = int(minutes[0]) if self.rows else 0
+        # only kept when the candles are not evenly spaced
+        self.minutes = None if (np.diff(minutes) == self.step).all() else minutes
+        self.columns = {column: dataframe[column].to_numpy() for column in columns}
+        # what the derived columns were computed for
+        self.keys = {}
+
+    def add(self, column: str, values: np.ndarray, key=None):
+        """
+        Add a column derived from the others
+        :param column: str Name of the column
+        :param values: np.ndarray One value per candle
+        :param key: The parameters the values depend on, kept in keys
+        """
+        self.columns[column] = values
+        self.keys[column] = key
+
+    def get(self, column: str, time: datetime):
+        """
+        :param column: str Indicator column
+        :param time: datetime Date of the candle
+        :return: The value at that candle, KeyError if there is no candle at that date
+        """
+        minute = int(time.timestamp()) // 60
+        if self.minutes is None:
+            row, offset = divmod(minute - self.start, self.step)
+            if offset or not 0 <= row < self.rows:
+                raise KeyError(time)
+        else:
+            row = int(np.searchsorted(self.minutes, minute))
+            if row == self.rows or self.minutes[row] != minute:
+                raise KeyError(time)
+        return self.columns[column][row]
+
+
+class SellRules:
+    """
+    The custom_sell rules of one parameter set, checked in order, the first match is the sell reason.
+    Within a family of profit bands only one band can hold the profit, it is found with a bisect over
+    the thresholds. Candle values that several rules compare are computed once per call. The rule tests
+    take the values of one candle or arrays of many alike, reasons evaluates a run of candles at once.
+    """
+
+    def __init__(self, families, rules, pumps):
+        """
+        :param families: list (flag, thresholds, rsi limits, reasons) per band family. Band n lies above
+            thresholds[n] and below thresholds[n + 1], the last band has no upper bound. flag is the shared
+            value the whole family requires, or None
+        :param rules: list (reason, low, high, test) of the other rules, the profit must lie above low and
+            below high
+        :param pumps: dict (length, level) -> sell pump threshold
+        """
+        self.families = []
+        for flag, thresholds, limits, reasons in families:
+            bounds = list(thresholds) + [np.inf]
+            # bands that touch or overlap (possible in hyperopt) are checked one by one, highest first
+            ordered = all(low < high for low, high in zip(bounds, bounds[1:]))
+            self.families.append((flag, bounds, ordered, limits, reasons))
+        # the families as arrays for reasons, the limit past the last band never matches
+        self.family_arrays = [(np.array(bounds), np.array(list(limits) + [np.nan]), np.array(reasons, dtype=object))
+                              for flag, bounds, ordered, limits, reasons in self.families]
+        self.rules = rules
+        self.pumps = pumps
+
+    def shared(self, candle: dict) -> dict:
+        """
+        :param candle: dict The analyzed candle, or column arrays of several
+        :return: dict The values several rules compare
+        """
+        shared = {
+            'under': candle['close'] < candle['ema_200'],
+            'ema_200_rel': (candle['ema_200'] - candle['close']) / candle['close'],
+        }
+        for (length, level), threshold in self.pumps.items():
+            shared[(length, level)] = candle[f"pump_ratio_{length}_1h"] > threshold
+        return shared
+
+    def match(self, candle: dict, current_profit: float, max_profit: float):
+        """
+        :param candle: dict The analyzed candle
+        :param current_profit: float Current profit ratio of the trade
+        :param max_profit: float Highest profit ratio of the trade
+        :return: str The sell reason of the first matching rule, None if no rule matches
+        """
+        shared = self.shared(candle)
+        rsi = candle['rsi']
+
+        for flag, bounds, ordered, limits, reasons in self.families:
+            if flag is not None and not shared[flag]:
+                continue
+            if ordered:
+                band = bisect.bisect_left(bounds, current_profit) - 1
+                if band >= 0 and current_profit < bounds[band + 1] and rsi < limits[band]:
+                    return reasons[band]
+            else:
+                for band in reversed(range(len(limits))):
+                    if (bounds[band + 1] > current_profit > bounds[band]) and (rsi < limits[band]):
+                        return reasons[band]
+
+        for reason, low, high, test in self.rules:
+            if (low < current_profit < high) and test(candle, shared, current_profit, max_profit):
+                return reason
+
+        return None
+
+    def reasons(self, candles: dict, profits: np.ndarray, max_profits: np.ndarray) -> np.ndarray:
+        """
+        match for a run of candles, every rule is evaluated as a mask over all of them. Bands and rules
+        whose profit range the run never reaches are skipped.
+        :param candles: dict Column arrays of the analyzed candles
+        :param profits: np.ndarray Profit ratio of the trade at every candle
+        :param max_profits: np.ndarray Highest profit ratio of the trade at every candle
+        :return: np.ndarray The sell reason of every candle, None where no rule matches
+        """
+        shared = self.shared(candles)
+        rsi = candles['rsi']
+        reasons = np.full(len(profits), None, dtype=object)
+        free = np.ones(len(profits), dtype=bool)
+        lowest, highest = float(profits.min()), float(profits.max())
+
+        for (flag, bounds, ordered, limits, names), (bound_values, limit_values, name_values) in zip(self.families, self.family_arrays):
+            if ordered:
+                if highest <= bounds[0]:
+                    continue
+                # the band of every candle, -1 below the first threshold
+                band = np.searchsorted(bound_values, profits) - 1
+                hit = free & (profits < bound_values[band + 1]) & (rsi < limit_values[band])
+                if flag is not None:
+                    hit &= shared[flag]
+                reasons[hit] = name_values[band[hit]]
+                free &= ~hit
+                continue
+            for band in reversed(range(len(limits))):
+                if not (bounds[band] < highest and lowest < bounds[band + 1]):
+                    continue
+                hit = free & (bounds[band] < profits) & (profits < bounds[band + 1]) & (rsi < limits[band])
+                if flag is not None:
+                    hit &= shared[flag]
+                reasons[hit] = names[band]
+                free &= ~hit
+
+        for reason, low, high, test in self.rules:
+            if not (low < highest and lowest < high):
+                continue
+            hit = free & (low < profits) & (profits < high) & test(candles, shared, profits, max_profits)
+            reasons[hit] = reason
+            free &= ~hit
+
+        return reasons
+
+
+class SellCandles:
+    """
+    The analyzed candles of one pair as arrays, for the custom_sell reasons of backtesting. The row of a
+    candle follows from its date and the fixed candle step, frames with gaps in the dates fall back to a
+    binary search.
+    """
+
+    def __init__(self, dataframe: DataFrame, columns, timeframe_minutes: int):
+        minutes = dataframe['date'].values.astype('datetime64[m]').astype(np.int64)
+        self.step = timeframe_minutes
+        self.rows = len(minutes)
+        self.start = int(minutes[0]) if self.rows else 0
+        # only kept when the candles are not evenly spaced
+        self.minutes = None if (np.diff(minutes) == self.step).all() else minutes
+        self.open = dataframe['open'].to_numpy(dtype=np.float64)
+        self.high = dataframe['high'].to_numpy(dtype=np.float64)
+        self.columns = {}
+        for column in columns:
+            values = dataframe[column].to_numpy()
+            # flags the informative merge left as object
+            self.columns[column] = (values == True) if values.dtype == object else values
+
+    def row(self, time: datetime):
+        """
+        :param time: datetime Date of the candle
+        :return: int Row of the candle, None if there is no candle at that date
+        """
+        minute = int(time.timestamp()) // 60
+        if self.minutes is None:
+            row, offset = divmod(minute - self.start, self.step)
+            return row if not offset and 0 <= row < self.rows else None
+        row = int(np.searchsorted(self.minutes, minute))
+        return row if row < self.rows and self.minutes[row] == minute else None
+
+    def sell_reasons(self, rules: SellRules, trade: 'Trade', row: int, length: int) -> dict:
+        """
+        The profits and sell reasons of a trade from a candle on, as the backtest hands them to custom_sell:
+        the profit at the open of the candle, the highest rate up to its high, and the candle before it.
+        :param rules: SellRules The current rules
+        :param trade: Trade Open trade, max_rate includes the high of the first candle
+        :param row: int Row of the first candle, at least 1
+        :param length: int Number of candles
+        :return: dict 'start', 'profits', 'max_profits' and 'reasons' of the candles
+        """
+        end = min(row + length, self.rows)
+        # Trade.calc_profit_ratio in floats, custom_sell checks that the profit of its candle is the same
+        sell_values = trade.amount * self.open[row:end]
+        profits = np.round((sell_values - sell_values * trade.fee_close) / trade.open_trade_value - 1, 8)
+        max_rates = np.maximum.accumulate(np.maximum(self.high[row:end], trade.max_rate))
+        max_profits = (max_rates - trade.open_rate) / trade.open_rate
+        candles = {column: values[row - 1:end - 1] for column, values in self.columns.items()}
+        return {
+            'start': row,
+            'profits': profits,
+            'max_profits': max_profits,
+            'reasons': rules.reasons(candles, profits, max_profits),
+        }
@@ -1,9 +1,12 @@
+import logging
 import freqtrade.vendor.qtpylib.indicators as qtpylib
 import numpy as np
 import talib.abstract as ta
 from freqtrade.strategy.interface import IStrategy
-from pandas import DataFrame
+from freqtrade.exchange import MAP_EXCHANGE_CHILDCLASS, Exchange, timeframe_to_minutes
+from pandas import DataFrame, Series
 from datetime import datetime, timedelta
+from collections import deque
 
 
 """
@@ -47,6 +50,9 @@ from datetime import datetime, timedelta
 """
 
 
+logger = logging.getLogger(__name__)
+
+
 class NormalizerStrategyHO2(IStrategy):
     INTERFACE_VERSION = 2
 
@@ -82,6 +88,29 @@ class NormalizerStrategyHO2(IStrategy):
     # Number of candles the strategy requires before producing valid signals
     startup_candle_count: int = 610
 
+    # Fibonacci lookbacks for the normalized close
+    norm_lookbacks = [13, 21, 34, 55, 89, 144, 233, 377, 610]
+
+    # Warm-up of the indicators per timeframe, chains of (kind, window) steps applied on top of each other
+    # (see warmup_candles)
+    startup_windows = {
+        '1h': tuple((('window', lookback + 1),) for lookback in norm_lookbacks),
+    }
+
+    # Seed error a recursive indicator (EMA, RSI, ...) may still carry at the first analyzed candle
+    startup_tolerance = 0.01
+
+    # Use the derived warm-up of the timeframe as startup_candle_count instead of the value above
+    auto_startup_candle_count = True
+
+    # Most candles the derived warm-up asks for. Freqtrade loads them in one request and refuses more than the
+    # exchange serves, in backtesting and hyperopt too. None for the limit of the exchange of the config less
+    # the 5 candles freqtrade keeps in reserve, set a number here or "startup_candle_limit" in the config
+    startup_candle_limit = None
+
+    # Per pair incremental normalizer state, only used in live / dry-run
+    normalizers = {}
+
     # Optional order type mapping.
     order_types = {
         'buy': 'limit',
@@ -90,6 +119,47 @@ class NormalizerStrategyHO2(IStrategy):
         'stoploss_on_exchange': False
     }
 
+    def __init__(self, config: dict) -> None:
+        super().__init__(config)
+        required = self.startup_candles()
+        if self.auto_startup_candle_count:
+            self.startup_candle_count = min(required[self.timeframe], self.startup_limit())
+        self.startup_report(required)
+
+    def startup_candles(self) -> dict:
+        """
+        Warm-up per timeframe, the longest chain of startup_windows
+        :return: dict Timeframe -> candles
+        """
+        return {timeframe: max(warmup_candles(chain, self.startup_tolerance) for chain in chains)
+                for timeframe, chains in self.startup_windows.items()}
+
+    def startup_limit(self) -> int:
+        """
+        Most candles startup_candle_count may be, see startup_candle_limit
+        :return: int
+        """
+        limit = self.config.get('startup_candle_limit', self.startup_candle_limit)
+        if limit is None:
+            limit = exchange_candle_limit(self.config.get('exchange', {}).get('name', ''), self.timeframe) - 5
+        return limit
+
+    def startup_report(self, required: dict):
+        """
+        Log how startup_candle_count compares to the warm-up of the indicators
+        :param required: dict Timeframe -> candles, from startup_candles
+        """
+        for timeframe, candles in required.items():
+            if timeframe != self.timeframe:
+                logger.info(f"The {timeframe} indicators need {candles} {timeframe} candles before the first analyzed candle")
+            elif candles > self.startup_candle_count:
+                capped = " (the startup candle limit)" if self.auto_startup_candle_count else ""
+                logger.warning(f"startup_candle_count is {self.startup_candle_count}{capped}, {candles - self.startup_candle_count} short "
+                               f"of the {candles} {timeframe} candles the indicators need to warm up")
+            elif candles < self.startup_candle_count:
+                logger.info(f"startup_candle_count is {self.startup_candle_count}, {self.startup_candle_count - candles} more "
+                            f"than the {candles} {timeframe} candles the indicators need to warm up")
+
     def custom_stoploss(self, pair: str, trade: 'Trade', current_time: datetime,
                         current_rate: float, current_profit: float, **kwargs) -> float:
         # Manage losing trades and open room for better ones.
@@ -98,20 +168,37 @@ class NormalizerStrategyHO2(IStrategy):
         return 0.99
 
     def fischer_norm(self, x, lookback):
-        res = np.zeros_like(x)
-        for i in range(lookback, len(x)):
-            x_min = np.min(x[i-lookback: i +1])
-            x_max = np.max(x[i-lookback: i +1])
-            #res[i] = (2*(x[i] - x_min) / (x_max - x_min)) - 1
-            res[i] = (x[i] - x_min) / (x_max - x_min)
+        return self.fischer_norm_bank(x, [lookback])[:, 0]
+
+    def fischer_norm_bank(self, x, lookbacks):
+        """
+        Normalized close for every lookback, one column per lookback.
+        Window extrema come from the O(n) sliding min/max of rolling() instead of a
+        slice per candle, the arithmetic per value is unchanged so the result is identical.
+        """
+        close = Series(x)
+        res = np.zeros((len(x), len(lookbacks)))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for j, lookback in enumerate(lookbacks):
+                window = close.rolling(lookback + 1)
+                x_min = window.min().values
+                x_max = window.max().values
+                res[lookback:, j] = ((x - x_min) / (x_max - x_min))[lookback:]
         return res
     
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
-        lookback = [13, 21, 34, 55, 89, 144, 233, 377, 610]
-        for look in lookback:
-            dataframe[f"norm_{look}"] = self.fischer_norm(dataframe["close"].values, look)
-        collist = [col for col in dataframe.columns if col.startswith("norm")]
-        dataframe["pct_sum"] = dataframe[collist].sum(axis=1)
+        if self.config['runmode'].value in ('live', 'dry_run'):
+            # only the newest candle(s) changed, update the window extrema instead of recomputing the history
+            if not metadata['pair'] in self.normalizers:
+                self.normalizers[metadata['pair']] = IncrementalNormalizer(self.norm_lookbacks, timeframe_to_minutes(self.timeframe))
+            norms, pct_sum = self.normalizers[metadata['pair']].update(dataframe["date"].values, dataframe["close"].values, self.fischer_norm_bank)
+        else:
+            norms = self.fischer_norm_bank(dataframe["close"].values, self.norm_lookbacks)
+            pct_sum = np.nansum(norms, axis=1)
+
+        for j, look in enumerate(self.norm_lookbacks):
+            dataframe[f"norm_{look}"] = norms[:, j]
+        dataframe["pct_sum"] = pct_sum
 
 
 
@@ -134,3 +221,208 @@ class NormalizerStrategyHO2(IStrategy):
             'sell'
         ] = 1
         return dataframe
+
+class IncrementalNormalizer:
+    """
+    Live state of the normalized close for one pair.
+    Keeps a monotonic min and max deque per lookback, so every new candle costs O(1) amortized
+    no matter how long the history is. Falls back to a full recompute when the new frame does not
+    continue the previous one (gap, restart, changed candles or NaN closes inside the windows).
+    """
+
+    def __init__(self, lookbacks, timeframe_minutes):
+        self.lookbacks = list(lookbacks)
+        self.step = np.timedelta64(timeframe_minutes, 'm')
+        self.dates = None
+        self.close = None
+        self.norms = None
+        self.pct_sum = None
+        self.mins = None
+        self.maxs = None
+        self.pos = 0
+
+    def update(self, dates, close, full_norm):
+        """
+        Return (norms, pct_sum) for the frame, identical to full_norm(close, lookbacks).
+
+        :param dates: ndarray of candle dates
+        :param close: ndarray of candle closes
+        :param full_norm: callable (close, lookbacks) -> norms, used for the full recompute
+        """
+        close = np.asarray(close, dtype=np.float64)
+        overlap = self.continues(dates, close)
+
+        if overlap is None:
+            self.reset(dates, close, full_norm(close, self.lookbacks))
+            return self.norms, self.pct_sum
+
+        fresh = close[overlap:]
+        rows = np.zeros((len(fresh), len(self.lookbacks)))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for i, value in enumerate(fresh):
+                self.push(value)
+                for j in range(len(self.lookbacks)):
+                    x_min = self.mins[j][0][1]
+                    x_max = self.maxs[j][0][1]
+                    rows[i, j] = (value - x_min) / (x_max - x_min)
+
+        kept = len(self.norms) - overlap
+        norms = np.concatenate([self.norms[kept:], rows])
+        pct_sum = np.concatenate([self.pct_sum[kept:], np.nansum(rows, axis=1)])
+
+        # a full recompute leaves the first `lookback` rows of the frame at 0, the rows that
+        # moved to the head of the frame have to follow that too
+        head = min(max(self.lookbacks), len(norms))
+        for j, lookback in enumerate(self.lookbacks):
+            norms[:lookback, j] = 0
+        pct_sum[:head] = np.nansum(norms[:head], axis=1)
+
+        self.dates = np.array(dates)
+        self.close = close.copy()
+        self.norms = norms
+        self.pct_sum = pct_sum
+        return self.norms, self.pct_sum
+
+    def continues(self, dates, close):
+        """
+        Number of leading rows shared with the previous frame, or None if a full recompute is needed
+        """
+        if self.dates is None or self.mins is None or len(dates) == 0:
+            return None
+
+        last = np.searchsorted(dates, self.dates[-1])
+        if last >= len(dates) or dates[last] != self.dates[-1] or last + 1 > len(self.dates):
+            return None
+
+        overlap = last + 1
+        if not (np.array_equal(dates[:overlap], self.dates[-overlap:]) and np.array_equal(close[:overlap], self.close[-overlap:], equal_nan=True)):
+            return None
+        if np.any(np.diff(dates[last:]) != self.step) or np.isnan(close[overlap:]).any():
+            return None
+
+        return overlap
+
+    def reset(self, dates, close, norms):
+        self.dates = np.array(dates)
+        self.close = close.copy()
+        self.norms = norms
+        self.pct_sum = np.nansum(norms, axis=1)
+
+        tail = close[-(max(self.lookbacks) + 1):]
+        if np.isnan(tail).any():
+            # NaN windows can't be tracked by the deques, keep recomputing until they roll out
+            self.mins = None
+            self.maxs = None
+            return
+
+        self.mins = [deque() for _ in self.lookbacks]
+        self.maxs = [deque() for _ in self.lookbacks]
+        self.pos = 0
+        for value in tail:
+            self.push(value)
+
+    def push(self, value):
+        self.pos += 1
+        for lookback, mins, maxs in zip(self.lookbacks, self.mins, self.maxs):
+            while mins and mins[-1][1] >= value:
+                mins.pop()
+            mins.append((self.pos, value))
+            while mins[0][0] < self.pos - lookback:
+                mins.popleft()
+
+            while maxs and maxs[-1][1] <= value:
+                maxs.pop()
+            maxs.append((self.pos, value))
+            while maxs[0][0] < self.pos - lookback:
+                maxs.popleft()
+
+
+def warmup_candles(chain, tolerance: float) -> int:
+    """
+    Candles of history a chain of indicators needs before its first value that is exact, or for the
+    recursive steps within tolerance of the error of their seed. The steps add up, which bounds the
+    warm-up of the chain from above. Kinds of steps:
+    'window' - rolling statistics, SMA and BB over window candles: window - 1
+    'shift' - shift / diff / ROC over window candles: window
+    'ema' - TA-Lib EMA, seeded with the SMA of window candles: window - 1 plus the seed decay of 2 / (window + 1)
+    't3' - TA-Lib T3, six EMAs of window on top of each other: 6 * (window - 1) plus the decay of the cascade
+    'kama' - TA-Lib KAMA, seeded with the candle before: window plus the seed decay at the smoothing of half the
+        efficiency ratio of a random walk, 1 / sqrt(window). Trends decay faster, choppy candles slower
+    'ewm' - pandas ewm or IIR filter of span window, seeded with the first value: the seed decay of 2 / (window + 1)
+    'wilder' - TA-Lib RSI / ATR, seeded with window candles: window plus the seed decay of 1 / window
+    :param chain: tuple (kind, window) steps, the first one on the candles
+    :param tolerance: float Share of the seed error left at the first analyzed candle
+    :return: int
+    """
+    candles = 0
+    for kind, window in chain:
+        if kind == 'window':
+            candles += window - 1
+        elif kind == 'shift':
+            candles += window
+        elif kind == 'ema':
+            candles += window - 1 + seed_decay(2 / (window + 1), tolerance)
+        elif kind == 't3':
+            candles += 6 * (window - 1) + cascade_decay(2 / (window + 1), 6, window - 1, tolerance)
+        elif kind == 'kama':
+            efficiency = 0.5 / np.sqrt(window)
+            candles += window + seed_decay((efficiency * (2 / 3 - 2 / 31) + 2 / 31) ** 2, tolerance)
+        elif kind == 'ewm':
+            candles += seed_decay(2 / (window + 1), tolerance)
+        elif kind == 'wilder':
+            candles += window + seed_decay(1 / window, tolerance)
+        else:
+            raise ValueError(f"Unknown warm-up step {kind}")
+    return candles
+
+
+def seed_decay(alpha: float, tolerance: float) -> int:
+    """
+    Candles a filter with weight alpha for the new value takes to leave tolerance of its seed error
+    :param alpha: float Weight of the new value
+    :param tolerance: float Share of the seed error left
+    :return: int
+    """
+    return int(np.ceil(np.log(tolerance) / np.log(1 - alpha)))
+
+
+def cascade_decay(alpha: float, stages: int, lag: int, tolerance: float) -> int:
+    """
+    Candles a cascade of filters with weight alpha for the new value, each seeded lag candles after the one
+    below it, takes from the seed of the last one to leave tolerance of the seed errors of all of them.
+    A seed error with d stages above it is left at the output as the chance that at most d of the candles
+    since its seed took the new value (a binomial tail), the shares of all stages add up.
+    :param alpha: float Weight of the new value
+    :param stages: int Number of filters
+    :param lag: int Candles between the seeds of two stages
+    :param tolerance: float Share of the seed error left
+    :return: int
+    """
+    def left(candles):
+        share = 0.0
+        for above in range(stages):
+            trials = candles + above * lag
+            term = (1 - alpha) ** trials
+            for taken in range(above + 1):
+                share += term
+                term *= (trials - taken) / (taken + 1) * alpha / (1 - alpha)
+        return share
+
+    candles = 0
+    while left(candles) > tolerance:
+        candles += 1
+    return candles
+
+
+def exchange_candle_limit(name: str, timeframe: str) -> int:
+    """
+    Candles the exchange serves in one request, freqtrade's Exchange.ohlcv_candle_limit without connecting
+    to the exchange. Exchanges freqtrade has no class for get its defaults.
+    :param name: str Exchange name of the config
+    :param timeframe: str Timeframe of the candles
+    :return: int
+    """
+    name = MAP_EXCHANGE_CHILDCLASS.get(name, name).title()
+    exchange = next((cls for cls in Exchange.__subclasses__() if cls.__name__ == name), Exchange)
+    has = {**Exchange._ft_has_default, **exchange._ft_has}
+    return int(has.get('ohlcv_candle_limit_per_timeframe', {}).get(timeframe, has['ohlcv_candle_limit']))
@@ -1,13 +1,36 @@
+import ast
+import bisect
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import queue
+import re
+import shutil
+import traceback
+try:
+    from multiprocessing import resource_tracker, shared_memory
+except ImportError:
+    # Python 3.7, pairs are populated serially
+    resource_tracker = shared_memory = None
 import freqtrade.vendor.qtpylib.indicators as qtpylib
 import numpy as np
+import pandas as pd
+import talib
 import talib.abstract as ta
 from freqtrade.strategy.interface import IStrategy
+from freqtrade.exchange import MAP_EXCHANGE_CHILDCLASS, Exchange, timeframe_to_minutes
 from freqtrade.strategy import (merge_informative_pair,
                                 DecimalParameter, IntParameter, CategoricalParameter)
-from pandas import DataFrame
+from pandas import DataFrame, Series, concat
 from functools import reduce
 from freqtrade.persistence import Trade
 from datetime import datetime
+from collections import deque
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
 
 
 ###########################################################################################################
@@ -62,9 +85,35 @@ class NostalgiaForInfinityNext(IStrategy):
     timeframe = '5m'
     inf_1h = '1h'
 
+    # Per pair informative row mapping, only kept in live / dry-run
+    informative_projections = {}
+
+    # Per pair bytes of the 5m frame saved by leaving the unused informative columns out
+    informative_savings = {}
+
     # Run "populate_indicators()" only for new candle.
     process_only_new_candles = True
 
+    # The last analyzed candle of every pair for custom_sell
+    candle_snapshots = {}
+
+    # The custom_sell rules compiled from the current parameters, see compile_sell_rules
+    sell_rules = None
+
+    # Backtesting and hyperopt: the analyzed candles of every pair and the sell reasons of its open trade,
+    # evaluated for a window of candles at once that doubles while the trade stays open, up to backtest_sell_window
+    sell_candles = {}
+    sell_windows = {}
+    backtest_sell_window = 1024
+
+    # custom_sell calls of backtesting and hyperopt whose candle or profits were not the precomputed ones,
+    # they are evaluated on their own. The first one is logged.
+    sell_window_fallbacks = 0
+
+    # The columns the custom_sell rules read
+    sell_rule_columns = ('rsi', 'rsi_1h', 'close', 'ema_200', 'ema_100', 'sma_200_dec', 'sma_200_dec_1h',
+                         'pump_ratio_48_1h', 'pump_ratio_36_1h', 'pump_ratio_24_1h')
+
     # These values can be overridden in the "ask_strategy" section in the config.
     use_sell_signal = True
     sell_profit_only = False
@@ -73,6 +122,41 @@ class NostalgiaForInfinityNext(IStrategy):
     # Number of candles the strategy requires before producing valid signals
     startup_candle_count: int = 400
 
+    # Warm-up of the indicators per timeframe, chains of (kind, window) steps applied on top of each other
+    # (see warmup_candles). Shifts of 1h columns in the 5m frame are counted in 1h candles.
+    startup_windows = {
+        '5m': (
+            (('ema', 200),),                                        # ema_200, ewo
+            (('window', 200), ('shift', 20)),                       # sma_200_dec, rising sma_200
+            (('window', 144),),                                     # dip protections
+            (('wilder', 14),),                                      # rsi
+            (('window', 40), ('shift', 1)),                         # bb 40, bbdelta / closedelta
+            (('window', 20), ('shift', 5)),                         # bb 20 of the previous candles
+            (('shift', 1), ('window', 14)),                         # mfi, chop
+            (('window', 30), ('shift', 1)),                         # volume_mean_30
+            (('window', 36),),                                      # lowest open of 36 candles
+        ),
+        '1h': (
+            (('ema', 200), ('shift', 3)),                           # ema_200_1h.shift(36)
+            (('window', 200), ('shift', 3)),                        # sma_200_1h.shift(36)
+            (('window', 200), ('shift', 20)),                       # sma_200_dec
+            (('wilder', 14),),                                      # rsi
+            (('window', 20),),                                      # bb
+            (('window', 48),),                                      # pump protections
+        ),
+    }
+
+    # Seed error a recursive indicator (EMA, RSI, ...) may still carry at the first analyzed candle
+    startup_tolerance = 0.01
+
+    # Use the derived warm-up of the timeframe as startup_candle_count instead of the value above
+    auto_startup_candle_count = True
+
+    # Most candles the derived warm-up asks for. Freqtrade loads them in one request and refuses more than the
+    # exchange serves, in backtesting and hyperopt too. None for the limit of the exchange of the config less
+    # the 5 candles freqtrade keeps in reserve, set a number here or "startup_candle_limit" in the config
+    startup_candle_limit = None
+
     # Optional order type mapping.
     order_types = {
         'buy': 'limit',
@@ -82,6 +166,88 @@ class NostalgiaForInfinityNext(IStrategy):
         'stoploss_on_exchange': False
     }
 
+    # Indicators read by each buy condition on top of its standard protections. Only the
+    # indicators reachable from the enabled conditions and the sell rules are computed.
+    buy_condition_indicators = {
+        1: ['mfi', 'rsi', 'rsi_1h'],
+        2: ['bb_lowerband', 'mfi', 'rsi', 'rsi_1h'],
+        3: ['bbdelta', 'closedelta', 'ema_200_1h', 'lower', 'tail'],
+        4: ['bb_lowerband', 'ema_50', 'volume_mean_30'],
+        5: ['bb_lowerband', 'ema_12', 'ema_200_1h', 'ema_26'],
+        6: ['bb_lowerband', 'ema_12', 'ema_26'],
+        7: ['ema_12', 'ema_26', 'rsi'],
+        8: ['rsi'],
+        9: ['bb_lowerband', 'ema_20', 'ema_200', 'ema_50', 'mfi', 'rsi_1h'],
+        10: ['bb_lowerband', 'ema_100_1h', 'ema_50_1h', 'rsi_1h', 'sma_30'],
+        11: ['ema_100_1h', 'ema_50_1h', 'mfi', 'rsi', 'rsi_1h', 'safe_pump_36_normal_1h', 'safe_pump_48_loose_1h', 'sma_30'],
+        12: ['ewo', 'rsi', 'sma_30'],
+        13: ['ema_100_1h', 'ema_50_1h', 'ewo', 'sma_30'],
+        14: ['bb_lowerband', 'ema_12', 'ema_20', 'ema_26'],
+        15: ['ema_12', 'ema_20', 'ema_200_1h', 'ema_26', 'rsi'],
+        16: ['ema_20', 'ewo', 'rsi'],
+        17: ['ema_20', 'ewo'],
+        18: ['bb_lowerband', 'rsi', 'sma_200', 'sma_200_1h'],
+        19: ['chop', 'ema_100_1h', 'ema_200_1h', 'ema_50_1h', 'rsi_1h'],
+        20: ['rsi', 'rsi_1h'],
+        21: ['rsi', 'rsi_1h'],
+        22: ['bb_lowerband', 'ema_100_1h', 'ema_200_1h', 'ewo', 'rsi', 'sma_30', 'volume_mean_4'],
+        23: ['bb_lowerband', 'ewo', 'rsi', 'rsi_1h'],
+    }
+
+    # Indicators read by each sell condition
+    sell_condition_indicators = {
+        1: ['bb_upperband', 'rsi'],
+        2: ['bb_upperband', 'rsi'],
+        3: ['rsi'],
+        4: ['rsi', 'rsi_1h'],
+        6: ['ema_200', 'ema_50', 'rsi'],
+        7: ['ema_12', 'ema_26', 'rsi_1h'],
+        8: ['bb_upperband_1h'],
+    }
+
+    # Indicators read by custom_sell for every open trade
+    custom_sell_indicators = ['ema_100', 'ema_200', 'pump_ratio_24_1h', 'pump_ratio_36_1h', 'pump_ratio_48_1h',
+                              'rsi', 'rsi_1h', 'sma_200_dec', 'sma_200_dec_1h']
+
+    # Indicators computed from other indicators
+    indicator_inputs = {
+        'bbdelta': ['lower', 'mid'],
+        'sma_200_dec': ['sma_200'],
+        'sma_200_dec_1h': ['sma_200_1h'],
+    }
+
+    # Per pair streamed indicator state, only used in live / dry-run
+    streams = {}
+
+    # Compute the EMA / SMA / RSI / Bollinger stacks of all pairs at once in backtesting and hyperopt
+    batch_indicators = True
+
+    # Per pair batched columns (and fetched 1h frames), only kept while the pairs are populated
+    batched = {}
+    batched_informative = {}
+
+    # Worker processes populating the pairs in backtesting and hyperopt, 1 populates serially, 0 for one per core
+    populate_workers = 1
+
+    # Per pair buy / sell signals the population workers computed along with the indicators, backtesting only
+    parallel_signals = {}
+
+    # Keep the populated frames of backtesting and hyperopt on disk and load them again on repeated runs,
+    # the entries go to user_data/indicator_store
+    store_indicators = False
+
+    # Class members the populated frames do not depend on, changing them keeps the stored frames
+    indicator_store_ignores = ('populate_buy_trend', 'populate_sell_trend', 'custom_sell', 'custom_stoploss',
+                               'min_roi_reached_dynamic', 'min_roi_reached', 'advise_buy', 'advise_sell',
+                               'buy_params', 'sell_params', 'minimal_roi', 'stoploss', 'custom_stop')
+
+    # Keep the populated frames with float32 indicators and bool protections, the first frame of every pair is
+    # checked to give the same buy / sell signals as in full precision
+    compact_indicators = False
+
+    # Per pair result of that check, True when the compact frame can be used
+    compact_checked = {}
+
     #############################################################
 
     buy_params = {
@@ -1422,6 +1588,9 @@ class NostalgiaForInfinityNext(IStrategy):
     sell_custom_stoploss_under_rel_1 = DecimalParameter(0.001, 0.02, default=0.004, space='sell', optimize=False, load=True)
     sell_custom_stoploss_under_rsi_diff_1 = DecimalParameter(0.0, 20.0, default=8.0, space='sell', optimize=False, load=True)
 
+    # Pump sell checks, window length -> sell_pump_threshold_N of each level
+    sell_pump_levels = {48: (1, 2, 3), 36: (4, 5, 6), 24: (7, 8, 9)}
+
     # 48h for pump sell checks
     sell_pump_threshold_1 = DecimalParameter(0.5, 1.2, default=0.9, space='sell', decimals=2, optimize=False, load=True)
     sell_pump_threshold_2 = DecimalParameter(0.4, 0.9, default=0.7, space='sell', decimals=2, optimize=False, load=True)
@@ -1474,172 +1643,260 @@ class NostalgiaForInfinityNext(IStrategy):
 
     #############################################################
 
+    def __init__(self, config: dict) -> None:
+        super().__init__(config)
+        required = self.startup_candles()
+        if self.auto_startup_candle_count:
+            self.startup_candle_count = min(required[self.timeframe], self.startup_limit())
+        self.startup_report(required)
+
+    def startup_candles(self) -> dict:
+        """
+        Warm-up per timeframe, the longest chain of startup_windows
+        :return: dict Timeframe -> candles
+        """
+        return {timeframe: max(warmup_candles(chain, self.startup_tolerance) for chain in chains)
+                for timeframe, chains in self.startup_windows.items()}
+
+    def startup_limit(self) -> int:
+        """
+        Most candles startup_candle_count may be, see startup_candle_limit
+        :return: int
+        """
+        limit = self.config.get('startup_candle_limit', self.startup_candle_limit)
+        if limit is None:
+            limit = exchange_candle_limit(self.config.get('exchange', {}).get('name', ''), self.timeframe) - 5
+        return limit
+
+    def startup_report(self, required: dict):
+        """
+        Log how startup_candle_count compares to the warm-up of the indicators
+        :param required: dict Timeframe -> candles, from startup_candles
+        """
+        for timeframe, candles in required.items():
+            if timeframe != self.timeframe:
+                logger.info(f"The {timeframe} indicators need {candles} {timeframe} candles before the first analyzed candle")
+            elif candles > self.startup_candle_count:
+                capped = " (the startup candle limit)" if self.auto_startup_candle_count else ""
+                logger.warning(f"startup_candle_count is {self.startup_candle_count}{capped}, {candles - self.startup_candle_count} short "
+                               f"of the {candles} {timeframe} candles the indicators need to warm up")
+            elif candles < self.startup_candle_count:
+                logger.info(f"startup_candle_count is {self.startup_candle_count}, {self.startup_candle_count - candles} more "
+                            f"than the {candles} {timeframe} candles the indicators need to warm up")
+
     def get_ticker_indicator(self):
         return int(self.timeframe[:-1])
 
+    def candle_snapshot(self, pair: str) -> dict:
+        """
+        The last analyzed candle of a pair as a plain dict. It is built once per analyzed candle and
+        shared by the callbacks of its open trades, instead of a row Series per call.
+        :param pair: str Pair
+        :return: dict Column values of the last candle, None if the pair was not analyzed yet
+        """
+        dataframe, last_updated = self.dp.get_analyzed_dataframe(pair, self.timeframe)
+        if len(dataframe.index) == 0:
+            return None
+        # a new analysis in live, the next candle of the slice in backtesting
+        key = (last_updated, dataframe.index[-1])
+        snapshot = self.candle_snapshots.get(pair)
+        if snapshot is None or snapshot[0] != key:
+            snapshot = (key, dataframe.iloc[-1].to_dict())
+            self.candle_snapshots[pair] = snapshot
+        return snapshot[1]
+
     def custom_sell(self, pair: str, trade: 'Trade', current_time: 'datetime', current_rate: float,
                     current_profit: float, **kwargs):
-        dataframe, _ = self.dp.get_analyzed_dataframe(pair, self.timeframe)
-        last_candle = dataframe.iloc[-1].squeeze()
-
         max_profit = ((trade.max_rate - trade.open_rate) / trade.open_rate)
 
-        if (last_candle is not None):
-            if (current_profit > self.sell_custom_profit_6.value) & (last_candle['rsi'] < self.sell_custom_rsi_6.value):
-                return 'signal_profit_6'
-            if (self.sell_custom_profit_6.value > current_profit > self.sell_custom_profit_5.value) & (last_candle['rsi'] < self.sell_custom_rsi_5.value):
-                return 'signal_profit_5'
-            elif (self.sell_custom_profit_5.value > current_profit > self.sell_custom_profit_4.value) & (last_candle['rsi'] < self.sell_custom_rsi_4.value):
-                return 'signal_profit_4'
-            elif (self.sell_custom_profit_4.value > current_profit > self.sell_custom_profit_3.value) & (last_candle['rsi'] < self.sell_custom_rsi_3.value):
-                return 'signal_profit_3'
-            elif (self.sell_custom_profit_3.value > current_profit > self.sell_custom_profit_2.value) & (last_candle['rsi'] < self.sell_custom_rsi_2.value):
-                return 'signal_profit_2'
-            elif (self.sell_custom_profit_2.value > current_profit > self.sell_custom_profit_1.value) & (last_candle['rsi'] < self.sell_custom_rsi_1.value):
-                return 'signal_profit_1'
-            elif (self.sell_custom_profit_1.value > current_profit > self.sell_custom_profit_0.value) & (last_candle['rsi'] < self.sell_custom_rsi_0.value):
-                return 'signal_profit_0'
+        if self.sell_rules is None:
+            self.sell_rules = self.compile_sell_rules()
 
-            # check if close is under EMA200
-            elif (current_profit > self.sell_custom_under_profit_6.value) & (last_candle['rsi'] < self.sell_custom_under_rsi_6.value) & (last_candle['close'] < last_candle['ema_200']):
-                return 'signal_profit_u_6'
-            elif (self.sell_custom_under_profit_6.value > current_profit > self.sell_custom_under_profit_5.value) & (last_candle['rsi'] < self.sell_custom_under_rsi_5.value) & (last_candle['close'] < last_candle['ema_200']):
-                return 'signal_profit_u_5'
-            elif (self.sell_custom_under_profit_5.value > current_profit > self.sell_custom_under_profit_4.value) & (last_candle['rsi'] < self.sell_custom_under_rsi_4.value) & (last_candle['close'] < last_candle['ema_200']):
-                return 'signal_profit_u_4'
-            elif (self.sell_custom_under_profit_4.value > current_profit > self.sell_custom_under_profit_3.value) & (last_candle['rsi'] < self.sell_custom_under_rsi_3.value) & (last_candle['close'] < last_candle['ema_200']):
-                return 'signal_profit_u_3'
-            elif (self.sell_custom_under_profit_3.value > current_profit > self.sell_custom_under_profit_2.value) & (last_candle['rsi'] < self.sell_custom_under_rsi_2.value) & (last_candle['close'] < last_candle['ema_200']):
-                return 'signal_profit_u_2'
-            elif (self.sell_custom_under_profit_2.value > current_profit > self.sell_custom_under_profit_1.value) & (last_candle['rsi'] < self.sell_custom_under_rsi_1.value) & (last_candle['close'] < last_candle['ema_200']):
-                return 'signal_profit_u_1'
-            elif (self.sell_custom_under_profit_1.value > current_profit > self.sell_custom_under_profit_0.value) & (last_candle['rsi'] < self.sell_custom_under_rsi_0.value) & (last_candle['close'] < last_candle['ema_200']):
-                return 'signal_profit_u_0'
-
-            # check if the pair is "pumped"
-
-            elif (last_candle['sell_pump_48_1_1h']) & (current_profit > self.sell_custom_pump_profit_1_5.value) & (last_candle['rsi'] < self.sell_custom_pump_rsi_1_5.value):
-                return 'signal_profit_p_1_5'
-            elif (last_candle['sell_pump_48_1_1h']) & (self.sell_custom_pump_profit_1_5.value > current_profit > self.sell_custom_pump_profit_1_4.value) & (last_candle['rsi'] < self.sell_custom_pump_rsi_1_4.value):
-                return 'signal_profit_p_1_4'
-            elif (last_candle['sell_pump_48_1_1h']) & (self.sell_custom_pump_profit_1_4.value > current_profit > self.sell_custom_pump_profit_1_3.value) & (last_candle['rsi'] < self.sell_custom_pump_rsi_1_3.value):
-                return 'signal_profit_p_1_3'
-            elif (last_candle['sell_pump_48_1_1h']) & (self.sell_custom_pump_profit_1_3.value > current_profit > self.sell_custom_pump_profit_1_2.value) & (last_candle['rsi'] < self.sell_custom_pump_rsi_1_2.value):
-                return 'signal_profit_p_1_2'
-            elif (last_candle['sell_pump_48_1_1h']) & (self.sell_custom_pump_profit_1_2.value > current_profit > self.sell_custom_pump_profit_1_1.value) & (last_candle['rsi'] < self.sell_custom_pump_rsi_1_1.value):
-                return 'signal_profit_p_1_1'
-
-            elif (last_candle['sell_pump_36_1_1h']) & (current_profit > self.sell_custom_pump_profit_2_5.value) & (last_candle['rsi'] < self.sell_custom_pump_rsi_2_5.value):
-                return 'signal_profit_p_2_5'
-            elif (last_candle['sell_pump_36_1_1h']) & (self.sell_custom_pump_profit_2_5.value > current_profit > self.sell_custom_pump_profit_2_4.value) & (last_candle['rsi'] < self.sell_custom_pump_rsi_2_4.value):
-                return 'signal_profit_p_2_4'
-            elif (last_candle['sell_pump_36_1_1h']) & (self.sell_custom_pump_profit_2_4.value > current_profit > self.sell_custom_pump_profit_2_3.value) & (last_candle['rsi'] < self.sell_custom_pump_rsi_2_3.value):
-                return 'signal_profit_p_2_3'
-            elif (last_candle['sell_pump_36_1_1h']) & (self.sell_custom_pump_profit_2_3.value > current_profit > self.sell_custom_pump_profit_2_2.value) & (last_candle['rsi'] < self.sell_custom_pump_rsi_2_2.value):
-                return 'signal_profit_p_2_2'
-            elif (last_candle['sell_pump_36_1_1h']) & (self.sell_custom_pump_profit_2_2.value > current_profit > self.sell_custom_pump_profit_2_1.value) & (last_candle['rsi'] < self.sell_custom_pump_rsi_2_1.value):
-                return 'signal_profit_p_2_1'
-
-            elif (last_candle['sell_pump_24_1_1h']) & (current_profit > self.sell_custom_pump_profit_3_5.value) & (last_candle['rsi'] < self.sell_custom_pump_rsi_3_5.value):
-                return 'signal_profit_p_3_5'
-            elif (last_candle['sell_pump_24_1_1h']) & (self.sell_custom_pump_profit_3_5.value > current_profit > self.sell_custom_pump_profit_3_4.value) & (last_candle['rsi'] < self.sell_custom_pump_rsi_3_4.value):
-                return 'signal_profit_p_3_4'
-            elif (last_candle['sell_pump_24_1_1h']) & (self.sell_custom_pump_profit_3_4.value > current_profit > self.sell_custom_pump_profit_3_3.value) & (last_candle['rsi'] < self.sell_custom_pump_rsi_3_3.value):
-                return 'signal_profit_p_3_3'
-            elif (last_candle['sell_pump_24_1_1h']) & (self.sell_custom_pump_profit_3_3.value > current_profit > self.sell_custom_pump_profit_3_2.value) & (last_candle['rsi'] < self.sell_custom_pump_rsi_3_2.value):
-                return 'signal_profit_p_3_2'
-            elif (last_candle['sell_pump_24_1_1h']) & (self.sell_custom_pump_profit_3_2.value > current_profit > self.sell_custom_pump_profit_3_1.value) & (last_candle['rsi'] < self.sell_custom_pump_rsi_3_1.value):
-                return 'signal_profit_p_3_1'
-
-            elif (self.sell_custom_dec_profit_max_1.value > current_profit > self.sell_custom_dec_profit_min_1.value) & (last_candle['sma_200_dec']):
-                return 'signal_profit_d_1'
-            elif (self.sell_custom_dec_profit_max_2.value > current_profit > self.sell_custom_dec_profit_min_2.value) & (last_candle['close'] < last_candle['ema_100']):
-                return 'signal_profit_d_2'
+        # In backtesting and hyperopt the reasons of the next candles of the trade are evaluated at once
+        if self.config['runmode'].value in ('backtest', 'hyperopt') and pair in self.sell_candles:
+            found, reason = self.backtest_sell_reason(pair, trade, current_time, current_profit, max_profit)
+            if found:
+                return reason
 
-            # Trailing
-            elif (self.sell_trail_profit_max_1.value > current_profit > self.sell_trail_profit_min_1.value) & (self.sell_trail_rsi_min_1.value < last_candle['rsi'] < self.sell_trail_rsi_max_1.value) & (max_profit > (current_profit + self.sell_trail_down_1.value)):
-                return 'signal_profit_t_1'
-            elif (self.sell_trail_profit_max_2.value > current_profit > self.sell_trail_profit_min_2.value) & (self.sell_trail_rsi_min_2.value < last_candle['rsi'] < self.sell_trail_rsi_max_2.value) & (max_profit > (current_profit + self.sell_trail_down_2.value)):
-                return 'signal_profit_t_2'
-            elif (self.sell_trail_profit_max_3.value > current_profit > self.sell_trail_profit_min_3.value) & (max_profit > (current_profit + self.sell_trail_down_3.value)) & (last_candle['sma_200_dec_1h']):
-                return 'signal_profit_t_3'
+        last_candle = self.candle_snapshot(pair)
 
-            elif (last_candle['close'] < last_candle['ema_200']) & (current_profit > self.sell_trail_profit_min_3.value) & (current_profit < self.sell_trail_profit_max_3.value) & (max_profit > (current_profit + self.sell_trail_down_3.value)):
-                return 'signal_profit_u_t_1'
+        if (last_candle is not None):
+            return self.sell_rules.match(last_candle, current_profit, max_profit)
 
-            elif (current_profit > 0.0) & (last_candle['close'] < last_candle['ema_200']) & (((last_candle['ema_200'] - last_candle['close']) / last_candle['close']) < self.sell_custom_profit_under_rel_1.value) & (last_candle['rsi'] > last_candle['rsi_1h'] + self.sell_custom_profit_under_rsi_diff_1.value):
-                return 'signal_profit_u_e_1'
+        return None
 
-            elif (current_profit < -0.0) & (last_candle['close'] < last_candle['ema_200']) & (((last_candle['ema_200'] - last_candle['close']) / last_candle['close']) < self.sell_custom_stoploss_under_rel_1.value) & (last_candle['rsi'] > last_candle['rsi_1h'] + self.sell_custom_stoploss_under_rsi_diff_1.value):
-                return 'signal_stoploss_u_1'
+    def compile_sell_rules(self) -> 'SellRules':
+        """
+        The custom_sell rules with the current parameter values, in the order they are checked.
+        Rebuilt by populate_sell_trend, which is where hyperopt has set the parameters of an epoch.
+        """
+        p = {name: parameter.value for name, parameter in self.enumerate_parameters('sell')}
+        pumps = {(length, level): p[f"sell_pump_threshold_{param}"]
+                 for length, params in self.sell_pump_levels.items() for level, param in enumerate(params, 1)}
+
+        families = [
+            (None, [p[f"sell_custom_profit_{n}"] for n in range(7)], [p[f"sell_custom_rsi_{n}"] for n in range(7)],
+             [f"signal_profit_{n}" for n in range(7)]),
+            # check if close is under EMA200
+            ('under', [p[f"sell_custom_under_profit_{n}"] for n in range(7)], [p[f"sell_custom_under_rsi_{n}"] for n in range(7)],
+             [f"signal_profit_u_{n}" for n in range(7)]),
+        ]
+        # check if the pair is "pumped"
+        for family, length in ((1, 48), (2, 36), (3, 24)):
+            families.append(((length, 1), [p[f"sell_custom_pump_profit_{family}_{n}"] for n in range(1, 6)],
+                             [p[f"sell_custom_pump_rsi_{family}_{n}"] for n in range(1, 6)],
+                             [f"signal_profit_p_{family}_{n}" for n in range(1, 6)]))
+
+        rules = [
+            ('signal_profit_d_1', p['sell_custom_dec_profit_min_1'], p['sell_custom_dec_profit_max_1'],
+             lambda candle, shared, profit, max_profit: candle['sma_200_dec']),
+            ('signal_profit_d_2', p['sell_custom_dec_profit_min_2'], p['sell_custom_dec_profit_max_2'],
+             lambda candle, shared, profit, max_profit: candle['close'] < candle['ema_100']),
 
-            elif (self.sell_custom_pump_dec_profit_max_1.value > current_profit > self.sell_custom_pump_dec_profit_min_1.value) & (last_candle['sell_pump_48_1_1h']) & (last_candle['sma_200_dec']) & (last_candle['close'] < last_candle['ema_200']):
-                return 'signal_profit_p_d_1'
-            elif (self.sell_custom_pump_dec_profit_max_2.value > current_profit > self.sell_custom_pump_dec_profit_min_2.value) & (last_candle['sell_pump_48_2_1h']) & (last_candle['sma_200_dec']) & (last_candle['close'] < last_candle['ema_200']):
-                return 'signal_profit_p_d_2'
-            elif (self.sell_custom_pump_dec_profit_max_3.value > current_profit > self.sell_custom_pump_dec_profit_min_3.value) & (last_candle['sell_pump_48_3_1h']) & (last_candle['sma_200_dec']) & (last_candle['close'] < last_candle['ema_200']):
-                return 'signal_profit_p_d_3'
+            # Trailing
+            ('signal_profit_t_1', p['sell_trail_profit_min_1'], p['sell_trail_profit_max_1'],
+             lambda candle, shared, profit, max_profit: (p['sell_trail_rsi_min_1'] < candle['rsi']) & (candle['rsi'] < p['sell_trail_rsi_max_1'])
+             & (max_profit > (profit + p['sell_trail_down_1']))),
+            ('signal_profit_t_2', p['sell_trail_profit_min_2'], p['sell_trail_profit_max_2'],
+             lambda candle, shared, profit, max_profit: (p['sell_trail_rsi_min_2'] < candle['rsi']) & (candle['rsi'] < p['sell_trail_rsi_max_2'])
+             & (max_profit > (profit + p['sell_trail_down_2']))),
+            ('signal_profit_t_3', p['sell_trail_profit_min_3'], p['sell_trail_profit_max_3'],
+             lambda candle, shared, profit, max_profit: (max_profit > (profit + p['sell_trail_down_3'])) & candle['sma_200_dec_1h']),
+
+            ('signal_profit_u_t_1', p['sell_trail_profit_min_3'], p['sell_trail_profit_max_3'],
+             lambda candle, shared, profit, max_profit: shared['under'] & (max_profit > (profit + p['sell_trail_down_3']))),
+
+            ('signal_profit_u_e_1', 0.0, np.inf,
+             lambda candle, shared, profit, max_profit: shared['under'] & (shared['ema_200_rel'] < p['sell_custom_profit_under_rel_1'])
+             & (candle['rsi'] > candle['rsi_1h'] + p['sell_custom_profit_under_rsi_diff_1'])),
+
+            ('signal_stoploss_u_1', -np.inf, -0.0,
+             lambda candle, shared, profit, max_profit: shared['under'] & (shared['ema_200_rel'] < p['sell_custom_stoploss_under_rel_1'])
+             & (candle['rsi'] > candle['rsi_1h'] + p['sell_custom_stoploss_under_rsi_diff_1'])),
+
+            ('signal_profit_p_d_1', p['sell_custom_pump_dec_profit_min_1'], p['sell_custom_pump_dec_profit_max_1'],
+             lambda candle, shared, profit, max_profit: shared[(48, 1)] & candle['sma_200_dec'] & shared['under']),
+            ('signal_profit_p_d_2', p['sell_custom_pump_dec_profit_min_2'], p['sell_custom_pump_dec_profit_max_2'],
+             lambda candle, shared, profit, max_profit: shared[(48, 2)] & candle['sma_200_dec'] & shared['under']),
+            ('signal_profit_p_d_3', p['sell_custom_pump_dec_profit_min_3'], p['sell_custom_pump_dec_profit_max_3'],
+             lambda candle, shared, profit, max_profit: shared[(48, 3)] & candle['sma_200_dec'] & shared['under']),
 
             # Pumped 48h 1, under EMA200
-            elif (self.sell_custom_pump_under_profit_max_1.value > current_profit > self.sell_custom_pump_under_profit_min_1.value) & (last_candle['sell_pump_48_1_1h']) & (last_candle['close'] < last_candle['ema_200']):
-                return 'signal_profit_p_u_1'
+            ('signal_profit_p_u_1', p['sell_custom_pump_under_profit_min_1'], p['sell_custom_pump_under_profit_max_1'],
+             lambda candle, shared, profit, max_profit: shared[(48, 1)] & shared['under']),
 
             # Pumped 36h 2, trail 1
-            elif (last_candle['sell_pump_36_2_1h']) & (self.sell_custom_pump_trail_profit_max_1.value > current_profit > self.sell_custom_pump_trail_profit_min_1.value) & (self.sell_custom_pump_trail_rsi_min_1.value < last_candle['rsi'] < self.sell_custom_pump_trail_rsi_max_1.value) & (max_profit > (current_profit + self.sell_custom_pump_trail_down_1.value)):
-                return 'signal_profit_p_t_1'
-
-            elif (max_profit < self.sell_custom_stoploss_pump_max_profit_1.value) & (self.sell_custom_stoploss_pump_min_1.value < current_profit < self.sell_custom_stoploss_pump_max_1.value) & (last_candle['sell_pump_48_1_1h']) & (last_candle['sma_200_dec']) & (last_candle['close'] < (last_candle['ema_200'] * self.sell_custom_stoploss_pump_ma_offset_1.value)):
-                return 'signal_stoploss_p_1'
-
-            elif (max_profit < self.sell_custom_stoploss_pump_max_profit_2.value) & (current_profit < self.sell_custom_stoploss_pump_loss_2.value) & (last_candle['sell_pump_48_1_1h']) & (last_candle['sma_200_dec_1h']) & (last_candle['close'] < (last_candle['ema_200'] * self.sell_custom_stoploss_pump_ma_offset_2.value)):
-                return 'signal_stoploss_p_2'
-
-            elif (max_profit < self.sell_custom_stoploss_pump_max_profit_3.value) & (current_profit < self.sell_custom_stoploss_pump_loss_3.value) & (last_candle['sell_pump_36_3_1h']) & (last_candle['close'] < (last_candle['ema_200'] * self.sell_custom_stoploss_pump_ma_offset_3.value)):
-                return 'signal_stoploss_p_3'
-
-        return None
+            ('signal_profit_p_t_1', p['sell_custom_pump_trail_profit_min_1'], p['sell_custom_pump_trail_profit_max_1'],
+             lambda candle, shared, profit, max_profit: shared[(36, 2)]
+             & (p['sell_custom_pump_trail_rsi_min_1'] < candle['rsi']) & (candle['rsi'] < p['sell_custom_pump_trail_rsi_max_1'])
+             & (max_profit > (profit + p['sell_custom_pump_trail_down_1']))),
+
+            ('signal_stoploss_p_1', p['sell_custom_stoploss_pump_min_1'], p['sell_custom_stoploss_pump_max_1'],
+             lambda candle, shared, profit, max_profit: (max_profit < p['sell_custom_stoploss_pump_max_profit_1']) & shared[(48, 1)]
+             & candle['sma_200_dec'] & (candle['close'] < (candle['ema_200'] * p['sell_custom_stoploss_pump_ma_offset_1']))),
+
+            ('signal_stoploss_p_2', -np.inf, p['sell_custom_stoploss_pump_loss_2'],
+             lambda candle, shared, profit, max_profit: (max_profit < p['sell_custom_stoploss_pump_max_profit_2']) & shared[(48, 1)]
+             & candle['sma_200_dec_1h'] & (candle['close'] < (candle['ema_200'] * p['sell_custom_stoploss_pump_ma_offset_2']))),
+
+            ('signal_stoploss_p_3', -np.inf, p['sell_custom_stoploss_pump_loss_3'],
+             lambda candle, shared, profit, max_profit: (max_profit < p['sell_custom_stoploss_pump_max_profit_3']) & shared[(36, 3)]
+             & (candle['close'] < (candle['ema_200'] * p['sell_custom_stoploss_pump_ma_offset_3']))),
+        ]
+        return SellRules(families, rules, pumps)
+
+    def backtest_sell_reason(self, pair: str, trade: 'Trade', current_time: datetime, current_profit: float,
+                             max_profit: float) -> tuple:
+        """
+        The custom_sell reason of a trade at a candle, backtesting and hyperopt only. The reasons of the next
+        candles of the trade are evaluated at once and reused by the calls that follow, 32 candles for a new
+        trade and twice as many for every following window, up to backtest_sell_window.
+        :param pair: str Pair
+        :param trade: Trade Open trade
+        :param current_time: datetime Date of the candle
+        :param current_profit: float Profit ratio of the trade at the candle
+        :param max_profit: float Highest profit ratio of the trade
+        :return: tuple (found, reason), not found if the candle or the profits are not the precomputed ones
+        """
+        candles = self.sell_candles[pair]
+        row = candles.row(current_time)
+        if row is None:
+            self.sell_window_fallback(pair, current_time, "no analyzed candle at that date")
+            return False, None
+        # custom_sell sees the candle before
+        if row == 0:
+            return False, None
+
+        window = self.sell_windows.get(pair)
+        if window is None or window['trade'] is not trade:
+            window = {'trade': trade, 'start': row, 'length': 32, 'reasons': ()}
+        if not window['start'] <= row < window['start'] + len(window['reasons']):
+            length = window['length'] if not len(window['reasons']) else min(2 * window['length'], self.backtest_sell_window)
+            window = candles.sell_reasons(self.sell_rules, trade, row, length)
+            window.update(trade=trade, length=length)
+            self.sell_windows[pair] = window
+
+        i = row - window['start']
+        if window['profits'][i] != current_profit or window['max_profits'][i] != max_profit:
+            self.sell_window_fallback(pair, current_time, f"profit {current_profit} / max profit {max_profit} instead of the "
+                                                          f"precomputed {window['profits'][i]} / {window['max_profits'][i]}")
+            return False, None
+        return True, window['reasons'][i]
+
+    def sell_window_fallback(self, pair: str, current_time: datetime, cause: str):
+        """
+        Count a custom_sell call the precomputed reasons could not answer, the first one is logged
+        """
+        if not self.sell_window_fallbacks:
+            logger.warning(f"custom_sell of {pair} at {current_time} is evaluated on its own, {cause}. "
+                           f"Every such call is counted in sell_window_fallbacks.")
+        self.sell_window_fallbacks += 1
 
-    def range_percent_change(self, dataframe: DataFrame, length: int) -> float:
+    def range_percent_change(self, dataframe: DataFrame, length: int, rolling: 'RollingCache' = None) -> float:
         """
         Rolling Percentage Change Maximum across interval.
 
         :param dataframe: DataFrame The original OHLC dataframe
         :param length: int The length to look back
+        :param rolling: RollingCache Shared rolling statistics of the dataframe (optional)
         """
-        df = dataframe.copy()
-        return ((df['open'].rolling(length).max() - df['close'].rolling(length).min()) / df['close'].rolling(length).min())
+        rolling = rolling or RollingCache(dataframe)
+        return ((rolling.get('open', length, 'max') - rolling.get('close', length, 'min')) / rolling.get('close', length, 'min'))
 
-    def range_maxgap(self, dataframe: DataFrame, length: int) -> float:
+    def range_maxgap(self, dataframe: DataFrame, length: int, rolling: 'RollingCache' = None) -> float:
         """
         Maximum Price Gap across interval.
 
         :param dataframe: DataFrame The original OHLC dataframe
         :param length: int The length to look back
+        :param rolling: RollingCache Shared rolling statistics of the dataframe (optional)
         """
-        df = dataframe.copy()
-        return (df['open'].rolling(length).max() - df['close'].rolling(length).min())
+        rolling = rolling or RollingCache(dataframe)
+        return (rolling.get('open', length, 'max') - rolling.get('close', length, 'min'))
 
-    def range_maxgap_adjusted(self, dataframe: DataFrame, length: int, adjustment: float) -> float:
+    def range_maxgap_adjusted(self, dataframe: DataFrame, length: int, adjustment: float, rolling: 'RollingCache' = None) -> float:
         """
         Maximum Price Gap across interval adjusted.
 
         :param dataframe: DataFrame The original OHLC dataframe
         :param length: int The length to look back
         :param adjustment: int The adjustment to be applied
+        :param rolling: RollingCache Shared rolling statistics of the dataframe (optional)
         """
-        return (self.range_maxgap(dataframe,length) / adjustment)
+        return (self.range_maxgap(dataframe, length, rolling) / adjustment)
 
-    def range_height(self, dataframe: DataFrame, length: int) -> float:
+    def range_height(self, dataframe: DataFrame, length: int, rolling: 'RollingCache' = None) -> float:
         """
         Current close distance to range bottom.
 
         :param dataframe: DataFrame The original OHLC dataframe
         :param length: int The length to look back
+        :param rolling: RollingCache Shared rolling statistics of the dataframe (optional)
         """
-        df = dataframe.copy()
-        return (df['close'] - df['close'].rolling(length).min())
+        rolling = rolling or RollingCache(dataframe)
+        return (dataframe['close'] - rolling.get('close', length, 'min'))
 
-    def safe_pump(self, dataframe: DataFrame, length: int, thresh: float, pull_thresh: float) -> bool:
+    def safe_pump(self, dataframe: DataFrame, length: int, thresh: float, pull_thresh: float, rolling: 'RollingCache' = None) -> bool:
         """
         Determine if entry after a pump is safe.
 
@@ -1647,9 +1904,125 @@ class NostalgiaForInfinityNext(IStrategy):
         :param length: int The length to look back
         :param thresh: int Maximum percentage change threshold
         :param pull_thresh: int Pullback from interval maximum threshold
+        :param rolling: RollingCache Shared rolling statistics of the dataframe (optional)
+        """
+        rolling = rolling or RollingCache(dataframe)
+        return (self.range_percent_change(dataframe, length, rolling) < thresh) | (self.range_maxgap_adjusted(dataframe, length, pull_thresh, rolling) > self.range_height(dataframe, length, rolling))
+
+    def pump_ratio(self, dataframe: DataFrame, length: int, rolling: 'RollingCache' = None) -> Series:
+        """
+        Height of the interval range relative to its bottom.
+
+        :param dataframe: DataFrame The original OHLC dataframe
+        :param length: int The length to look back
+        :param rolling: RollingCache Shared rolling statistics of the dataframe (optional)
+        """
+        rolling = rolling or RollingCache(dataframe)
+        return ((rolling.get('high', length, 'max') - rolling.get('low', length, 'min')) / rolling.get('low', length, 'min'))
+
+    def sell_pump_bank(self, dataframe: DataFrame, rolling: 'RollingCache' = None) -> dict:
+        """
+        Sell pump detectors: one range ratio per window, compared against all the thresholds of that window at once.
+        Returns the 'pump_ratio_{length}' ratios and the 'sell_pump_{length}_{level}' flags.
+
+        :param dataframe: DataFrame The original OHLC dataframe
+        :param rolling: RollingCache Shared rolling statistics of the dataframe (optional)
+        """
+        bank = {}
+        for length, params in self.sell_pump_levels.items():
+            ratio = self.pump_ratio(dataframe, length, rolling)
+            thresholds = np.array([getattr(self, f"sell_pump_threshold_{param}").value for param in params])
+            flags = ratio.values[:, None] > thresholds
+
+            bank[f"pump_ratio_{length}"] = ratio
+            for level in range(len(params)):
+                bank[f"sell_pump_{length}_{level + 1}"] = flags[:, level]
+
+        return bank
+
+    def buy_protection_indicators(self, condition: int) -> list:
+        """
+        Indicators read by the standard protections of a buy condition with the current parameters
+
+        :param condition: int Number of the buy condition
+        """
+        def param(name):
+            return getattr(self, f"buy_{condition:02d}_protection__{name}").value
+
+        columns = []
+        if param('ema_fast'):
+            columns += [f"ema_{param('ema_fast_len')}", 'ema_200']
+        if param('ema_slow'):
+            columns += [f"ema_{param('ema_slow_len')}_1h", 'ema_200_1h']
+        if param('close_above_ema_fast'):
+            columns.append(f"ema_{param('close_above_ema_fast_len')}")
+        if param('close_above_ema_slow'):
+            columns.append(f"ema_{param('close_above_ema_slow_len')}_1h")
+        if param('sma200_rising'):
+            columns.append('sma_200')
+        if param('sma200_1h_rising'):
+            columns.append('sma_200_1h')
+        if param('safe_dips'):
+            columns.append(f"safe_dips_{param('safe_dips_type')}")
+        if param('safe_pump'):
+            columns.append(f"safe_pump_{param('safe_pump_period')}_{param('safe_pump_type')}_1h")
+        return columns
+
+    def required_indicators(self) -> set:
+        """
+        Indicators reachable from the enabled buy conditions, the enabled sell conditions and custom_sell.
+        AllIndicators in hyperopt, it changes the enabled conditions after the indicators are populated.
         """
-        df = dataframe.copy()
-        return (self.range_percent_change(df, length) < thresh) | (self.range_maxgap_adjusted(df, length, pull_thresh) > self.range_height(df, length))
+        if self.config['runmode'].value == 'hyperopt':
+            return AllIndicators()
+
+        need = set(self.custom_sell_indicators)
+        for condition, columns in self.sell_condition_indicators.items():
+            if getattr(self, f"sell_condition_{condition}_enable").value:
+                need.update(columns)
+        for condition, columns in self.buy_condition_indicators.items():
+            if getattr(self, f"buy_condition_{condition}_enable").value:
+                need.update(columns)
+                need.update(self.buy_protection_indicators(condition))
+
+        pending = list(need)
+        while pending:
+            for column in self.indicator_inputs.get(pending.pop(), []):
+                if column not in need:
+                    need.add(column)
+                    pending.append(column)
+        return need
+
+    def is_required(self, need: set, *columns: str) -> bool:
+        """
+        True if any of the columns is required
+
+        :param need: set Required indicators, or AllIndicators
+        :param columns: str Columns produced together by one computation
+        """
+        return not need.isdisjoint(columns)
+
+    def indicator_store(self):
+        """
+        The store of the populated frames of backtesting and hyperopt, None if it is not used
+        """
+        if not self.store_indicators or not self.config['runmode'].value in ('backtest', 'hyperopt'):
+            return None
+
+        code, names, patterns = indicator_source(type(self), self.indicator_store_ignores)
+        parameters = {name: parameter.value for name, parameter in self.enumerate_parameters()
+                      if name in names or any(re.fullmatch(pattern, name) for pattern in patterns)}
+        key = {
+            'code': code,
+            'parameters': parameters,
+            'timeframes': [self.timeframe, self.inf_1h],
+            'versions': [np.__version__, pd.__version__, talib.__version__],
+            'compact': self.compact_indicators,
+        }
+        need = self.required_indicators()
+        key['indicators'] = 'all' if isinstance(need, AllIndicators) else sorted(need)
+        digest = hashlib.sha256(json.dumps(key, sort_keys=True, default=str).encode()).hexdigest()[:16]
+        return IndicatorStore(Path(self.config.get('user_data_dir', 'user_data')) / 'indicator_store' / type(self).__name__, digest)
 
     def informative_pairs(self):
         # get access to all pairs available in whitelist.
@@ -1660,917 +2033,1167 @@ class NostalgiaForInfinityNext(IStrategy):
 
     def informative_1h_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         assert self.dp, "DataProvider is required for multiple timeframes."
-        # Get the informative pair
-        informative_1h = self.dp.get_pair_dataframe(pair=metadata['pair'], timeframe=self.inf_1h)
+        # Get the informative pair, backtesting and hyperopt fetched it already along with its batched indicators
+        informative_1h, batched = self.batched_informative.pop(metadata['pair'], (None, []))
+        if informative_1h is None:
+            informative_1h = self.dp.get_pair_dataframe(pair=metadata['pair'], timeframe=self.inf_1h)
+        need = self.required_indicators() - {f"{column}_{self.inf_1h}" for column in batched}
 
         # EMA
-        informative_1h['ema_15'] = ta.EMA(informative_1h, timeperiod=15)
-        informative_1h['ema_20'] = ta.EMA(informative_1h, timeperiod=20)
-        informative_1h['ema_26'] = ta.EMA(informative_1h, timeperiod=26)
-        informative_1h['ema_50'] = ta.EMA(informative_1h, timeperiod=50)
-        informative_1h['ema_100'] = ta.EMA(informative_1h, timeperiod=100)
-        informative_1h['ema_200'] = ta.EMA(informative_1h, timeperiod=200)
+        for length in (15, 20, 26, 50, 100, 200):
+            if self.is_required(need, f"ema_{length}_1h"):
+                informative_1h[f"ema_{length}"] = ta.EMA(informative_1h, timeperiod=length)
 
         # SMA
-        informative_1h['sma_200'] = ta.SMA(informative_1h, timeperiod=200)
-        informative_1h['sma_200_dec'] = informative_1h['sma_200'] < informative_1h['sma_200'].shift(20)
+        if self.is_required(need, 'sma_200_1h'):
+            informative_1h['sma_200'] = ta.SMA(informative_1h, timeperiod=200)
+        if self.is_required(need, 'sma_200_dec_1h'):
+            informative_1h['sma_200_dec'] = informative_1h['sma_200'] < informative_1h['sma_200'].shift(20)
 
         # RSI
-        informative_1h['rsi'] = ta.RSI(informative_1h, timeperiod=14)
+        if self.is_required(need, 'rsi_1h'):
+            informative_1h['rsi'] = ta.RSI(informative_1h, timeperiod=14)
 
         # BB
-        bollinger = qtpylib.bollinger_bands(qtpylib.typical_price(informative_1h), window=20, stds=2)
-        informative_1h['bb_lowerband'] = bollinger['lower']
-        informative_1h['bb_middleband'] = bollinger['mid']
-        informative_1h['bb_upperband'] = bollinger['upper']
-
-        # Pump protections
-        informative_1h['safe_pump_24_normal'] = self.safe_pump(informative_1h, 24, self.buy_pump_threshold_1.value, self.buy_pump_pull_threshold_1.value)
-        informative_1h['safe_pump_36_normal'] = self.safe_pump(informative_1h, 36, self.buy_pump_threshold_2.value, self.buy_pump_pull_threshold_2.value)
-        informative_1h['safe_pump_48_normal'] = self.safe_pump(informative_1h, 48, self.buy_pump_threshold_3.value, self.buy_pump_pull_threshold_3.value)
+        if self.is_required(need, 'bb_lowerband_1h', 'bb_middleband_1h', 'bb_upperband_1h'):
+            bollinger = qtpylib.bollinger_bands(qtpylib.typical_price(informative_1h), window=20, stds=2)
+            informative_1h['bb_lowerband'] = bollinger['lower']
+            informative_1h['bb_middleband'] = bollinger['mid']
+            informative_1h['bb_upperband'] = bollinger['upper']
+
+        # Pump protections, all of them share the same rolling max/min
+        rolling = RollingCache(informative_1h)
+        if self.is_required(need, 'safe_pump_24_normal_1h'):
+            informative_1h['safe_pump_24_normal'] = self.safe_pump(informative_1h, 24, self.buy_pump_threshold_1.value, self.buy_pump_pull_threshold_1.value, rolling)
+        if self.is_required(need, 'safe_pump_36_normal_1h'):
+            informative_1h['safe_pump_36_normal'] = self.safe_pump(informative_1h, 36, self.buy_pump_threshold_2.value, self.buy_pump_pull_threshold_2.value, rolling)
+        if self.is_required(need, 'safe_pump_48_normal_1h'):
+            informative_1h['safe_pump_48_normal'] = self.safe_pump(informative_1h, 48, self.buy_pump_threshold_3.value, self.buy_pump_pull_threshold_3.value, rolling)
+
+        if self.is_required(need, 'safe_pump_24_strict_1h'):
+            informative_1h['safe_pump_24_strict'] = self.safe_pump(informative_1h, 24, self.buy_pump_threshold_4.value, self.buy_pump_pull_threshold_4.value, rolling)
+        if self.is_required(need, 'safe_pump_36_strict_1h'):
+            informative_1h['safe_pump_36_strict'] = self.safe_pump(informative_1h, 36, self.buy_pump_threshold_5.value, self.buy_pump_pull_threshold_5.value, rolling)
+        if self.is_required(need, 'safe_pump_48_strict_1h'):
+            informative_1h['safe_pump_48_strict'] = self.safe_pump(informative_1h, 48, self.buy_pump_threshold_6.value, self.buy_pump_pull_threshold_6.value, rolling)
+
+        if self.is_required(need, 'safe_pump_24_loose_1h'):
+            informative_1h['safe_pump_24_loose'] = self.safe_pump(informative_1h, 24, self.buy_pump_threshold_7.value, self.buy_pump_pull_threshold_7.value, rolling)
+        if self.is_required(need, 'safe_pump_36_loose_1h'):
+            informative_1h['safe_pump_36_loose'] = self.safe_pump(informative_1h, 36, self.buy_pump_threshold_8.value, self.buy_pump_pull_threshold_8.value, rolling)
+        if self.is_required(need, 'safe_pump_48_loose_1h'):
+            informative_1h['safe_pump_48_loose'] = self.safe_pump(informative_1h, 48, self.buy_pump_threshold_9.value, self.buy_pump_pull_threshold_9.value, rolling)
+
+        # Sell pump protections, one range ratio per window and all of its thresholds
+        for column, values in self.sell_pump_bank(informative_1h, rolling).items():
+            informative_1h[column] = values
 
-        informative_1h['safe_pump_24_strict'] = self.safe_pump(informative_1h, 24, self.buy_pump_threshold_4.value, self.buy_pump_pull_threshold_4.value)
-        informative_1h['safe_pump_36_strict'] = self.safe_pump(informative_1h, 36, self.buy_pump_threshold_5.value, self.buy_pump_pull_threshold_5.value)
-        informative_1h['safe_pump_48_strict'] = self.safe_pump(informative_1h, 48, self.buy_pump_threshold_6.value, self.buy_pump_pull_threshold_6.value)
+        return informative_1h
 
-        informative_1h['safe_pump_24_loose'] = self.safe_pump(informative_1h, 24, self.buy_pump_threshold_7.value, self.buy_pump_pull_threshold_7.value)
-        informative_1h['safe_pump_36_loose'] = self.safe_pump(informative_1h, 36, self.buy_pump_threshold_8.value, self.buy_pump_pull_threshold_8.value)
-        informative_1h['safe_pump_48_loose'] = self.safe_pump(informative_1h, 48, self.buy_pump_threshold_9.value, self.buy_pump_pull_threshold_9.value)
+    def safe_dips_bank(self, dataframe: DataFrame, profiles: dict) -> dict:
+        """
+        Dip protections. The drawdown ratios are computed once, every profile is a row of
+        thresholds and all profiles are checked against them in one comparison.
 
-        informative_1h['sell_pump_48_1'] = (((informative_1h['high'].rolling(48).max() - informative_1h['low'].rolling(48).min()) / informative_1h['low'].rolling(48).min()) > self.sell_pump_threshold_1.value)
-        informative_1h['sell_pump_48_2'] = (((informative_1h['high'].rolling(48).max() - informative_1h['low'].rolling(48).min()) / informative_1h['low'].rolling(48).min()) > self.sell_pump_threshold_2.value)
-        informative_1h['sell_pump_48_3'] = (((informative_1h['high'].rolling(48).max() - informative_1h['low'].rolling(48).min()) / informative_1h['low'].rolling(48).min()) > self.sell_pump_threshold_3.value)
+        :param dataframe: DataFrame The original OHLC dataframe
+        :param profiles: dict Column name -> thresholds, one per window of dip_ratios
+        """
+        ratios = dip_ratios(dataframe)
+        thresholds = np.array(list(profiles.values()), dtype=np.float64)
+        safe = (ratios[:, None, :] < thresholds[None, :, :]).all(axis=2)
+        return {column: safe[:, i] for i, column in enumerate(profiles)}
 
-        informative_1h['sell_pump_36_1'] = (((informative_1h['high'].rolling(36).max() - informative_1h['low'].rolling(36).min()) / informative_1h['low'].rolling(36).min()) > self.sell_pump_threshold_4.value)
-        informative_1h['sell_pump_36_2'] = (((informative_1h['high'].rolling(36).max() - informative_1h['low'].rolling(36).min()) / informative_1h['low'].rolling(36).min()) > self.sell_pump_threshold_5.value)
-        informative_1h['sell_pump_36_3'] = (((informative_1h['high'].rolling(36).max() - informative_1h['low'].rolling(36).min()) / informative_1h['low'].rolling(36).min()) > self.sell_pump_threshold_6.value)
+    def stream_specs(self, need: set) -> dict:
+        """
+        Indicators of the normal timeframe that are kept as running state in live runs.
+        Output columns (None for an unused output) -> (source, state factory)
 
-        informative_1h['sell_pump_24_1'] = (((informative_1h['high'].rolling(24).max() - informative_1h['low'].rolling(24).min()) / informative_1h['low'].rolling(24).min()) > self.sell_pump_threshold_7.value)
-        informative_1h['sell_pump_24_2'] = (((informative_1h['high'].rolling(24).max() - informative_1h['low'].rolling(24).min()) / informative_1h['low'].rolling(24).min()) > self.sell_pump_threshold_8.value)
-        informative_1h['sell_pump_24_3'] = (((informative_1h['high'].rolling(24).max() - informative_1h['low'].rolling(24).min()) / informative_1h['low'].rolling(24).min()) > self.sell_pump_threshold_9.value)
+        :param need: set Required indicators, or AllIndicators
+        """
+        specs = {}
+        for length in (12, 20, 26, 50, 100, 200):
+            if self.is_required(need, f"ema_{length}"):
+                specs[(f"ema_{length}",)] = ('close', lambda length=length: EMAState(length))
+        for length in (5, 30, 200):
+            if self.is_required(need, f"sma_{length}"):
+                specs[(f"sma_{length}",)] = ('close', lambda length=length: SMAState(length))
+        if self.is_required(need, 'rsi'):
+            specs[('rsi',)] = ('close', lambda: RSIState(14))
+        if self.is_required(need, 'ewo'):
+            specs[('ewo',)] = ('close', lambda: EWOState(50, 200))
+        if self.is_required(need, 'bb_lowerband', 'bb_middleband', 'bb_upperband'):
+            specs[('bb_lowerband', 'bb_middleband', 'bb_upperband')] = ('typical', lambda: BollingerState(20, 2))
+        if self.is_required(need, 'lower', 'mid'):
+            specs[('lower', 'mid', None)] = ('close', lambda: BollingerState(40, 2))
+        if self.is_required(need, 'volume_mean_30'):
+            specs[('volume_mean_30',)] = ('volume', lambda: SMAState(30))
+        return specs
+
+    def batch_specs(self, need: set, informative: bool = False) -> dict:
+        """
+        Indicators computed for all pairs together in backtesting and hyperopt.
+        Output columns (None for an unused output) -> (source, kernel over a (pairs x candles) array)
 
-        return informative_1h
+        :param need: set Required indicators, or AllIndicators
+        :param informative: bool The 1h stack instead of the normal timeframe one
+        """
+        suffix = f"_{self.inf_1h}" if informative else ''
+        specs = {}
+        for length in ((15, 20, 26, 50, 100, 200) if informative else (12, 20, 26, 50, 100, 200)):
+            if self.is_required(need, f"ema_{length}{suffix}"):
+                specs[(f"ema_{length}",)] = ('close', lambda values, length=length: (talib_rows(talib.EMA, values, timeperiod=length),))
+        for length in ((200,) if informative else (5, 30, 200)):
+            if self.is_required(need, f"sma_{length}{suffix}"):
+                specs[(f"sma_{length}",)] = ('close', lambda values, length=length: (talib_rows(talib.SMA, values, timeperiod=length),))
+        if self.is_required(need, f"rsi{suffix}"):
+            specs[('rsi',)] = ('close', lambda values: (talib_rows(talib.RSI, values, timeperiod=14),))
+        if self.is_required(need, f"bb_lowerband{suffix}", f"bb_middleband{suffix}", f"bb_upperband{suffix}"):
+            specs[('bb_lowerband', 'bb_middleband', 'bb_upperband')] = ('typical', lambda values: bollinger_batch(values, 20, 2))
+        if informative:
+            return specs
+
+        if self.is_required(need, 'ewo'):
+            specs[('ewo',)] = ('close', lambda values: (EWO_batch(values, 50, 200),))
+        if self.is_required(need, 'lower', 'mid'):
+            specs[('lower', 'mid', None)] = ('close', lambda values: bollinger_batch(values, 40, 2))
+        if self.is_required(need, 'volume_mean_30'):
+            specs[('volume_mean_30',)] = ('volume', lambda values: (rolling_batch(values, 30).mean().values.T,))
+        return specs
 
     def normal_tf_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        need = self.required_indicators()
+
+        # Live runs only push the new candles through the streamed indicators
+        if self.config['runmode'].value in ('live', 'dry_run'):
+            if not metadata['pair'] in self.streams:
+                self.streams[metadata['pair']] = IndicatorStream(self.stream_specs(need), timeframe_to_minutes(self.timeframe))
+            streamed = self.streams[metadata['pair']].update(dataframe)
+            for column, values in streamed.items():
+                dataframe[column] = values
+            need = need - set(streamed)
+
+        # Backtesting and hyperopt computed the batchable indicators of all pairs up front
+        batched = self.batched.pop(metadata['pair'], {})
+        if all(len(values) == len(dataframe) for values in batched.values()):
+            for column, values in batched.items():
+                dataframe[column] = values
+            need = need - set(batched)
+
         # BB 40
-        bb_40 = qtpylib.bollinger_bands(dataframe['close'], window=40, stds=2)
-        dataframe['lower'] = bb_40['lower']
-        dataframe['mid'] = bb_40['mid']
-        dataframe['bbdelta'] = (bb_40['mid'] - dataframe['lower']).abs()
-        dataframe['closedelta'] = (dataframe['close'] - dataframe['close'].shift()).abs()
-        dataframe['tail'] = (dataframe['close'] - dataframe['low']).abs()
+        if self.is_required(need, 'lower', 'mid'):
+            bb_40 = qtpylib.bollinger_bands(dataframe['close'], window=40, stds=2)
+            dataframe['lower'] = bb_40['lower']
+            dataframe['mid'] = bb_40['mid']
+        if self.is_required(need, 'bbdelta', 'closedelta', 'tail'):
+            dataframe['bbdelta'] = (dataframe['mid'] - dataframe['lower']).abs()
+            dataframe['closedelta'] = (dataframe['close'] - dataframe['close'].shift()).abs()
+            dataframe['tail'] = (dataframe['close'] - dataframe['low']).abs()
 
         # BB 20
-        bollinger = qtpylib.bollinger_bands(qtpylib.typical_price(dataframe), window=20, stds=2)
-        dataframe['bb_lowerband'] = bollinger['lower']
-        dataframe['bb_middleband'] = bollinger['mid']
-        dataframe['bb_upperband'] = bollinger['upper']
-
-        # EMA 200
-        dataframe['ema_12'] = ta.EMA(dataframe, timeperiod=12)
-        dataframe['ema_20'] = ta.EMA(dataframe, timeperiod=20)
-        dataframe['ema_26'] = ta.EMA(dataframe, timeperiod=26)
-        dataframe['ema_50'] = ta.EMA(dataframe, timeperiod=50)
-        dataframe['ema_100'] = ta.EMA(dataframe, timeperiod=100)
-        dataframe['ema_200'] = ta.EMA(dataframe, timeperiod=200)
+        if self.is_required(need, 'bb_lowerband', 'bb_middleband', 'bb_upperband'):
+            bollinger = qtpylib.bollinger_bands(qtpylib.typical_price(dataframe), window=20, stds=2)
+            dataframe['bb_lowerband'] = bollinger['lower']
+            dataframe['bb_middleband'] = bollinger['mid']
+            dataframe['bb_upperband'] = bollinger['upper']
+
+        # EMA
+        for length in (12, 20, 26, 50, 100, 200):
+            if self.is_required(need, f"ema_{length}"):
+                dataframe[f"ema_{length}"] = ta.EMA(dataframe, timeperiod=length)
 
         # SMA
-        dataframe['sma_5'] = ta.SMA(dataframe, timeperiod=5)
-        dataframe['sma_30'] = ta.SMA(dataframe, timeperiod=30)
-        dataframe['sma_200'] = ta.SMA(dataframe, timeperiod=200)
+        for length in (5, 30, 200):
+            if self.is_required(need, f"sma_{length}"):
+                dataframe[f"sma_{length}"] = ta.SMA(dataframe, timeperiod=length)
 
-        dataframe['sma_200_dec'] = dataframe['sma_200'] < dataframe['sma_200'].shift(20)
+        if self.is_required(need, 'sma_200_dec'):
+            dataframe['sma_200_dec'] = dataframe['sma_200'] < dataframe['sma_200'].shift(20)
 
         # MFI
-        dataframe['mfi'] = ta.MFI(dataframe)
+        if self.is_required(need, 'mfi'):
+            dataframe['mfi'] = ta.MFI(dataframe)
 
         # EWO
-        dataframe['ewo'] = EWO(dataframe, 50, 200)
+        if self.is_required(need, 'ewo'):
+            dataframe['ewo'] = EWO(dataframe, 50, 200)
 
         # RSI
-        dataframe['rsi'] = ta.RSI(dataframe, timeperiod=14)
+        if self.is_required(need, 'rsi'):
+            dataframe['rsi'] = ta.RSI(dataframe, timeperiod=14)
 
         # Chopiness
-        dataframe['chop']= qtpylib.chopiness(dataframe, 14)
+        if self.is_required(need, 'chop'):
+            dataframe['chop']= qtpylib.chopiness(dataframe, 14)
 
         # Dip protection
-        dataframe['safe_dips_normal'] = ((((dataframe['open'] - dataframe['close']) / dataframe['close']) < self.buy_dip_threshold_1.value) &
-                                  (((dataframe['open'].rolling(2).max() - dataframe['close']) / dataframe['close']) < self.buy_dip_threshold_2.value) &
-                                  (((dataframe['open'].rolling(12).max() - dataframe['close']) / dataframe['close']) < self.buy_dip_threshold_3.value) &
-                                  (((dataframe['open'].rolling(144).max() - dataframe['close']) / dataframe['close']) < self.buy_dip_threshold_4.value))
-
-        dataframe['safe_dips_strict'] = ((((dataframe['open'] - dataframe['close']) / dataframe['close']) < self.buy_dip_threshold_5.value) &
-                                  (((dataframe['open'].rolling(2).max() - dataframe['close']) / dataframe['close']) < self.buy_dip_threshold_6.value) &
-                                  (((dataframe['open'].rolling(12).max() - dataframe['close']) / dataframe['close']) < self.buy_dip_threshold_7.value) &
-                                  (((dataframe['open'].rolling(144).max() - dataframe['close']) / dataframe['close']) < self.buy_dip_threshold_8.value))
-
-        dataframe['safe_dips_loose'] = ((((dataframe['open'] - dataframe['close']) / dataframe['close']) < self.buy_dip_threshold_9.value) &
-                                  (((dataframe['open'].rolling(2).max() - dataframe['close']) / dataframe['close']) < self.buy_dip_threshold_10.value) &
-                                  (((dataframe['open'].rolling(12).max() - dataframe['close']) / dataframe['close']) < self.buy_dip_threshold_11.value) &
-                                  (((dataframe['open'].rolling(144).max() - dataframe['close']) / dataframe['close']) < self.buy_dip_threshold_12.value))
+        profiles = {
+            'safe_dips_normal': (self.buy_dip_threshold_1.value, self.buy_dip_threshold_2.value, self.buy_dip_threshold_3.value, self.buy_dip_threshold_4.value),
+            'safe_dips_strict': (self.buy_dip_threshold_5.value, self.buy_dip_threshold_6.value, self.buy_dip_threshold_7.value, self.buy_dip_threshold_8.value),
+            'safe_dips_loose': (self.buy_dip_threshold_9.value, self.buy_dip_threshold_10.value, self.buy_dip_threshold_11.value, self.buy_dip_threshold_12.value),
+        }
+        profiles = {column: thresholds for column, thresholds in profiles.items() if self.is_required(need, column)}
+        if profiles:
+            for column, values in self.safe_dips_bank(dataframe, profiles).items():
+                dataframe[column] = values
 
         # Volume
-        dataframe['volume_mean_4'] = dataframe['volume'].rolling(4).mean().shift(1)
-        dataframe['volume_mean_30'] = dataframe['volume'].rolling(30).mean()
+        if self.is_required(need, 'volume_mean_4'):
+            dataframe['volume_mean_4'] = dataframe['volume'].rolling(4).mean().shift(1)
+        if self.is_required(need, 'volume_mean_30'):
+            dataframe['volume_mean_30'] = dataframe['volume'].rolling(30).mean()
 
         return dataframe
 
+    def project_informative(self, dataframe: DataFrame, informative: DataFrame, metadata: dict, columns: dict = None) -> DataFrame:
+        """
+        Same columns as merge_informative_pair(ffill=True), without merging and copying the whole dataframe.
+        In live runs the row mapping is kept per pair and extended as candles arrive.
+
+        :param dataframe: DataFrame of the strategy timeframe
+        :param informative: DataFrame of the informative timeframe
+        :param metadata: dict Metadata of the pair
+        :param columns: dict Informative column -> name in the dataframe, by default all of them with the timeframe suffix
+        """
+        if columns is None:
+            columns = {column: f"{column}_{self.inf_1h}" for column in informative.columns}
+
+        projection = InformativeProjection(timeframe_to_minutes(self.timeframe), timeframe_to_minutes(self.inf_1h))
+        if self.config['runmode'].value in ('live', 'dry_run'):
+            projection = self.informative_projections.setdefault(metadata['pair'], projection)
+
+        return projection.project(dataframe, informative, columns)
+
+    def informative_exports(self, dataframe: DataFrame, informative: DataFrame, metadata: dict) -> dict:
+        """
+        The informative columns that are read in the normal timeframe, with their names there.
+        The others are not projected into the 5m frame, the memory that saves is reported once per pair.
+
+        :param dataframe: DataFrame of the normal timeframe
+        :param informative: DataFrame of the informative timeframe
+        :param metadata: dict Metadata of the pair
+        """
+        columns = {column: f"{column}_{self.inf_1h}" for column in informative.columns}
+        need = self.required_indicators()
+        if isinstance(need, AllIndicators):
+            return columns
+
+        exports = {column: name for column, name in columns.items() if name in need}
+        if not metadata['pair'] in self.informative_savings:
+            saved = sum(informative[column].dtype.itemsize for column in columns if not column in exports) * len(dataframe)
+            self.informative_savings[metadata['pair']] = saved
+            logger.info(f"{metadata['pair']}: {len(exports)} of {len(columns)} informative columns used, "
+                        f"{saved / 1024:.1f} KiB of the {self.timeframe} frame saved")
+        return exports
+
+    def ohlcvdata_to_dataframe(self, data: dict) -> dict:
+        """
+        Backtesting and hyperopt populate all pairs in one go. The pairs whose frames are in the indicator
+        store are loaded from it, the others are populated and stored.
+
+        :param data: dict Pair -> OHLCV dataframe
+        """
+        store = self.indicator_store()
+        stored = {}
+        if store:
+            extras = {pair: frame_digest(self.dp.get_pair_dataframe(pair=pair, timeframe=self.inf_1h)) for pair in data}
+            for pair, candles in data.items():
+                dataframe = store.load(pair, self.timeframe, candles, extras[pair])
+                if dataframe is not None:
+                    stored[pair] = dataframe
+
+        populated = self.populate_batched({pair: candles for pair, candles in data.items() if not pair in stored})
+        if store:
+            for pair, dataframe in populated.items():
+                store.save(pair, self.timeframe, dataframe, extras[pair])
+            store.prune()
+            logger.info(f"Indicator store {store.path}: {len(stored)} of {len(data)} pairs loaded")
+
+        return {pair: stored[pair] if pair in stored else populated[pair] for pair in data}
+
+    def populate_batched(self, data: dict) -> dict:
+        """
+        The batchable indicators of both timeframes are computed for all pairs together first,
+        populate_indicators then picks them up pair by pair.
+
+        :param data: dict Pair -> OHLCV dataframe
+        """
+        if not self.batch_indicators:
+            return self.populate_pairs(data)
+
+        need = self.required_indicators()
+        self.batched = IndicatorBatch(self.batch_specs(need)).compute(data)
+        if self.dp:
+            informative = {pair: self.dp.get_pair_dataframe(pair=pair, timeframe=self.inf_1h) for pair in data}
+            batched = IndicatorBatch(self.batch_specs(need, informative=True)).compute(informative)
+            for pair, informative_1h in informative.items():
+                for column, values in batched.get(pair, {}).items():
+                    informative_1h[column] = values
+            self.batched_informative = {pair: (informative_1h, list(batched.get(pair, {}))) for pair, informative_1h in informative.items()}
+
+        try:
+            return self.populate_pairs(data)
+        finally:
+            self.batched = {}
+            self.batched_informative = {}
+
+    def populate_pairs(self, data: dict) -> dict:
+        """
+        Populate the indicators of all pairs, in backtesting and hyperopt in worker processes when there are cores
+        to spare. Live runs only get here with Edge and are not forked. Backtesting also takes the buy / sell
+        signals from the workers, hyperopt changes them every epoch.
+
+        :param data: dict Pair -> OHLCV dataframe
+        """
+        self.parallel_signals = {}
+        workers = min(self.populate_workers or os.cpu_count() or 1, len(data))
+        if workers < 2 or not self.config['runmode'].value in ('backtest', 'hyperopt') or not ParallelPopulation.available():
+            return super().ohlcvdata_to_dataframe(data)
+
+        population = ParallelPopulation(workers, signals=self.config['runmode'].value == 'backtest')
+        populated, self.parallel_signals = population.run(self, data)
+        return populated
+
+    def advise_buy(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        # Backtests take the buy signals computed by the population workers
+        signals = self.parallel_signals.get(metadata['pair'])
+        if signals is not None and take_signals(dataframe, signals, 'buy'):
+            return dataframe
+        return super().advise_buy(dataframe, metadata)
+
+    def advise_sell(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        # Backtests take the sell signals computed by the population workers
+        signals = self.parallel_signals.pop(metadata['pair'], None)
+        if signals is not None and take_signals(dataframe, signals, 'sell'):
+            return dataframe
+        return super().advise_sell(dataframe, metadata)
+
+    def compact(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        """
+        Compact copy of a populated frame (see compact_frame). On the first frame of a pair both frames run
+        through populate_buy_trend / populate_sell_trend, a pair whose signals differ stays in full precision.
+        :param dataframe: DataFrame The populated frame
+        :param metadata: dict Pair metadata
+        :return: DataFrame The compact frame, or the populated one if the pair failed the check
+        """
+        compact = compact_frame(dataframe)
+        pair = metadata['pair']
+        if pair not in self.compact_checked:
+            full = self.populate_sell_trend(self.populate_buy_trend(dataframe.copy(), metadata), metadata)
+            small = self.populate_sell_trend(self.populate_buy_trend(compact.copy(), metadata), metadata)
+            self.compact_checked[pair] = all(np.array_equal(signal_values(full, column), signal_values(small, column))
+                                             for column in ('buy', 'sell'))
+            if self.compact_checked[pair]:
+                logger.info(f"{pair}: compact frame {compact.memory_usage(deep=True).sum() / 1024:.0f} KiB, "
+                            f"{dataframe.memory_usage(deep=True).sum() / 1024:.0f} KiB in full precision")
+            else:
+                logger.warning(f"{pair}: the compact frame changes the signals, keeping it in full precision")
+        if not self.compact_checked[pair]:
+            return dataframe
+        return compact
+
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         # The indicators for the 1h informative timeframe
         informative_1h = self.informative_1h_indicators(dataframe, metadata)
-        dataframe = merge_informative_pair(dataframe, informative_1h, self.timeframe, self.inf_1h, ffill=True)
+        dataframe = self.project_informative(dataframe, informative_1h, metadata, self.informative_exports(dataframe, informative_1h, metadata))
 
         # The indicators for the normal (5m) timeframe
         dataframe = self.normal_tf_indicators(dataframe, metadata)
 
+        if self.compact_indicators:
+            dataframe = self.compact(dataframe, metadata)
+
         return dataframe
 
 
     def populate_buy_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         conditions = []
-        # Protections
-        buy_01_protections = [True]
-        if self.buy_01_protection__ema_fast.value:
-            buy_01_protections.append(dataframe[f"ema_{self.buy_01_protection__ema_fast_len.value}"] > dataframe['ema_200'])
-        if self.buy_01_protection__ema_slow.value:
-            buy_01_protections.append(dataframe[f"ema_{self.buy_01_protection__ema_slow_len.value}_1h"] > dataframe['ema_200_1h'])
-        if self.buy_01_protection__close_above_ema_fast.value:
-            buy_01_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_01_protection__close_above_ema_fast_len.value}"])
-        if self.buy_01_protection__close_above_ema_slow.value:
-            buy_01_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_01_protection__close_above_ema_slow_len.value}_1h"])
-        if self.buy_01_protection__sma200_rising.value:
-            buy_01_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(int(self.buy_01_protection__sma200_rising_val.value)))
-        if self.buy_01_protection__sma200_1h_rising.value:
-            buy_01_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(int(self.buy_01_protection__sma200_1h_rising_val.value)))
-        if self.buy_01_protection__safe_dips.value:
-            buy_01_protections.append(dataframe[f"safe_dips_{self.buy_01_protection__safe_dips_type.value}"])
-        if self.buy_01_protection__safe_pump.value:
-            buy_01_protections.append(dataframe[f"safe_pump_{self.buy_01_protection__safe_pump_period.value}_{self.buy_01_protection__safe_pump_type.value}_1h"])
-        # Non-Standard protections (add below)
-
-        # Logic
-        buy_01_logic = []
-        buy_01_logic.append(reduce(lambda x, y: x & y, buy_01_protections))
-        buy_01_logic.append(((dataframe['close'] - dataframe['open'].rolling(36).min()) / dataframe['open'].rolling(36).min()) > self.buy_min_inc_1.value)
-        buy_01_logic.append(dataframe['rsi_1h'] > self.buy_rsi_1h_min_1.value)
-        buy_01_logic.append(dataframe['rsi_1h'] < self.buy_rsi_1h_max_1.value)
-        buy_01_logic.append(dataframe['rsi'] < self.buy_rsi_1.value)
-        buy_01_logic.append(dataframe['mfi'] < self.buy_mfi_1.value)
-        buy_01_logic.append(dataframe['volume'] > 0)
-        # Populate
-        dataframe['buy_01_trigger'] = reduce(lambda x, y: x & y, buy_01_logic)
         if self.buy_condition_1_enable.value:
+            # Protections
+            buy_01_protections = [True]
+            if self.buy_01_protection__ema_fast.value:
+                buy_01_protections.append(dataframe[f"ema_{self.buy_01_protection__ema_fast_len.value}"] > dataframe['ema_200'])
+            if self.buy_01_protection__ema_slow.value:
+                buy_01_protections.append(dataframe[f"ema_{self.buy_01_protection__ema_slow_len.value}_1h"] > dataframe['ema_200_1h'])
+            if self.buy_01_protection__close_above_ema_fast.value:
+                buy_01_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_01_protection__close_above_ema_fast_len.value}"])
+            if self.buy_01_protection__close_above_ema_slow.value:
+                buy_01_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_01_protection__close_above_ema_slow_len.value}_1h"])
+            if self.buy_01_protection__sma200_rising.value:
+                buy_01_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(int(self.buy_01_protection__sma200_rising_val.value)))
+            if self.buy_01_protection__sma200_1h_rising.value:
+                buy_01_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(int(self.buy_01_protection__sma200_1h_rising_val.value)))
+            if self.buy_01_protection__safe_dips.value:
+                buy_01_protections.append(dataframe[f"safe_dips_{self.buy_01_protection__safe_dips_type.value}"])
+            if self.buy_01_protection__safe_pump.value:
+                buy_01_protections.append(dataframe[f"safe_pump_{self.buy_01_protection__safe_pump_period.value}_{self.buy_01_protection__safe_pump_type.value}_1h"])
+            # Non-Standard protections (add below)
+
+            # Logic
+            buy_01_logic = []
+            buy_01_logic.append(reduce(lambda x, y: x & y, buy_01_protections))
+            buy_01_logic.append(((dataframe['close'] - dataframe['open'].rolling(36).min()) / dataframe['open'].rolling(36).min()) > self.buy_min_inc_1.value)
+            buy_01_logic.append(dataframe['rsi_1h'] > self.buy_rsi_1h_min_1.value)
+            buy_01_logic.append(dataframe['rsi_1h'] < self.buy_rsi_1h_max_1.value)
+            buy_01_logic.append(dataframe['rsi'] < self.buy_rsi_1.value)
+            buy_01_logic.append(dataframe['mfi'] < self.buy_mfi_1.value)
+            buy_01_logic.append(dataframe['volume'] > 0)
+            # Populate
+            dataframe['buy_01_trigger'] = reduce(lambda x, y: x & y, buy_01_logic)
             conditions.append(dataframe['buy_01_trigger'])
 
-        # Protections
-        buy_02_protections = [True]
-        if self.buy_02_protection__ema_fast.value:
-            buy_02_protections.append(dataframe[f"ema_{self.buy_02_protection__ema_fast_len.value}"] > dataframe['ema_200'])
-        if self.buy_02_protection__ema_slow.value:
-            buy_02_protections.append(dataframe[f"ema_{self.buy_02_protection__ema_slow_len.value}_1h"] > dataframe['ema_200_1h'])
-        if self.buy_02_protection__close_above_ema_fast.value:
-            buy_02_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_02_protection__close_above_ema_fast_len.value}"])
-        if self.buy_02_protection__close_above_ema_slow.value:
-            buy_02_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_02_protection__close_above_ema_slow_len.value}_1h"])
-        if self.buy_02_protection__sma200_rising.value:
-            buy_02_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(int(self.buy_02_protection__sma200_rising_val.value)))
-        if self.buy_02_protection__sma200_1h_rising.value:
-            buy_02_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(int(self.buy_02_protection__sma200_1h_rising_val.value)))
-        if self.buy_02_protection__safe_dips.value:
-            buy_02_protections.append(dataframe[f"safe_dips_{self.buy_02_protection__safe_dips_type.value}"])
-        if self.buy_02_protection__safe_pump.value:
-            buy_02_protections.append(dataframe[f"safe_pump_{self.buy_02_protection__safe_pump_period.value}_{self.buy_02_protection__safe_pump_type.value}_1h"])
-        # Non-Standard protections (add below)
-
-        # Logic
-        buy_02_logic = []
-        buy_02_logic.append(reduce(lambda x, y: x & y, buy_02_protections))
-        #buy_02_logic.append(dataframe['volume_mean_4'] * self.buy_volume_2.value > dataframe['volume'])
-        buy_02_logic.append(dataframe['rsi'] < dataframe['rsi_1h'] - self.buy_rsi_1h_diff_2.value)
-        buy_02_logic.append(dataframe['mfi'] < self.buy_mfi_2.value)
-        buy_02_logic.append(dataframe['close'] < (dataframe['bb_lowerband'] * self.buy_bb_offset_2.value))
-        buy_02_logic.append(dataframe['volume'] > 0)
-        # Populate
-        dataframe['buy_02_trigger'] = reduce(lambda x, y: x & y, buy_02_logic)
         if self.buy_condition_2_enable.value:
+            # Protections
+            buy_02_protections = [True]
+            if self.buy_02_protection__ema_fast.value:
+                buy_02_protections.append(dataframe[f"ema_{self.buy_02_protection__ema_fast_len.value}"] > dataframe['ema_200'])
+            if self.buy_02_protection__ema_slow.value:
+                buy_02_protections.append(dataframe[f"ema_{self.buy_02_protection__ema_slow_len.value}_1h"] > dataframe['ema_200_1h'])
+            if self.buy_02_protection__close_above_ema_fast.value:
+                buy_02_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_02_protection__close_above_ema_fast_len.value}"])
+            if self.buy_02_protection__close_above_ema_slow.value:
+                buy_02_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_02_protection__close_above_ema_slow_len.value}_1h"])
+            if self.buy_02_protection__sma200_rising.value:
+                buy_02_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(int(self.buy_02_protection__sma200_rising_val.value)))
+            if self.buy_02_protection__sma200_1h_rising.value:
+                buy_02_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(int(self.buy_02_protection__sma200_1h_rising_val.value)))
+            if self.buy_02_protection__safe_dips.value:
+                buy_02_protections.append(dataframe[f"safe_dips_{self.buy_02_protection__safe_dips_type.value}"])
+            if self.buy_02_protection__safe_pump.value:
+                buy_02_protections.append(dataframe[f"safe_pump_{self.buy_02_protection__safe_pump_period.value}_{self.buy_02_protection__safe_pump_type.value}_1h"])
+            # Non-Standard protections (add below)
+
+            # Logic
+            buy_02_logic = []
+            buy_02_logic.append(reduce(lambda x, y: x & y, buy_02_protections))
+            #buy_02_logic.append(dataframe['volume_mean_4'] * self.buy_volume_2.value > dataframe['volume'])
+            buy_02_logic.append(dataframe['rsi'] < dataframe['rsi_1h'] - self.buy_rsi_1h_diff_2.value)
+            buy_02_logic.append(dataframe['mfi'] < self.buy_mfi_2.value)
+            buy_02_logic.append(dataframe['close'] < (dataframe['bb_lowerband'] * self.buy_bb_offset_2.value))
+            buy_02_logic.append(dataframe['volume'] > 0)
+            # Populate
+            dataframe['buy_02_trigger'] = reduce(lambda x, y: x & y, buy_02_logic)
             conditions.append(dataframe['buy_02_trigger'])
 
-        # Protections
-        buy_03_protections = [True]
-        if self.buy_03_protection__ema_fast.value:
-            buy_03_protections.append(dataframe[f"ema_{self.buy_03_protection__ema_fast_len.value}"] > dataframe['ema_200'])
-        if self.buy_03_protection__ema_slow.value:
-            buy_03_protections.append(dataframe[f"ema_{self.buy_03_protection__ema_slow_len.value}_1h"] > dataframe['ema_200_1h'])
-        if self.buy_03_protection__close_above_ema_fast.value:
-            buy_03_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_03_protection__close_above_ema_fast_len.value}"])
-        if self.buy_03_protection__close_above_ema_slow.value:
-            buy_03_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_03_protection__close_above_ema_slow_len.value}_1h"])
-        if self.buy_03_protection__sma200_rising.value:
-            buy_03_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(int(self.buy_03_protection__sma200_rising_val.value)))
-        if self.buy_03_protection__sma200_1h_rising.value:
-            buy_03_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(int(self.buy_03_protection__sma200_1h_rising_val.value)))
-        if self.buy_03_protection__safe_dips.value:
-            buy_03_protections.append(dataframe[f"safe_dips_{self.buy_03_protection__safe_dips_type.value}"])
-        if self.buy_03_protection__safe_pump.value:
-            buy_03_protections.append(dataframe[f"safe_pump_{self.buy_03_protection__safe_pump_period.value}_{self.buy_03_protection__safe_pump_type.value}_1h"])
-        # Non-Standard protections (add below)
-        buy_03_protections.append(dataframe['close'] > (dataframe['ema_200_1h'] * self.buy_ema_rel_3.value))
-
-        # Logic
-        buy_03_logic = []
-        buy_03_logic.append(reduce(lambda x, y: x & y, buy_03_protections))
-        buy_03_logic.append(dataframe['lower'].shift().gt(0))
-        buy_03_logic.append(dataframe['bbdelta'].gt(dataframe['close'] * self.buy_bb40_bbdelta_close_3.value))
-        buy_03_logic.append(dataframe['closedelta'].gt(dataframe['close'] * self.buy_bb40_closedelta_close_3.value))
-        buy_03_logic.append(dataframe['tail'].lt(dataframe['bbdelta'] * self.buy_bb40_tail_bbdelta_3.value))
-        buy_03_logic.append(dataframe['close'].lt(dataframe['lower'].shift()))
-        buy_03_logic.append(dataframe['close'].le(dataframe['close'].shift()))
-        buy_03_logic.append(dataframe['volume'] > 0)
-        # Populate
-        dataframe['buy_03_trigger'] = reduce(lambda x, y: x & y, buy_03_logic)
         if self.buy_condition_3_enable.value:
+            # Protections
+            buy_03_protections = [True]
+            if self.buy_03_protection__ema_fast.value:
+                buy_03_protections.append(dataframe[f"ema_{self.buy_03_protection__ema_fast_len.value}"] > dataframe['ema_200'])
+            if self.buy_03_protection__ema_slow.value:
+                buy_03_protections.append(dataframe[f"ema_{self.buy_03_protection__ema_slow_len.value}_1h"] > dataframe['ema_200_1h'])
+            if self.buy_03_protection__close_above_ema_fast.value:
+                buy_03_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_03_protection__close_above_ema_fast_len.value}"])
+            if self.buy_03_protection__close_above_ema_slow.value:
+                buy_03_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_03_protection__close_above_ema_slow_len.value}_1h"])
+            if self.buy_03_protection__sma200_rising.value:
+                buy_03_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(int(self.buy_03_protection__sma200_rising_val.value)))
+            if self.buy_03_protection__sma200_1h_rising.value:
+                buy_03_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(int(self.buy_03_protection__sma200_1h_rising_val.value)))
+            if self.buy_03_protection__safe_dips.value:
+                buy_03_protections.append(dataframe[f"safe_dips_{self.buy_03_protection__safe_dips_type.value}"])
+            if self.buy_03_protection__safe_pump.value:
+                buy_03_protections.append(dataframe[f"safe_pump_{self.buy_03_protection__safe_pump_period.value}_{self.buy_03_protection__safe_pump_type.value}_1h"])
+            # Non-Standard protections (add below)
+            buy_03_protections.append(dataframe['close'] > (dataframe['ema_200_1h'] * self.buy_ema_rel_3.value))
+
+            # Logic
+            buy_03_logic = []
+            buy_03_logic.append(reduce(lambda x, y: x & y, buy_03_protections))
+            buy_03_logic.append(dataframe['lower'].shift().gt(0))
+            buy_03_logic.append(dataframe['bbdelta'].gt(dataframe['close'] * self.buy_bb40_bbdelta_close_3.value))
+            buy_03_logic.append(dataframe['closedelta'].gt(dataframe['close'] * self.buy_bb40_closedelta_close_3.value))
+            buy_03_logic.append(dataframe['tail'].lt(dataframe['bbdelta'] * self.buy_bb40_tail_bbdelta_3.value))
+            buy_03_logic.append(dataframe['close'].lt(dataframe['lower'].shift()))
+            buy_03_logic.append(dataframe['close'].le(dataframe['close'].shift()))
+            buy_03_logic.append(dataframe['volume'] > 0)
+            # Populate
+            dataframe['buy_03_trigger'] = reduce(lambda x, y: x & y, buy_03_logic)
             conditions.append(dataframe['buy_03_trigger'])
 
-        # Protections
-        buy_04_protections = [True]
-        if self.buy_04_protection__ema_fast.value:
-            buy_04_protections.append(dataframe[f"ema_{self.buy_04_protection__ema_fast_len.value}"] > dataframe['ema_200'])
-        if self.buy_04_protection__ema_slow.value:
-            buy_04_protections.append(dataframe[f"ema_{self.buy_04_protection__ema_slow_len.value}_1h"] > dataframe['ema_200_1h'])
-        if self.buy_04_protection__close_above_ema_fast.value:
-            buy_04_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_04_protection__close_above_ema_fast_len.value}"])
-        if self.buy_04_protection__close_above_ema_slow.value:
-            buy_04_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_04_protection__close_above_ema_slow_len.value}_1h"])
-        if self.buy_04_protection__sma200_rising.value:
-            buy_04_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(int(self.buy_04_protection__sma200_rising_val.value)))
-        if self.buy_04_protection__sma200_1h_rising.value:
-            buy_04_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(int(self.buy_04_protection__sma200_1h_rising_val.value)))
-        if self.buy_04_protection__safe_dips.value:
-            buy_04_protections.append(dataframe[f"safe_dips_{self.buy_04_protection__safe_dips_type.value}"])
-        if self.buy_04_protection__safe_pump.value:
-            buy_04_protections.append(dataframe[f"safe_pump_{self.buy_04_protection__safe_pump_period.value}_{self.buy_04_protection__safe_pump_type.value}_1h"])
-        # Non-Standard protections (add below)
-
-        # Logic
-        buy_04_logic = []
-        buy_04_logic.append(reduce(lambda x, y: x & y, buy_04_protections))
-        buy_04_logic.append(dataframe['close'] < dataframe['ema_50'])
-        buy_04_logic.append(dataframe['close'] < self.buy_bb20_close_bblowerband_4.value * dataframe['bb_lowerband'])
-        buy_04_logic.append(dataframe['volume'] < (dataframe['volume_mean_30'].shift(1) * self.buy_bb20_volume_4.value))
-        # Populate
-        dataframe['buy_04_trigger'] = reduce(lambda x, y: x & y, buy_04_logic)
         if self.buy_condition_4_enable.value:
+            # Protections
+            buy_04_protections = [True]
+            if self.buy_04_protection__ema_fast.value:
+                buy_04_protections.append(dataframe[f"ema_{self.buy_04_protection__ema_fast_len.value}"] > dataframe['ema_200'])
+            if self.buy_04_protection__ema_slow.value:
+                buy_04_protections.append(dataframe[f"ema_{self.buy_04_protection__ema_slow_len.value}_1h"] > dataframe['ema_200_1h'])
+            if self.buy_04_protection__close_above_ema_fast.value:
+                buy_04_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_04_protection__close_above_ema_fast_len.value}"])
+            if self.buy_04_protection__close_above_ema_slow.value:
+                buy_04_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_04_protection__close_above_ema_slow_len.value}_1h"])
+            if self.buy_04_protection__sma200_rising.value:
+                buy_04_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(int(self.buy_04_protection__sma200_rising_val.value)))
+            if self.buy_04_protection__sma200_1h_rising.value:
+                buy_04_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(int(self.buy_04_protection__sma200_1h_rising_val.value)))
+            if self.buy_04_protection__safe_dips.value:
+                buy_04_protections.append(dataframe[f"safe_dips_{self.buy_04_protection__safe_dips_type.value}"])
+            if self.buy_04_protection__safe_pump.value:
+                buy_04_protections.append(dataframe[f"safe_pump_{self.buy_04_protection__safe_pump_period.value}_{self.buy_04_protection__safe_pump_type.value}_1h"])
+            # Non-Standard protections (add below)
+
+            # Logic
+            buy_04_logic = []
+            buy_04_logic.append(reduce(lambda x, y: x & y, buy_04_protections))
+            buy_04_logic.append(dataframe['close'] < dataframe['ema_50'])
+            buy_04_logic.append(dataframe['close'] < self.buy_bb20_close_bblowerband_4.value * dataframe['bb_lowerband'])
+            buy_04_logic.append(dataframe['volume'] < (dataframe['volume_mean_30'].shift(1) * self.buy_bb20_volume_4.value))
+            # Populate
+            dataframe['buy_04_trigger'] = reduce(lambda x, y: x & y, buy_04_logic)
             conditions.append(dataframe['buy_04_trigger'])
 
-
-        # Protections
-        buy_05_protections = [True]
-        if self.buy_05_protection__ema_fast.value:
-            buy_05_protections.append(dataframe[f"ema_{self.buy_05_protection__ema_fast_len.value}"] > dataframe['ema_200'])
-        if self.buy_05_protection__ema_slow.value:
-            buy_05_protections.append(dataframe[f"ema_{self.buy_05_protection__ema_slow_len.value}_1h"] > dataframe['ema_200_1h'])
-        if self.buy_05_protection__close_above_ema_fast.value:
-            buy_05_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_05_protection__close_above_ema_fast_len.value}"])
-        if self.buy_05_protection__close_above_ema_slow.value:
-            buy_05_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_05_protection__close_above_ema_slow_len.value}_1h"])
-        if self.buy_05_protection__sma200_rising.value:
-            buy_05_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(int(self.buy_05_protection__sma200_rising_val.value)))
-        if self.buy_05_protection__sma200_1h_rising.value:
-            buy_05_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(int(self.buy_05_protection__sma200_1h_rising_val.value)))
-        if self.buy_05_protection__safe_dips.value:
-            buy_05_protections.append(dataframe[f"safe_dips_{self.buy_05_protection__safe_dips_type.value}"])
-        if self.buy_05_protection__safe_pump.value:
-            buy_05_protections.append(dataframe[f"safe_pump_{self.buy_05_protection__safe_pump_period.value}_{self.buy_05_protection__safe_pump_type.value}_1h"])
-        # Non-Standard protections (add below)
-        buy_05_protections.append(dataframe['close'] > (dataframe['ema_200_1h'] * self.buy_ema_rel_5.value))
-
-        # Logic
-        buy_05_logic = []
-        buy_05_logic.append(reduce(lambda x, y: x & y, buy_05_protections))
-        buy_05_logic.append(dataframe['ema_26'] > dataframe['ema_12'])
-        buy_05_logic.append((dataframe['ema_26'] - dataframe['ema_12']) > (dataframe['open'] * self.buy_ema_open_mult_5.value))
-        buy_05_logic.append((dataframe['ema_26'].shift() - dataframe['ema_12'].shift()) > (dataframe['open'] / 100))
-        buy_05_logic.append(dataframe['close'] < (dataframe['bb_lowerband'] * self.buy_bb_offset_5.value))
-        buy_05_logic.append(dataframe['volume'] > 0)
-        # Populate
-        dataframe['buy_05_trigger'] = reduce(lambda x, y: x & y, buy_05_logic)
         if self.buy_condition_5_enable.value:
+            # Protections
+            buy_05_protections = [True]
+            if self.buy_05_protection__ema_fast.value:
+                buy_05_protections.append(dataframe[f"ema_{self.buy_05_protection__ema_fast_len.value}"] > dataframe['ema_200'])
+            if self.buy_05_protection__ema_slow.value:
+                buy_05_protections.append(dataframe[f"ema_{self.buy_05_protection__ema_slow_len.value}_1h"] > dataframe['ema_200_1h'])
+            if self.buy_05_protection__close_above_ema_fast.value:
+                buy_05_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_05_protection__close_above_ema_fast_len.value}"])
+            if self.buy_05_protection__close_above_ema_slow.value:
+                buy_05_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_05_protection__close_above_ema_slow_len.value}_1h"])
+            if self.buy_05_protection__sma200_rising.value:
+                buy_05_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(int(self.buy_05_protection__sma200_rising_val.value)))
+            if self.buy_05_protection__sma200_1h_rising.value:
+                buy_05_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(int(self.buy_05_protection__sma200_1h_rising_val.value)))
+            if self.buy_05_protection__safe_dips.value:
+                buy_05_protections.append(dataframe[f"safe_dips_{self.buy_05_protection__safe_dips_type.value}"])
+            if self.buy_05_protection__safe_pump.value:
+                buy_05_protections.append(dataframe[f"safe_pump_{self.buy_05_protection__safe_pump_period.value}_{self.buy_05_protection__safe_pump_type.value}_1h"])
+            # Non-Standard protections (add below)
+            buy_05_protections.append(dataframe['close'] > (dataframe['ema_200_1h'] * self.buy_ema_rel_5.value))
+
+            # Logic
+            buy_05_logic = []
+            buy_05_logic.append(reduce(lambda x, y: x & y, buy_05_protections))
+            buy_05_logic.append(dataframe['ema_26'] > dataframe['ema_12'])
+            buy_05_logic.append((dataframe['ema_26'] - dataframe['ema_12']) > (dataframe['open'] * self.buy_ema_open_mult_5.value))
+            buy_05_logic.append((dataframe['ema_26'].shift() - dataframe['ema_12'].shift()) > (dataframe['open'] / 100))
+            buy_05_logic.append(dataframe['close'] < (dataframe['bb_lowerband'] * self.buy_bb_offset_5.value))
+            buy_05_logic.append(dataframe['volume'] > 0)
+            # Populate
+            dataframe['buy_05_trigger'] = reduce(lambda x, y: x & y, buy_05_logic)
             conditions.append(dataframe['buy_05_trigger'])
 
-        # Protections
-        buy_06_protections = [True]
-        if self.buy_06_protection__ema_fast.value:
-            buy_06_protections.append(dataframe[f"ema_{self.buy_06_protection__ema_fast_len.value}"] > dataframe['ema_200'])
-        if self.buy_06_protection__ema_slow.value:
-            buy_06_protections.append(dataframe[f"ema_{self.buy_06_protection__ema_slow_len.value}_1h"] > dataframe['ema_200_1h'])
-        if self.buy_06_protection__close_above_ema_fast.value:
-            buy_06_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_06_protection__close_above_ema_fast_len.value}"])
-        if self.buy_06_protection__close_above_ema_slow.value:
-            buy_06_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_06_protection__close_above_ema_slow_len.value}_1h"])
-        if self.buy_06_protection__sma200_rising.value:
-            buy_06_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(int(self.buy_06_protection__sma200_rising_val.value)))
-        if self.buy_06_protection__sma200_1h_rising.value:
-            buy_06_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(int(self.buy_06_protection__sma200_1h_rising_val.value)))
-        if self.buy_06_protection__safe_dips.value:
-            buy_06_protections.append(dataframe[f"safe_dips_{self.buy_06_protection__safe_dips_type.value}"])
-        if self.buy_06_protection__safe_pump.value:
-            buy_06_protections.append(dataframe[f"safe_pump_{self.buy_06_protection__safe_pump_period.value}_{self.buy_06_protection__safe_pump_type.value}_1h"])
-        # Non-Standard protections (add below)
-
-        # Logic
-        buy_06_logic = []
-        buy_06_logic.append(reduce(lambda x, y: x & y, buy_06_protections))
-        buy_06_logic.append(dataframe['ema_26'] > dataframe['ema_12'])
-        buy_06_logic.append((dataframe['ema_26'] - dataframe['ema_12']) > (dataframe['open'] * self.buy_ema_open_mult_6.value))
-        buy_06_logic.append((dataframe['ema_26'].shift() - dataframe['ema_12'].shift()) > (dataframe['open'] / 100))
-        buy_06_logic.append(dataframe['close'] < (dataframe['bb_lowerband'] * self.buy_bb_offset_6.value))
-        buy_06_logic.append(dataframe['volume'] > 0)
-        # Populate
-        dataframe['buy_06_trigger'] = reduce(lambda x, y: x & y, buy_06_logic)
         if self.buy_condition_6_enable.value:
+            # Protections
+            buy_06_protections = [True]
+            if self.buy_06_protection__ema_fast.value:
+                buy_06_protections.append(dataframe[f"ema_{self.buy_06_protection__ema_fast_len.value}"] > dataframe['ema_200'])
+            if self.buy_06_protection__ema_slow.value:
+                buy_06_protections.append(dataframe[f"ema_{self.buy_06_protection__ema_slow_len.value}_1h"] > dataframe['ema_200_1h'])
+            if self.buy_06_protection__close_above_ema_fast.value:
+                buy_06_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_06_protection__close_above_ema_fast_len.value}"])
+            if self.buy_06_protection__close_above_ema_slow.value:
+                buy_06_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_06_protection__close_above_ema_slow_len.value}_1h"])
+            if self.buy_06_protection__sma200_rising.value:
+                buy_06_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(int(self.buy_06_protection__sma200_rising_val.value)))
+            if self.buy_06_protection__sma200_1h_rising.value:
+                buy_06_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(int(self.buy_06_protection__sma200_1h_rising_val.value)))
+            if self.buy_06_protection__safe_dips.value:
+                buy_06_protections.append(dataframe[f"safe_dips_{self.buy_06_protection__safe_dips_type.value}"])
+            if self.buy_06_protection__safe_pump.value:
+                buy_06_protections.append(dataframe[f"safe_pump_{self.buy_06_protection__safe_pump_period.value}_{self.buy_06_protection__safe_pump_type.value}_1h"])
+            # Non-Standard protections (add below)
+
+            # Logic
+            buy_06_logic = []
+            buy_06_logic.append(reduce(lambda x, y: x & y, buy_06_protections))
+            buy_06_logic.append(dataframe['ema_26'] > dataframe['ema_12'])
+            buy_06_logic.append((dataframe['ema_26'] - dataframe['ema_12']) > (dataframe['open'] * self.buy_ema_open_mult_6.value))
+            buy_06_logic.append((dataframe['ema_26'].shift() - dataframe['ema_12'].shift()) > (dataframe['open'] / 100))
+            buy_06_logic.append(dataframe['close'] < (dataframe['bb_lowerband'] * self.buy_bb_offset_6.value))
+            buy_06_logic.append(dataframe['volume'] > 0)
+            # Populate
+            dataframe['buy_06_trigger'] = reduce(lambda x, y: x & y, buy_06_logic)
             conditions.append(dataframe['buy_06_trigger'])
 
-        # Protections
-        buy_07_protections = [True]
-        if self.buy_07_protection__ema_fast.value:
-            buy_07_protections.append(dataframe[f"ema_{self.buy_07_protection__ema_fast_len.value}"] > dataframe['ema_200'])
-        if self.buy_07_protection__ema_slow.value:
-            buy_07_protections.append(dataframe[f"ema_{self.buy_07_protection__ema_slow_len.value}_1h"] > dataframe['ema_200_1h'])
-        if self.buy_07_protection__close_above_ema_fast.value:
-            buy_07_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_07_protection__close_above_ema_fast_len.value}"])
-        if self.buy_07_protection__close_above_ema_slow.value:
-            buy_07_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_07_protection__close_above_ema_slow_len.value}_1h"])
-        if self.buy_07_protection__sma200_rising.value:
-            buy_07_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(int(self.buy_07_protection__sma200_rising_val.value)))
-        if self.buy_07_protection__sma200_1h_rising.value:
-            buy_07_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(int(self.buy_07_protection__sma200_1h_rising_val.value)))
-        if self.buy_07_protection__safe_dips.value:
-            buy_07_protections.append(dataframe[f"safe_dips_{self.buy_07_protection__safe_dips_type.value}"])
-        if self.buy_07_protection__safe_pump.value:
-            buy_07_protections.append(dataframe[f"safe_pump_{self.buy_07_protection__safe_pump_period.value}_{self.buy_07_protection__safe_pump_type.value}_1h"])
-        # Non-Standard protections (add below)
-
-        # Logic
-        buy_07_logic = []
-        buy_07_logic.append(reduce(lambda x, y: x & y, buy_07_protections))
-        #buy_07_logic.append(dataframe['volume'].rolling(4).mean() * self.buy_volume_7.value > dataframe['volume'])
-        buy_07_logic.append(dataframe['ema_26'] > dataframe['ema_12'])
-        buy_07_logic.append((dataframe['ema_26'] - dataframe['ema_12']) > (dataframe['open'] * self.buy_ema_open_mult_7.value))
-        buy_07_logic.append((dataframe['ema_26'].shift() - dataframe['ema_12'].shift()) > (dataframe['open'] / 100))
-        buy_07_logic.append(dataframe['rsi'] < self.buy_rsi_7.value)
-        buy_07_logic.append(dataframe['volume'] > 0)
-        # Populate
-        dataframe['buy_07_trigger'] = reduce(lambda x, y: x & y, buy_07_logic)
         if self.buy_condition_7_enable.value:
+            # Protections
+            buy_07_protections = [True]
+            if self.buy_07_protection__ema_fast.value:
+                buy_07_protections.append(dataframe[f"ema_{self.buy_07_protection__ema_fast_len.value}"] > dataframe['ema_200'])
+            if self.buy_07_protection__ema_slow.value:
+                buy_07_protections.append(dataframe[f"ema_{self.buy_07_protection__ema_slow_len.value}_1h"] > dataframe['ema_200_1h'])
+            if self.buy_07_protection__close_above_ema_fast.value:
+                buy_07_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_07_protection__close_above_ema_fast_len.value}"])
+            if self.buy_07_protection__close_above_ema_slow.value:
+                buy_07_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_07_protection__close_above_ema_slow_len.value}_1h"])
+            if self.buy_07_protection__sma200_rising.value:
+                buy_07_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(int(self.buy_07_protection__sma200_rising_val.value)))
+            if self.buy_07_protection__sma200_1h_rising.value:
+                buy_07_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(int(self.buy_07_protection__sma200_1h_rising_val.value)))
+            if self.buy_07_protection__safe_dips.value:
+                buy_07_protections.append(dataframe[f"safe_dips_{self.buy_07_protection__safe_dips_type.value}"])
+            if self.buy_07_protection__safe_pump.value:
+                buy_07_protections.append(dataframe[f"safe_pump_{self.buy_07_protection__safe_pump_period.value}_{self.buy_07_protection__safe_pump_type.value}_1h"])
+            # Non-Standard protections (add below)
+
+            # Logic
+            buy_07_logic = []
+            buy_07_logic.append(reduce(lambda x, y: x & y, buy_07_protections))
+            #buy_07_logic.append(dataframe['volume'].rolling(4).mean() * self.buy_volume_7.value > dataframe['volume'])
+            buy_07_logic.append(dataframe['ema_26'] > dataframe['ema_12'])
+            buy_07_logic.append((dataframe['ema_26'] - dataframe['ema_12']) > (dataframe['open'] * self.buy_ema_open_mult_7.value))
+            buy_07_logic.append((dataframe['ema_26'].shift() - dataframe['ema_12'].shift()) > (dataframe['open'] / 100))
+            buy_07_logic.append(dataframe['rsi'] < self.buy_rsi_7.value)
+            buy_07_logic.append(dataframe['volume'] > 0)
+            # Populate
+            dataframe['buy_07_trigger'] = reduce(lambda x, y: x & y, buy_07_logic)
             conditions.append(dataframe['buy_07_trigger'])
 
-        # Protections
-        buy_08_protections = [True]
-        if self.buy_08_protection__ema_fast.value:
-            buy_08_protections.append(dataframe[f"ema_{self.buy_08_protection__ema_fast_len.value}"] > dataframe['ema_200'])
-        if self.buy_08_protection__ema_slow.value:
-            buy_08_protections.append(dataframe[f"ema_{self.buy_08_protection__ema_slow_len.value}_1h"] > dataframe['ema_200_1h'])
-        if self.buy_08_protection__close_above_ema_fast.value:
-            buy_08_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_08_protection__close_above_ema_fast_len.value}"])
-        if self.buy_08_protection__close_above_ema_slow.value:
-            buy_08_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_08_protection__close_above_ema_slow_len.value}_1h"])
-        if self.buy_08_protection__sma200_rising.value:
-            buy_08_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(int(self.buy_08_protection__sma200_rising_val.value)))
-        if self.buy_08_protection__sma200_1h_rising.value:
-            buy_08_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(int(self.buy_08_protection__sma200_1h_rising_val.value)))
-        if self.buy_08_protection__safe_dips.value:
-            buy_08_protections.append(dataframe[f"safe_dips_{self.buy_08_protection__safe_dips_type.value}"])
-        if self.buy_08_protection__safe_pump.value:
-            buy_08_protections.append(dataframe[f"safe_pump_{self.buy_08_protection__safe_pump_period.value}_{self.buy_08_protection__safe_pump_type.value}_1h"])
-        # Non-Standard protections (add below)
-
-        # Logic
-        buy_08_logic = []
-        buy_08_logic.append(reduce(lambda x, y: x & y, buy_08_protections))
-        buy_08_logic.append(dataframe['rsi'] < self.buy_rsi_8.value)
-        buy_08_logic.append(dataframe['volume'] > (dataframe['volume'].shift(1) * self.buy_volume_8.value))
-        buy_08_logic.append(dataframe['close'] > dataframe['open'])
-        buy_08_logic.append((dataframe['close'] - dataframe['low']) > ((dataframe['close'] - dataframe['open']) * self.buy_tail_diff_8.value))
-        buy_08_logic.append(dataframe['volume'] > 0)
-
-        # Populate
-        dataframe['buy_08_trigger'] = reduce(lambda x, y: x & y, buy_08_logic)
         if self.buy_condition_8_enable.value:
+            # Protections
+            buy_08_protections = [True]
+            if self.buy_08_protection__ema_fast.value:
+                buy_08_protections.append(dataframe[f"ema_{self.buy_08_protection__ema_fast_len.value}"] > dataframe['ema_200'])
+            if self.buy_08_protection__ema_slow.value:
+                buy_08_protections.append(dataframe[f"ema_{self.buy_08_protection__ema_slow_len.value}_1h"] > dataframe['ema_200_1h'])
+            if self.buy_08_protection__close_above_ema_fast.value:
+                buy_08_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_08_protection__close_above_ema_fast_len.value}"])
+            if self.buy_08_protection__close_above_ema_slow.value:
+                buy_08_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_08_protection__close_above_ema_slow_len.value}_1h"])
+            if self.buy_08_protection__sma200_rising.value:
+                buy_08_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(int(self.buy_08_protection__sma200_rising_val.value)))
+            if self.buy_08_protection__sma200_1h_rising.value:
+                buy_08_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(int(self.buy_08_protection__sma200_1h_rising_val.value)))
+            if self.buy_08_protection__safe_dips.value:
+                buy_08_protections.append(dataframe[f"safe_dips_{self.buy_08_protection__safe_dips_type.value}"])
+            if self.buy_08_protection__safe_pump.value:
+                buy_08_protections.append(dataframe[f"safe_pump_{self.buy_08_protection__safe_pump_period.value}_{self.buy_08_protection__safe_pump_type.value}_1h"])
+            # Non-Standard protections (add below)
+
+            # Logic
+            buy_08_logic = []
+            buy_08_logic.append(reduce(lambda x, y: x & y, buy_08_protections))
+            buy_08_logic.append(dataframe['rsi'] < self.buy_rsi_8.value)
+            buy_08_logic.append(dataframe['volume'] > (dataframe['volume'].shift(1) * self.buy_volume_8.value))
+            buy_08_logic.append(dataframe['close'] > dataframe['open'])
+            buy_08_logic.append((dataframe['close'] - dataframe['low']) > ((dataframe['close'] - dataframe['open']) * self.buy_tail_diff_8.value))
+            buy_08_logic.append(dataframe['volume'] > 0)
+
+            # Populate
+            dataframe['buy_08_trigger'] = reduce(lambda x, y: x & y, buy_08_logic)
             conditions.append(dataframe['buy_08_trigger'])
 
-        # Protections
-        buy_09_protections = [True]
-        if self.buy_09_protection__ema_fast.value:
-            buy_09_protections.append(dataframe[f"ema_{self.buy_09_protection__ema_fast_len.value}"] > dataframe['ema_200'])
-        if self.buy_09_protection__ema_slow.value:
-            buy_09_protections.append(dataframe[f"ema_{self.buy_09_protection__ema_slow_len.value}_1h"] > dataframe['ema_200_1h'])
-        if self.buy_09_protection__close_above_ema_fast.value:
-            buy_09_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_09_protection__close_above_ema_fast_len.value}"])
-        if self.buy_09_protection__close_above_ema_slow.value:
-            buy_09_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_09_protection__close_above_ema_slow_len.value}_1h"])
-        if self.buy_09_protection__sma200_rising.value:
-            buy_09_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(int(self.buy_09_protection__sma200_rising_val.value)))
-        if self.buy_09_protection__sma200_1h_rising.value:
-            buy_09_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(int(self.buy_09_protection__sma200_1h_rising_val.value)))
-        if self.buy_09_protection__safe_dips.value:
-            buy_09_protections.append(dataframe[f"safe_dips_{self.buy_09_protection__safe_dips_type.value}"])
-        if self.buy_09_protection__safe_pump.value:
-            buy_09_protections.append(dataframe[f"safe_pump_{self.buy_09_protection__safe_pump_period.value}_{self.buy_09_protection__safe_pump_type.value}_1h"])
-        # Non-Standard protections (add below)
-        buy_09_protections.append(dataframe['ema_50'] > dataframe['ema_200'])
-
-        # Logic
-        buy_09_logic = []
-        buy_09_logic.append(reduce(lambda x, y: x & y, buy_09_protections))
-        #buy_09_logic.append(dataframe['volume_mean_4'] * self.buy_volume_9.value > dataframe['volume'])
-        buy_09_logic.append(dataframe['close'] < dataframe['ema_20'] * self.buy_ma_offset_9.value)
-        buy_09_logic.append(dataframe['close'] < dataframe['bb_lowerband'] * self.buy_bb_offset_9.value)
-        buy_09_logic.append(dataframe['rsi_1h'] > self.buy_rsi_1h_min_9.value)
-        buy_09_logic.append(dataframe['rsi_1h'] < self.buy_rsi_1h_max_9.value)
-        buy_09_logic.append(dataframe['mfi'] < self.buy_mfi_9.value)
-        buy_09_logic.append(dataframe['volume'] > 0)
-        # Populate
-        dataframe['buy_09_trigger'] = reduce(lambda x, y: x & y, buy_09_logic)
         if self.buy_condition_9_enable.value:
+            # Protections
+            buy_09_protections = [True]
+            if self.buy_09_protection__ema_fast.value:
+                buy_09_protections.append(dataframe[f"ema_{self.buy_09_protection__ema_fast_len.value}"] > dataframe['ema_200'])
+            if self.buy_09_protection__ema_slow.value:
+                buy_09_protections.append(dataframe[f"ema_{self.buy_09_protection__ema_slow_len.value}_1h"] > dataframe['ema_200_1h'])
+            if self.buy_09_protection__close_above_ema_fast.value:
+                buy_09_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_09_protection__close_above_ema_fast_len.value}"])
+            if self.buy_09_protection__close_above_ema_slow.value:
+                buy_09_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_09_protection__close_above_ema_slow_len.value}_1h"])
+            if self.buy_09_protection__sma200_rising.value:
+                buy_09_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(int(self.buy_09_protection__sma200_rising_val.value)))
+            if self.buy_09_protection__sma200_1h_rising.value:
+                buy_09_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(int(self.buy_09_protection__sma200_1h_rising_val.value)))
+            if self.buy_09_protection__safe_dips.value:
+                buy_09_protections.append(dataframe[f"safe_dips_{self.buy_09_protection__safe_dips_type.value}"])
+            if self.buy_09_protection__safe_pump.value:
+                buy_09_protections.append(dataframe[f"safe_pump_{self.buy_09_protection__safe_pump_period.value}_{self.buy_09_protection__safe_pump_type.value}_1h"])
+            # Non-Standard protections (add below)
+            buy_09_protections.append(dataframe['ema_50'] > dataframe['ema_200'])
+
+            # Logic
+            buy_09_logic = []
+            buy_09_logic.append(reduce(lambda x, y: x & y, buy_09_protections))
+            #buy_09_logic.append(dataframe['volume_mean_4'] * self.buy_volume_9.value > dataframe['volume'])
+            buy_09_logic.append(dataframe['close'] < dataframe['ema_20'] * self.buy_ma_offset_9.value)
+            buy_09_logic.append(dataframe['close'] < dataframe['bb_lowerband'] * self.buy_bb_offset_9.value)
+            buy_09_logic.append(dataframe['rsi_1h'] > self.buy_rsi_1h_min_9.value)
+            buy_09_logic.append(dataframe['rsi_1h'] < self.buy_rsi_1h_max_9.value)
+            buy_09_logic.append(dataframe['mfi'] < self.buy_mfi_9.value)
+            buy_09_logic.append(dataframe['volume'] > 0)
+            # Populate
+            dataframe['buy_09_trigger'] = reduce(lambda x, y: x & y, buy_09_logic)
             conditions.append(dataframe['buy_09_trigger'])
 
-        # Protections
-        buy_10_protections = [True]
-        if self.buy_10_protection__ema_fast.value:
-            buy_10_protections.append(dataframe[f"ema_{self.buy_10_protection__ema_fast_len.value}"] > dataframe['ema_200'])
-        if self.buy_10_protection__ema_slow.value:
-            buy_10_protections.append(dataframe[f"ema_{self.buy_10_protection__ema_slow_len.value}_1h"] > dataframe['ema_200_1h'])
-        if self.buy_10_protection__close_above_ema_fast.value:
-            buy_10_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_10_protection__close_above_ema_fast_len.value}"])
-        if self.buy_10_protection__close_above_ema_slow.value:
-            buy_10_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_10_protection__close_above_ema_slow_len.value}_1h"])
-        if self.buy_10_protection__sma200_rising.value:
-            buy_10_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(int(self.buy_10_protection__sma200_rising_val.value)))
-        if self.buy_10_protection__sma200_1h_rising.value:
-            buy_10_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(int(self.buy_10_protection__sma200_1h_rising_val.value)))
-        if self.buy_10_protection__safe_dips.value:
-            buy_10_protections.append(dataframe[f"safe_dips_{self.buy_10_protection__safe_dips_type.value}"])
-        if self.buy_10_protection__safe_pump.value:
-            buy_10_protections.append(dataframe[f"safe_pump_{self.buy_10_protection__safe_pump_period.value}_{self.buy_10_protection__safe_pump_type.value}_1h"])
-        # Non-Standard protections (add below)
-        buy_10_protections.append(dataframe['ema_50_1h'] > dataframe['ema_100_1h'])
-
-        # Logic
-        buy_10_logic = []
-        buy_10_logic.append(reduce(lambda x, y: x & y, buy_10_protections))
-        #buy_10_logic.append((dataframe['volume_mean_4'] * self.buy_volume_10.value) > dataframe['volume'])
-        buy_10_logic.append(dataframe['close'] < dataframe['sma_30'] * self.buy_ma_offset_10.value)
-        buy_10_logic.append(dataframe['close'] < dataframe['bb_lowerband'] * self.buy_bb_offset_10.value)
-        buy_10_logic.append(dataframe['rsi_1h'] < self.buy_rsi_1h_10.value)
-        buy_10_logic.append(dataframe['volume'] > 0)
-        # Populate
-        dataframe['buy_10_trigger'] = reduce(lambda x, y: x & y, buy_10_logic)
         if self.buy_condition_10_enable.value:
+            # Protections
+            buy_10_protections = [True]
+            if self.buy_10_protection__ema_fast.value:
+                buy_10_protections.append(dataframe[f"ema_{self.buy_10_protection__ema_fast_len.value}"] > dataframe['ema_200'])
+            if self.buy_10_protection__ema_slow.value:
+                buy_10_protections.append(dataframe[f"ema_{self.buy_10_protection__ema_slow_len.value}_1h"] > dataframe['ema_200_1h'])
+            if self.buy_10_protection__close_above_ema_fast.value:
+                buy_10_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_10_protection__close_above_ema_fast_len.value}"])
+            if self.buy_10_protection__close_above_ema_slow.value:
+                buy_10_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_10_protection__close_above_ema_slow_len.value}_1h"])
+            if self.buy_10_protection__sma200_rising.value:
+                buy_10_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(int(self.buy_10_protection__sma200_rising_val.value)))
+            if self.buy_10_protection__sma200_1h_rising.value:
+                buy_10_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(int(self.buy_10_protection__sma200_1h_rising_val.value)))
+            if self.buy_10_protection__safe_dips.value:
+                buy_10_protections.append(dataframe[f"safe_dips_{self.buy_10_protection__safe_dips_type.value}"])
+            if self.buy_10_protection__safe_pump.value:
+                buy_10_protections.append(dataframe[f"safe_pump_{self.buy_10_protection__safe_pump_period.value}_{self.buy_10_protection__safe_pump_type.value}_1h"])
+            # Non-Standard protections (add below)
+            buy_10_protections.append(dataframe['ema_50_1h'] > dataframe['ema_100_1h'])
+
+            # Logic
+            buy_10_logic = []
+            buy_10_logic.append(reduce(lambda x, y: x & y, buy_10_protections))
+            #buy_10_logic.append((dataframe['volume_mean_4'] * self.buy_volume_10.value) > dataframe['volume'])
+            buy_10_logic.append(dataframe['close'] < dataframe['sma_30'] * self.buy_ma_offset_10.value)
+            buy_10_logic.append(dataframe['close'] < dataframe['bb_lowerband'] * self.buy_bb_offset_10.value)
+            buy_10_logic.append(dataframe['rsi_1h'] < self.buy_rsi_1h_10.value)
+            buy_10_logic.append(dataframe['volume'] > 0)
+            # Populate
+            dataframe['buy_10_trigger'] = reduce(lambda x, y: x & y, buy_10_logic)
             conditions.append(dataframe['buy_10_trigger'])
 
-        # Protections
-        buy_11_protections = [True]
-        if self.buy_11_protection__ema_fast.value:
-            buy_11_protections.append(dataframe[f"ema_{self.buy_11_protection__ema_fast_len.value}"] > dataframe['ema_200'])
-        if self.buy_11_protection__ema_slow.value:
-            buy_11_protections.append(dataframe[f"ema_{self.buy_11_protection__ema_slow_len.value}_1h"] > dataframe['ema_200_1h'])
-        if self.buy_11_protection__close_above_ema_fast.value:
-            buy_11_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_11_protection__close_above_ema_fast_len.value}"])
-        if self.buy_11_protection__close_above_ema_slow.value:
-            buy_11_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_11_protection__close_above_ema_slow_len.value}_1h"])
-        if self.buy_11_protection__sma200_rising.value:
-            buy_11_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(int(self.buy_11_protection__sma200_rising_val.value)))
-        if self.buy_11_protection__sma200_1h_rising.value:
-            buy_11_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(int(self.buy_11_protection__sma200_1h_rising_val.value)))
-        if self.buy_11_protection__safe_dips.value:
-            buy_11_protections.append(dataframe[f"safe_dips_{self.buy_11_protection__safe_dips_type.value}"])
-        if self.buy_11_protection__safe_pump.value:
-            buy_11_protections.append(dataframe[f"safe_pump_{self.buy_11_protection__safe_pump_period.value}_{self.buy_11_protection__safe_pump_type.value}_1h"])
-        # Non-Standard protections (add below)
-        buy_11_protections.append(dataframe['ema_50_1h'] > dataframe['ema_100_1h'])
-        buy_11_protections.append(dataframe['safe_pump_36_normal_1h'])
-        buy_11_protections.append(dataframe['safe_pump_48_loose_1h'])
-
-        # Logic
-        buy_11_logic = []
-        buy_11_logic.append(reduce(lambda x, y: x & y, buy_11_protections))
-        buy_11_logic.append(((dataframe['close'] - dataframe['open'].rolling(36).min()) / dataframe['open'].rolling(36).min()) > self.buy_min_inc_11.value)
-        buy_11_logic.append(dataframe['close'] < dataframe['sma_30'] * self.buy_ma_offset_11.value)
-        buy_11_logic.append(dataframe['rsi_1h'] > self.buy_rsi_1h_min_11.value)
-        buy_11_logic.append(dataframe['rsi_1h'] < self.buy_rsi_1h_max_11.value)
-        buy_11_logic.append(dataframe['rsi'] < self.buy_rsi_11.value)
-        buy_11_logic.append(dataframe['mfi'] < self.buy_mfi_11.value)
-        buy_11_logic.append(dataframe['volume'] > 0)
-        # Populate
-        dataframe['buy_11_trigger'] = reduce(lambda x, y: x & y, buy_11_logic)
         if self.buy_condition_11_enable.value:
+            # Protections
+            buy_11_protections = [True]
+            if self.buy_11_protection__ema_fast.value:
+                buy_11_protections.append(dataframe[f"ema_{self.buy_11_protection__ema_fast_len.value}"] > dataframe['ema_200'])
+            if self.buy_11_protection__ema_slow.value:
+                buy_11_protections.append(dataframe[f"ema_{self.buy_11_protection__ema_slow_len.value}_1h"] > dataframe['ema_200_1h'])
+            if self.buy_11_protection__close_above_ema_fast.value:
+                buy_11_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_11_protection__close_above_ema_fast_len.value}"])
+            if self.buy_11_protection__close_above_ema_slow.value:
+                buy_11_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_11_protection__close_above_ema_slow_len.value}_1h"])
+            if self.buy_11_protection__sma200_rising.value:
+                buy_11_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(int(self.buy_11_protection__sma200_rising_val.value)))
+            if self.buy_11_protection__sma200_1h_rising.value:
+                buy_11_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(int(self.buy_11_protection__sma200_1h_rising_val.value)))
+            if self.buy_11_protection__safe_dips.value:
+                buy_11_protections.append(dataframe[f"safe_dips_{self.buy_11_protection__safe_dips_type.value}"])
+            if self.buy_11_protection__safe_pump.value:
+                buy_11_protections.append(dataframe[f"safe_pump_{self.buy_11_protection__safe_pump_period.value}_{self.buy_11_protection__safe_pump_type.value}_1h"])
+            # Non-Standard protections (add below)
+            buy_11_protections.append(dataframe['ema_50_1h'] > dataframe['ema_100_1h'])
+            buy_11_protections.append(dataframe['safe_pump_36_normal_1h'])
+            buy_11_protections.append(dataframe['safe_pump_48_loose_1h'])
+
+            # Logic
+            buy_11_logic = []
+            buy_11_logic.append(reduce(lambda x, y: x & y, buy_11_protections))
+            buy_11_logic.append(((dataframe['close'] - dataframe['open'].rolling(36).min()) / dataframe['open'].rolling(36).min()) > self.buy_min_inc_11.value)
+            buy_11_logic.append(dataframe['close'] < dataframe['sma_30'] * self.buy_ma_offset_11.value)
+            buy_11_logic.append(dataframe['rsi_1h'] > self.buy_rsi_1h_min_11.value)
+            buy_11_logic.append(dataframe['rsi_1h'] < self.buy_rsi_1h_max_11.value)
+            buy_11_logic.append(dataframe['rsi'] < self.buy_rsi_11.value)
+            buy_11_logic.append(dataframe['mfi'] < self.buy_mfi_11.value)
+            buy_11_logic.append(dataframe['volume'] > 0)
+            # Populate
+            dataframe['buy_11_trigger'] = reduce(lambda x, y: x & y, buy_11_logic)
             conditions.append(dataframe['buy_11_trigger'])
 
-        # Protections
-        buy_12_protections = [True]
-        if self.buy_12_protection__ema_fast.value:
-            buy_12_protections.append(dataframe[f"ema_{self.buy_12_protection__ema_fast_len.value}"] > dataframe['ema_200'])
-        if self.buy_12_protection__ema_slow.value:
-            buy_12_protections.append(dataframe[f"ema_{self.buy_12_protection__ema_slow_len.value}_1h"] > dataframe['ema_200_1h'])
-        if self.buy_12_protection__close_above_ema_fast.value:
-            buy_12_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_12_protection__close_above_ema_fast_len.value}"])
-        if self.buy_12_protection__close_above_ema_slow.value:
-            buy_12_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_12_protection__close_above_ema_slow_len.value}_1h"])
-        if self.buy_12_protection__sma200_rising.value:
-            buy_12_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(int(self.buy_12_protection__sma200_rising_val.value)))
-        if self.buy_12_protection__sma200_1h_rising.value:
-            buy_12_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(int(self.buy_12_protection__sma200_1h_rising_val.value)))
-        if self.buy_12_protection__safe_dips.value:
-            buy_12_protections.append(dataframe[f"safe_dips_{self.buy_12_protection__safe_dips_type.value}"])
-        if self.buy_12_protection__safe_pump.value:
-            buy_12_protections.append(dataframe[f"safe_pump_{self.buy_12_protection__safe_pump_period.value}_{self.buy_12_protection__safe_pump_type.value}_1h"])
-        # Non-Standard protections (add below)
-
-        # Logic
-        buy_12_logic = []
-        buy_12_logic.append(reduce(lambda x, y: x & y, buy_12_protections))
-        #buy_12_logic.append((dataframe['volume_mean_4'] * self.buy_volume_12.value) > dataframe['volume'])
-        buy_12_logic.append(dataframe['close'] < dataframe['sma_30'] * self.buy_ma_offset_12.value)
-        buy_12_logic.append(dataframe['ewo'] > self.buy_ewo_12.value)
-        buy_12_logic.append(dataframe['rsi'] < self.buy_rsi_12.value)
-        buy_12_logic.append(dataframe['volume'] > 0)
-        # Populate
-        dataframe['buy_12_trigger'] = reduce(lambda x, y: x & y, buy_12_logic)
         if self.buy_condition_12_enable.value:
+            # Protections
+            buy_12_protections = [True]
+            if self.buy_12_protection__ema_fast.value:
+                buy_12_protections.append(dataframe[f"ema_{self.buy_12_protection__ema_fast_len.value}"] > dataframe['ema_200'])
+            if self.buy_12_protection__ema_slow.value:
+                buy_12_protections.append(dataframe[f"ema_{self.buy_12_protection__ema_slow_len.value}_1h"] > dataframe['ema_200_1h'])
+            if self.buy_12_protection__close_above_ema_fast.value:
+                buy_12_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_12_protection__close_above_ema_fast_len.value}"])
+            if self.buy_12_protection__close_above_ema_slow.value:
+                buy_12_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_12_protection__close_above_ema_slow_len.value}_1h"])
+            if self.buy_12_protection__sma200_rising.value:
+                buy_12_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(int(self.buy_12_protection__sma200_rising_val.value)))
+            if self.buy_12_protection__sma200_1h_rising.value:
+                buy_12_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(int(self.buy_12_protection__sma200_1h_rising_val.value)))
+            if self.buy_12_protection__safe_dips.value:
+                buy_12_protections.append(dataframe[f"safe_dips_{self.buy_12_protection__safe_dips_type.value}"])
+            if self.buy_12_protection__safe_pump.value:
+                buy_12_protections.append(dataframe[f"safe_pump_{self.buy_12_protection__safe_pump_period.value}_{self.buy_12_protection__safe_pump_type.value}_1h"])
+            # Non-Standard protections (add below)
+
+            # Logic
+            buy_12_logic = []
+            buy_12_logic.append(reduce(lambda x, y: x & y, buy_12_protections))
+            #buy_12_logic.append((dataframe['volume_mean_4'] * self.buy_volume_12.value) > dataframe['volume'])
+            buy_12_logic.append(dataframe['close'] < dataframe['sma_30'] * self.buy_ma_offset_12.value)
+            buy_12_logic.append(dataframe['ewo'] > self.buy_ewo_12.value)
+            buy_12_logic.append(dataframe['rsi'] < self.buy_rsi_12.value)
+            buy_12_logic.append(dataframe['volume'] > 0)
+            # Populate
+            dataframe['buy_12_trigger'] = reduce(lambda x, y: x & y, buy_12_logic)
             conditions.append(dataframe['buy_12_trigger'])
 
-        # Protections
-        buy_13_protections = [True]
-        if self.buy_13_protection__ema_fast.value:
-            buy_13_protections.append(dataframe[f"ema_{self.buy_13_protection__ema_fast_len.value}"] > dataframe['ema_200'])
-        if self.buy_13_protection__ema_slow.value:
-            buy_13_protections.append(dataframe[f"ema_{self.buy_13_protection__ema_slow_len.value}_1h"] > dataframe['ema_200_1h'])
-        if self.buy_13_protection__close_above_ema_fast.value:
-            buy_13_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_13_protection__close_above_ema_fast_len.value}"])
-        if self.buy_13_protection__close_above_ema_slow.value:
-            buy_13_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_13_protection__close_above_ema_slow_len.value}_1h"])
-        if self.buy_13_protection__sma200_rising.value:
-            buy_13_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(int(self.buy_13_protection__sma200_rising_val.value)))
-        if self.buy_13_protection__sma200_1h_rising.value:
-            buy_13_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(int(self.buy_13_protection__sma200_1h_rising_val.value)))
-        if self.buy_13_protection__safe_dips.value:
-            buy_13_protections.append(dataframe[f"safe_dips_{self.buy_13_protection__safe_dips_type.value}"])
-        if self.buy_13_protection__safe_pump.value:
-            buy_13_protections.append(dataframe[f"safe_pump_{self.buy_13_protection__safe_pump_period.value}_{self.buy_13_protection__safe_pump_type.value}_1h"])
-        # Non-Standard protections (add below)
-        buy_13_protections.append(dataframe['ema_50_1h'] > dataframe['ema_100_1h'])
-        #buy_13_protections.append(dataframe['safe_pump_36_loose_1h'])
-
-        # Logic
-        buy_13_logic = []
-        buy_13_logic.append(reduce(lambda x, y: x & y, buy_13_protections))
-        #buy_13_logic.append((dataframe['volume_mean_4'] * self.buy_volume_13.value) > dataframe['volume'])
-        buy_13_logic.append(dataframe['close'] < dataframe['sma_30'] * self.buy_ma_offset_13.value)
-        buy_13_logic.append(dataframe['ewo'] < self.buy_ewo_13.value)
-        buy_13_logic.append(dataframe['volume'] > 0)
-        # Populate
-        dataframe['buy_13_trigger'] = reduce(lambda x, y: x & y, buy_13_logic)
         if self.buy_condition_13_enable.value:
+            # Protections
+            buy_13_protections = [True]
+            if self.buy_13_protection__ema_fast.value:
+                buy_13_protections.append(dataframe[f"ema_{self.buy_13_protection__ema_fast_len.value}"] > dataframe['ema_200'])
+            if self.buy_13_protection__ema_slow.value:
+                buy_13_protections.append(dataframe[f"ema_{self.buy_13_protection__ema_slow_len.value}_1h"] > dataframe['ema_200_1h'])
+            if self.buy_13_protection__close_above_ema_fast.value:
+                buy_13_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_13_protection__close_above_ema_fast_len.value}"])
+            if self.buy_13_protection__close_above_ema_slow.value:
+                buy_13_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_13_protection__close_above_ema_slow_len.value}_1h"])
+            if self.buy_13_protection__sma200_rising.value:
+                buy_13_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(int(self.buy_13_protection__sma200_rising_val.value)))
+            if self.buy_13_protection__sma200_1h_rising.value:
+                buy_13_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(int(self.buy_13_protection__sma200_1h_rising_val.value)))
+            if self.buy_13_protection__safe_dips.value:
+                buy_13_protections.append(dataframe[f"safe_dips_{self.buy_13_protection__safe_dips_type.value}"])
+            if self.buy_13_protection__safe_pump.value:
+                buy_13_protections.append(dataframe[f"safe_pump_{self.buy_13_protection__safe_pump_period.value}_{self.buy_13_protection__safe_pump_type.value}_1h"])
+            # Non-Standard protections (add below)
+            buy_13_protections.append(dataframe['ema_50_1h'] > dataframe['ema_100_1h'])
+            #buy_13_protections.append(dataframe['safe_pump_36_loose_1h'])
+
+            # Logic
+            buy_13_logic = []
+            buy_13_logic.append(reduce(lambda x, y: x & y, buy_13_protections))
+            #buy_13_logic.append((dataframe['volume_mean_4'] * self.buy_volume_13.value) > dataframe['volume'])
+            buy_13_logic.append(dataframe['close'] < dataframe['sma_30'] * self.buy_ma_offset_13.value)
+            buy_13_logic.append(dataframe['ewo'] < self.buy_ewo_13.value)
+            buy_13_logic.append(dataframe['volume'] > 0)
+            # Populate
+            dataframe['buy_13_trigger'] = reduce(lambda x, y: x & y, buy_13_logic)
             conditions.append(dataframe['buy_13_trigger'])
 
-        # Protections
-        buy_14_protections = [True]
-        if self.buy_14_protection__ema_fast.value:
-            buy_14_protections.append(dataframe[f"ema_{self.buy_14_protection__ema_fast_len.value}"] > dataframe['ema_200'])
-        if self.buy_14_protection__ema_slow.value:
-            buy_14_protections.append(dataframe[f"ema_{self.buy_14_protection__ema_slow_len.value}_1h"] > dataframe['ema_200_1h'])
-        if self.buy_14_protection__close_above_ema_fast.value:
-            buy_14_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_14_protection__close_above_ema_fast_len.value}"])
-        if self.buy_14_protection__close_above_ema_slow.value:
-            buy_14_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_14_protection__close_above_ema_slow_len.value}_1h"])
-        if self.buy_14_protection__sma200_rising.value:
-            buy_14_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(int(self.buy_14_protection__sma200_rising_val.value)))
-        if self.buy_14_protection__sma200_1h_rising.value:
-            buy_14_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(int(self.buy_14_protection__sma200_1h_rising_val.value)))
-        if self.buy_14_protection__safe_dips.value:
-            buy_14_protections.append(dataframe[f"safe_dips_{self.buy_14_protection__safe_dips_type.value}"])
-        if self.buy_14_protection__safe_pump.value:
-            buy_14_protections.append(dataframe[f"safe_pump_{self.buy_14_protection__safe_pump_period.value}_{self.buy_14_protection__safe_pump_type.value}_1h"])
-        # Non-Standard protections (add below)
-
-        # Logic
-        buy_14_logic = []
-        buy_14_logic.append(reduce(lambda x, y: x & y, buy_14_protections))
-        #buy_14_logic.append(dataframe['volume_mean_4'] * self.buy_volume_14.value > dataframe['volume'])
-        buy_14_logic.append(dataframe['ema_26'] > dataframe['ema_12'])
-        buy_14_logic.append((dataframe['ema_26'] - dataframe['ema_12']) > (dataframe['open'] * self.buy_ema_open_mult_14.value))
-        buy_14_logic.append((dataframe['ema_26'].shift() - dataframe['ema_12'].shift()) > (dataframe['open'] / 100))
-        buy_14_logic.append(dataframe['close'] < (dataframe['bb_lowerband'] * self.buy_bb_offset_14.value))
-        buy_14_logic.append(dataframe['close'] < dataframe['ema_20'] * self.buy_ma_offset_14.value)
-        buy_14_logic.append(dataframe['volume'] > 0)
-        # Populate
-        dataframe['buy_14_trigger'] = reduce(lambda x, y: x & y, buy_14_logic)
         if self.buy_condition_14_enable.value:
+            # Protections
+            buy_14_protections = [True]
+            if self.buy_14_protection__ema_fast.value:
+                buy_14_protections.append(dataframe[f"ema_{self.buy_14_protection__ema_fast_len.value}"] > dataframe['ema_200'])
+            if self.buy_14_protection__ema_slow.value:
+                buy_14_protections.append(dataframe[f"ema_{self.buy_14_protection__ema_slow_len.value}_1h"] > dataframe['ema_200_1h'])
+            if self.buy_14_protection__close_above_ema_fast.value:
+                buy_14_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_14_protection__close_above_ema_fast_len.value}"])
+            if self.buy_14_protection__close_above_ema_slow.value:
+                buy_14_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_14_protection__close_above_ema_slow_len.value}_1h"])
+            if self.buy_14_protection__sma200_rising.value:
+                buy_14_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(int(self.buy_14_protection__sma200_rising_val.value)))
+            if self.buy_14_protection__sma200_1h_rising.value:
+                buy_14_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(int(self.buy_14_protection__sma200_1h_rising_val.value)))
+            if self.buy_14_protection__safe_dips.value:
+                buy_14_protections.append(dataframe[f"safe_dips_{self.buy_14_protection__safe_dips_type.value}"])
+            if self.buy_14_protection__safe_pump.value:
+                buy_14_protections.append(dataframe[f"safe_pump_{self.buy_14_protection__safe_pump_period.value}_{self.buy_14_protection__safe_pump_type.value}_1h"])
+            # Non-Standard protections (add below)
+
+            # Logic
+            buy_14_logic = []
+            buy_14_logic.append(reduce(lambda x, y: x & y, buy_14_protections))
+            #buy_14_logic.append(dataframe['volume_mean_4'] * self.buy_volume_14.value > dataframe['volume'])
+            buy_14_logic.append(dataframe['ema_26'] > dataframe['ema_12'])
+            buy_14_logic.append((dataframe['ema_26'] - dataframe['ema_12']) > (dataframe['open'] * self.buy_ema_open_mult_14.value))
+            buy_14_logic.append((dataframe['ema_26'].shift() - dataframe['ema_12'].shift()) > (dataframe['open'] / 100))
+            buy_14_logic.append(dataframe['close'] < (dataframe['bb_lowerband'] * self.buy_bb_offset_14.value))
+            buy_14_logic.append(dataframe['close'] < dataframe['ema_20'] * self.buy_ma_offset_14.value)
+            buy_14_logic.append(dataframe['volume'] > 0)
+            # Populate
+            dataframe['buy_14_trigger'] = reduce(lambda x, y: x & y, buy_14_logic)
             conditions.append(dataframe['buy_14_trigger'])
 
-        # Protections
-        buy_15_protections = [True]
-        if self.buy_15_protection__ema_fast.value:
-            buy_15_protections.append(dataframe[f"ema_{self.buy_15_protection__ema_fast_len.value}"] > dataframe['ema_200'])
-        if self.buy_15_protection__ema_slow.value:
-            buy_15_protections.append(dataframe[f"ema_{self.buy_15_protection__ema_slow_len.value}_1h"] > dataframe['ema_200_1h'])
-        if self.buy_15_protection__close_above_ema_fast.value:
-            buy_15_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_15_protection__close_above_ema_fast_len.value}"])
-        if self.buy_15_protection__close_above_ema_slow.value:
-            buy_15_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_15_protection__close_above_ema_slow_len.value}_1h"])
-        if self.buy_15_protection__sma200_rising.value:
-            buy_15_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(int(self.buy_15_protection__sma200_rising_val.value)))
-        if self.buy_15_protection__sma200_1h_rising.value:
-            buy_15_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(int(self.buy_15_protection__sma200_1h_rising_val.value)))
-        if self.buy_15_protection__safe_dips.value:
-            buy_15_protections.append(dataframe[f"safe_dips_{self.buy_15_protection__safe_dips_type.value}"])
-        if self.buy_15_protection__safe_pump.value:
-            buy_15_protections.append(dataframe[f"safe_pump_{self.buy_15_protection__safe_pump_period.value}_{self.buy_15_protection__safe_pump_type.value}_1h"])
-        # Non-Standard protections (add below)
-        buy_15_protections.append(dataframe['close'] > dataframe['ema_200_1h'] * self.buy_ema_rel_15.value)
-
-        # Logic
-        buy_15_logic = []
-        buy_15_logic.append(reduce(lambda x, y: x & y, buy_15_protections))
-        buy_15_logic.append(dataframe['ema_26'] > dataframe['ema_12'])
-        buy_15_logic.append((dataframe['ema_26'] - dataframe['ema_12']) > (dataframe['open'] * self.buy_ema_open_mult_15.value))
-        buy_15_logic.append((dataframe['ema_26'].shift() - dataframe['ema_12'].shift()) > (dataframe['open'] / 100))
-        buy_15_logic.append(dataframe['rsi'] < self.buy_rsi_15.value)
-        buy_15_logic.append(dataframe['close'] < dataframe['ema_20'] * self.buy_ma_offset_15.value)
-        buy_15_logic.append(dataframe['volume'] > 0)
-        # Populate
-        dataframe['buy_15_trigger'] = reduce(lambda x, y: x & y, buy_15_logic)
         if self.buy_condition_15_enable.value:
+            # Protections
+            buy_15_protections = [True]
+            if self.buy_15_protection__ema_fast.value:
+                buy_15_protections.append(dataframe[f"ema_{self.buy_15_protection__ema_fast_len.value}"] > dataframe['ema_200'])
+            if self.buy_15_protection__ema_slow.value:
+                buy_15_protections.append(dataframe[f"ema_{self.buy_15_protection__ema_slow_len.value}_1h"] > dataframe['ema_200_1h'])
+            if self.buy_15_protection__close_above_ema_fast.value:
+                buy_15_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_15_protection__close_above_ema_fast_len.value}"])
+            if self.buy_15_protection__close_above_ema_slow.value:
+                buy_15_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_15_protection__close_above_ema_slow_len.value}_1h"])
+            if self.buy_15_protection__sma200_rising.value:
+                buy_15_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(int(self.buy_15_protection__sma200_rising_val.value)))
+            if self.buy_15_protection__sma200_1h_rising.value:
+                buy_15_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(int(self.buy_15_protection__sma200_1h_rising_val.value)))
+            if self.buy_15_protection__safe_dips.value:
+                buy_15_protections.append(dataframe[f"safe_dips_{self.buy_15_protection__safe_dips_type.value}"])
+            if self.buy_15_protection__safe_pump.value:
+                buy_15_protections.append(dataframe[f"safe_pump_{self.buy_15_protection__safe_pump_period.value}_{self.buy_15_protection__safe_pump_type.value}_1h"])
+            # Non-Standard protections (add below)
+            buy_15_protections.append(dataframe['close'] > dataframe['ema_200_1h'] * self.buy_ema_rel_15.value)
+
+            # Logic
+            buy_15_logic = []
+            buy_15_logic.append(reduce(lambda x, y: x & y, buy_15_protections))
+            buy_15_logic.append(dataframe['ema_26'] > dataframe['ema_12'])
+            buy_15_logic.append((dataframe['ema_26'] - dataframe['ema_12']) > (dataframe['open'] * self.buy_ema_open_mult_15.value))
+            buy_15_logic.append((dataframe['ema_26'].shift() - dataframe['ema_12'].shift()) > (dataframe['open'] / 100))
+            buy_15_logic.append(dataframe['rsi'] < self.buy_rsi_15.value)
+            buy_15_logic.append(dataframe['close'] < dataframe['ema_20'] * self.buy_ma_offset_15.value)
+            buy_15_logic.append(dataframe['volume'] > 0)
+            # Populate
+            dataframe['buy_15_trigger'] = reduce(lambda x, y: x & y, buy_15_logic)
             conditions.append(dataframe['buy_15_trigger'])
 
-        # Protections
-        buy_16_protections = [True]
-        if self.buy_16_protection__ema_fast.value:
-            buy_16_protections.append(dataframe[f"ema_{self.buy_16_protection__ema_fast_len.value}"] > dataframe['ema_200'])
-        if self.buy_16_protection__ema_slow.value:
-            buy_16_protections.append(dataframe[f"ema_{self.buy_16_protection__ema_slow_len.value}_1h"] > dataframe['ema_200_1h'])
-        if self.buy_16_protection__close_above_ema_fast.value:
-            buy_16_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_16_protection__close_above_ema_fast_len.value}"])
-        if self.buy_16_protection__close_above_ema_slow.value:
-            buy_16_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_16_protection__close_above_ema_slow_len.value}_1h"])
-        if self.buy_16_protection__sma200_rising.value:
-            buy_16_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(int(self.buy_16_protection__sma200_rising_val.value)))
-        if self.buy_16_protection__sma200_1h_rising.value:
-            buy_16_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(int(self.buy_16_protection__sma200_1h_rising_val.value)))
-        if self.buy_16_protection__safe_dips.value:
-            buy_16_protections.append(dataframe[f"safe_dips_{self.buy_16_protection__safe_dips_type.value}"])
-        if self.buy_16_protection__safe_pump.value:
-            buy_16_protections.append(dataframe[f"safe_pump_{self.buy_16_protection__safe_pump_period.value}_{self.buy_16_protection__safe_pump_type.value}_1h"])
-        # Non-Standard protections (add below)
-
-        # Logic
-        buy_16_logic = []
-        buy_16_logic.append(reduce(lambda x, y: x & y, buy_16_protections))
-        #buy_16_logic.append((dataframe['volume_mean_4'] * self.buy_volume_16.value) > dataframe['volume'])
-        buy_16_logic.append(dataframe['close'] < dataframe['ema_20'] * self.buy_ma_offset_16.value)
-        buy_16_logic.append(dataframe['ewo'] > self.buy_ewo_16.value)
-        buy_16_logic.append(dataframe['rsi'] < self.buy_rsi_16.value)
-        buy_16_logic.append(dataframe['volume'] > 0)
-        # Populate
-        dataframe['buy_16_trigger'] = reduce(lambda x, y: x & y, buy_16_logic)
         if self.buy_condition_16_enable.value:
+            # Protections
+            buy_16_protections = [True]
+            if self.buy_16_protection__ema_fast.value:
+                buy_16_protections.append(dataframe[f"ema_{self.buy_16_protection__ema_fast_len.value}"] > dataframe['ema_200'])
+            if self.buy_16_protection__ema_slow.value:
+                buy_16_protections.append(dataframe[f"ema_{self.buy_16_protection__ema_slow_len.value}_1h"] > dataframe['ema_200_1h'])
+            if self.buy_16_protection__close_above_ema_fast.value:
+                buy_16_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_16_protection__close_above_ema_fast_len.value}"])
+            if self.buy_16_protection__close_above_ema_slow.value:
+                buy_16_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_16_protection__close_above_ema_slow_len.value}_1h"])
+            if self.buy_16_protection__sma200_rising.value:
+                buy_16_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(int(self.buy_16_protection__sma200_rising_val.value)))
+            if self.buy_16_protection__sma200_1h_rising.value:
+                buy_16_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(int(self.buy_16_protection__sma200_1h_rising_val.value)))
+            if self.buy_16_protection__safe_dips.value:
+                buy_16_protections.append(dataframe[f"safe_dips_{self.buy_16_protection__safe_dips_type.value}"])
+            if self.buy_16_protection__safe_pump.value:
+                buy_16_protections.append(dataframe[f"safe_pump_{self.buy_16_protection__safe_pump_period.value}_{self.buy_16_protection__safe_pump_type.value}_1h"])
+            # Non-Standard protections (add below)
+
+            # Logic
+            buy_16_logic = []
+            buy_16_logic.append(reduce(lambda x, y: x & y, buy_16_protections))
+            #buy_16_logic.append((dataframe['volume_mean_4'] * self.buy_volume_16.value) > dataframe['volume'])
+            buy_16_logic.append(dataframe['close'] < dataframe['ema_20'] * self.buy_ma_offset_16.value)
+            buy_16_logic.append(dataframe['ewo'] > self.buy_ewo_16.value)
+            buy_16_logic.append(dataframe['rsi'] < self.buy_rsi_16.value)
+            buy_16_logic.append(dataframe['volume'] > 0)
+            # Populate
+            dataframe['buy_16_trigger'] = reduce(lambda x, y: x & y, buy_16_logic)
             conditions.append(dataframe['buy_16_trigger'])
 
-        # Protections
-        buy_17_protections = [True]
-        if self.buy_17_protection__ema_fast.value:
-            buy_17_protections.append(dataframe[f"ema_{self.buy_17_protection__ema_fast_len.value}"] > dataframe['ema_200'])
-        if self.buy_17_protection__ema_slow.value:
-            buy_17_protections.append(dataframe[f"ema_{self.buy_17_protection__ema_slow_len.value}_1h"] > dataframe['ema_200_1h'])
-        if self.buy_17_protection__close_above_ema_fast.value:
-            buy_17_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_17_protection__close_above_ema_fast_len.value}"])
-        if self.buy_17_protection__close_above_ema_slow.value:
-            buy_17_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_17_protection__close_above_ema_slow_len.value}_1h"])
-        if self.buy_17_protection__sma200_rising.value:
-            buy_17_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(int(self.buy_17_protection__sma200_rising_val.value)))
-        if self.buy_17_protection__sma200_1h_rising.value:
-            buy_17_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(int(self.buy_17_protection__sma200_1h_rising_val.value)))
-        if self.buy_17_protection__safe_dips.value:
-            buy_17_protections.append(dataframe[f"safe_dips_{self.buy_17_protection__safe_dips_type.value}"])
-        if self.buy_17_protection__safe_pump.value:
-            buy_17_protections.append(dataframe[f"safe_pump_{self.buy_17_protection__safe_pump_period.value}_{self.buy_17_protection__safe_pump_type.value}_1h"])
-        # Non-Standard protections (add below)
-
-        # Logic
-        buy_17_logic = []
-        buy_17_logic.append(reduce(lambda x, y: x & y, buy_17_protections))
-        #buy_17_logic.append((dataframe['volume_mean_4'] * self.buy_volume_17.value) > dataframe['volume'])
-        buy_17_logic.append(dataframe['close'] < dataframe['ema_20'] * self.buy_ma_offset_17.value)
-        buy_17_logic.append(dataframe['ewo'] < self.buy_ewo_17.value)
-        buy_17_logic.append(dataframe['volume'] > 0)
-        # Populate
-        dataframe['buy_17_trigger'] = reduce(lambda x, y: x & y, buy_17_logic)
         if self.buy_condition_17_enable.value:
+            # Protections
+            buy_17_protections = [True]
+            if self.buy_17_protection__ema_fast.value:
+                buy_17_protections.append(dataframe[f"ema_{self.buy_17_protection__ema_fast_len.value}"] > dataframe['ema_200'])
+            if self.buy_17_protection__ema_slow.value:
+                buy_17_protections.append(dataframe[f"ema_{self.buy_17_protection__ema_slow_len.value}_1h"] > dataframe['ema_200_1h'])
+            if self.buy_17_protection__close_above_ema_fast.value:
+                buy_17_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_17_protection__close_above_ema_fast_len.value}"])
+            if self.buy_17_protection__close_above_ema_slow.value:
+                buy_17_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_17_protection__close_above_ema_slow_len.value}_1h"])
+            if self.buy_17_protection__sma200_rising.value:
+                buy_17_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(int(self.buy_17_protection__sma200_rising_val.value)))
+            if self.buy_17_protection__sma200_1h_rising.value:
+                buy_17_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(int(self.buy_17_protection__sma200_1h_rising_val.value)))
+            if self.buy_17_protection__safe_dips.value:
+                buy_17_protections.append(dataframe[f"safe_dips_{self.buy_17_protection__safe_dips_type.value}"])
+            if self.buy_17_protection__safe_pump.value:
+                buy_17_protections.append(dataframe[f"safe_pump_{self.buy_17_protection__safe_pump_period.value}_{self.buy_17_protection__safe_pump_type.value}_1h"])
+            # Non-Standard protections (add below)
+
+            # Logic
+            buy_17_logic = []
+            buy_17_logic.append(reduce(lambda x, y: x & y, buy_17_protections))
+            #buy_17_logic.append((dataframe['volume_mean_4'] * self.buy_volume_17.value) > dataframe['volume'])
+            buy_17_logic.append(dataframe['close'] < dataframe['ema_20'] * self.buy_ma_offset_17.value)
+            buy_17_logic.append(dataframe['ewo'] < self.buy_ewo_17.value)
+            buy_17_logic.append(dataframe['volume'] > 0)
+            # Populate
+            dataframe['buy_17_trigger'] = reduce(lambda x, y: x & y, buy_17_logic)
             conditions.append(dataframe['buy_17_trigger'])
 
-        # Protections
-        buy_18_protections = [True]
-        if self.buy_18_protection__ema_fast.value:
-            buy_18_protections.append(dataframe[f"ema_{self.buy_18_protection__ema_fast_len.value}"] > dataframe['ema_200'])
-        if self.buy_18_protection__ema_slow.value:
-            buy_18_protections.append(dataframe[f"ema_{self.buy_18_protection__ema_slow_len.value}_1h"] > dataframe['ema_200_1h'])
-        if self.buy_18_protection__close_above_ema_fast.value:
-            buy_18_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_18_protection__close_above_ema_fast_len.value}"])
-        if self.buy_18_protection__close_above_ema_slow.value:
-            buy_18_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_18_protection__close_above_ema_slow_len.value}_1h"])
-        if self.buy_18_protection__sma200_rising.value:
-            buy_18_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(int(self.buy_18_protection__sma200_rising_val.value)))
-        if self.buy_18_protection__sma200_1h_rising.value:
-            buy_18_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(int(self.buy_18_protection__sma200_1h_rising_val.value)))
-        if self.buy_18_protection__safe_dips.value:
-            buy_18_protections.append(dataframe[f"safe_dips_{self.buy_18_protection__safe_dips_type.value}"])
-        if self.buy_18_protection__safe_pump.value:
-            buy_18_protections.append(dataframe[f"safe_pump_{self.buy_18_protection__safe_pump_period.value}_{self.buy_18_protection__safe_pump_type.value}_1h"])
-        # Non-Standard protections (add below)
-        #buy_18_protections.append(dataframe['ema_100'] > dataframe['ema_200'])
-        buy_18_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(20))
-        buy_18_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(36))
-
-        # Logic
-        buy_18_logic = []
-        buy_18_logic.append(reduce(lambda x, y: x & y, buy_18_protections))
-        #buy_18_logic.append((dataframe['volume_mean_4'] * self.buy_volume_18.value) > dataframe['volume'])
-        buy_18_logic.append(dataframe['rsi'] < self.buy_rsi_18.value)
-        buy_18_logic.append(dataframe['close'] < (dataframe['bb_lowerband'] * self.buy_bb_offset_18.value))
-        buy_18_logic.append(dataframe['volume'] > 0)
-        # Populate
-        dataframe['buy_18_trigger'] = reduce(lambda x, y: x & y, buy_18_logic)
         if self.buy_condition_18_enable.value:
+            # Protections
+            buy_18_protections = [True]
+            if self.buy_18_protection__ema_fast.value:
+                buy_18_protections.append(dataframe[f"ema_{self.buy_18_protection__ema_fast_len.value}"] > dataframe['ema_200'])
+            if self.buy_18_protection__ema_slow.value:
+                buy_18_protections.append(dataframe[f"ema_{self.buy_18_protection__ema_slow_len.value}_1h"] > dataframe['ema_200_1h'])
+            if self.buy_18_protection__close_above_ema_fast.value:
+                buy_18_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_18_protection__close_above_ema_fast_len.value}"])
+            if self.buy_18_protection__close_above_ema_slow.value:
+                buy_18_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_18_protection__close_above_ema_slow_len.value}_1h"])
+            if self.buy_18_protection__sma200_rising.value:
+                buy_18_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(int(self.buy_18_protection__sma200_rising_val.value)))
+            if self.buy_18_protection__sma200_1h_rising.value:
+                buy_18_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(int(self.buy_18_protection__sma200_1h_rising_val.value)))
+            if self.buy_18_protection__safe_dips.value:
+                buy_18_protections.append(dataframe[f"safe_dips_{self.buy_18_protection__safe_dips_type.value}"])
+            if self.buy_18_protection__safe_pump.value:
+                buy_18_protections.append(dataframe[f"safe_pump_{self.buy_18_protection__safe_pump_period.value}_{self.buy_18_protection__safe_pump_type.value}_1h"])
+            # Non-Standard protections (add below)
+            #buy_18_protections.append(dataframe['ema_100'] > dataframe['ema_200'])
+            buy_18_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(20))
+            buy_18_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(36))
+
+            # Logic
+            buy_18_logic = []
+            buy_18_logic.append(reduce(lambda x, y: x & y, buy_18_protections))
+            #buy_18_logic.append((dataframe['volume_mean_4'] * self.buy_volume_18.value) > dataframe['volume'])
+            buy_18_logic.append(dataframe['rsi'] < self.buy_rsi_18.value)
+            buy_18_logic.append(dataframe['close'] < (dataframe['bb_lowerband'] * self.buy_bb_offset_18.value))
+            buy_18_logic.append(dataframe['volume'] > 0)
+            # Populate
+            dataframe['buy_18_trigger'] = reduce(lambda x, y: x & y, buy_18_logic)
             conditions.append(dataframe['buy_18_trigger'])
 
-        # Protections
-        buy_19_protections = [True]
-        if self.buy_19_protection__ema_fast.value:
-            buy_19_protections.append(dataframe[f"ema_{self.buy_19_protection__ema_fast_len.value}"] > dataframe['ema_200'])
-        if self.buy_19_protection__ema_slow.value:
-            buy_19_protections.append(dataframe[f"ema_{self.buy_19_protection__ema_slow_len.value}_1h"] > dataframe['ema_200_1h'])
-        if self.buy_19_protection__close_above_ema_fast.value:
-            buy_19_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_19_protection__close_above_ema_fast_len.value}"])
-        if self.buy_19_protection__close_above_ema_slow.value:
-            buy_19_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_19_protection__close_above_ema_slow_len.value}_1h"])
-        if self.buy_19_protection__sma200_rising.value:
-            buy_19_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(int(self.buy_19_protection__sma200_rising_val.value)))
-        if self.buy_19_protection__sma200_1h_rising.value:
-            buy_19_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(int(self.buy_19_protection__sma200_1h_rising_val.value)))
-        if self.buy_19_protection__safe_dips.value:
-            buy_19_protections.append(dataframe[f"safe_dips_{self.buy_19_protection__safe_dips_type.value}"])
-        if self.buy_19_protection__safe_pump.value:
-            buy_19_protections.append(dataframe[f"safe_pump_{self.buy_19_protection__safe_pump_period.value}_{self.buy_19_protection__safe_pump_type.value}_1h"])
-        # Non-Standard protections (add below)
-        buy_19_protections.append(dataframe['ema_50_1h'] > dataframe['ema_200_1h'])
-
-        # Logic
-        buy_19_logic = []
-        buy_19_logic.append(reduce(lambda x, y: x & y, buy_19_protections))
-        buy_19_logic.append(dataframe['close'].shift(1) > dataframe['ema_100_1h'])
-        buy_19_logic.append(dataframe['low'] < dataframe['ema_100_1h'])
-        buy_19_logic.append(dataframe['close'] > dataframe['ema_100_1h'])
-        buy_19_logic.append(dataframe['rsi_1h'] > self.buy_rsi_1h_min_19.value)
-        buy_19_logic.append(dataframe['chop'] < self.buy_chop_min_19.value)
-        buy_19_logic.append(dataframe['volume'] > 0)
-        # Populate
-        dataframe['buy_19_trigger'] = reduce(lambda x, y: x & y, buy_19_logic)
         if self.buy_condition_19_enable.value:
+            # Protections
+            buy_19_protections = [True]
+            if self.buy_19_protection__ema_fast.value:
+                buy_19_protections.append(dataframe[f"ema_{self.buy_19_protection__ema_fast_len.value}"] > dataframe['ema_200'])
+            if self.buy_19_protection__ema_slow.value:
+                buy_19_protections.append(dataframe[f"ema_{self.buy_19_protection__ema_slow_len.value}_1h"] > dataframe['ema_200_1h'])
+            if self.buy_19_protection__close_above_ema_fast.value:
+                buy_19_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_19_protection__close_above_ema_fast_len.value}"])
+            if self.buy_19_protection__close_above_ema_slow.value:
+                buy_19_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_19_protection__close_above_ema_slow_len.value}_1h"])
+            if self.buy_19_protection__sma200_rising.value:
+                buy_19_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(int(self.buy_19_protection__sma200_rising_val.value)))
+            if self.buy_19_protection__sma200_1h_rising.value:
+                buy_19_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(int(self.buy_19_protection__sma200_1h_rising_val.value)))
+            if self.buy_19_protection__safe_dips.value:
+                buy_19_protections.append(dataframe[f"safe_dips_{self.buy_19_protection__safe_dips_type.value}"])
+            if self.buy_19_protection__safe_pump.value:
+                buy_19_protections.append(dataframe[f"safe_pump_{self.buy_19_protection__safe_pump_period.value}_{self.buy_19_protection__safe_pump_type.value}_1h"])
+            # Non-Standard protections (add below)
+            buy_19_protections.append(dataframe['ema_50_1h'] > dataframe['ema_200_1h'])
+
+            # Logic
+            buy_19_logic = []
+            buy_19_logic.append(reduce(lambda x, y: x & y, buy_19_protections))
+            buy_19_logic.append(dataframe['close'].shift(1) > dataframe['ema_100_1h'])
+            buy_19_logic.append(dataframe['low'] < dataframe['ema_100_1h'])
+            buy_19_logic.append(dataframe['close'] > dataframe['ema_100_1h'])
+            buy_19_logic.append(dataframe['rsi_1h'] > self.buy_rsi_1h_min_19.value)
+            buy_19_logic.append(dataframe['chop'] < self.buy_chop_min_19.value)
+            buy_19_logic.append(dataframe['volume'] > 0)
+            # Populate
+            dataframe['buy_19_trigger'] = reduce(lambda x, y: x & y, buy_19_logic)
             conditions.append(dataframe['buy_19_trigger'])
 
-        # Protections
-        buy_20_protections = [True]
-        if self.buy_20_protection__ema_fast.value:
-            buy_20_protections.append(dataframe[f"ema_{self.buy_20_protection__ema_fast_len.value}"] > dataframe['ema_200'])
-        if self.buy_20_protection__ema_slow.value:
-            buy_20_protections.append(dataframe[f"ema_{self.buy_20_protection__ema_slow_len.value}_1h"] > dataframe['ema_200_1h'])
-        if self.buy_20_protection__close_above_ema_fast.value:
-            buy_20_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_20_protection__close_above_ema_fast_len.value}"])
-        if self.buy_20_protection__close_above_ema_slow.value:
-            buy_20_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_20_protection__close_above_ema_slow_len.value}_1h"])
-        if self.buy_20_protection__sma200_rising.value:
-            buy_20_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(int(self.buy_20_protection__sma200_rising_val.value)))
-        if self.buy_20_protection__sma200_1h_rising.value:
-            buy_20_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(int(self.buy_20_protection__sma200_1h_rising_val.value)))
-        if self.buy_20_protection__safe_dips.value:
-            buy_20_protections.append(dataframe[f"safe_dips_{self.buy_20_protection__safe_dips_type.value}"])
-        if self.buy_20_protection__safe_pump.value:
-            buy_20_protections.append(dataframe[f"safe_pump_{self.buy_20_protection__safe_pump_period.value}_{self.buy_20_protection__safe_pump_type.value}_1h"])
-        # Non-Standard protections (add below)
-
-        # Logic
-        buy_20_logic = []
-        buy_20_logic.append(reduce(lambda x, y: x & y, buy_20_protections))
-        #buy_20_logic.append((dataframe['volume_mean_4'] * self.buy_volume_20.value) > dataframe['volume'])
-        buy_20_logic.append(dataframe['rsi'] < self.buy_rsi_20.value)
-        buy_20_logic.append(dataframe['rsi_1h'] < self.buy_rsi_1h_20.value)
-        buy_20_logic.append(dataframe['volume'] > 0)
-        # Populate
-        dataframe['buy_20_trigger'] = reduce(lambda x, y: x & y, buy_20_logic)
         if self.buy_condition_20_enable.value:
+            # Protections
+            buy_20_protections = [True]
+            if self.buy_20_protection__ema_fast.value:
+                buy_20_protections.append(dataframe[f"ema_{self.buy_20_protection__ema_fast_len.value}"] > dataframe['ema_200'])
+            if self.buy_20_protection__ema_slow.value:
+                buy_20_protections.append(dataframe[f"ema_{self.buy_20_protection__ema_slow_len.value}_1h"] > dataframe['ema_200_1h'])
+            if self.buy_20_protection__close_above_ema_fast.value:
+                buy_20_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_20_protection__close_above_ema_fast_len.value}"])
+            if self.buy_20_protection__close_above_ema_slow.value:
+                buy_20_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_20_protection__close_above_ema_slow_len.value}_1h"])
+            if self.buy_20_protection__sma200_rising.value:
+                buy_20_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(int(self.buy_20_protection__sma200_rising_val.value)))
+            if self.buy_20_protection__sma200_1h_rising.value:
+                buy_20_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(int(self.buy_20_protection__sma200_1h_rising_val.value)))
+            if self.buy_20_protection__safe_dips.value:
+                buy_20_protections.append(dataframe[f"safe_dips_{self.buy_20_protection__safe_dips_type.value}"])
+            if self.buy_20_protection__safe_pump.value:
+                buy_20_protections.append(dataframe[f"safe_pump_{self.buy_20_protection__safe_pump_period.value}_{self.buy_20_protection__safe_pump_type.value}_1h"])
+            # Non-Standard protections (add below)
+
+            # Logic
+            buy_20_logic = []
+            buy_20_logic.append(reduce(lambda x, y: x & y, buy_20_protections))
+            #buy_20_logic.append((dataframe['volume_mean_4'] * self.buy_volume_20.value) > dataframe['volume'])
+            buy_20_logic.append(dataframe['rsi'] < self.buy_rsi_20.value)
+            buy_20_logic.append(dataframe['rsi_1h'] < self.buy_rsi_1h_20.value)
+            buy_20_logic.append(dataframe['volume'] > 0)
+            # Populate
+            dataframe['buy_20_trigger'] = reduce(lambda x, y: x & y, buy_20_logic)
             conditions.append(dataframe['buy_20_trigger'])
 
-        # Protections
-        buy_21_protections = [True]
-        if self.buy_21_protection__ema_fast.value:
-            buy_21_protections.append(dataframe[f"ema_{self.buy_21_protection__ema_fast_len.value}"] > dataframe['ema_200'])
-        if self.buy_21_protection__ema_slow.value:
-            buy_21_protections.append(dataframe[f"ema_{self.buy_21_protection__ema_slow_len.value}_1h"] > dataframe['ema_200_1h'])
-        if self.buy_21_protection__close_above_ema_fast.value:
-            buy_21_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_21_protection__close_above_ema_fast_len.value}"])
-        if self.buy_21_protection__close_above_ema_slow.value:
-            buy_21_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_21_protection__close_above_ema_slow_len.value}_1h"])
-        if self.buy_21_protection__sma200_rising.value:
-            buy_21_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(int(self.buy_21_protection__sma200_rising_val.value)))
-        if self.buy_21_protection__sma200_1h_rising.value:
-            buy_21_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(int(self.buy_21_protection__sma200_1h_rising_val.value)))
-        if self.buy_21_protection__safe_dips.value:
-            buy_21_protections.append(dataframe[f"safe_dips_{self.buy_21_protection__safe_dips_type.value}"])
-        if self.buy_21_protection__safe_pump.value:
-            buy_21_protections.append(dataframe[f"safe_pump_{self.buy_21_protection__safe_pump_period.value}_{self.buy_21_protection__safe_pump_type.value}_1h"])
-        # Non-Standard protections (add below)
-
-        # Logic
-        buy_21_logic = []
-        buy_21_logic.append(reduce(lambda x, y: x & y, buy_21_protections))
-        #buy_21_logic.append((dataframe['volume_mean_4'] * self.buy_volume_21.value) > dataframe['volume'])
-        buy_21_logic.append(dataframe['rsi'] < self.buy_rsi_21.value)
-        buy_21_logic.append(dataframe['rsi_1h'] < self.buy_rsi_1h_21.value)
-        buy_21_logic.append(dataframe['volume'] > 0)
-        # Populate
-        dataframe['buy_21_trigger'] = reduce(lambda x, y: x & y, buy_21_logic)
         if self.buy_condition_21_enable.value:
+            # Protections
+            buy_21_protections = [True]
+            if self.buy_21_protection__ema_fast.value:
+                buy_21_protections.append(dataframe[f"ema_{self.buy_21_protection__ema_fast_len.value}"] > dataframe['ema_200'])
+            if self.buy_21_protection__ema_slow.value:
+                buy_21_protections.append(dataframe[f"ema_{self.buy_21_protection__ema_slow_len.value}_1h"] > dataframe['ema_200_1h'])
+            if self.buy_21_protection__close_above_ema_fast.value:
+                buy_21_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_21_protection__close_above_ema_fast_len.value}"])
+            if self.buy_21_protection__close_above_ema_slow.value:
+                buy_21_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_21_protection__close_above_ema_slow_len.value}_1h"])
+            if self.buy_21_protection__sma200_rising.value:
+                buy_21_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(int(self.buy_21_protection__sma200_rising_val.value)))
+            if self.buy_21_protection__sma200_1h_rising.value:
+                buy_21_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(int(self.buy_21_protection__sma200_1h_rising_val.value)))
+            if self.buy_21_protection__safe_dips.value:
+                buy_21_protections.append(dataframe[f"safe_dips_{self.buy_21_protection__safe_dips_type.value}"])
+            if self.buy_21_protection__safe_pump.value:
+                buy_21_protections.append(dataframe[f"safe_pump_{self.buy_21_protection__safe_pump_period.value}_{self.buy_21_protection__safe_pump_type.value}_1h"])
+            # Non-Standard protections (add below)
+
+            # Logic
+            buy_21_logic = []
+            buy_21_logic.append(reduce(lambda x, y: x & y, buy_21_protections))
+            #buy_21_logic.append((dataframe['volume_mean_4'] * self.buy_volume_21.value) > dataframe['volume'])
+            buy_21_logic.append(dataframe['rsi'] < self.buy_rsi_21.value)
+            buy_21_logic.append(dataframe['rsi_1h'] < self.buy_rsi_1h_21.value)
+            buy_21_logic.append(dataframe['volume'] > 0)
+            # Populate
+            dataframe['buy_21_trigger'] = reduce(lambda x, y: x & y, buy_21_logic)
             conditions.append(dataframe['buy_21_trigger'])
 
-        # Protections
-        buy_22_protections = [True]
-        if self.buy_22_protection__ema_fast.value:
-            buy_22_protections.append(dataframe[f"ema_{self.buy_22_protection__ema_fast_len.value}"] > dataframe['ema_200'])
-        if self.buy_22_protection__ema_slow.value:
-            buy_22_protections.append(dataframe[f"ema_{self.buy_22_protection__ema_slow_len.value}_1h"] > dataframe['ema_200_1h'])
-        if self.buy_22_protection__close_above_ema_fast.value:
-            buy_22_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_22_protection__close_above_ema_fast_len.value}"])
-        if self.buy_22_protection__close_above_ema_slow.value:
-            buy_22_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_22_protection__close_above_ema_slow_len.value}_1h"])
-        if self.buy_22_protection__sma200_rising.value:
-            buy_22_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(int(self.buy_22_protection__sma200_rising_val.value)))
-        if self.buy_22_protection__sma200_1h_rising.value:
-            buy_22_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(int(self.buy_22_protection__sma200_1h_rising_val.value)))
-        if self.buy_22_protection__safe_dips.value:
-            buy_22_protections.append(dataframe[f"safe_dips_{self.buy_22_protection__safe_dips_type.value}"])
-        if self.buy_22_protection__safe_pump.value:
-            buy_22_protections.append(dataframe[f"safe_pump_{self.buy_22_protection__safe_pump_period.value}_{self.buy_22_protection__safe_pump_type.value}_1h"])
-        # Non-Standard protections (add below)
-        buy_22_protections.append(dataframe['ema_100_1h'] > dataframe['ema_100_1h'].shift(12))
-        buy_22_protections.append(dataframe['ema_200_1h'] > dataframe['ema_200_1h'].shift(36))
-
-        # Logic
-        buy_22_logic = []
-        buy_22_logic.append(reduce(lambda x, y: x & y, buy_22_protections))
-        buy_22_logic.append((dataframe['volume_mean_4'] * self.buy_volume_22.value) > dataframe['volume'])
-        buy_22_logic.append(dataframe['close'] < dataframe['sma_30'] * self.buy_ma_offset_22.value)
-        buy_22_logic.append(dataframe['close'] < (dataframe['bb_lowerband'] * self.buy_bb_offset_22.value))
-        buy_22_logic.append(dataframe['ewo'] > self.buy_ewo_22.value)
-        buy_22_logic.append(dataframe['rsi'] < self.buy_rsi_22.value)
-        buy_22_logic.append(dataframe['volume'] > 0)
-        # Populate
-        dataframe['buy_22_trigger'] = reduce(lambda x, y: x & y, buy_22_logic)
         if self.buy_condition_22_enable.value:
+            # Protections
+            buy_22_protections = [True]
+            if self.buy_22_protection__ema_fast.value:
+                buy_22_protections.append(dataframe[f"ema_{self.buy_22_protection__ema_fast_len.value}"] > dataframe['ema_200'])
+            if self.buy_22_protection__ema_slow.value:
+                buy_22_protections.append(dataframe[f"ema_{self.buy_22_protection__ema_slow_len.value}_1h"] > dataframe['ema_200_1h'])
+            if self.buy_22_protection__close_above_ema_fast.value:
+                buy_22_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_22_protection__close_above_ema_fast_len.value}"])
+            if self.buy_22_protection__close_above_ema_slow.value:
+                buy_22_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_22_protection__close_above_ema_slow_len.value}_1h"])
+            if self.buy_22_protection__sma200_rising.value:
+                buy_22_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(int(self.buy_22_protection__sma200_rising_val.value)))
+            if self.buy_22_protection__sma200_1h_rising.value:
+                buy_22_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(int(self.buy_22_protection__sma200_1h_rising_val.value)))
+            if self.buy_22_protection__safe_dips.value:
+                buy_22_protections.append(dataframe[f"safe_dips_{self.buy_22_protection__safe_dips_type.value}"])
+            if self.buy_22_protection__safe_pump.value:
+                buy_22_protections.append(dataframe[f"safe_pump_{self.buy_22_protection__safe_pump_period.value}_{self.buy_22_protection__safe_pump_type.value}_1h"])
+            # Non-Standard protections (add below)
+            buy_22_protections.append(dataframe['ema_100_1h'] > dataframe['ema_100_1h'].shift(12))
+            buy_22_protections.append(dataframe['ema_200_1h'] > dataframe['ema_200_1h'].shift(36))
+
+            # Logic
+            buy_22_logic = []
+            buy_22_logic.append(reduce(lambda x, y: x & y, buy_22_protections))
+            buy_22_logic.append((dataframe['volume_mean_4'] * self.buy_volume_22.value) > dataframe['volume'])
+            buy_22_logic.append(dataframe['close'] < dataframe['sma_30'] * self.buy_ma_offset_22.value)
+            buy_22_logic.append(dataframe['close'] < (dataframe['bb_lowerband'] * self.buy_bb_offset_22.value))
+            buy_22_logic.append(dataframe['ewo'] > self.buy_ewo_22.value)
+            buy_22_logic.append(dataframe['rsi'] < self.buy_rsi_22.value)
+            buy_22_logic.append(dataframe['volume'] > 0)
+            # Populate
+            dataframe['buy_22_trigger'] = reduce(lambda x, y: x & y, buy_22_logic)
             conditions.append(dataframe['buy_22_trigger'])
 
-            # Protections
-        buy_23_protections = [True]
-        if self.buy_23_protection__ema_fast.value:
-            buy_23_protections.append(dataframe[f"ema_{self.buy_23_protection__ema_fast_len.value}"] > dataframe['ema_200'])
-        if self.buy_23_protection__ema_slow.value:
-            buy_23_protections.append(dataframe[f"ema_{self.buy_23_protection__ema_slow_len.value}_1h"] > dataframe['ema_200_1h'])
-        if self.buy_23_protection__close_above_ema_fast.value:
-            buy_23_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_23_protection__close_above_ema_fast_len.value}"])
-        if self.buy_23_protection__close_above_ema_slow.value:
-            buy_23_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_23_protection__close_above_ema_slow_len.value}_1h"])
-        if self.buy_23_protection__sma200_rising.value:
-            buy_23_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(int(self.buy_23_protection__sma200_rising_val.value)))
-        if self.buy_23_protection__sma200_1h_rising.value:
-            buy_23_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(int(self.buy_23_protection__sma200_1h_rising_val.value)))
-        if self.buy_23_protection__safe_dips.value:
-            buy_23_protections.append(dataframe[f"safe_dips_{self.buy_23_protection__safe_dips_type.value}"])
-        if self.buy_23_protection__safe_pump.value:
-            buy_23_protections.append(dataframe[f"safe_pump_{self.buy_23_protection__safe_pump_period.value}_{self.buy_23_protection__safe_pump_type.value}_1h"])
-        # Non-Standard protections (add below)
-
-        # Logic
-        buy_23_logic = []
-        buy_23_logic.append(reduce(lambda x, y: x & y, buy_23_protections))
-        buy_23_logic.append(dataframe['close'] < (dataframe['bb_lowerband'] * self.buy_bb_offset_23.value))
-        buy_23_logic.append(dataframe['ewo'] > self.buy_ewo_23.value)
-        buy_23_logic.append(dataframe['rsi'] < self.buy_rsi_23.value)
-        buy_23_logic.append(dataframe['rsi_1h'] < self.buy_rsi_1h_23.value)
-        buy_23_logic.append(dataframe['volume'] > 0)
-        # Populate
-        dataframe['buy_23_trigger'] = reduce(lambda x, y: x & y, buy_23_logic)
         if self.buy_condition_23_enable.value:
+            # Protections
+            buy_23_protections = [True]
+            if self.buy_23_protection__ema_fast.value:
+                buy_23_protections.append(dataframe[f"ema_{self.buy_23_protection__ema_fast_len.value}"] > dataframe['ema_200'])
+            if self.buy_23_protection__ema_slow.value:
+                buy_23_protections.append(dataframe[f"ema_{self.buy_23_protection__ema_slow_len.value}_1h"] > dataframe['ema_200_1h'])
+            if self.buy_23_protection__close_above_ema_fast.value:
+                buy_23_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_23_protection__close_above_ema_fast_len.value}"])
+            if self.buy_23_protection__close_above_ema_slow.value:
+                buy_23_protections.append(dataframe['close'] > dataframe[f"ema_{self.buy_23_protection__close_above_ema_slow_len.value}_1h"])
+            if self.buy_23_protection__sma200_rising.value:
+                buy_23_protections.append(dataframe['sma_200'] > dataframe['sma_200'].shift(int(self.buy_23_protection__sma200_rising_val.value)))
+            if self.buy_23_protection__sma200_1h_rising.value:
+                buy_23_protections.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(int(self.buy_23_protection__sma200_1h_rising_val.value)))
+            if self.buy_23_protection__safe_dips.value:
+                buy_23_protections.append(dataframe[f"safe_dips_{self.buy_23_protection__safe_dips_type.value}"])
+            if self.buy_23_protection__safe_pump.value:
+                buy_23_protections.append(dataframe[f"safe_pump_{self.buy_23_protection__safe_pump_period.value}_{self.buy_23_protection__safe_pump_type.value}_1h"])
+            # Non-Standard protections (add below)
+
+            # Logic
+            buy_23_logic = []
+            buy_23_logic.append(reduce(lambda x, y: x & y, buy_23_protections))
+            buy_23_logic.append(dataframe['close'] < (dataframe['bb_lowerband'] * self.buy_bb_offset_23.value))
+            buy_23_logic.append(dataframe['ewo'] > self.buy_ewo_23.value)
+            buy_23_logic.append(dataframe['rsi'] < self.buy_rsi_23.value)
+            buy_23_logic.append(dataframe['rsi_1h'] < self.buy_rsi_1h_23.value)
+            buy_23_logic.append(dataframe['volume'] > 0)
+            # Populate
+            dataframe['buy_23_trigger'] = reduce(lambda x, y: x & y, buy_23_logic)
             conditions.append(dataframe['buy_23_trigger'])
 
+        # Disabled conditions keep an empty trigger column, plots and analyses read all of them
+        for condition in self.buy_condition_indicators:
+            if not f"buy_{condition:02d}_trigger" in dataframe:
+                dataframe[f"buy_{condition:02d}_trigger"] = False
+
         if conditions:
             dataframe.loc[
                 reduce(lambda x, y: x | y, conditions),
@@ -2580,84 +3203,82 @@ class NostalgiaForInfinityNext(IStrategy):
         return dataframe
 
     def populate_sell_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        self.sell_rules = self.compile_sell_rules()
+        if self.config['runmode'].value in ('backtest', 'hyperopt'):
+            self.sell_candles[metadata['pair']] = SellCandles(dataframe, self.sell_rule_columns, timeframe_to_minutes(self.timeframe))
+            self.sell_windows.pop(metadata['pair'], None)
+
         conditions = []
 
-        conditions.append(
-            (
-                self.sell_condition_1_enable.value &
-
-                (dataframe['rsi'] > self.sell_rsi_bb_1.value) &
-                (dataframe['close'] > dataframe['bb_upperband']) &
-                (dataframe['close'].shift(1) > dataframe['bb_upperband'].shift(1)) &
-                (dataframe['close'].shift(2) > dataframe['bb_upperband'].shift(2)) &
-                (dataframe['close'].shift(3) > dataframe['bb_upperband'].shift(3)) &
-                (dataframe['close'].shift(4) > dataframe['bb_upperband'].shift(4)) &
-                (dataframe['close'].shift(5) > dataframe['bb_upperband'].shift(5)) &
-                (dataframe['volume'] > 0)
+        if self.sell_condition_1_enable.value:
+            conditions.append(
+                (
+                    (dataframe['rsi'] > self.sell_rsi_bb_1.value) &
+                    (dataframe['close'] > dataframe['bb_upperband']) &
+                    (dataframe['close'].shift(1) > dataframe['bb_upperband'].shift(1)) &
+                    (dataframe['close'].shift(2) > dataframe['bb_upperband'].shift(2)) &
+                    (dataframe['close'].shift(3) > dataframe['bb_upperband'].shift(3)) &
+                    (dataframe['close'].shift(4) > dataframe['bb_upperband'].shift(4)) &
+                    (dataframe['close'].shift(5) > dataframe['bb_upperband'].shift(5)) &
+                    (dataframe['volume'] > 0)
+                )
             )
-        )
 
-        conditions.append(
-            (
-                self.sell_condition_2_enable.value &
-
-                (dataframe['rsi'] > self.sell_rsi_bb_2.value) &
-                (dataframe['close'] > dataframe['bb_upperband']) &
-                (dataframe['close'].shift(1) > dataframe['bb_upperband'].shift(1)) &
-                (dataframe['close'].shift(2) > dataframe['bb_upperband'].shift(2)) &
-                (dataframe['volume'] > 0)
+        if self.sell_condition_2_enable.value:
+            conditions.append(
+                (
+                    (dataframe['rsi'] > self.sell_rsi_bb_2.value) &
+                    (dataframe['close'] > dataframe['bb_upperband']) &
+                    (dataframe['close'].shift(1) > dataframe['bb_upperband'].shift(1)) &
+                    (dataframe['close'].shift(2) > dataframe['bb_upperband'].shift(2)) &
+                    (dataframe['volume'] > 0)
+                )
             )
-        )
-
-        conditions.append(
-            (
-                self.sell_condition_3_enable.value &
 
-                (dataframe['rsi'] > self.sell_rsi_main_3.value) &
-                (dataframe['volume'] > 0)
+        if self.sell_condition_3_enable.value:
+            conditions.append(
+                (
+                    (dataframe['rsi'] > self.sell_rsi_main_3.value) &
+                    (dataframe['volume'] > 0)
+                )
             )
-        )
 
-        conditions.append(
-            (
-                self.sell_condition_4_enable.value &
-
-                (dataframe['rsi'] > self.sell_dual_rsi_rsi_4.value) &
-                (dataframe['rsi_1h'] > self.sell_dual_rsi_rsi_1h_4.value) &
-                (dataframe['volume'] > 0)
+        if self.sell_condition_4_enable.value:
+            conditions.append(
+                (
+                    (dataframe['rsi'] > self.sell_dual_rsi_rsi_4.value) &
+                    (dataframe['rsi_1h'] > self.sell_dual_rsi_rsi_1h_4.value) &
+                    (dataframe['volume'] > 0)
+                )
             )
-        )
-
-        conditions.append(
-            (
-                self.sell_condition_6_enable.value &
 
-                (dataframe['close'] < dataframe['ema_200']) &
-                (dataframe['close'] > dataframe['ema_50']) &
-                (dataframe['rsi'] > self.sell_rsi_under_6.value) &
-                (dataframe['volume'] > 0)
+        if self.sell_condition_6_enable.value:
+            conditions.append(
+                (
+                    (dataframe['close'] < dataframe['ema_200']) &
+                    (dataframe['close'] > dataframe['ema_50']) &
+                    (dataframe['rsi'] > self.sell_rsi_under_6.value) &
+                    (dataframe['volume'] > 0)
+                )
             )
-        )
-
-        conditions.append(
-            (
-                self.sell_condition_7_enable.value &
 
-                (dataframe['rsi_1h'] > self.sell_rsi_1h_7.value) &
-                qtpylib.crossed_below(dataframe['ema_12'], dataframe['ema_26']) &
-                (dataframe['volume'] > 0)
+        if self.sell_condition_7_enable.value:
+            conditions.append(
+                (
+                    (dataframe['rsi_1h'] > self.sell_rsi_1h_7.value) &
+                    qtpylib.crossed_below(dataframe['ema_12'], dataframe['ema_26']) &
+                    (dataframe['volume'] > 0)
+                )
             )
-        )
 
-        conditions.append(
-            (
-                self.sell_condition_8_enable.value &
+        if self.sell_condition_8_enable.value:
+            conditions.append(
+                (
+                    (dataframe['close'] > dataframe['bb_upperband_1h'] * self.sell_bb_relative_8.value) &
 
-                (dataframe['close'] > dataframe['bb_upperband_1h'] * self.sell_bb_relative_8.value) &
-
-                (dataframe['volume'] > 0)
+                    (dataframe['volume'] > 0)
+                )
             )
-        )
 
         if conditions:
             dataframe.loc[
@@ -2675,3 +3296,1041 @@ def EWO(dataframe, sma1_length=5, sma2_length=35):
     sma2 = ta.EMA(df, timeperiod=sma2_length)
     smadif = (sma1 - sma2) / df['close'] * 100
     return smadif
+
+class RollingCache:
+    """
+    Rolling window statistics of one dataframe, computed once per (column, window, op).
+    Lets several protections share the same rolling max/min instead of recomputing them.
+    """
+
+    def __init__(self, dataframe: DataFrame):
+        self.dataframe = dataframe
+        self.stats = {}
+
+    def get(self, column: str, window: int, op: str) -> Series:
+        """
+        :param column: str Column of the dataframe
+        :param window: int Rolling window length
+        :param op: str Rolling reduction, e.g. 'max', 'min', 'mean'
+        """
+        key = (column, window, op)
+        if not key in self.stats:
+            self.stats[key] = getattr(self.dataframe[column].rolling(window), op)()
+        return self.stats[key]
+
+def dip_ratios(dataframe, windows=(1, 2, 12, 144)):
+    """
+    Drawdown of the close from the highest open of each window, one column per window
+    """
+    close = dataframe['close']
+    ratios = np.empty((len(dataframe), len(windows)))
+    for i, window in enumerate(windows):
+        top = dataframe['open'] if window == 1 else dataframe['open'].rolling(window).max()
+        ratios[:, i] = ((top - close) / close).values
+    return ratios
+
+class EMAState:
+    """
+    TA-Lib compatible EMA, seeded with the SMA of the first `period` values
+    """
+
+    def __init__(self, period):
+        self.period = period
+        self.k = 2.0 / (period + 1)
+        self.count = 0
+        self.value = 0.0
+
+    def seed(self, values):
+        """
+        The EMA of a whole frame in one TA-Lib pass, the state is left at its last value
+        """
+        out = talib.EMA(values, timeperiod=self.period)
+        self.count = len(values)
+        self.value = out[-1] if self.count >= self.period else values.sum()
+        return (out,)
+
+    def push(self, x):
+        self.count += 1
+        if self.count < self.period:
+            self.value += x
+            return (np.nan,)
+        if self.count == self.period:
+            self.value = (self.value + x) / self.period
+        else:
+            self.value = ((x - self.value) * self.k) + self.value
+        return (self.value,)
+
+class SMAState:
+    """
+    TA-Lib compatible SMA, a running total over the window.
+    The total is summed again from the window every `period` candles, so the rounding error of the
+    additions and subtractions does not build up over a long live session.
+    """
+
+    def __init__(self, period):
+        self.period = period
+        self.window = deque()
+        self.total = 0.0
+        self.pushes = 0
+
+    def seed(self, values):
+        """
+        The SMA of a whole frame in one TA-Lib pass, the window keeps the values the next candle needs
+        """
+        out = talib.SMA(values, timeperiod=self.period)
+        kept = len(values) if len(values) < self.period else self.period - 1
+        self.window = deque(values[len(values) - kept:])
+        self.total = float(np.sum(self.window))
+        self.pushes = 0
+        return (out,)
+
+    def push(self, x):
+        self.window.append(x)
+        self.total += x
+        if len(self.window) < self.period:
+            return (np.nan,)
+        value = self.total / self.period
+        self.total -= self.window.popleft()
+        self.pushes += 1
+        if self.pushes >= self.period:
+            self.total = float(np.sum(self.window))
+            self.pushes = 0
+        return (value,)
+
+class RSIState:
+    """
+    TA-Lib compatible RSI, Wilder smoothing of the gains and losses
+    """
+
+    def __init__(self, period):
+        self.period = period
+        self.count = 0
+        self.prev = None
+        self.gain = 0.0
+        self.loss = 0.0
+
+    def seed(self, values):
+        """
+        The RSI of a whole frame in one TA-Lib pass. The Wilder averages of the gains and losses, which
+        TA-Lib does not return, are smoothed again with one vectorized pass
+        """
+        out = talib.RSI(values, timeperiod=self.period)
+        if len(values) == 0:
+            return (out,)
+        diff = np.diff(values)
+        gains = np.maximum(diff, 0.)
+        losses = np.maximum(-diff, 0.)
+        self.prev = values[-1]
+        self.count = len(diff)
+        if self.count < self.period:
+            self.gain = gains.sum()
+            self.loss = losses.sum()
+        else:
+            alpha = 1. / self.period
+            self.gain = Series(np.concatenate([[gains[:self.period].mean()], gains[self.period:]])).ewm(alpha=alpha, adjust=False).mean().iat[-1]
+            self.loss = Series(np.concatenate([[losses[:self.period].mean()], losses[self.period:]])).ewm(alpha=alpha, adjust=False).mean().iat[-1]
+        return (out,)
+
+    def push(self, x):
+        if self.prev is None:
+            self.prev = x
+            return (np.nan,)
+        diff = x - self.prev
+        self.prev = x
+        self.count += 1
+        if self.count > self.period:
+            self.gain *= (self.period - 1)
+            self.loss *= (self.period - 1)
+        if diff < 0:
+            self.loss -= diff
+        else:
+            self.gain += diff
+        if self.count < self.period:
+            return (np.nan,)
+        self.gain /= self.period
+        self.loss /= self.period
+        total = self.gain + self.loss
+        return (100 * (self.gain / total) if not -1e-14 < total < 1e-14 else 0.0,)
+
+class EWOState:
+    """
+    Elliot Wave Oscillator of the EWO function, two EMA states over the close
+    """
+
+    def __init__(self, fast, slow):
+        self.fast = EMAState(fast)
+        self.slow = EMAState(slow)
+
+    def seed(self, values):
+        return ((self.fast.seed(values)[0] - self.slow.seed(values)[0]) / values * 100,)
+
+    def push(self, x):
+        return ((self.fast.push(x)[0] - self.slow.push(x)[0]) / x * 100,)
+
+class BollingerState:
+    """
+    qtpylib compatible Bollinger bands (lower, mid, upper), partial windows are used from the first candle
+    """
+
+    def __init__(self, window, stds):
+        self.window = deque(maxlen=window)
+        self.stds = stds
+
+    def seed(self, values):
+        """
+        The bands of a whole frame in one rolling pass, the window keeps the last values
+        """
+        self.window.clear()
+        self.window.extend(values[-self.window.maxlen:])
+        return tuple(band[0] for band in bollinger_batch(values[None, :], self.window.maxlen, self.stds))
+
+    def push(self, x):
+        self.window.append(x)
+        values = np.array(self.window)
+        mid = values.mean()
+        std = values.std(ddof=1) if len(values) > 1 else np.nan
+        return (mid - std * self.stds, mid, mid + std * self.stds)
+
+class IndicatorStream:
+    """
+    Live state of the streamed indicators of one pair.
+    Every indicator keeps its running state, so a new candle costs O(1) per indicator (O(window) for the
+    Bollinger deviation) no matter how long the history is. The values continue the ones of the first
+    analyzed frame, like a backtest over the whole history, instead of being seeded again from the head
+    of every new frame. Falls back to a full recompute when the new frame does not continue the previous one
+    (gap, restart, changed candles or NaN inputs), the states are then seeded from the vectorized
+    indicators of the whole frame.
+    """
+
+    def __init__(self, specs, timeframe_minutes):
+        self.specs = specs
+        self.step = np.timedelta64(timeframe_minutes, 'm')
+        self.dates = None
+        self.sources = None
+        self.states = None
+        self.columns = None
+
+    def update(self, dataframe):
+        """
+        Return {column: ndarray} of the streamed indicators for the frame
+
+        :param dataframe: DataFrame The original OHLCV dataframe
+        """
+        dates = dataframe['date'].values
+        sources = {
+            'close': dataframe['close'].values.astype(np.float64),
+            'typical': ((dataframe['high'] + dataframe['low'] + dataframe['close']) / 3.).values,
+            'volume': dataframe['volume'].values.astype(np.float64),
+        }
+        overlap = self.continues(dates, sources)
+
+        seed = overlap is None
+        if seed:
+            overlap = 0
+            self.states = {columns: factory() for columns, (source, factory) in self.specs.items()}
+            self.columns = {column: np.empty(0) for columns in self.specs for column in columns if column}
+            kept = 0
+        else:
+            kept = len(self.dates) - overlap
+
+        columns = {}
+        for names, (source, factory) in self.specs.items():
+            state = self.states[names]
+            if seed:
+                rows = np.column_stack(state.seed(sources[source]))
+            else:
+                rows = np.array([state.push(x) for x in sources[source][overlap:]], dtype=np.float64).reshape(-1, len(names))
+            for j, column in enumerate(names):
+                if column:
+                    columns[column] = np.concatenate([self.columns[column][kept:], rows[:, j]])
+
+        self.dates = np.array(dates)
+        self.sources = sources
+        self.columns = columns
+        return self.columns
+
+    def continues(self, dates, sources):
+        """
+        Number of leading rows shared with the previous frame, or None if a full recompute is needed
+        """
+        if self.dates is None or len(dates) == 0:
+            return None
+
+        last = np.searchsorted(dates, self.dates[-1])
+        if last >= len(dates) or dates[last] != self.dates[-1] or last + 1 > len(self.dates):
+            return None
+
+        overlap = last + 1
+        if not np.array_equal(dates[:overlap], self.dates[-overlap:]):
+            return None
+        for name, values in sources.items():
+            if not np.array_equal(values[:overlap], self.sources[name][-overlap:], equal_nan=True):
+                return None
+            if np.isnan(values[overlap:]).any():
+                return None
+        if np.any(np.diff(dates[last:]) != self.step):
+            return None
+
+        return overlap
+
+class InformativeProjection:
+    """
+    As-of projection of an informative timeframe onto the candles of the strategy timeframe.
+    Every candle gets the last informative candle that has closed by then, the rows merge_informative_pair
+    picks, found with searchsorted on the timestamps and gathered as array takes. The row mapping is
+    kept and only extended for the new candles while the informative candles stay the same.
+    """
+
+    def __init__(self, timeframe_minutes, timeframe_inf_minutes):
+        self.offset = np.timedelta64(timeframe_inf_minutes - timeframe_minutes, 'm')
+        self.dates = None
+        self.inf_dates = None
+        self.rows = None
+
+    def mapping(self, dates, inf_dates):
+        """
+        Row of the informative frame for every candle, -1 before the first informative candle.
+        The candles are expected without gaps, as the dataprovider serves them.
+        """
+        overlap = 0
+        if self.rows is not None and len(self.dates) and len(dates) and np.array_equal(inf_dates, self.inf_dates):
+            last = np.searchsorted(dates, self.dates[-1])
+            if last < len(dates) and dates[last] == self.dates[-1] and last < len(self.dates) and dates[0] == self.dates[-(last + 1)]:
+                overlap = last + 1
+
+        merge_dates = inf_dates + self.offset
+        fresh = np.searchsorted(merge_dates, dates[overlap:], side='right') - 1
+        rows = np.concatenate([self.rows[len(self.rows) - overlap:], fresh]) if overlap else fresh
+
+        # merge_informative_pair only matches informative candles that line up with a candle of the
+        # frame, the ones from before its first candle are not carried over
+        if len(dates):
+            head = np.searchsorted(rows, np.searchsorted(merge_dates, dates[0]))
+            rows[:head] = -1
+
+        self.dates = np.array(dates)
+        self.inf_dates = np.array(inf_dates)
+        self.rows = rows
+        return rows
+
+    def project(self, dataframe, informative, columns):
+        """
+        Add the informative columns to the dataframe, forward filled like merge_informative_pair(ffill=True)
+
+        :param dataframe: DataFrame of the strategy timeframe
+        :param informative: DataFrame of the informative timeframe
+        :param columns: dict Informative column -> name in the dataframe
+        """
+        rows = self.mapping(dataframe['date'].values, informative['date'].values)
+        source = informative[list(columns)].reset_index(drop=True)
+        # candles before the first informative candle get NaN, like the left merge
+        projected = source.reindex(rows) if len(rows) and rows[0] < 0 else source.take(rows)
+        projected = projected.ffill().set_axis(dataframe.index)
+        for column, name in columns.items():
+            dataframe[name] = projected[column]
+        return dataframe
+
+def talib_rows(function, values, **kwargs):
+    """
+    A TA-Lib function over every row of a (pairs x candles) array, each row is one contiguous C pass
+    """
+    out = np.empty_like(values)
+    for row, series in zip(out, values):
+        row[:] = function(series, **kwargs)
+    return out
+
+def EWO_batch(values, fast, slow):
+    """
+    Elliot Wave Oscillator of the EWO function over a (pairs x candles) array of closes
+    """
+    return (talib_rows(talib.EMA, values, timeperiod=fast) - talib_rows(talib.EMA, values, timeperiod=slow)) / values * 100
+
+def rolling_batch(values, window, min_periods=None):
+    """
+    Pandas rolling window over a (pairs x candles) array, all pairs in one column-wise call
+    """
+    return DataFrame(values.T).rolling(window, min_periods=min_periods)
+
+def bollinger_batch(values, window, stds):
+    """
+    qtpylib compatible Bollinger bands (lower, mid, upper) over a (pairs x candles) array
+    """
+    rolling = rolling_batch(values, window, min_periods=1)
+    mid = rolling.mean().values.T
+    std = rolling.std().values.T
+    return (mid - std * stds, mid, mid + std * stds)
+
+class IndicatorBatch:
+    """
+    Indicators of many pairs computed together. The frames with the same number of candles are stacked
+    into one (pairs x candles) array per source. The rolling indicators run column-wise over all pairs in
+    one pandas call, the recursive ones (EMA, RSI) as raw TA-Lib passes over the contiguous rows, which is
+    faster than any numpy closed form and gives the same values as the per pair computation. Either way
+    the abstract API and dataframe round trips of every pair and indicator are gone. Each pair gets views
+    into the result arrays. Frames with NaN sources are left to the per pair computation.
+    """
+
+    def __init__(self, specs, cells=1 << 20):
+        self.specs = specs
+        self.cells = cells
+
+    def sources(self, dataframe):
+        """
+        The source columns the specs read, as float64 arrays
+        """
+        used = {source for source, kernel in self.specs.values()}
+        sources = {}
+        if 'close' in used:
+            sources['close'] = dataframe['close'].values.astype(np.float64)
+        if 'typical' in used:
+            sources['typical'] = ((dataframe['high'] + dataframe['low'] + dataframe['close']) / 3.).values
+        if 'volume' in used:
+            sources['volume'] = dataframe['volume'].values.astype(np.float64)
+        return sources
+
+    def compute(self, frames):
+        """
+        Return {pair: {column: ndarray}} of the batched indicators
+
+        :param frames: dict Pair -> OHLCV dataframe
+        """
+        if not self.specs:
+            return {}
+
+        groups = {}
+        for pair, dataframe in frames.items():
+            sources = self.sources(dataframe)
+            if not any(np.isnan(values).any() for values in sources.values()):
+                groups.setdefault(len(dataframe), []).append((pair, sources))
+
+        # Long frames are split over several stacks, so the arrays stay small enough to be cheap to allocate
+        batches = []
+        for length, members in groups.items():
+            size = max(1, self.cells // max(length, 1))
+            batches.extend(members[i:i + size] for i in range(0, len(members), size))
+
+        results = {}
+        for members in batches:
+            # One (pairs x candles) array per source, a pair is a row
+            stacks = {source: np.stack([sources[source] for pair, sources in members]) for source in members[0][1]}
+            outputs = {}
+            for names, (source, kernel) in self.specs.items():
+                for column, values in zip(names, kernel(stacks[source])):
+                    if column:
+                        outputs[column] = values
+            for j, (pair, sources) in enumerate(members):
+                results[pair] = {column: values[j] for column, values in outputs.items()}
+        return results
+
+class AllIndicators:
+    """
+    Every indicator but the ones already computed some other way, what hyperopt requires
+    since any condition may be enabled after the indicators are populated
+    """
+
+    def __init__(self, computed=()):
+        self.computed = frozenset(computed)
+
+    def __contains__(self, column):
+        return not column in self.computed
+
+    def __sub__(self, computed):
+        return AllIndicators(self.computed | set(computed))
+
+    def isdisjoint(self, columns):
+        return all(column in self.computed for column in columns)
+
+def take_signals(dataframe, signals, column):
+    """
+    Copy a precomputed signal column onto the candles of the dataframe, False if some candle has no signal
+    """
+    dates = signals['date'].values
+    candles = dataframe['date'].values
+    rows = np.minimum(np.searchsorted(dates, candles), max(len(dates) - 1, 0))
+    if len(candles) and (not len(dates) or not np.array_equal(dates[rows], candles)):
+        return False
+    dataframe[column] = signals[column].values[rows]
+    return True
+
+class ParallelPopulation:
+    """
+    Populates the pairs of a backtest / hyperopt in forked worker processes, one pair at a time from a
+    shared task queue. The workers are forked once the candles are loaded, so every pair's OHLCV is shared
+    with them copy-on-write instead of being pickled over, only the pair names go out. The populated
+    numeric columns come back in one shared memory block per pair, the result queue carries their layout
+    and the other columns (strings, tz-aware dates), which are still pickled.
+    """
+
+    def __init__(self, workers, signals=False):
+        self.workers = workers
+        self.signals = signals
+
+    @staticmethod
+    def available():
+        return shared_memory is not None and 'fork' in multiprocessing.get_all_start_methods()
+
+    def run(self, strategy, data):
+        """
+        Return ({pair: populated dataframe}, {pair: date / buy / sell dataframe}), the signals only if requested
+
+        :param strategy: IStrategy The strategy, the workers inherit it as it is
+        :param data: dict Pair -> OHLCV dataframe
+        """
+        context = multiprocessing.get_context('fork')
+        # Started before forking so all processes share it, a block must outlive the worker that made it
+        resource_tracker.ensure_running()
+        tasks = context.Queue()
+        results = context.Queue()
+        for pair in data:
+            tasks.put(pair)
+        for _ in range(self.workers):
+            tasks.put(None)
+
+        processes = [context.Process(target=self.work, args=(strategy, data, tasks, results), daemon=True) for _ in range(self.workers)]
+        for process in processes:
+            process.start()
+
+        populated = {}
+        signals = {}
+        try:
+            while len(populated) < len(data):
+                try:
+                    pair, stored, error = results.get(timeout=1)
+                except queue.Empty:
+                    if any(process.exitcode not in (None, 0) for process in processes):
+                        raise RuntimeError("A population worker died")
+                    continue
+                if error:
+                    raise RuntimeError(f"Populating {pair} failed in a worker:\n{error}")
+
+                columns = self.load(stored)
+                if self.signals:
+                    signals[pair] = DataFrame({'date': data[pair]['date'], 'buy': columns.pop('buy'), 'sell': columns.pop('sell')})
+                populated[pair] = concat([data[pair], DataFrame(columns, index=data[pair].index)], axis=1)
+        finally:
+            if len(populated) < len(data):
+                for process in processes:
+                    process.terminate()
+                # release the blocks of the pairs that were done but not read
+                while True:
+                    try:
+                        pair, stored, error = results.get(timeout=0.1)
+                    except queue.Empty:
+                        break
+                    if stored:
+                        self.load(stored)
+            for process in processes:
+                process.join()
+
+        return populated, signals
+
+    def work(self, strategy, data, tasks, results):
+        for pair in iter(tasks.get, None):
+            try:
+                metadata = {'pair': pair}
+                dataframe = strategy.advise_indicators(data[pair].copy(), metadata)
+                if self.signals:
+                    # as backtesting does before asking for the signals
+                    dataframe['buy'] = 0
+                    dataframe['sell'] = 0
+                    dataframe = strategy.advise_sell(strategy.advise_buy(dataframe, metadata), metadata)
+                results.put((pair, self.store(dataframe, data[pair].columns), None))
+            except Exception:
+                results.put((pair, None, traceback.format_exc()))
+
+    @staticmethod
+    def store(dataframe, skip):
+        """
+        Copy the columns added to the frame into a new shared memory block. Returns (block name, rows, layout),
+        the layout is (column, dtype, offset, None) per column in the block, or (column, None, None, values)
+        for the ones without a flat numpy layout (strings, tz-aware dates), which go through the queue.
+        """
+        layout = []
+        size = 0
+        for column in dataframe.columns:
+            if column in skip:
+                continue
+            dtype = dataframe[column].dtype
+            if isinstance(dtype, np.dtype) and dtype.kind in 'biufM':
+                layout.append((column, dtype.str, size, None))
+                size += dtype.itemsize * len(dataframe)
+            else:
+                layout.append((column, None, None, dataframe[column].array))
+
+        block = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        for column, dtype, offset, values in layout:
+            if dtype:
+                np.ndarray(len(dataframe), dtype, buffer=block.buf, offset=offset)[:] = dataframe[column].values
+        name = block.name
+        block.close()
+        return name, len(dataframe), layout
+
+    @staticmethod
+    def load(stored):
+        """
+        {column: values} of a block made by store, the block is released once copied out
+        """
+        name, rows, layout = stored
+        block = shared_memory.SharedMemory(name=name)
+        try:
+            columns = {}
+            for column, dtype, offset, values in layout:
+                columns[column] = values if dtype is None else np.ndarray(rows, dtype, buffer=block.buf, offset=offset).copy()
+        finally:
+            block.close()
+            block.unlink()
+        return columns
+
+def indicator_source(cls, ignore):
+    """
+    Digest of the code the populated frames of the strategy class depend on, plus the parameters that code
+    reads: (digest, names read as self.<name>.value, regexes of the names read as getattr(self, f"...")).
+    The module is compared as an AST dump, so formatting and comments do not count. The class members in
+    ignore and the parameter declarations are left out, the parameter values are keyed on their own.
+    """
+    with open(cls.populate_indicators.__code__.co_filename) as f:
+        tree = ast.parse(f.read())
+
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and node.name == cls.__name__:
+            node.body = [item for item in node.body if not ignored_member(item, ignore)]
+
+    names = set()
+    patterns = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Attribute) and node.attr == 'value' and isinstance(node.value, ast.Attribute) \
+                and isinstance(node.value.value, ast.Name) and node.value.value.id == 'self':
+            names.add(node.value.attr)
+        elif isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == 'getattr' \
+                and len(node.args) > 1 and isinstance(node.args[0], ast.Name) and node.args[0].id == 'self' \
+                and isinstance(node.args[1], ast.JoinedStr):
+            patterns.append(''.join(re.escape(part.value) if isinstance(part, ast.Constant) else '.+' for part in node.args[1].values))
+
+    return hashlib.sha256(ast.dump(tree).encode()).hexdigest(), names, patterns
+
+def ignored_member(item, ignore):
+    """
+    True for the methods / class attributes named in ignore and for the hyperopt parameter declarations
+    """
+    if isinstance(item, (ast.FunctionDef, ast.ClassDef)):
+        return item.name in ignore
+    if isinstance(item, (ast.Assign, ast.AnnAssign)):
+        if isinstance(item.value, ast.Call) and getattr(item.value.func, 'id', '').endswith('Parameter'):
+            return True
+        targets = item.targets if isinstance(item, ast.Assign) else [item.target]
+        return all(isinstance(target, ast.Name) and target.id in ignore for target in targets)
+    return False
+
+def frame_digest(dataframe):
+    """
+    Digest of the candles of a frame
+    """
+    digest = hashlib.sha1(dataframe['date'].values.astype(np.int64).tobytes())
+    for column in ('open', 'high', 'low', 'close', 'volume'):
+        digest.update(np.ascontiguousarray(dataframe[column].values, dtype=np.float64))
+    return digest.hexdigest()
+
+class SellRules:
+    """
+    The custom_sell rules of one parameter set, checked in order, the first match is the sell reason.
+    Within a family of profit bands only one band can hold the profit, it is found with a bisect over
+    the thresholds. Candle values that several rules compare are computed once per call. The rule tests
+    take the values of one candle or arrays of many alike, reasons evaluates a run of candles at once.
+    """
+
+    def __init__(self, families, rules, pumps):
+        """
+        :param families: list (flag, thresholds, rsi limits, reasons) per band family. Band n lies above
+            thresholds[n] and below thresholds[n + 1], the last band has no upper bound. flag is the shared
+            value the whole family requires, or None
+        :param rules: list (reason, low, high, test) of the other rules, the profit must lie above low and
+            below high
+        :param pumps: dict (length, level) -> sell pump threshold
+        """
+        self.families = []
+        for flag, thresholds, limits, reasons in families:
+            bounds = list(thresholds) + [np.inf]
+            # bands that touch or overlap (possible in hyperopt) are checked one by one, highest first
+            ordered = all(low < high for low, high in zip(bounds, bounds[1:]))
+            self.families.append((flag, bounds, ordered, limits, reasons))
+        # the families as arrays for reasons, the limit past the last band never matches
+        self.family_arrays = [(np.array(bounds), np.array(list(limits) + [np.nan]), np.array(reasons, dtype=object))
+                              for flag, bounds, ordered, limits, reasons in self.families]
+        self.rules = rules
+        self.pumps = pumps
+
+    def shared(self, candle: dict) -> dict:
+        """
+        :param candle: dict The analyzed candle, or column arrays of several
+        :return: dict The values several rules compare
+        """
+        shared = {
+            'under': candle['close'] < candle['ema_200'],
+            'ema_200_rel': (candle['ema_200'] - candle['close']) / candle['close'],
+        }
+        for (length, level), threshold in self.pumps.items():
+            shared[(length, level)] = candle[f"pump_ratio_{length}_1h"] > threshold
+        return shared
+
+    def match(self, candle: dict, current_profit: float, max_profit: float):
+        """
+        :param candle: dict The analyzed candle
+        :param current_profit: float Current profit ratio of the trade
+        :param max_profit: float Highest profit ratio of the trade
+        :return: str The sell reason of the first matching rule, None if no rule matches
+        """
+        shared = self.shared(candle)
+        rsi = candle['rsi']
+
+        for flag, bounds, ordered, limits, reasons in self.families:
+            if flag is not None and not shared[flag]:
+                continue
+            if ordered:
+                band = bisect.bisect_left(bounds, current_profit) - 1
+                if band >= 0 and current_profit < bounds[band + 1] and rsi < limits[band]:
+                    return reasons[band]
+            else:
+                for band in reversed(range(len(limits))):
+                    if (bounds[band + 1] > current_profit > bounds[band]) and (rsi < limits[band]):
+                        return reasons[band]
+
+        for reason, low, high, test in self.rules:
+            if (low < current_profit < high) and test(candle, shared, current_profit, max_profit):
+                return reason
+
+        return None
+
+    def reasons(self, candles: dict, profits: np.ndarray, max_profits: np.ndarray) -> np.ndarray:
+        """
+        match for a run of candles, every rule is evaluated as a mask over all of them. Bands and rules
+        whose profit range the run never reaches are skipped.
+        :param candles: dict Column arrays of the analyzed candles
+        :param profits: np.ndarray Profit ratio of the trade at every candle
+        :param max_profits: np.ndarray Highest profit ratio of the trade at every candle
+        :return: np.ndarray The sell reason of every candle, None where no rule matches
+        """
+        shared = self.shared(candles)
+        rsi = candles['rsi']
+        reasons = np.full(len(profits), None, dtype=object)
+        free = np.ones(len(profits), dtype=bool)
+        lowest, highest = float(profits.min()), float(profits.max())
+
+        for (flag, bounds, ordered, limits, names), (bound_values, limit_values, name_values) in zip(self.families, self.family_arrays):
+            if ordered:
+                if highest <= bounds[0]:
+                    continue
+                # the band of every candle, -1 below the first threshold
+                band = np.searchsorted(bound_values, profits) - 1
+                hit = free & (profits < bound_values[band + 1]) & (rsi < limit_values[band])
+                if flag is not None:
+                    hit &= shared[flag]
+                reasons[hit] = name_values[band[hit]]
+                free &= ~hit
+                continue
+            for band in reversed(range(len(limits))):
+                if not (bounds[band] < highest and lowest < bounds[band + 1]):
+                    continue
+                hit = free & (bounds[band] < profits) & (profits < bounds[band + 1]) & (rsi < limits[band])
+                if flag is not None:
+                    hit &= shared[flag]
+                reasons[hit] = names[band]
+                free &= ~hit
+
+        for reason, low, high, test in self.rules:
+            if not (low < highest and lowest < high):
+                continue
+            hit = free & (low < profits) & (profits < high) & test(candles, shared, profits, max_profits)
+            reasons[hit] = reason
+            free &= ~hit
+
+        return reasons
+
+class SellCandles:
+    """
+    The analyzed candles of one pair as arrays, for the custom_sell reasons of backtesting. The row of a
+    candle follows from its date and the fixed candle step, frames with gaps in the dates fall back to a
+    binary search.
+    """
+
+    def __init__(self, dataframe: DataFrame, columns, timeframe_minutes: int):
+        minutes = dataframe['date'].values.astype('datetime64[m]').astype(np.int64)
+        self.step = timeframe_minutes
+        self.rows = len(minutes)
+        self.start = int(minutes[0]) if self.rows else 0
+        # only kept when the candles are not evenly spaced
+        self.minutes = None if (np.diff(minutes) == self.step).all() else minutes
+        self.open = dataframe['open'].to_numpy(dtype=np.float64)
+        self.high = dataframe['high'].to_numpy(dtype=np.float64)
+        self.columns = {}
+        for column in columns:
+            values = dataframe[column].to_numpy()
+            # flags the informative merge left as object
+            self.columns[column] = (values == True) if values.dtype == object else values
+
+    def row(self, time: datetime):
+        """
+        :param time: datetime Date of the candle
+        :return: int Row of the candle, None if there is no candle at that date
+        """
+        minute = int(time.timestamp()) // 60
+        if self.minutes is None:
+            row, offset = divmod(minute - self.start, self.step)
+            return row if not offset and 0 <= row < self.rows else None
+        row = int(np.searchsorted(self.minutes, minute))
+        return row if row < self.rows and self.minutes[row] == minute else None
+
+    def sell_reasons(self, rules: SellRules, trade: 'Trade', row: int, length: int) -> dict:
+        """
+        The profits and sell reasons of a trade from a candle on, as the backtest hands them to custom_sell:
+        the profit at the open of the candle, the highest rate up to its high, and the candle before it.
+        :param rules: SellRules The current rules
+        :param trade: Trade Open trade, max_rate includes the high of the first candle
+        :param row: int Row of the first candle, at least 1
+        :param length: int Number of candles
+        :return: dict 'start', 'profits', 'max_profits' and 'reasons' of the candles
+        """
+        end = min(row + length, self.rows)
+        # Trade.calc_profit_ratio in floats, custom_sell checks that the profit of its candle is the same
+        sell_values = trade.amount * self.open[row:end]
+        profits = np.round((sell_values - sell_values * trade.fee_close) / trade.open_trade_value - 1, 8)
+        max_rates = np.maximum.accumulate(np.maximum(self.high[row:end], trade.max_rate))
+        max_profits = (max_rates - trade.open_rate) / trade.open_rate
+        candles = {column: values[row - 1:end - 1] for column, values in self.columns.items()}
+        return {
+            'start': row,
+            'profits': profits,
+            'max_profits': max_profits,
+            'reasons': rules.reasons(candles, profits, max_profits),
+        }
+
+class IndicatorStore:
+    """
+    Populated frames on disk. An entry is a directory of .npy columns per pair and timeframe, under a key
+    covering the indicator code, the parameter values it reads and the library versions. Indicators only
+    look back, so an entry also serves any shorter range starting at the same candle, its OHLCV is checked
+    against the candles asked for. A longer range or changed informative candles are populated again in
+    full, the EMAs of the new candles depend on every candle before them. Columns are memory-mapped so
+    only the rows asked for are read, the frame gets its own copy of them; object columns are pickled.
+    Only the `keep` most recently used keys stay on disk.
+    """
+
+    ohlcv = ('date', 'open', 'high', 'low', 'close', 'volume')
+
+    def __init__(self, root, key, keep=3):
+        self.root = Path(root)
+        self.path = self.root / key
+        self.keep = keep
+
+    def entry(self, pair, timeframe):
+        return self.path / f"{pair.replace('/', '_')}-{timeframe}"
+
+    def load(self, pair, timeframe, candles, extra=None):
+        """
+        The stored frame for the candles, None if no entry covers them
+
+        :param pair: str Pair
+        :param timeframe: str Timeframe of the candles
+        :param candles: DataFrame OHLCV of the pair
+        :param extra: str Digest of the other inputs (informative candles), has to match the stored one
+        """
+        entry = self.entry(pair, timeframe)
+        try:
+            with open(entry / 'meta.json') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        rows = len(candles)
+        if meta['rows'] < rows or meta['extra'] != extra:
+            return None
+
+        columns = {}
+        for i, (column, kind, dtype) in enumerate(meta['columns']):
+            columns[column] = np.load(entry / f"{i}.npy", mmap_mode=None if kind == 'O' else 'r', allow_pickle=kind == 'O')[:rows]
+            if column in self.ohlcv and not np.array_equal(columns[column], candles[column].values):
+                return None
+            if dtype:
+                columns[column] = pd.array(columns[column], dtype=dtype)
+
+        os.utime(self.path)
+        return DataFrame(columns, index=candles.index)
+
+    def save(self, pair, timeframe, dataframe, extra=None):
+        """
+        Store a populated frame, False if its column names are not unique.
+        Columns of pandas' own dtypes keep the name of the dtype, tz-aware dates are stored as UTC
+        datetime64, the others as pickled object arrays.
+        """
+        if not dataframe.columns.is_unique:
+            return False
+
+        layout = []
+        arrays = []
+        for column in dataframe.columns:
+            series = dataframe[column]
+            if isinstance(series.dtype, np.dtype):
+                layout.append((column, series.dtype.kind, None))
+                arrays.append(series.values)
+            elif isinstance(series.dtype, pd.DatetimeTZDtype):
+                layout.append((column, 'M', str(series.dtype)))
+                arrays.append(series.dt.tz_convert('UTC').dt.tz_localize(None).values)
+            else:
+                layout.append((column, 'O', str(series.dtype)))
+                arrays.append(np.asarray(series.array, dtype=object))
+
+        entry = self.entry(pair, timeframe)
+        staging = entry.with_name(f"{entry.name}.{os.getpid()}.tmp")
+        staging.mkdir(parents=True, exist_ok=True)
+        for i, ((column, kind, dtype), values) in enumerate(zip(layout, arrays)):
+            np.save(staging / f"{i}.npy", values, allow_pickle=kind == 'O')
+        with open(staging / 'meta.json', 'w') as f:
+            json.dump({'rows': len(dataframe), 'extra': extra, 'columns': layout}, f)
+
+        shutil.rmtree(entry, ignore_errors=True)
+        os.replace(staging, entry)
+        return True
+
+    def prune(self):
+        """
+        Remove all but the `keep` most recently used keys
+        """
+        keys = sorted((path for path in self.root.iterdir() if path.is_dir()), key=lambda path: path.stat().st_mtime, reverse=True)
+        for path in keys[self.keep:]:
+            if path != self.path:
+                shutil.rmtree(path, ignore_errors=True)
+
+
+def compact_frame(dataframe: DataFrame, keep=('date', 'open', 'high', 'low', 'close', 'volume')) -> DataFrame:
+    """
+    Copy of a populated frame in smaller dtypes: float64 indicators become float32 (unless out of its range),
+    columns of only True / False / NaN become bool with NaN as False (which is what the signal masks make of it),
+    integers take the smallest type that holds them and ssl-dir is int8, 1 up / 0 down / -1 missing.
+    The candles keep their dtypes.
+    :param dataframe: DataFrame The populated frame
+    :param keep: tuple Columns to copy as they are
+    :return: DataFrame
+    """
+    columns = {}
+    for column in dataframe.columns:
+        series = dataframe[column]
+        if column in keep:
+            pass
+        elif column == 'ssl-dir':
+            values = series.to_numpy(dtype=object)
+            series = Series(np.select([values == 'up', values == 'down'], [1, 0], -1).astype(np.int8), index=series.index)
+        elif series.dtype == np.float64:
+            values = series.to_numpy()
+            finite = np.abs(values[np.isfinite(values)])
+            if not len(finite) or finite.max() <= np.finfo(np.float32).max:
+                series = series.astype(np.float32)
+        elif series.dtype.kind in 'iu':
+            series = pd.to_numeric(series, downcast='unsigned' if series.dtype.kind == 'u' else 'integer')
+        elif series.dtype == object:
+            values = series.to_numpy()
+            values = values[~pd.isna(values)]
+            if len(values) and isinstance(values[0], (bool, np.bool_)) and ((values == True) | (values == False)).all():
+                series = series.fillna(False).astype(bool)
+        columns[column] = series
+    return DataFrame(columns, index=dataframe.index)
+
+
+def signal_values(dataframe: DataFrame, column: str) -> np.ndarray:
+    """
+    Signal column as float array, missing signals as 0.
+    :param dataframe: DataFrame Frame after populate_buy_trend / populate_sell_trend
+    :param column: str 'buy' or 'sell'
+    :return: np.ndarray
+    """
+    if column not in dataframe:
+        return np.zeros(len(dataframe))
+    return dataframe[column].fillna(0).to_numpy(dtype=float)
+
+
+def warmup_candles(chain, tolerance: float) -> int:
+    """
+    Candles of history a chain of indicators needs before its first value that is exact, or for the
+    recursive steps within tolerance of the error of their seed. The steps add up, which bounds the
+    warm-up of the chain from above. Kinds of steps:
+    'window' - rolling statistics, SMA and BB over window candles: window - 1
+    'shift' - shift / diff / ROC over window candles: window
+    'ema' - TA-Lib EMA, seeded with the SMA of window candles: window - 1 plus the seed decay of 2 / (window + 1)
+    't3' - TA-Lib T3, six EMAs of window on top of each other: 6 * (window - 1) plus the decay of the cascade
+    'kama' - TA-Lib KAMA, seeded with the candle before: window plus the seed decay at the smoothing of half the
+        efficiency ratio of a random walk, 1 / sqrt(window). Trends decay faster, choppy candles slower
+    'ewm' - pandas ewm or IIR filter of span window, seeded with the first value: the seed decay of 2 / (window + 1)
+    'wilder' - TA-Lib RSI / ATR, seeded with window candles: window plus the seed decay of 1 / window
+    :param chain: tuple (kind, window) steps, the first one on the candles
+    :param tolerance: float Share of the seed error left at the first analyzed candle
+    :return: int
+    """
+    candles = 0
+    for kind, window in chain:
+        if kind == 'window':
+            candles += window - 1
+        elif kind == 'shift':
+            candles += window
+        elif kind == 'ema':
+            candles += window - 1 + seed_decay(2 / (window + 1), tolerance)
+        elif kind == 't3':
+            candles += 6 * (window - 1) + cascade_decay(2 / (window + 1), 6, window - 1, tolerance)
+        elif kind == 'kama':
+            efficiency = 0.5 / np.sqrt(window)
+            candles += window + seed_decay((efficiency * (2 / 3 - 2 / 31) + 2 / 31) ** 2, tolerance)
+        elif kind == 'ewm':
+            candles += seed_decay(2 / (window + 1), tolerance)
+        elif kind == 'wilder':
+            candles += window + seed_decay(1 / window, tolerance)
+        else:
+            raise ValueError(f"Unknown warm-up step {kind}")
+    return candles
+
+
+def seed_decay(alpha: float, tolerance: float) -> int:
+    """
+    Candles a filter with weight alpha for the new value takes to leave tolerance of its seed error
+    :param alpha: float Weight of the new value
+    :param tolerance: float Share of the seed error left
+    :return: int
+    """
+    return int(np.ceil(np.log(tolerance) / np.log(1 - alpha)))
+
+
+def cascade_decay(alpha: float, stages: int, lag: int, tolerance: float) -> int:
+    """
+    Candles a cascade of filters with weight alpha for the new value, each seeded lag candles after the one
+    below it, takes from the seed of the last one to leave tolerance of the seed errors of all of them.
+    A seed error with d stages above it is left at the output as the chance that at most d of the candles
+    since its seed took the new value (a binomial tail), the shares of all stages add up.
+    :param alpha: float Weight of the new value
+    :param stages: int Number of filters
+    :param lag: int Candles between the seeds of two stages
+    :param tolerance: float Share of the seed error left
+    :return: int
+    """
+    def left(candles):
+        share = 0.0
+        for above in range(stages):
+            trials = candles + above * lag
+            term = (1 - alpha) ** trials
+            for taken in range(above + 1):
+                share += term
+                term *= (trials - taken) / (taken + 1) * alpha / (1 - alpha)
+        return share
+
+    candles = 0
+    while left(candles) > tolerance:
+        candles += 1
+    return candles
+
+
+def exchange_candle_limit(name: str, timeframe: str) -> int:
+    """
+    Candles the exchange serves in one request, freqtrade's Exchange.ohlcv_candle_limit without connecting
+    to the exchange. Exchanges freqtrade has no class for get its defaults.
+    :param name: str Exchange name of the config
+    :param timeframe: str Timeframe of the candles
+    :return: int
+    """
+    name = MAP_EXCHANGE_CHILDCLASS.get(name, name).title()
+    exchange = next((cls for cls in Exchange.__subclasses__() if cls.__name__ == name), Exchange)
+    has = {**Exchange._ft_has_default, **exchange._ft_has}
+    return int(has.get('ohlcv_candle_limit_per_timeframe', {}).get(timeframe, has['ohlcv_candle_limit']))
@@ -1,7 +1,10 @@
+import bisect
+import logging
 import freqtrade.vendor.qtpylib.indicators as qtpylib
 import numpy as np
 import talib.abstract as ta
 from freqtrade.strategy.interface import IStrategy
+from freqtrade.exchange import MAP_EXCHANGE_CHILDCLASS, Exchange, timeframe_to_minutes
 from freqtrade.strategy import (merge_informative_pair,
                                 DecimalParameter, IntParameter, CategoricalParameter)
 from pandas import DataFrame
@@ -45,6 +48,9 @@ from datetime import datetime
 # I hope you do enough testing before proceeding.
 # Thank you to those who created these strategies.
 
+logger = logging.getLogger(__name__)
+
+
 class NostalgiaForInfinityV5MultiOffsetAndHO2(IStrategy):
     INTERFACE_VERSION = 2
 
@@ -204,9 +210,31 @@ class NostalgiaForInfinityV5MultiOffsetAndHO2(IStrategy):
     timeframe = '5m'
     inf_1h = '1h'
 
+    # Per pair informative row mapping, only kept in live / dry-run
+    informative_projections = {}
+
     # Run "populate_indicators()" only for new candle.
     process_only_new_candles = True
 
+    # The last analyzed candle of every pair for custom_sell
+    candle_snapshots = {}
+
+    # The custom_sell rules compiled from the current parameters, see compile_sell_rules
+    sell_rules = None
+
+    # Backtesting and hyperopt: the analyzed candles of every pair and the sell reasons of its open trade,
+    # evaluated for a window of candles at once that doubles while the trade stays open, up to backtest_sell_window
+    sell_candles = {}
+    sell_windows = {}
+    backtest_sell_window = 1024
+
+    # custom_sell calls of backtesting and hyperopt whose candle or profits were not the precomputed ones,
+    # they are evaluated on their own. The first one is logged.
+    sell_window_fallbacks = 0
+
+    # The columns the custom_sell rules read
+    sell_rule_columns = ('rsi', 'rsi_1h', 'close', 'ema_200', 'ema_100', 'sma_200_dec')
+
     # These values can be overridden in the "ask_strategy" section in the config.
     use_sell_signal = True
     sell_profit_only = False
@@ -215,6 +243,41 @@ class NostalgiaForInfinityV5MultiOffsetAndHO2(IStrategy):
     # Number of candles the strategy requires before producing valid signals
     startup_candle_count: int = 300
 
+    # Warm-up of the indicators per timeframe, chains of (kind, window) steps applied on top of each other
+    # (see warmup_candles). Shifts of 1h columns in the 5m frame are counted in 1h candles.
+    startup_windows = {
+        '5m': (
+            (('ema', 200),),                                        # ema_200, ewo
+            (('window', 200), ('shift', 50)),                       # sma_200_dec, rising sma_200
+            (('window', 144),),                                     # dip protections
+            (('wilder', 14),),                                      # rsi
+            (('window', 40), ('shift', 1)),                         # bb 40, bbdelta / closedelta
+            (('window', 20), ('shift', 5)),                         # bb 20 of the previous candles
+            (('shift', 1), ('window', 14)),                         # mfi, chop
+            (('window', 30), ('shift', 1)),                         # volume_mean_30
+            (('t3', 80),),                                          # t3 offset, at the top of base_nb_candles
+            (('kama', 80),),                                        # kama offset, at the top of base_nb_candles
+        ),
+        '1h': (
+            (('ema', 200),),                                        # ema_200
+            (('window', 200), ('shift', 6)),                        # sma_200_1h.shift(72)
+            (('wilder', 14),),                                      # rsi
+            (('window', 20),),                                      # bb
+            (('window', 48),),                                      # pump protections
+        ),
+    }
+
+    # Seed error a recursive indicator (EMA, RSI, ...) may still carry at the first analyzed candle
+    startup_tolerance = 0.01
+
+    # Use the derived warm-up of the timeframe as startup_candle_count instead of the value above
+    auto_startup_candle_count = True
+
+    # Most candles the derived warm-up asks for. Freqtrade loads them in one request and refuses more than the
+    # exchange serves, in backtesting and hyperopt too. None for the limit of the exchange of the config less
+    # the 5 candles freqtrade keeps in reserve, set a number here or "startup_candle_limit" in the config
+    startup_candle_limit = None
+
     # plot config
     plot_config = {
         'main_plot': {
@@ -465,57 +528,185 @@ class NostalgiaForInfinityV5MultiOffsetAndHO2(IStrategy):
 
     #############################################################
 
+    def __init__(self, config: dict) -> None:
+        super().__init__(config)
+        required = self.startup_candles()
+        if self.auto_startup_candle_count:
+            self.startup_candle_count = min(required[self.timeframe], self.startup_limit())
+        self.startup_report(required)
+
+    def startup_candles(self) -> dict:
+        """
+        Warm-up per timeframe, the longest chain of startup_windows
+        :return: dict Timeframe -> candles
+        """
+        return {timeframe: max(warmup_candles(chain, self.startup_tolerance) for chain in chains)
+                for timeframe, chains in self.startup_windows.items()}
+
+    def startup_limit(self) -> int:
+        """
+        Most candles startup_candle_count may be, see startup_candle_limit
+        :return: int
+        """
+        limit = self.config.get('startup_candle_limit', self.startup_candle_limit)
+        if limit is None:
+            limit = exchange_candle_limit(self.config.get('exchange', {}).get('name', ''), self.timeframe) - 5
+        return limit
+
+    def startup_report(self, required: dict):
+        """
+        Log how startup_candle_count compares to the warm-up of the indicators
+        :param required: dict Timeframe -> candles, from startup_candles
+        """
+        for timeframe, candles in required.items():
+            if timeframe != self.timeframe:
+                logger.info(f"The {timeframe} indicators need {candles} {timeframe} candles before the first analyzed candle")
+            elif candles > self.startup_candle_count:
+                capped = " (the startup candle limit)" if self.auto_startup_candle_count else ""
+                logger.warning(f"startup_candle_count is {self.startup_candle_count}{capped}, {candles - self.startup_candle_count} short "
+                               f"of the {candles} {timeframe} candles the indicators need to warm up")
+            elif candles < self.startup_candle_count:
+                logger.info(f"startup_candle_count is {self.startup_candle_count}, {self.startup_candle_count - candles} more "
+                            f"than the {candles} {timeframe} candles the indicators need to warm up")
+
     def get_ticker_indicator(self):
         return int(self.timeframe[:-1])
 
 
+    def candle_snapshot(self, pair: str) -> dict:
+        """
+        The last analyzed candle of a pair as a plain dict. It is built once per analyzed candle and
+        shared by the callbacks of its open trades, instead of a row Series per call.
+        :param pair: str Pair
+        :return: dict Column values of the last candle, None if the pair was not analyzed yet
+        """
+        dataframe, last_updated = self.dp.get_analyzed_dataframe(pair, self.timeframe)
+        if len(dataframe.index) == 0:
+            return None
+        # a new analysis in live, the next candle of the slice in backtesting
+        key = (last_updated, dataframe.index[-1])
+        snapshot = self.candle_snapshots.get(pair)
+        if snapshot is None or snapshot[0] != key:
+            snapshot = (key, dataframe.iloc[-1].to_dict())
+            self.candle_snapshots[pair] = snapshot
+        return snapshot[1]
+
     def custom_sell(self, pair: str, trade: 'Trade', current_time: 'datetime', current_rate: float,
                     current_profit: float, **kwargs):
-        dataframe, _ = self.dp.get_analyzed_dataframe(pair, self.timeframe)
-        last_candle = dataframe.iloc[-1].squeeze()
-
         max_profit = ((trade.max_rate - trade.open_rate) / trade.open_rate)
 
+        if self.sell_rules is None:
+            self.sell_rules = self.compile_sell_rules()
+
+        # In backtesting and hyperopt the reasons of the next candles of the trade are evaluated at once
+        if self.config['runmode'].value in ('backtest', 'hyperopt') and pair in self.sell_candles:
+            found, reason = self.backtest_sell_reason(pair, trade, current_time, current_profit, max_profit)
+            if found:
+                return reason
+
+        last_candle = self.candle_snapshot(pair)
+
         if (last_candle is not None):
-            if (current_profit > self.sell_custom_profit_4.value) & (last_candle['rsi'] < self.sell_custom_rsi_4.value):
-                return 'signal_profit_4'
-            elif (current_profit > self.sell_custom_profit_3.value) & (last_candle['rsi'] < self.sell_custom_rsi_3.value):
-                return 'signal_profit_3'
-            elif (current_profit > self.sell_custom_profit_2.value) & (last_candle['rsi'] < self.sell_custom_rsi_2.value):
-                return 'signal_profit_2'
-            elif (current_profit > self.sell_custom_profit_1.value) & (last_candle['rsi'] < self.sell_custom_rsi_1.value):
-                return 'signal_profit_1'
-            elif (current_profit > self.sell_custom_profit_0.value) & (last_candle['rsi'] < self.sell_custom_rsi_0.value):
-                return 'signal_profit_0'
-
-            elif (current_profit > self.sell_custom_under_profit_1.value) & (last_candle['rsi'] < self.sell_custom_under_rsi_1.value) & (last_candle['close'] < last_candle['ema_200']):
-                return 'signal_profit_u_1'
-            elif (current_profit > self.sell_custom_under_profit_2.value) & (last_candle['rsi'] < self.sell_custom_under_rsi_2.value) & (last_candle['close'] < last_candle['ema_200']):
-                return 'signal_profit_u_2'
-            elif (current_profit > self.sell_custom_under_profit_3.value) & (last_candle['rsi'] < self.sell_custom_under_rsi_3.value) & (last_candle['close'] < last_candle['ema_200']):
-                return 'signal_profit_u_3'
-
-            elif (current_profit > self.sell_custom_dec_profit_1.value) & (last_candle['sma_200_dec']):
-                return 'signal_profit_d_1'
-            elif (current_profit > self.sell_custom_dec_profit_2.value) & (last_candle['close'] < last_candle['ema_100']):
-                return 'signal_profit_d_2'
-
-            elif (current_profit > self.sell_trail_profit_min_1.value) & (current_profit < self.sell_trail_profit_max_1.value) & (max_profit > (current_profit + self.sell_trail_down_1.value)):
-                return 'signal_profit_t_1'
-            elif (current_profit > self.sell_trail_profit_min_2.value) & (current_profit < self.sell_trail_profit_max_2.value) & (max_profit > (current_profit + self.sell_trail_down_2.value)):
-                return 'signal_profit_t_2'
-
-            elif (last_candle['close'] < last_candle['ema_200']) & (current_profit > self.sell_trail_profit_min_3.value) & (current_profit < self.sell_trail_profit_max_3.value) & (max_profit > (current_profit + self.sell_trail_down_3.value)):
-                return 'signal_profit_u_t_1'
-
-            elif (current_profit > 0.0) & (last_candle['close'] < last_candle['ema_200']) & (((last_candle['ema_200'] - last_candle['close']) / last_candle['close']) < self.sell_custom_profit_under_rel_1.value) & (last_candle['rsi'] > last_candle['rsi_1h'] + self.sell_custom_profit_under_rsi_diff_1.value):
-                return 'signal_profit_u_e_1'
-
-            elif (current_profit < -0.0) & (last_candle['close'] < last_candle['ema_200']) & (((last_candle['ema_200'] - last_candle['close']) / last_candle['close']) < self.sell_custom_stoploss_under_rel_1.value) & (last_candle['rsi'] > last_candle['rsi_1h'] + self.sell_custom_stoploss_under_rsi_diff_1.value):
-                return 'signal_stoploss_u_1'
+            return self.sell_rules.match(last_candle, current_profit, max_profit)
 
         return None
 
+    def compile_sell_rules(self) -> 'SellRules':
+        """
+        The custom_sell rules with the current parameter values, in the order they are checked.
+        Rebuilt by populate_sell_trend, which is where hyperopt has set the parameters of an epoch.
+        """
+        p = {name: parameter.value for name, parameter in self.enumerate_parameters('sell')}
+
+        rules = [
+            ('signal_profit_4', p['sell_custom_profit_4'], np.inf,
+             lambda candle, shared, profit, max_profit: candle['rsi'] < p['sell_custom_rsi_4']),
+            ('signal_profit_3', p['sell_custom_profit_3'], np.inf,
+             lambda candle, shared, profit, max_profit: candle['rsi'] < p['sell_custom_rsi_3']),
+            ('signal_profit_2', p['sell_custom_profit_2'], np.inf,
+             lambda candle, shared, profit, max_profit: candle['rsi'] < p['sell_custom_rsi_2']),
+            ('signal_profit_1', p['sell_custom_profit_1'], np.inf,
+             lambda candle, shared, profit, max_profit: candle['rsi'] < p['sell_custom_rsi_1']),
+            ('signal_profit_0', p['sell_custom_profit_0'], np.inf,
+             lambda candle, shared, profit, max_profit: candle['rsi'] < p['sell_custom_rsi_0']),
+
+            ('signal_profit_u_1', p['sell_custom_under_profit_1'], np.inf,
+             lambda candle, shared, profit, max_profit: (candle['rsi'] < p['sell_custom_under_rsi_1']) & shared['under']),
+            ('signal_profit_u_2', p['sell_custom_under_profit_2'], np.inf,
+             lambda candle, shared, profit, max_profit: (candle['rsi'] < p['sell_custom_under_rsi_2']) & shared['under']),
+            ('signal_profit_u_3', p['sell_custom_under_profit_3'], np.inf,
+             lambda candle, shared, profit, max_profit: (candle['rsi'] < p['sell_custom_under_rsi_3']) & shared['under']),
+
+            ('signal_profit_d_1', p['sell_custom_dec_profit_1'], np.inf,
+             lambda candle, shared, profit, max_profit: candle['sma_200_dec']),
+            ('signal_profit_d_2', p['sell_custom_dec_profit_2'], np.inf,
+             lambda candle, shared, profit, max_profit: candle['close'] < candle['ema_100']),
+
+            ('signal_profit_t_1', p['sell_trail_profit_min_1'], p['sell_trail_profit_max_1'],
+             lambda candle, shared, profit, max_profit: max_profit > (profit + p['sell_trail_down_1'])),
+            ('signal_profit_t_2', p['sell_trail_profit_min_2'], p['sell_trail_profit_max_2'],
+             lambda candle, shared, profit, max_profit: max_profit > (profit + p['sell_trail_down_2'])),
+
+            ('signal_profit_u_t_1', p['sell_trail_profit_min_3'], p['sell_trail_profit_max_3'],
+             lambda candle, shared, profit, max_profit: shared['under'] & (max_profit > (profit + p['sell_trail_down_3']))),
+
+            ('signal_profit_u_e_1', 0.0, np.inf,
+             lambda candle, shared, profit, max_profit: shared['under'] & (shared['ema_200_rel'] < p['sell_custom_profit_under_rel_1'])
+             & (candle['rsi'] > candle['rsi_1h'] + p['sell_custom_profit_under_rsi_diff_1'])),
+
+            ('signal_stoploss_u_1', -np.inf, -0.0,
+             lambda candle, shared, profit, max_profit: shared['under'] & (shared['ema_200_rel'] < p['sell_custom_stoploss_under_rel_1'])
+             & (candle['rsi'] > candle['rsi_1h'] + p['sell_custom_stoploss_under_rsi_diff_1'])),
+        ]
+        return SellRules([], rules, {})
+
+    def backtest_sell_reason(self, pair: str, trade: 'Trade', current_time: datetime, current_profit: float,
+                             max_profit: float) -> tuple:
+        """
+        The custom_sell reason of a trade at a candle, backtesting and hyperopt only. The reasons of the next
+        candles of the trade are evaluated at once and reused by the calls that follow, 32 candles for a new
+        trade and twice as many for every following window, up to backtest_sell_window.
+        :param pair: str Pair
+        :param trade: Trade Open trade
+        :param current_time: datetime Date of the candle
+        :param current_profit: float Profit ratio of the trade at the candle
+        :param max_profit: float Highest profit ratio of the trade
+        :return: tuple (found, reason), not found if the candle or the profits are not the precomputed ones
+        """
+        candles = self.sell_candles[pair]
+        row = candles.row(current_time)
+        if row is None:
+            self.sell_window_fallback(pair, current_time, "no analyzed candle at that date")
+            return False, None
+        # custom_sell sees the candle before
+        if row == 0:
+            return False, None
+
+        window = self.sell_windows.get(pair)
+        if window is None or window['trade'] is not trade:
+            window = {'trade': trade, 'start': row, 'length': 32, 'reasons': ()}
+        if not window['start'] <= row < window['start'] + len(window['reasons']):
+            length = window['length'] if not len(window['reasons']) else min(2 * window['length'], self.backtest_sell_window)
+            window = candles.sell_reasons(self.sell_rules, trade, row, length)
+            window.update(trade=trade, length=length)
+            self.sell_windows[pair] = window
+
+        i = row - window['start']
+        if window['profits'][i] != current_profit or window['max_profits'][i] != max_profit:
+            self.sell_window_fallback(pair, current_time, f"profit {current_profit} / max profit {max_profit} instead of the "
+                                                          f"precomputed {window['profits'][i]} / {window['max_profits'][i]}")
+            return False, None
+        return True, window['reasons'][i]
+
+    def sell_window_fallback(self, pair: str, current_time: datetime, cause: str):
+        """
+        Count a custom_sell call the precomputed reasons could not answer, the first one is logged
+        """
+        if not self.sell_window_fallbacks:
+            logger.warning(f"custom_sell of {pair} at {current_time} is evaluated on its own, {cause}. "
+                           f"Every such call is counted in sell_window_fallbacks.")
+        self.sell_window_fallbacks += 1
+
     def informative_pairs(self):
         # get access to all pairs available in whitelist.
         pairs = self.dp.current_whitelist()
@@ -556,6 +747,19 @@ class NostalgiaForInfinityV5MultiOffsetAndHO2(IStrategy):
 
         return informative_1h
 
+    def safe_dips_bank(self, dataframe: DataFrame, profiles: dict) -> dict:
+        """
+        Dip protections. The drawdown ratios are computed once, every profile is a row of
+        thresholds and all profiles are checked against them in one comparison.
+
+        :param dataframe: DataFrame The original OHLC dataframe
+        :param profiles: dict Column name -> thresholds, one per window of dip_ratios
+        """
+        ratios = dip_ratios(dataframe)
+        thresholds = np.array(list(profiles.values()), dtype=np.float64)
+        safe = (ratios[:, None, :] < thresholds[None, :, :]).all(axis=2)
+        return {column: safe[:, i] for i, column in enumerate(profiles)}
+
     def normal_tf_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         # BB 40
         bb_40 = qtpylib.bollinger_bands(dataframe['close'], window=40, stds=2)
@@ -599,20 +803,13 @@ class NostalgiaForInfinityV5MultiOffsetAndHO2(IStrategy):
         dataframe['chop']= qtpylib.chopiness(dataframe, 14)
 
         # Dip protection
-        dataframe['safe_dips'] = ((((dataframe['open'] - dataframe['close']) / dataframe['close']) < self.buy_dip_threshold_1.value) &
-                                  (((dataframe['open'].rolling(2).max() - dataframe['close']) / dataframe['close']) < self.buy_dip_threshold_2.value) &
-                                  (((dataframe['open'].rolling(12).max() - dataframe['close']) / dataframe['close']) < self.buy_dip_threshold_3.value) &
-                                  (((dataframe['open'].rolling(144).max() - dataframe['close']) / dataframe['close']) < self.buy_dip_threshold_4.value))
-
-        dataframe['safe_dips_strict'] = ((((dataframe['open'] - dataframe['close']) / dataframe['close']) < self.buy_dip_threshold_5.value) &
-                                  (((dataframe['open'].rolling(2).max() - dataframe['close']) / dataframe['close']) < self.buy_dip_threshold_6.value) &
-                                  (((dataframe['open'].rolling(12).max() - dataframe['close']) / dataframe['close']) < self.buy_dip_threshold_7.value) &
-                                  (((dataframe['open'].rolling(144).max() - dataframe['close']) / dataframe['close']) < self.buy_dip_threshold_8.value))
-
-        dataframe['safe_dips_loose'] = ((((dataframe['open'] - dataframe['close']) / dataframe['close']) < self.buy_dip_threshold_9.value) &
-                                  (((dataframe['open'].rolling(2).max() - dataframe['close']) / dataframe['close']) < self.buy_dip_threshold_10.value) &
-                                  (((dataframe['open'].rolling(12).max() - dataframe['close']) / dataframe['close']) < self.buy_dip_threshold_11.value) &
-                                  (((dataframe['open'].rolling(144).max() - dataframe['close']) / dataframe['close']) < self.buy_dip_threshold_12.value))
+        dips = self.safe_dips_bank(dataframe, {
+            'safe_dips': (self.buy_dip_threshold_1.value, self.buy_dip_threshold_2.value, self.buy_dip_threshold_3.value, self.buy_dip_threshold_4.value),
+            'safe_dips_strict': (self.buy_dip_threshold_5.value, self.buy_dip_threshold_6.value, self.buy_dip_threshold_7.value, self.buy_dip_threshold_8.value),
+            'safe_dips_loose': (self.buy_dip_threshold_9.value, self.buy_dip_threshold_10.value, self.buy_dip_threshold_11.value, self.buy_dip_threshold_12.value),
+        })
+        for column, values in dips.items():
+            dataframe[column] = values
 
         # Volume
         dataframe['volume_mean_4'] = dataframe['volume'].rolling(4).mean().shift(1)
@@ -629,10 +826,29 @@ class NostalgiaForInfinityV5MultiOffsetAndHO2(IStrategy):
 
         return dataframe
 
+    def project_informative(self, dataframe: DataFrame, informative: DataFrame, metadata: dict, columns: dict = None) -> DataFrame:
+        """
+        Same columns as merge_informative_pair(ffill=True), without merging and copying the whole dataframe.
+        In live runs the row mapping is kept per pair and extended as candles arrive.
+
+        :param dataframe: DataFrame of the strategy timeframe
+        :param informative: DataFrame of the informative timeframe
+        :param metadata: dict Metadata of the pair
+        :param columns: dict Informative column -> name in the dataframe, by default all of them with the timeframe suffix
+        """
+        if columns is None:
+            columns = {column: f"{column}_{self.inf_1h}" for column in informative.columns}
+
+        projection = InformativeProjection(timeframe_to_minutes(self.timeframe), timeframe_to_minutes(self.inf_1h))
+        if self.config['runmode'].value in ('live', 'dry_run'):
+            projection = self.informative_projections.setdefault(metadata['pair'], projection)
+
+        return projection.project(dataframe, informative, columns)
+
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         # The indicators for the 1h informative timeframe
         informative_1h = self.informative_1h_indicators(dataframe, metadata)
-        dataframe = merge_informative_pair(dataframe, informative_1h, self.timeframe, self.inf_1h, ffill=True)
+        dataframe = self.project_informative(dataframe, informative_1h, metadata)
 
         # The indicators for the normal (5m) timeframe
         dataframe = self.normal_tf_indicators(dataframe, metadata)
@@ -1066,6 +1282,11 @@ class NostalgiaForInfinityV5MultiOffsetAndHO2(IStrategy):
         return dataframe
 
     def populate_sell_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        self.sell_rules = self.compile_sell_rules()
+        if self.config['runmode'].value in ('backtest', 'hyperopt'):
+            self.sell_candles[metadata['pair']] = SellCandles(dataframe, self.sell_rule_columns, timeframe_to_minutes(self.timeframe))
+            self.sell_windows.pop(metadata['pair'], None)
+
         conditions = []
 
         conditions.append(
@@ -1169,3 +1390,329 @@ def EWO(dataframe, sma1_length=5, sma2_length=35):
     sma2 = ta.EMA(df, timeperiod=sma2_length)
     smadif = (sma1 - sma2) / df['close'] * 100
     return smadif
+
+def dip_ratios(dataframe, windows=(1, 2, 12, 144)):
+    """
+    Drawdown of the close from the highest open of each window, one column per window
+    """
+    close = dataframe['close']
+    ratios = np.empty((len(dataframe), len(windows)))
+    for i, window in enumerate(windows):
+        top = dataframe['open'] if window == 1 else dataframe['open'].rolling(window).max()
+        ratios[:, i] = ((top - close) / close).values
+    return ratios
+
+class InformativeProjection:
+    """
+    As-of projection of an informative timeframe onto the candles of the strategy timeframe.
+    Every candle gets the last informative candle that has closed by then, the rows merge_informative_pair
+    picks, found with searchsorted on the timestamps and gathered as array takes. The row mapping is
+    kept and only extended for the new candles while the informative candles stay the same.
+    """
+
+    def __init__(self, timeframe_minutes, timeframe_inf_minutes):
+        self.offset = np.timedelta64(timeframe_inf_minutes - timeframe_minutes, 'm')
+        self.dates = None
+        self.inf_dates = None
+        self.rows = None
+
+    def mapping(self, dates, inf_dates):
+        """
+        Row of the informative frame for every candle, -1 before the first informative candle.
+        The candles are expected without gaps, as the dataprovider serves them.
+        """
+        overlap = 0
+        if self.rows is not None and len(self.dates) and len(dates) and np.array_equal(inf_dates, self.inf_dates):
+            last = np.searchsorted(dates, self.dates[-1])
+            if last < len(dates) and dates[last] == self.dates[-1] and last < len(self.dates) and dates[0] == self.dates[-(last + 1)]:
+                overlap = last + 1
+
+        merge_dates = inf_dates + self.offset
+        fresh = np.searchsorted(merge_dates, dates[overlap:], side='right') - 1
+        rows = np.concatenate([self.rows[len(self.rows) - overlap:], fresh]) if overlap else fresh
+
+        # merge_informative_pair only matches informative candles that line up with a candle of the
+        # frame, the ones from before its first candle are not carried over
+        if len(dates):
+            head = np.searchsorted(rows, np.searchsorted(merge_dates, dates[0]))
+            rows[:head] = -1
+
+        self.dates = np.array(dates)
+        self.inf_dates = np.array(inf_dates)
+        self.rows = rows
+        return rows
+
+    def project(self, dataframe, informative, columns):
+        """
+        Add the informative columns to the dataframe, forward filled like merge_informative_pair(ffill=True)
+
+        :param dataframe: DataFrame of the strategy timeframe
+        :param informative: DataFrame of the informative timeframe
+        :param columns: dict Informative column -> name in the dataframe
+        """
+        rows = self.mapping(dataframe['date'].values, informative['date'].values)
+        source = informative[list(columns)].reset_index(drop=True)
+        # candles before the first informative candle get NaN, like the left merge
+        projected = source.reindex(rows) if len(rows) and rows[0] < 0 else source.take(rows)
+        projected = projected.ffill().set_axis(dataframe.index)
+        for column, name in columns.items():
+            dataframe[name] = projected[column]
+        return dataframe
+
+
+def warmup_candles(chain, tolerance: float) -> int:
+    """
+    Candles of history a chain of indicators needs before its first value that is exact, or for the
+    recursive steps within tolerance of the error of their seed. The steps add up, which bounds the
+    warm-up of the chain from above. Kinds of steps:
+    'window' - rolling statistics, SMA and BB over window candles: window - 1
+    'shift' - shift / diff / ROC over window candles: window
+    'ema' - TA-Lib EMA, seeded with the SMA of window candles: window - 1 plus the seed decay of 2 / (window + 1)
+    't3' - TA-Lib T3, six EMAs of window on top of each other: 6 * (window - 1) plus the decay of the cascade
+    'kama' - TA-Lib KAMA, seeded with the candle before: window plus the seed decay at the smoothing of half the
+        efficiency ratio of a random walk, 1 / sqrt(window). Trends decay faster, choppy candles slower
+    'ewm' - pandas ewm or IIR filter of span window, seeded with the first value: the seed decay of 2 / (window + 1)
+    'wilder' - TA-Lib RSI / ATR, seeded with window candles: window plus the seed decay of 1 / window
+    :param chain: tuple (kind, window) steps, the first one on the candles
+    :param tolerance: float Share of the seed error left at the first analyzed candle
+    :return: int
+    """
+    candles = 0
+    for kind, window in chain:
+        if kind == 'window':
+            candles += window - 1
+        elif kind == 'shift':
+            candles += window
+        elif kind == 'ema':
+            candles += window - 1 + seed_decay(2 / (window + 1), tolerance)
+        elif kind == 't3':
+            candles += 6 * (window - 1) + cascade_decay(2 / (window + 1), 6, window - 1, tolerance)
+        elif kind == 'kama':
+            efficiency = 0.5 / np.sqrt(window)
+            candles += window + seed_decay((efficiency * (2 / 3 - 2 / 31) + 2 / 31) ** 2, tolerance)
+        elif kind == 'ewm':
+            candles += seed_decay(2 / (window + 1), tolerance)
+        elif kind == 'wilder':
+            candles += window + seed_decay(1 / window, tolerance)
+        else:
+            raise ValueError(f"Unknown warm-up step {kind}")
+    return candles
+
+
+def seed_decay(alpha: float, tolerance: float) -> int:
+    """
+    Candles a filter with weight alpha for the new value takes to leave tolerance of its seed error
+    :param alpha: float Weight of the new value
+    :param tolerance: float Share of the seed error left
+    :return: int
+    """
+    return int(np.ceil(np.log(tolerance) / np.log(1 - alpha)))
+
+
+def cascade_decay(alpha: float, stages: int, lag: int, tolerance: float) -> int:
+    """
+    Candles a cascade of filters with weight alpha for the new value, each seeded lag candles after the one
+    below it, takes from the seed of the last one to leave tolerance of the seed errors of all of them.
+    A seed error with d stages above it is left at the output as the chance that at most d of the candles
+    since its seed took the new value (a binomial tail), the shares of all stages add up.
+    :param alpha: float Weight of the new value
+    :param stages: int Number of filters
+    :param lag: int Candles between the seeds of two stages
+    :param tolerance: float Share of the seed error left
+    :return: int
+    """
+    def left(candles):
+        share = 0.0
+        for above in range(stages):
+            trials = candles + above * lag
+            term = (1 - alpha) ** trials
+            for taken in range(above + 1):
+                share += term
+                term *= (trials - taken) / (taken + 1) * alpha / (1 - alpha)
+        return share
+
+    candles = 0
+    while left(candles) > tolerance:
+        candles += 1
+    return candles
+
+
+def exchange_candle_limit(name: str, timeframe: str) -> int:
+    """
+    Candles the exchange serves in one request, freqtrade's Exchange.ohlcv_candle_limit without connecting
+    to the exchange. Exchanges freqtrade has no class for get its defaults.
+    :param name: str Exchange name of the config
+    :param timeframe: str Timeframe of the candles
+    :return: int
+    """
+    name = MAP_EXCHANGE_CHILDCLASS.get(name, name).title()
+    exchange = next((cls for cls in Exchange.__subclasses__() if cls.__name__ == name), Exchange)
+    has = {**Exchange._ft_has_default, **exchange._ft_has}
+    return int(has.get('ohlcv_candle_limit_per_timeframe', {}).get(timeframe, has['ohlcv_candle_limit']))
+
+
+class SellRules:
+    """
+    The custom_sell rules of one parameter set, checked in order, the first match is the sell reason.
+    Within a family of profit bands only one band can hold the profit, it is found with a bisect over
+    the thresholds. Candle values that several rules compare are computed once per call. The rule tests
+    take the values of one candle or arrays of many alike, reasons evaluates a run of candles at once.
+    """
+
+    def __init__(self, families, rules, pumps):
+        """
+        :param families: list (flag, thresholds, rsi limits, reasons) per band family. Band n lies above
+            thresholds[n] and below thresholds[n + 1], the last band has no upper bound. flag is the shared
+            value the whole family requires, or None
+        :param rules: list (reason, low, high, test) of the other rules, the profit must lie above low and
+            below high
+        :param pumps: dict (length, level) -> sell pump threshold
+        """
+        self.families = []
+        for flag, thresholds, limits, reasons in families:
+            bounds = list(thresholds) + [np.inf]
+            # bands that touch or overlap (possible in hyperopt) are checked one by one, highest first
+            ordered = all(low < high for low, high in zip(bounds, bounds[1:]))
+            self.families.append((flag, bounds, ordered, limits, reasons))
+        # the families as arrays for reasons, the limit past the last band never matches
+        self.family_arrays = [(np.array(bounds), np.array(list(limits) + [np.nan]), np.array(reasons, dtype=object))
+                              for flag, bounds, ordered, limits, reasons in self.families]
+        self.rules = rules
+        self.pumps = pumps
+
+    def shared(self, candle: dict) -> dict:
+        """
+        :param candle: dict The analyzed candle, or column arrays of several
+        :return: dict The values several rules compare
+        """
+        shared = {
+            'under': candle['close'] < candle['ema_200'],
+            'ema_200_rel': (candle['ema_200'] - candle['close']) / candle['close'],
+        }
+        for (length, level), threshold in self.pumps.items():
+            shared[(length, level)] = candle[f"pump_ratio_{length}_1h"] > threshold
+        return shared
+
+    def match(self, candle: dict, current_profit: float, max_profit: float):
+        """
+        :param candle: dict The analyzed candle
+        :param current_profit: float Current profit ratio of the trade
+        :param max_profit: float Highest profit ratio of the trade
+        :return: str The sell reason of the first matching rule, None if no rule matches
+        """
+        shared = self.shared(candle)
+        rsi = candle['rsi']
+
+        for flag, bounds, ordered, limits, reasons in self.families:
+            if flag is not None and not shared[flag]:
+                continue
+            if ordered:
+                band = bisect.bisect_left(bounds, current_profit) - 1
+                if band >= 0 and current_profit < bounds[band + 1] and rsi < limits[band]:
+                    return reasons[band]
+            else:
+                for band in reversed(range(len(limits))):
+                    if (bounds[band + 1] > current_profit > bounds[band]) and (rsi < limits[band]):
+                        return reasons[band]
+
+        for reason, low, high, test in self.rules:
+            if (low < current_profit < high) and test(candle, shared, current_profit, max_profit):
+                return reason
+
+        return None
+
+    def reasons(self, candles: dict, profits: np.ndarray, max_profits: np.ndarray) -> np.ndarray:
+        """
+        match for a run of candles, every rule is evaluated as a mask over all of them
+        :param candles: dict Column arrays of the analyzed candles
+        :param profits: np.ndarray Profit ratio of the trade at every candle
+        :param max_profits: np.ndarray Highest profit ratio of the trade at every candle
+        :return: np.ndarray The sell reason of every candle, None where no rule matches
+        """
+        shared = self.shared(candles)
+        rsi = candles['rsi']
+        reasons = np.full(len(profits), None, dtype=object)
+        free = np.ones(len(profits), dtype=bool)
+
+        for (flag, bounds, ordered, limits, names), (bound_values, limit_values, name_values) in zip(self.families, self.family_arrays):
+            if ordered:
+                # the band of every candle, -1 below the first threshold
+                band = np.searchsorted(bound_values, profits) - 1
+                hit = free & (profits < bound_values[band + 1]) & (rsi < limit_values[band])
+                if flag is not None:
+                    hit &= shared[flag]
+                reasons[hit] = name_values[band[hit]]
+                free &= ~hit
+                continue
+            for band in reversed(range(len(limits))):
+                hit = free & (bounds[band] < profits) & (profits < bounds[band + 1]) & (rsi < limits[band])
+                if flag is not None:
+                    hit &= shared[flag]
+                reasons[hit] = names[band]
+                free &= ~hit
+
+        for reason, low, high, test in self.rules:
+            hit = free & (low < profits) & (profits < high) & test(candles, shared, profits, max_profits)
+            reasons[hit] = reason
+            free &= ~hit
+
+        return reasons
+
+
+class SellCandles:
+    """
+    The analyzed candles of one pair as arrays, for the custom_sell reasons of backtesting. The row of a
+    candle follows from its date and the fixed candle step, frames with gaps in the dates fall back to a
+    binary search.
+    """
+
+    def __init__(self, dataframe: DataFrame, columns, timeframe_minutes: int):
+        minutes = dataframe['date'].values.astype('datetime64[m]').astype(np.int64)
+        self.step = timeframe_minutes
+        self.rows = len(minutes)
+        self.start = int(minutes[0]) if self.rows else 0
+        # only kept when the candles are not evenly spaced
+        self.minutes = None if (np.diff(minutes) == self.step).all() else minutes
+        self.open = dataframe['open'].to_numpy(dtype=np.float64)
+        self.high = dataframe['high'].to_numpy(dtype=np.float64)
+        self.columns = {}
+        for column in columns:
+            values = dataframe[column].to_numpy()
+            # flags the informative merge left as object
+            self.columns[column] = (values == True) if values.dtype == object else values
+
+    def row(self, time: datetime):
+        """
+        :param time: datetime Date of the candle
+        :return: int Row of the candle, None if there is no candle at that date
+        """
+        minute = int(time.timestamp()) // 60
+        if self.minutes is None:
+            row, offset = divmod(minute - self.start, self.step)
+            return row if not offset and 0 <= row < self.rows else None
+        row = int(np.searchsorted(self.minutes, minute))
+        return row if row < self.rows and self.minutes[row] == minute else None
+
+    def sell_reasons(self, rules: SellRules, trade: 'Trade', row: int, length: int) -> dict:
+        """
+        The profits and sell reasons of a trade from a candle on, as the backtest hands them to custom_sell:
+        the profit at the open of the candle, the highest rate up to its high, and the candle before it.
+        :param rules: SellRules The current rules
+        :param trade: Trade Open trade, max_rate includes the high of the first candle
+        :param row: int Row of the first candle, at least 1
+        :param length: int Number of candles
+        :return: dict 'start', 'profits', 'max_profits' and 'reasons' of the candles
+        """
+        end = min(row + length, self.rows)
+        # Trade.calc_profit_ratio in floats, custom_sell checks that the profit of its candle is the same
+        sell_values = trade.amount * self.open[row:end]
+        profits = np.round((sell_values - sell_values * trade.fee_close) / trade.open_trade_value - 1, 8)
+        max_rates = np.maximum.accumulate(np.maximum(self.high[row:end], trade.max_rate))
+        max_profits = (max_rates - trade.open_rate) / trade.open_rate
+        candles = {column: values[row - 1:end - 1] for column, values in self.columns.items()}
+        return {
+            'start': row,
+            'profits': profits,
+            'max_profits': max_profits,
+            'reasons': rules.reasons(candles, profits, max_profits),
+        }
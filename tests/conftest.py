@@ -0,0 +1,85 @@
+"""
+The strategies are standalone modules in the repository root, the way they are copied to
+user_data/strategies, so the tests import them from there.
+"""
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+from pandas import DataFrame, date_range
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def ohlcv(count: int, seed: int, start: str = '2021-05-01', minutes: int = 5):
+    """
+    Random walk candles
+    :param count: int Number of candles
+    :param seed: int Seed of the random walk
+    :param start: str Date of the first candle
+    :param minutes: int Timeframe in minutes
+    """
+    rng = np.random.default_rng(seed)
+    close = 100 * np.cumprod(1 + rng.normal(0, 0.004, count))
+    open_ = np.r_[close[0], close[:-1]]
+    spread = np.abs(rng.normal(0, 0.003, count)) * close
+    return DataFrame({
+        'date': date_range(start, periods=count, freq=f"{minutes}min", tz='UTC'),
+        'open': open_,
+        'high': np.maximum(open_, close) + spread,
+        'low': np.minimum(open_, close) - spread,
+        'close': close,
+        'volume': rng.uniform(100, 1000, count),
+    })
+
+
+def resample(dataframe, minutes: int):
+    """
+    The candles of a longer timeframe
+    :param dataframe: DataFrame Candles
+    :param minutes: int Timeframe in minutes
+    """
+    return dataframe.resample(f"{minutes}min", on='date').agg(
+        {'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last', 'volume': 'sum'}).reset_index()
+
+
+def backtest_strategy(strategy_class, tmp_path, monkeypatch, candles, informative_minutes: int = 60):
+    """
+    A strategy set up as the backtesting sets it up, the dataprovider serves the informative
+    candles resampled from the given ones.
+    """
+    from freqtrade.data.dataprovider import DataProvider
+    from freqtrade.enums import RunMode
+
+    informative = resample(candles, informative_minutes)
+    monkeypatch.setattr(DataProvider, 'historic_ohlcv', lambda self, pair, timeframe=None: informative.copy())
+    config = {
+        'runmode': RunMode.BACKTEST,
+        'timeframe': strategy_class.timeframe,
+        'stake_currency': 'USDT',
+        'dry_run': True,
+        'datadir': tmp_path,
+        'user_data_dir': tmp_path,
+    }
+    strategy = strategy_class(config)
+    strategy.dp = DataProvider(config, None)
+    return strategy
+
+
+@pytest.fixture
+def restore_parameters():
+    """
+    The hyperopt parameters are class attributes, the values a test changes are restored afterwards.
+    Yields a function that takes the strategy whose parameters to restore.
+    """
+    saved = []
+
+    def keep(strategy):
+        saved.extend((parameter, parameter.value) for name, parameter in strategy.enumerate_parameters())
+        return strategy
+
+    yield keep
+    for parameter, value in saved:
+        parameter.value = value
@@ -0,0 +1,47 @@
+import warnings
+
+import numpy as np
+import pytest
+
+talib = pytest.importorskip('talib')
+pytest.importorskip('freqtrade')
+
+from CryptoFrogHO import EMA_batch, iir_filter  # noqa: E402
+
+
+def test_iir_filter_matches_recursion():
+    rng = np.random.default_rng(1)
+    x = rng.normal(0, 1, (3000, 2))
+    expected = np.empty_like(x)
+    previous = np.array([1.5, -2.0])
+    for i in range(len(x)):
+        previous = 0.97 * previous + x[i]
+        expected[i] = previous
+
+    assert np.allclose(iir_filter(x, 0.97, [1.5, -2.0]), expected, rtol=1e-9)
+
+
+def test_iir_filter_without_decay():
+    x = np.arange(5.0)
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        assert np.array_equal(iir_filter(x, 0.0, 3.0), x)
+
+
+@pytest.mark.parametrize('period', [1, 2, 5, 14, 50])
+def test_ema_batch_matches_talib(period):
+    rng = np.random.default_rng(period)
+    values = rng.normal(100, 5, (600, 4))
+    values[:3, 1] = np.nan
+    values[:17, 2] = np.nan
+    values[:, 3] = np.nan
+
+    smooth = EMA_batch(values, period)
+    for column in range(3):
+        assert np.allclose(smooth[:, column], talib.EMA(values[:, column], period), equal_nan=True, rtol=1e-10)
+    assert np.isnan(smooth[:, 3]).all()
+    assert np.allclose(EMA_batch(values[:, 0], period), talib.EMA(values[:, 0], period), equal_nan=True, rtol=1e-10)
+
+
+def test_ema_batch_short_input():
+    assert np.isnan(EMA_batch(np.ones((3, 2)), 5)).all()
@@ -0,0 +1,68 @@
+"""
+IndicatorStore keeps the populated frames of backtesting and hyperopt on disk. An entry serves the
+candles it was populated from and any shorter range starting at the same candle, nothing else.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip('talib')
+pytest.importorskip('freqtrade')
+
+from conftest import ohlcv  # noqa: E402
+from NostalgiaForInfinityNext import IndicatorStore  # noqa: E402
+
+
+PAIR = 'BTC/USDT'
+
+
+def populated(candles):
+    dataframe = candles.copy()
+    dataframe['ema'] = dataframe['close'].ewm(span=20).mean()
+    dataframe['flag'] = dataframe['close'] > dataframe['open']
+    dataframe['ssl-dir'] = np.where(dataframe['flag'], 'up', 'down')
+    dataframe['date_1h'] = dataframe['date'].dt.floor('1h')
+    return dataframe
+
+
+@pytest.fixture
+def store(tmp_path):
+    return IndicatorStore(tmp_path, 'key')
+
+
+def test_store_round_trip(store):
+    candles = ohlcv(500, seed=1)
+    dataframe = populated(candles)
+    assert store.save(PAIR, '5m', dataframe, 'inf')
+
+    loaded = store.load(PAIR, '5m', candles, 'inf')
+    pd.testing.assert_frame_equal(loaded, dataframe)
+
+    shorter = candles.iloc[:300]
+    pd.testing.assert_frame_equal(store.load(PAIR, '5m', shorter, 'inf'), dataframe.iloc[:300])
+
+
+def test_store_loaded_frame_is_writable(store):
+    candles = ohlcv(100, seed=2)
+    store.save(PAIR, '5m', populated(candles), 'inf')
+
+    loaded = store.load(PAIR, '5m', candles, 'inf')
+    loaded.loc[loaded.index[:10], 'ema'] = 0.
+    assert (loaded['ema'].iloc[:10] == 0.).all()
+
+
+def test_store_misses(store):
+    candles = ohlcv(500, seed=3)
+    store.save(PAIR, '5m', populated(candles.iloc[:400]), 'inf')
+
+    # longer range, populated again in full
+    assert store.load(PAIR, '5m', candles, 'inf') is None
+    # changed informative candles
+    assert store.load(PAIR, '5m', candles.iloc[:400], 'other') is None
+    # changed candles
+    changed = candles.iloc[:400].copy()
+    changed.loc[changed.index[-1], 'close'] += 1
+    assert store.load(PAIR, '5m', changed, 'inf') is None
+    # other timeframe or pair
+    assert store.load(PAIR, '15m', candles.iloc[:400], 'inf') is None
+    assert store.load('ETH/USDT', '5m', candles.iloc[:400], 'inf') is None
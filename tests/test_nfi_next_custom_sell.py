@@ -0,0 +1,126 @@
+"""
+custom_sell of NostalgiaForInfinityNext takes the reasons of backtesting and hyperopt from windows of
+candles evaluated at once (SellCandles), live runs check the last analyzed candle. Trades are run
+through custom_sell the way freqtrade's backtesting calls it, and every reason has to be the one of the
+elif chain on the candle the dataprovider serves.
+"""
+import numpy as np
+import pytest
+
+pytest.importorskip('talib')
+pytest.importorskip('freqtrade')
+
+from freqtrade.data.dataprovider import DataProvider  # noqa: E402
+from freqtrade.enums import RunMode  # noqa: E402
+from freqtrade.persistence import LocalTrade  # noqa: E402
+
+from conftest import backtest_strategy, ohlcv  # noqa: E402
+from NostalgiaForInfinityNext import NostalgiaForInfinityNext  # noqa: E402
+from test_nfi_next_sell_rules import randomize, reference_sell  # noqa: E402
+
+
+PAIR = 'BTC/USDT'
+
+
+@pytest.fixture
+def strategy(tmp_path, monkeypatch, restore_parameters):
+    candles = ohlcv(3000, seed=24)
+    strategy = restore_parameters(backtest_strategy(NostalgiaForInfinityNext, tmp_path, monkeypatch, candles))
+    strategy.store_indicators = False
+    strategy.sell_candles = {}
+    strategy.sell_windows = {}
+    strategy.candle_snapshots = {}
+    strategy.candles = candles
+    return strategy
+
+
+def analyze(strategy):
+    """
+    The analyzed frame of the pair, cached by the dataprovider the way backtesting does
+    """
+    dataframe = strategy.ohlcvdata_to_dataframe({PAIR: strategy.candles.copy()})[PAIR]
+    strategy.dp._set_cached_df(PAIR, strategy.timeframe, dataframe)
+    dataframe['buy'] = 0
+    dataframe['sell'] = 0
+    metadata = {'pair': PAIR}
+    return strategy.advise_sell(strategy.advise_buy(dataframe, metadata), metadata)
+
+
+def open_trade(dataframe, row):
+    rate = dataframe['open'].iat[row]
+    return LocalTrade(pair=PAIR, open_rate=rate, open_date=dataframe['date'].iat[row].to_pydatetime(),
+                      stake_amount=100, amount=round(100 / rate, 8), fee_open=0.001, fee_close=0.001,
+                      exchange='backtesting', is_open=True)
+
+
+def test_window_profits_are_the_trade_profits(strategy):
+    dataframe = analyze(strategy)
+    trade = open_trade(dataframe, 700)
+    trade.adjust_min_max_rates(dataframe['high'].iat[700])
+
+    window = strategy.sell_candles[PAIR].sell_reasons(strategy.sell_rules, trade, 700, 1000)
+
+    expected = [trade.calc_profit_ratio(rate) for rate in dataframe['open'].iloc[700:1700]]
+    assert window['profits'].tolist() == expected
+
+
+@pytest.mark.parametrize('parameter_set', range(4))
+def test_backtest_reasons_match_the_chain(strategy, parameter_set):
+    if parameter_set:
+        randomize(strategy, np.random.default_rng(parameter_set))
+    dataframe = analyze(strategy)
+    dates = dataframe['date']
+    found = set()
+
+    for entry, hold in ((700, 1200), (1900, 800), (2800, 200)):
+        trade = open_trade(dataframe, entry)
+        for row in range(entry, entry + hold):
+            # backtesting hands custom_sell the open of the candle and slices the analyzed frame before it
+            strategy.dp._set_dataframe_max_index(row)
+            rate = dataframe['open'].iat[row]
+            trade.adjust_min_max_rates(dataframe['high'].iat[row])
+            current_profit = trade.calc_profit_ratio(rate)
+            reason = strategy.custom_sell(PAIR, trade, dates.iat[row].to_pydatetime(), rate, current_profit)
+
+            candle = strategy.dp.get_analyzed_dataframe(PAIR, strategy.timeframe)[0].iloc[-1]
+            assert candle['date'] == dates.iat[row - 1]
+            max_profit = (trade.max_rate - trade.open_rate) / trade.open_rate
+            assert reason == reference_sell(strategy, candle.to_dict(), current_profit, max_profit), row
+            found.add(reason)
+
+    assert strategy.sell_window_fallbacks == 0
+    assert len(found) > 1
+
+
+def test_backtest_fallback_is_counted(strategy, caplog):
+    dataframe = analyze(strategy)
+    trade = open_trade(dataframe, 700)
+    strategy.dp._set_dataframe_max_index(710)
+    trade.adjust_min_max_rates(dataframe['high'].iat[710])
+
+    # a profit backtesting would not have handed over
+    current_profit = trade.calc_profit_ratio(dataframe['open'].iat[710]) + 0.01
+    reason = strategy.custom_sell(PAIR, trade, dataframe['date'].iat[710].to_pydatetime(), 0, current_profit)
+
+    candle = strategy.dp.get_analyzed_dataframe(PAIR, strategy.timeframe)[0].iloc[-1]
+    max_profit = (trade.max_rate - trade.open_rate) / trade.open_rate
+    assert reason == reference_sell(strategy, candle.to_dict(), current_profit, max_profit)
+    assert strategy.sell_window_fallbacks == 1
+    assert 'sell_window_fallbacks' in caplog.text
+
+
+def test_live_reason_of_the_last_candle(strategy):
+    dataframe = analyze(strategy)
+    strategy.config['runmode'] = RunMode.DRY_RUN
+    strategy.dp = DataProvider({**strategy.config, 'runmode': RunMode.DRY_RUN}, None)
+    trade = open_trade(dataframe, 2000)
+
+    for end in range(2001, 2400, 7):
+        strategy.dp._set_cached_df(PAIR, strategy.timeframe, dataframe.iloc[:end])
+        rate = dataframe['close'].iat[end - 1]
+        trade.adjust_min_max_rates(rate)
+        current_profit = trade.calc_profit_ratio(rate)
+        max_profit = (trade.max_rate - trade.open_rate) / trade.open_rate
+
+        reason = strategy.custom_sell(PAIR, trade, dataframe['date'].iat[end - 1].to_pydatetime(), rate, current_profit)
+        assert reason == reference_sell(strategy, dataframe.iloc[end - 1].to_dict(), current_profit, max_profit)
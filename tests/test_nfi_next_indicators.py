@@ -0,0 +1,73 @@
+"""
+NostalgiaForInfinityNext only computes the indicators reachable from the enabled conditions, through the
+hand-kept buy_condition_indicators / sell_condition_indicators / custom_sell_indicators / indicator_inputs
+maps. Every condition is enabled on its own here, a column its code reads but the maps miss fails with a
+KeyError.
+"""
+import pytest
+
+pytest.importorskip('talib')
+pytest.importorskip('freqtrade')
+
+from conftest import backtest_strategy, ohlcv  # noqa: E402
+from NostalgiaForInfinityNext import NostalgiaForInfinityNext  # noqa: E402
+
+
+PAIR = 'BTC/USDT'
+PROTECTIONS = ('ema_fast', 'ema_slow', 'close_above_ema_fast', 'close_above_ema_slow', 'sma200_rising',
+               'sma200_1h_rising', 'safe_dips', 'safe_pump')
+
+
+@pytest.fixture
+def strategy(tmp_path, monkeypatch, restore_parameters):
+    candles = ohlcv(1500, seed=3)
+    strategy = restore_parameters(backtest_strategy(NostalgiaForInfinityNext, tmp_path, monkeypatch, candles))
+    strategy.store_indicators = False
+    strategy.populate_workers = 1
+    strategy.candles = candles
+    for condition in strategy.buy_condition_indicators:
+        getattr(strategy, f"buy_condition_{condition}_enable").value = False
+    for condition in strategy.sell_condition_indicators:
+        getattr(strategy, f"sell_condition_{condition}_enable").value = False
+    return strategy
+
+
+def populate(strategy):
+    return strategy.ohlcvdata_to_dataframe({PAIR: strategy.candles.copy()})[PAIR]
+
+
+@pytest.mark.parametrize('condition', sorted(NostalgiaForInfinityNext.buy_condition_indicators))
+def test_buy_condition_columns(strategy, condition):
+    getattr(strategy, f"buy_condition_{condition}_enable").value = True
+    for protection in PROTECTIONS:
+        getattr(strategy, f"buy_{condition:02d}_protection__{protection}").value = True
+    # buy_params carries lengths the parameters do not offer for protections it leaves disabled
+    for name, parameter in strategy.enumerate_parameters('buy'):
+        if name.startswith(f"buy_{condition:02d}_protection__") and not parameter.value in parameter.opt_range:
+            parameter.value = parameter.opt_range[0]
+
+    dataframe = populate(strategy)
+    for column in strategy.buy_condition_indicators[condition] + strategy.buy_protection_indicators(condition):
+        assert column in dataframe
+
+    dataframe = strategy.advise_buy(dataframe, {'pair': PAIR})
+    for other in strategy.buy_condition_indicators:
+        assert f"buy_{other:02d}_trigger" in dataframe
+        if other != condition:
+            assert not dataframe[f"buy_{other:02d}_trigger"].any()
+
+
+@pytest.mark.parametrize('condition', sorted(NostalgiaForInfinityNext.sell_condition_indicators))
+def test_sell_condition_columns(strategy, condition):
+    getattr(strategy, f"sell_condition_{condition}_enable").value = True
+
+    dataframe = populate(strategy)
+    for column in strategy.sell_condition_indicators[condition]:
+        assert column in dataframe
+    strategy.advise_sell(dataframe, {'pair': PAIR})
+
+
+def test_custom_sell_columns(strategy):
+    dataframe = populate(strategy)
+    for column in strategy.custom_sell_indicators + list(strategy.sell_rule_columns):
+        assert column in dataframe
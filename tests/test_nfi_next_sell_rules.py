@@ -0,0 +1,203 @@
+"""
+The custom_sell rules of NostalgiaForInfinityNext are compiled into SellRules, which finds the band of the
+profit with a bisect and shares the values several rules compare. Its reason has to be the one of the
+elif chain it replaced, kept below as the reference, for any candle, profit and parameter set hyperopt
+may try, overlapping profit bands included.
+"""
+import numpy as np
+import pytest
+
+pytest.importorskip('talib')
+pytest.importorskip('freqtrade')
+
+from freqtrade.strategy import CategoricalParameter, DecimalParameter, IntParameter  # noqa: E402
+
+from conftest import backtest_strategy, ohlcv  # noqa: E402
+from NostalgiaForInfinityNext import NostalgiaForInfinityNext  # noqa: E402
+
+
+def is_pumped(s, candle, length, level):
+    param = s.sell_pump_levels[length][level - 1]
+    return candle[f"pump_ratio_{length}_1h"] > getattr(s, f"sell_pump_threshold_{param}").value
+
+
+def reference_sell(s, last_candle, current_profit, max_profit):
+    """
+    custom_sell of NostalgiaForInfinityNext before the rules were compiled
+    """
+    if (last_candle is not None):
+        if (current_profit > s.sell_custom_profit_6.value) & (last_candle['rsi'] < s.sell_custom_rsi_6.value):
+            return 'signal_profit_6'
+        if (s.sell_custom_profit_6.value > current_profit > s.sell_custom_profit_5.value) & (last_candle['rsi'] < s.sell_custom_rsi_5.value):
+            return 'signal_profit_5'
+        elif (s.sell_custom_profit_5.value > current_profit > s.sell_custom_profit_4.value) & (last_candle['rsi'] < s.sell_custom_rsi_4.value):
+            return 'signal_profit_4'
+        elif (s.sell_custom_profit_4.value > current_profit > s.sell_custom_profit_3.value) & (last_candle['rsi'] < s.sell_custom_rsi_3.value):
+            return 'signal_profit_3'
+        elif (s.sell_custom_profit_3.value > current_profit > s.sell_custom_profit_2.value) & (last_candle['rsi'] < s.sell_custom_rsi_2.value):
+            return 'signal_profit_2'
+        elif (s.sell_custom_profit_2.value > current_profit > s.sell_custom_profit_1.value) & (last_candle['rsi'] < s.sell_custom_rsi_1.value):
+            return 'signal_profit_1'
+        elif (s.sell_custom_profit_1.value > current_profit > s.sell_custom_profit_0.value) & (last_candle['rsi'] < s.sell_custom_rsi_0.value):
+            return 'signal_profit_0'
+
+        # check if close is under EMA200
+        elif (current_profit > s.sell_custom_under_profit_6.value) & (last_candle['rsi'] < s.sell_custom_under_rsi_6.value) & (last_candle['close'] < last_candle['ema_200']):
+            return 'signal_profit_u_6'
+        elif (s.sell_custom_under_profit_6.value > current_profit > s.sell_custom_under_profit_5.value) & (last_candle['rsi'] < s.sell_custom_under_rsi_5.value) & (last_candle['close'] < last_candle['ema_200']):
+            return 'signal_profit_u_5'
+        elif (s.sell_custom_under_profit_5.value > current_profit > s.sell_custom_under_profit_4.value) & (last_candle['rsi'] < s.sell_custom_under_rsi_4.value) & (last_candle['close'] < last_candle['ema_200']):
+            return 'signal_profit_u_4'
+        elif (s.sell_custom_under_profit_4.value > current_profit > s.sell_custom_under_profit_3.value) & (last_candle['rsi'] < s.sell_custom_under_rsi_3.value) & (last_candle['close'] < last_candle['ema_200']):
+            return 'signal_profit_u_3'
+        elif (s.sell_custom_under_profit_3.value > current_profit > s.sell_custom_under_profit_2.value) & (last_candle['rsi'] < s.sell_custom_under_rsi_2.value) & (last_candle['close'] < last_candle['ema_200']):
+            return 'signal_profit_u_2'
+        elif (s.sell_custom_under_profit_2.value > current_profit > s.sell_custom_under_profit_1.value) & (last_candle['rsi'] < s.sell_custom_under_rsi_1.value) & (last_candle['close'] < last_candle['ema_200']):
+            return 'signal_profit_u_1'
+        elif (s.sell_custom_under_profit_1.value > current_profit > s.sell_custom_under_profit_0.value) & (last_candle['rsi'] < s.sell_custom_under_rsi_0.value) & (last_candle['close'] < last_candle['ema_200']):
+            return 'signal_profit_u_0'
+
+        # check if the pair is "pumped"
+
+        elif (is_pumped(s, last_candle, 48, 1)) & (current_profit > s.sell_custom_pump_profit_1_5.value) & (last_candle['rsi'] < s.sell_custom_pump_rsi_1_5.value):
+            return 'signal_profit_p_1_5'
+        elif (is_pumped(s, last_candle, 48, 1)) & (s.sell_custom_pump_profit_1_5.value > current_profit > s.sell_custom_pump_profit_1_4.value) & (last_candle['rsi'] < s.sell_custom_pump_rsi_1_4.value):
+            return 'signal_profit_p_1_4'
+        elif (is_pumped(s, last_candle, 48, 1)) & (s.sell_custom_pump_profit_1_4.value > current_profit > s.sell_custom_pump_profit_1_3.value) & (last_candle['rsi'] < s.sell_custom_pump_rsi_1_3.value):
+            return 'signal_profit_p_1_3'
+        elif (is_pumped(s, last_candle, 48, 1)) & (s.sell_custom_pump_profit_1_3.value > current_profit > s.sell_custom_pump_profit_1_2.value) & (last_candle['rsi'] < s.sell_custom_pump_rsi_1_2.value):
+            return 'signal_profit_p_1_2'
+        elif (is_pumped(s, last_candle, 48, 1)) & (s.sell_custom_pump_profit_1_2.value > current_profit > s.sell_custom_pump_profit_1_1.value) & (last_candle['rsi'] < s.sell_custom_pump_rsi_1_1.value):
+            return 'signal_profit_p_1_1'
+
+        elif (is_pumped(s, last_candle, 36, 1)) & (current_profit > s.sell_custom_pump_profit_2_5.value) & (last_candle['rsi'] < s.sell_custom_pump_rsi_2_5.value):
+            return 'signal_profit_p_2_5'
+        elif (is_pumped(s, last_candle, 36, 1)) & (s.sell_custom_pump_profit_2_5.value > current_profit > s.sell_custom_pump_profit_2_4.value) & (last_candle['rsi'] < s.sell_custom_pump_rsi_2_4.value):
+            return 'signal_profit_p_2_4'
+        elif (is_pumped(s, last_candle, 36, 1)) & (s.sell_custom_pump_profit_2_4.value > current_profit > s.sell_custom_pump_profit_2_3.value) & (last_candle['rsi'] < s.sell_custom_pump_rsi_2_3.value):
+            return 'signal_profit_p_2_3'
+        elif (is_pumped(s, last_candle, 36, 1)) & (s.sell_custom_pump_profit_2_3.value > current_profit > s.sell_custom_pump_profit_2_2.value) & (last_candle['rsi'] < s.sell_custom_pump_rsi_2_2.value):
+            return 'signal_profit_p_2_2'
+        elif (is_pumped(s, last_candle, 36, 1)) & (s.sell_custom_pump_profit_2_2.value > current_profit > s.sell_custom_pump_profit_2_1.value) & (last_candle['rsi'] < s.sell_custom_pump_rsi_2_1.value):
+            return 'signal_profit_p_2_1'
+
+        elif (is_pumped(s, last_candle, 24, 1)) & (current_profit > s.sell_custom_pump_profit_3_5.value) & (last_candle['rsi'] < s.sell_custom_pump_rsi_3_5.value):
+            return 'signal_profit_p_3_5'
+        elif (is_pumped(s, last_candle, 24, 1)) & (s.sell_custom_pump_profit_3_5.value > current_profit > s.sell_custom_pump_profit_3_4.value) & (last_candle['rsi'] < s.sell_custom_pump_rsi_3_4.value):
+            return 'signal_profit_p_3_4'
+        elif (is_pumped(s, last_candle, 24, 1)) & (s.sell_custom_pump_profit_3_4.value > current_profit > s.sell_custom_pump_profit_3_3.value) & (last_candle['rsi'] < s.sell_custom_pump_rsi_3_3.value):
+            return 'signal_profit_p_3_3'
+        elif (is_pumped(s, last_candle, 24, 1)) & (s.sell_custom_pump_profit_3_3.value > current_profit > s.sell_custom_pump_profit_3_2.value) & (last_candle['rsi'] < s.sell_custom_pump_rsi_3_2.value):
+            return 'signal_profit_p_3_2'
+        elif (is_pumped(s, last_candle, 24, 1)) & (s.sell_custom_pump_profit_3_2.value > current_profit > s.sell_custom_pump_profit_3_1.value) & (last_candle['rsi'] < s.sell_custom_pump_rsi_3_1.value):
+            return 'signal_profit_p_3_1'
+
+        elif (s.sell_custom_dec_profit_max_1.value > current_profit > s.sell_custom_dec_profit_min_1.value) & (last_candle['sma_200_dec']):
+            return 'signal_profit_d_1'
+        elif (s.sell_custom_dec_profit_max_2.value > current_profit > s.sell_custom_dec_profit_min_2.value) & (last_candle['close'] < last_candle['ema_100']):
+            return 'signal_profit_d_2'
+
+        # Trailing
+        elif (s.sell_trail_profit_max_1.value > current_profit > s.sell_trail_profit_min_1.value) & (s.sell_trail_rsi_min_1.value < last_candle['rsi'] < s.sell_trail_rsi_max_1.value) & (max_profit > (current_profit + s.sell_trail_down_1.value)):
+            return 'signal_profit_t_1'
+        elif (s.sell_trail_profit_max_2.value > current_profit > s.sell_trail_profit_min_2.value) & (s.sell_trail_rsi_min_2.value < last_candle['rsi'] < s.sell_trail_rsi_max_2.value) & (max_profit > (current_profit + s.sell_trail_down_2.value)):
+            return 'signal_profit_t_2'
+        elif (s.sell_trail_profit_max_3.value > current_profit > s.sell_trail_profit_min_3.value) & (max_profit > (current_profit + s.sell_trail_down_3.value)) & (last_candle['sma_200_dec_1h']):
+            return 'signal_profit_t_3'
+
+        elif (last_candle['close'] < last_candle['ema_200']) & (current_profit > s.sell_trail_profit_min_3.value) & (current_profit < s.sell_trail_profit_max_3.value) & (max_profit > (current_profit + s.sell_trail_down_3.value)):
+            return 'signal_profit_u_t_1'
+
+        elif (current_profit > 0.0) & (last_candle['close'] < last_candle['ema_200']) & (((last_candle['ema_200'] - last_candle['close']) / last_candle['close']) < s.sell_custom_profit_under_rel_1.value) & (last_candle['rsi'] > last_candle['rsi_1h'] + s.sell_custom_profit_under_rsi_diff_1.value):
+            return 'signal_profit_u_e_1'
+
+        elif (current_profit < -0.0) & (last_candle['close'] < last_candle['ema_200']) & (((last_candle['ema_200'] - last_candle['close']) / last_candle['close']) < s.sell_custom_stoploss_under_rel_1.value) & (last_candle['rsi'] > last_candle['rsi_1h'] + s.sell_custom_stoploss_under_rsi_diff_1.value):
+            return 'signal_stoploss_u_1'
+
+        elif (s.sell_custom_pump_dec_profit_max_1.value > current_profit > s.sell_custom_pump_dec_profit_min_1.value) & (is_pumped(s, last_candle, 48, 1)) & (last_candle['sma_200_dec']) & (last_candle['close'] < last_candle['ema_200']):
+            return 'signal_profit_p_d_1'
+        elif (s.sell_custom_pump_dec_profit_max_2.value > current_profit > s.sell_custom_pump_dec_profit_min_2.value) & (is_pumped(s, last_candle, 48, 2)) & (last_candle['sma_200_dec']) & (last_candle['close'] < last_candle['ema_200']):
+            return 'signal_profit_p_d_2'
+        elif (s.sell_custom_pump_dec_profit_max_3.value > current_profit > s.sell_custom_pump_dec_profit_min_3.value) & (is_pumped(s, last_candle, 48, 3)) & (last_candle['sma_200_dec']) & (last_candle['close'] < last_candle['ema_200']):
+            return 'signal_profit_p_d_3'
+
+        # Pumped 48h 1, under EMA200
+        elif (s.sell_custom_pump_under_profit_max_1.value > current_profit > s.sell_custom_pump_under_profit_min_1.value) & (is_pumped(s, last_candle, 48, 1)) & (last_candle['close'] < last_candle['ema_200']):
+            return 'signal_profit_p_u_1'
+
+        # Pumped 36h 2, trail 1
+        elif (is_pumped(s, last_candle, 36, 2)) & (s.sell_custom_pump_trail_profit_max_1.value > current_profit > s.sell_custom_pump_trail_profit_min_1.value) & (s.sell_custom_pump_trail_rsi_min_1.value < last_candle['rsi'] < s.sell_custom_pump_trail_rsi_max_1.value) & (max_profit > (current_profit + s.sell_custom_pump_trail_down_1.value)):
+            return 'signal_profit_p_t_1'
+
+        elif (max_profit < s.sell_custom_stoploss_pump_max_profit_1.value) & (s.sell_custom_stoploss_pump_min_1.value < current_profit < s.sell_custom_stoploss_pump_max_1.value) & (is_pumped(s, last_candle, 48, 1)) & (last_candle['sma_200_dec']) & (last_candle['close'] < (last_candle['ema_200'] * s.sell_custom_stoploss_pump_ma_offset_1.value)):
+            return 'signal_stoploss_p_1'
+
+        elif (max_profit < s.sell_custom_stoploss_pump_max_profit_2.value) & (current_profit < s.sell_custom_stoploss_pump_loss_2.value) & (is_pumped(s, last_candle, 48, 1)) & (last_candle['sma_200_dec_1h']) & (last_candle['close'] < (last_candle['ema_200'] * s.sell_custom_stoploss_pump_ma_offset_2.value)):
+            return 'signal_stoploss_p_2'
+
+        elif (max_profit < s.sell_custom_stoploss_pump_max_profit_3.value) & (current_profit < s.sell_custom_stoploss_pump_loss_3.value) & (is_pumped(s, last_candle, 36, 3)) & (last_candle['close'] < (last_candle['ema_200'] * s.sell_custom_stoploss_pump_ma_offset_3.value)):
+            return 'signal_stoploss_p_3'
+
+    return None
+
+
+def randomize(strategy, rng):
+    """
+    Random values for the sell parameters, within the ranges hyperopt searches
+    """
+    for name, parameter in strategy.enumerate_parameters('sell'):
+        if isinstance(parameter, CategoricalParameter):
+            parameter.value = parameter.opt_range[rng.integers(len(parameter.opt_range))]
+        elif isinstance(parameter, DecimalParameter):
+            parameter.value = round(float(rng.uniform(parameter.low, parameter.high)), parameter._decimals)
+        elif isinstance(parameter, IntParameter):
+            parameter.value = int(rng.integers(parameter.low, parameter.high + 1))
+
+
+def random_candle(rng, thresholds):
+    candle = {
+        'rsi': rng.uniform(10, 90) if rng.random() > 0.02 else np.nan,
+        'rsi_1h': rng.uniform(10, 90),
+        'close': rng.uniform(0.8, 1.2),
+        'ema_200': rng.uniform(0.8, 1.2),
+        'ema_100': rng.uniform(0.8, 1.2),
+        'sma_200_dec': bool(rng.random() < 0.5),
+        'sma_200_dec_1h': bool(rng.random() < 0.5),
+    }
+    for length in (48, 36, 24):
+        candle[f"pump_ratio_{length}_1h"] = rng.uniform(0.2, 1.2)
+    if rng.random() < 0.1:
+        # on a limit of a rule, the comparisons are strict
+        candle['rsi'] = float(rng.choice(thresholds))
+    return candle
+
+
+@pytest.fixture
+def strategy(tmp_path, monkeypatch, restore_parameters):
+    return restore_parameters(backtest_strategy(NostalgiaForInfinityNext, tmp_path, monkeypatch, ohlcv(100, seed=1)))
+
+
+def test_sell_rules_match_the_chain(strategy):
+    rng = np.random.default_rng(23)
+    matched = set()
+    for parameter_set in range(25):
+        if parameter_set:
+            randomize(strategy, rng)
+        rules = strategy.compile_sell_rules()
+        thresholds = [parameter.value for name, parameter in strategy.enumerate_parameters('sell')
+                      if isinstance(parameter.value, (int, float)) and not isinstance(parameter.value, bool)]
+
+        for _ in range(2000):
+            candle = random_candle(rng, thresholds)
+            if rng.random() < 0.1:
+                current_profit = float(rng.choice(thresholds))
+            else:
+                current_profit = float(rng.uniform(-0.3, 0.3))
+            max_profit = max(current_profit, 0.) + float(rng.uniform(0, 0.1))
+
+            expected = reference_sell(strategy, candle, current_profit, max_profit)
+            assert rules.match(candle, current_profit, max_profit) == expected, (candle, current_profit, max_profit)
+            matched.add(expected)
+
+    # the candles reach most of the rules, a fuzz that never matches would pass as well
+    assert len(matched) > 40
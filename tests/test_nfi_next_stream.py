@@ -0,0 +1,85 @@
+"""
+The live runs of NostalgiaForInfinityNext keep the normal timeframe indicators as running state
+(IndicatorStream), backtesting computes them with the batch kernels. Both have to give the same values:
+the stream continues the whole history it has seen, and is seeded again from the frame after a gap.
+"""
+import numpy as np
+import pytest
+
+pytest.importorskip('talib')
+pytest.importorskip('freqtrade')
+
+from conftest import backtest_strategy, ohlcv  # noqa: E402
+from NostalgiaForInfinityNext import AllIndicators, IndicatorStream, NostalgiaForInfinityNext, SMAState  # noqa: E402
+
+
+def sources(candles):
+    return {
+        'close': candles['close'].values,
+        'typical': ((candles['high'] + candles['low'] + candles['close']) / 3.).values,
+        'volume': candles['volume'].values,
+    }
+
+
+def expected(strategy, history, rows):
+    """
+    The batch kernels over the whole history, the last `rows` candles of every column
+    """
+    values = sources(history)
+    columns = {}
+    for names, (source, kernel) in strategy.batch_specs(AllIndicators()).items():
+        for column, output in zip(names, kernel(values[source][None, :])):
+            if column:
+                columns[column] = output[0][-rows:]
+    return columns
+
+
+def assert_columns(streamed, columns):
+    assert set(streamed) == set(columns)
+    for column, values in columns.items():
+        assert np.allclose(streamed[column], values, rtol=1e-9, equal_nan=True), column
+
+
+@pytest.fixture
+def strategy(tmp_path, monkeypatch):
+    return backtest_strategy(NostalgiaForInfinityNext, tmp_path, monkeypatch, ohlcv(100, seed=1))
+
+
+def test_stream_matches_batch(strategy):
+    candles = ohlcv(1200, seed=5)
+    stream = IndicatorStream(strategy.stream_specs(AllIndicators()), 5)
+
+    # First frame, seeded
+    assert_columns(stream.update(candles.iloc[:600]), expected(strategy, candles.iloc[:600], 600))
+
+    # Sliding frames, the new candles are pushed and the values continue the whole history
+    for end in (601, 605, 700):
+        frame = candles.iloc[end - 600:end]
+        assert_columns(stream.update(frame), expected(strategy, candles.iloc[:end], 600))
+
+    # A gap, seeded again from the frame alone
+    frame = candles.iloc[800:1200]
+    assert_columns(stream.update(frame), expected(strategy, frame, 400))
+
+    frame = candles.drop(index=1000).iloc[-400:]
+    assert_columns(stream.update(frame), expected(strategy, frame, 400))
+
+
+def test_stream_short_first_frame(strategy):
+    candles = ohlcv(300, seed=6)
+    stream = IndicatorStream(strategy.stream_specs(AllIndicators()), 5)
+
+    stream.update(candles.iloc[:10])
+    assert_columns(stream.update(candles.iloc[:300]), expected(strategy, candles, 300))
+
+
+def test_sma_state_total_does_not_drift():
+    rng = np.random.default_rng(7)
+    values = 1e6 + rng.normal(0, 1e3, 50000)
+    state = SMAState(30)
+    state.seed(values[:100])
+    pushed = np.array([state.push(x)[0] for x in values[100:]])
+
+    means = np.lib.stride_tricks.sliding_window_view(values, 30).mean(axis=1)[71:]
+    assert np.abs(pushed - means).max() < 1e-9
+    assert abs(state.total - np.sum(state.window)) <= state.period * np.spacing(state.total)
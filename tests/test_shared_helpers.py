@@ -0,0 +1,73 @@
+"""
+Every strategy is a standalone module, copied alone to user_data/strategies, so the helpers they share
+are pasted into each of them instead of being imported from a common module. A fix to one copy has to be
+made to all of them: the copies are compared here and any difference fails.
+"""
+import ast
+from functools import lru_cache
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Module level classes and functions shared by several strategies
+SHARED = (
+    'InformativeProjection',
+    'IndicatorStore',
+    'frame_digest',
+    'indicator_source',
+    'ParallelPopulation',
+    'compact_frame',
+    'signal_values',
+    'SellCandles',
+    'warmup_candles',
+    'seed_decay',
+    'cascade_decay',
+    'exchange_candle_limit',
+)
+
+# Methods of the strategy classes shared by several strategies
+SHARED_METHODS = (
+    'compact',
+    'backtest_sell_reason',
+    'sell_window_fallback',
+)
+
+
+@lru_cache(maxsize=None)
+def modules() -> tuple:
+    """
+    (file name, source, module level nodes) of every strategy file
+    """
+    found = []
+    for path in sorted(ROOT.glob('*.py')):
+        source = path.read_text()
+        found.append((path.name, source, ast.parse(source).body))
+    return tuple(found)
+
+
+def copies(name: str, methods: bool = False) -> dict:
+    """
+    Source of every module level definition of `name` by strategy file, or of the method `name` of the
+    module level classes
+    """
+    found = {}
+    for path, source, nodes in modules():
+        if methods:
+            nodes = [node for cls in nodes if isinstance(cls, ast.ClassDef) for node in cls.body]
+        for node in nodes:
+            if isinstance(node, (ast.ClassDef, ast.FunctionDef)) and node.name == name:
+                found[path] = ast.get_source_segment(source, node)
+    return found
+
+
+@pytest.mark.parametrize('name, methods', [(name, False) for name in SHARED] + [(name, True) for name in SHARED_METHODS])
+def test_shared_copies_are_identical(name, methods):
+    found = copies(name, methods)
+    assert len(found) > 1, f"{name} is not shared anymore, drop it from the list"
+
+    reference = max(set(found.values()), key=list(found.values()).count)
+    differ = sorted(path for path, source in found.items() if source != reference)
+    assert not differ, f"{name} differs from the other {len(found) - len(differ)} copies in {', '.join(differ)}"
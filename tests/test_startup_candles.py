@@ -0,0 +1,123 @@
+"""
+The strategies with startup_windows derive their warm-up from them and use it as startup_candle_count,
+within what the exchange of the config serves on startup, in every runmode.
+"""
+import importlib
+import logging
+
+import numpy as np
+import pytest
+
+talib = pytest.importorskip('talib')
+pytest.importorskip('freqtrade')
+
+from freqtrade.enums import RunMode  # noqa: E402
+from freqtrade.resolvers import ExchangeResolver  # noqa: E402
+
+
+STRATEGIES = ('CryptoFrogOffset', 'NFI46', 'NormalizerStrategyHO2', 'NostalgiaForInfinityNext',
+              'NostalgiaForInfinityV5MultiOffsetAndHO2', 'SMAOffsetProtectOptV1HO1')
+
+
+def config(name, runmode, exchange='binance', **extra):
+    strategy_class = getattr(importlib.import_module(name), name)
+    return {'runmode': runmode, 'timeframe': strategy_class.timeframe, 'stake_currency': 'USDT', 'dry_run': True,
+            'exchange': {'name': exchange, 'key': '', 'secret': '', 'ccxt_config': {}, 'ccxt_async_config': {},
+                         'pair_whitelist': []}, **extra}
+
+
+def strategy(name, runmode, exchange='binance', **extra):
+    return getattr(importlib.import_module(name), name)(config(name, runmode, exchange, **extra))
+
+
+def warnings(caplog, name):
+    return [record for record in caplog.records if record.levelno >= logging.WARNING and record.name == name]
+
+
+@pytest.mark.parametrize('runmode', (RunMode.BACKTEST, RunMode.HYPEROPT, RunMode.DRY_RUN))
+@pytest.mark.parametrize('name', STRATEGIES)
+def test_startup_candle_count_is_the_warmup(name, runmode, caplog):
+    # hyperopt reads the spaces it optimizes from the arguments
+    extra = {'spaces': ['default']} if runmode == RunMode.HYPEROPT else {}
+    with caplog.at_level(logging.INFO):
+        loaded = strategy(name, runmode, **extra)
+
+    assert loaded.startup_candle_count == loaded.startup_candles()[loaded.timeframe]
+    assert not warnings(caplog, name)
+
+
+@pytest.mark.parametrize('name', STRATEGIES)
+def test_startup_candle_count_fits_the_exchange(name):
+    loaded = strategy(name, RunMode.BACKTEST)
+    exchange = ExchangeResolver.load_exchange('binance', config(name, RunMode.BACKTEST), validate=False)
+    try:
+        assert exchange.ohlcv_candle_limit(loaded.timeframe) == 1000
+        exchange.validate_required_startup_candles(loaded.startup_candle_count, loaded.timeframe)
+    finally:
+        exchange.close()
+
+
+@pytest.mark.parametrize('runmode', (RunMode.BACKTEST, RunMode.DRY_RUN))
+@pytest.mark.parametrize('name', STRATEGIES)
+def test_startup_candle_count_is_capped_with_a_warning(name, runmode, caplog):
+    # exchanges freqtrade has no class for serve 500 candles
+    with caplog.at_level(logging.INFO):
+        loaded = strategy(name, runmode, exchange='anyexchange')
+
+    required = loaded.startup_candles()[loaded.timeframe]
+    assert loaded.startup_candle_count == min(required, 495)
+    assert bool(warnings(caplog, name)) == (required > 495)
+
+
+@pytest.mark.parametrize('name', STRATEGIES)
+def test_startup_candle_limit_of_the_config(name, caplog):
+    with caplog.at_level(logging.INFO):
+        loaded = strategy(name, RunMode.BACKTEST, startup_candle_limit=300)
+
+    assert loaded.startup_candle_count == 300
+    assert 'short of the' in warnings(caplog, name)[0].getMessage()
+
+
+def seed_errors(function, candles, start, lookback, period):
+    """
+    Error of the indicator computed from `start` on against the one over the whole history, from its first value
+    """
+    return np.abs(function(candles[start:], timeperiod=period)[lookback:] - function(candles, timeperiod=period)[start + lookback:])
+
+
+def test_single_stage_cascade_is_the_seed_decay():
+    from NostalgiaForInfinityV5MultiOffsetAndHO2 import cascade_decay, seed_decay
+
+    for period in (5, 20, 80, 200):
+        assert cascade_decay(2 / (period + 1), 1, period - 1, 0.01) == seed_decay(2 / (period + 1), 0.01)
+
+
+@pytest.mark.parametrize('period', (20, 80))
+def test_t3_warmup_covers_talib(period):
+    from NostalgiaForInfinityV5MultiOffsetAndHO2 import warmup_candles
+
+    lookback = 6 * (period - 1)
+    decay = warmup_candles((('t3', period),), 0.01) - lookback
+    rng = np.random.default_rng(period)
+    for _ in range(50):
+        candles = 100 * np.cumprod(1 + rng.normal(0, 0.004, 4000))
+        # the seed errors of the six EMAs of the cascade, each at its seed
+        seeds = []
+        full, short = candles, candles[2000:]
+        for stage in range(6):
+            full, short = talib.EMA(full, timeperiod=period), talib.EMA(short, timeperiod=period)
+            seed = (stage + 1) * (period - 1)
+            seeds.append(abs(short[seed] - full[2000 + seed]))
+        errors = seed_errors(talib.T3, candles, 2000, lookback, period)
+        assert (errors[decay:] <= 0.01 * max(seeds)).all()
+
+
+def test_kama_warmup_covers_talib():
+    from NostalgiaForInfinityV5MultiOffsetAndHO2 import warmup_candles
+
+    decay = warmup_candles((('kama', 80),), 0.01) - 80
+    rng = np.random.default_rng(80)
+    for _ in range(50):
+        candles = 100 * np.cumprod(1 + rng.normal(0, 0.004, 4000))
+        errors = seed_errors(talib.KAMA, candles, 2000, 80, 80)
+        assert (errors[decay:] <= 0.01 * errors[0]).all()